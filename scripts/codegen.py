@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import logging
+import os
 import sys
 
 import click
@@ -24,6 +25,8 @@ try:
 except ImportError:
     _has_coloredlogs = False
 
+from matter.idl.generators import set_template_cache_dir
+from matter.idl.generators.incremental import write_depfile
 from matter.idl.generators.path_resolution import expand_path_for_idl
 from matter.idl.generators.registry import GENERATORS, CodeGenerator
 from matter.idl.generators.storage import FileSystemGeneratorStorage, GeneratorStorage
@@ -92,10 +95,34 @@ __LOG_LEVELS__ = {
     type=click.Path(exists=True),
     default=None,
     help='A file containing all expected outputs. Script will fail if outputs do not match')
+@click.option(
+    '--parse-cache-dir',
+    type=click.Path(exists=False),
+    default=None,
+    help='A directory where parsed IDL files are cached, so that generators run over the same file parse it only once. ' +
+         'May be shared by concurrent codegen runs.')
+@click.option(
+    '--template-cache-dir',
+    type=click.Path(exists=False),
+    default=None,
+    help='A directory where compiled templates are cached (see scripts/codegen_compile_templates.py). ' +
+         'May be shared by concurrent codegen runs.')
+@click.option(
+    '--incremental-state',
+    type=click.Path(exists=False),
+    default=None,
+    help='A file where the dependencies of every output are saved, so that subsequent runs only render ' +
+         'outputs whose inputs changed.')
+@click.option(
+    '--depfile',
+    type=click.Path(exists=False),
+    default=None,
+    help='A depfile to write, listing the inputs of the generated outputs (for build systems)')
 @click.argument(
     'idl_path',
     type=click.Path(exists=True))
-def main(log_level, generator, option, output_dir, dry_run, name_only, expected_outputs, idl_path):
+def main(log_level, generator, option, output_dir, dry_run, name_only, expected_outputs, parse_cache_dir, template_cache_dir,
+         incremental_state, depfile, idl_path):
     """
     Parses MATTER IDL files (.matter) and performs SDK code generation
     as set up by the program arguments.
@@ -116,7 +143,7 @@ def main(log_level, generator, option, output_dir, dry_run, name_only, expected_
         storage = FileSystemGeneratorStorage(output_dir)
 
     logging.info("Parsing idl from %s" % idl_path)
-    idl_tree = CreateParser().parse(open(idl_path, "rt").read(), file_name=idl_path)
+    idl_tree = CreateParser(cache_dir=parse_cache_dir).parse(open(idl_path, "rt").read(), file_name=idl_path)
 
     plugin_module = None
     if generator.startswith('custom:'):
@@ -140,16 +167,24 @@ def main(log_level, generator, option, output_dir, dry_run, name_only, expected_
         extra_args[key] = value
 
     logging.info("Running code generator %s" % generator)
+    set_template_cache_dir(template_cache_dir)
     generator = CodeGenerator.FromString(generator).Create(storage, idl=idl_tree, plugin_module=plugin_module, **extra_args)
+    if incremental_state and not (dry_run or name_only):
+        generator.enable_incremental(incremental_state)
     generator.render(dry_run)
 
+    # Outputs in the order build systems declare them
+    outputs = sorted(storage.generated_paths)
+
     if expected_outputs:
         with open(expected_outputs, 'rt') as fin:
             expected = set()
+            outputs = []
             for line in fin.readlines():
                 line = line.strip()
                 for expanded_path in expand_path_for_idl(idl_tree, line):
                     expected.add(expanded_path)
+                    outputs.append(expanded_path)
 
             if expected != storage.generated_paths:
                 logging.fatal("expected and generated files do not match.")
@@ -165,6 +200,10 @@ def main(log_level, generator, option, output_dir, dry_run, name_only, expected_
 
                 sys.exit(1)
 
+    if depfile:
+        write_depfile(depfile, [os.path.join(output_dir, path) for path in outputs],
+                      [idl_path] + generator.source_files())
+
     logging.info("Done")
 
 
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+import click
+
+try:
+    import coloredlogs
+    _has_coloredlogs = True
+except ImportError:
+    _has_coloredlogs = False
+
+from matter.idl.generators.batch import LoadManifest, PrintTimings, RunBatch
+
+# Supported log levels, mapping string values required for argument
+# parsing into logging constants
+__LOG_LEVELS__ = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warn': logging.WARN,
+    'fatal': logging.FATAL,
+}
+
+
+@click.command()
+@click.option(
+    '--log-level',
+    default='INFO',
+    type=click.Choice(__LOG_LEVELS__.keys(), case_sensitive=False),
+    help='Determines the verbosity of script output')
+@click.option(
+    '--parallel/--no-parallel',
+    default=True,
+    help='Generate targets in a pool of worker processes.')
+@click.option(
+    '--parse-cache-dir',
+    type=click.Path(exists=False),
+    default=None,
+    help='A directory where parsed IDL files are cached. Defaults to a temporary directory.')
+@click.option(
+    '--template-cache-dir',
+    type=click.Path(exists=False),
+    default=None,
+    help='A directory where compiled templates are cached (see scripts/codegen_compile_templates.py).')
+@click.argument(
+    'manifest',
+    type=click.Path(exists=True))
+def main(log_level, parallel, parse_cache_dir, template_cache_dir, manifest):
+    """
+    Runs all the code generation targets of a JSON manifest (see
+    `matter.idl.generators.batch.LoadManifest`) within a single pool of
+    workers, rather than one `codegen.py` invocation per target.
+    """
+    if _has_coloredlogs:
+        coloredlogs.install(level=__LOG_LEVELS__[
+                            log_level], fmt='%(asctime)s %(levelname)-7s %(message)s')
+    else:
+        logging.basicConfig(
+            level=__LOG_LEVELS__[log_level],
+            format='%(asctime)s %(levelname)-7s %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+
+    targets = LoadManifest(manifest)
+    logging.info("Generating %d targets from %s" % (len(targets), manifest))
+
+    PrintTimings(RunBatch(targets, parse_cache_dir=parse_cache_dir, parallel=parallel, template_cache_dir=template_cache_dir))
+
+    logging.info("Done")
+
+
+if __name__ == '__main__':
+    main(auto_envvar_prefix='CHIP')
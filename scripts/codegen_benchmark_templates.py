@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import tempfile
+import time
+
+import click
+
+from matter.idl.generators import set_template_cache_dir
+from matter.idl.generators.registry import GENERATORS, compile_templates
+from matter.idl.generators.storage import GeneratorStorage
+from matter.idl.matter_idl_parser import CreateParser
+
+_CHIP_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+_APP_IDL_PATH = os.path.join(_CHIP_ROOT, 'scripts/py_matter_idl/matter/idl/tests/inputs/large_all_clusters_app.matter')
+_CONTROLLER_IDL_PATH = os.path.join(_CHIP_ROOT, 'src/controller/data_model/controller-clusters.matter')
+
+
+class _MemoryStorage(GeneratorStorage):
+    def get_existing_data(self, relative_path: str):
+        return None
+
+    def write_new_data(self, relative_path: str, content: str):
+        pass
+
+
+def _parse(path):
+    with open(path, 'rt') as f:
+        return CreateParser().parse(f.read(), file_name=path)
+
+
+def _time(generator, idl, iterations):
+    best = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        generator.Create(_MemoryStorage(), idl=idl).render()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e3
+
+
+@click.command()
+@click.option(
+    '--iterations',
+    type=int,
+    default=3,
+    show_default=True,
+    help='Number of runs of each generator, the fastest one is reported')
+def main(iterations):
+    """
+    Times every codegen.py generator with templates compiled on every run
+    (no cache) and with templates loaded from a cache filled by
+    compile_templates(), as codegen.py --template-cache-dir does.
+
+    The Java and Kotlin generators run over controller-clusters.matter, the
+    others over all-clusters-app.matter. Each run creates a new generator,
+    like a separate codegen.py invocation; outputs are rendered but not
+    written.
+    """
+    logging.disable(logging.WARNING)
+    appIdl, controllerIdl = _parse(_APP_IDL_PATH), _parse(_CONTROLLER_IDL_PATH)
+    generators = {name: (generator, controllerIdl if name.startswith(('java', 'kotlin')) else appIdl)
+                  for name, generator in GENERATORS.items() if name != 'custom'}
+
+    set_template_cache_dir(None)
+    uncached = {name: _time(generator, idl, iterations) for name, (generator, idl) in generators.items()}
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        count = compile_templates(cache_dir)
+        compile_time = (time.perf_counter() - start) * 1e3
+        cached = {name: _time(generator, idl, iterations) for name, (generator, idl) in generators.items()}
+        set_template_cache_dir(None)
+
+    print(f"compile_templates: {count} templates in {compile_time:.1f} ms")
+    print(f"{'Generator':<24} {'no cache (ms)':>18} {'cached (ms)':>18} {'Speedup':>10}")
+    for name in generators:
+        print(f"{name:<24} {uncached[name]:>18.1f} {cached[name]:>18.1f} {uncached[name] / cached[name]:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
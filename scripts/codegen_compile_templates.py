@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+
+import click
+
+from matter.idl.generators.registry import compile_templates
+
+
+@click.command()
+@click.option(
+    '--cache-dir',
+    type=click.Path(exists=False),
+    required=True,
+    help='The template cache directory, as passed to codegen.py --template-cache-dir')
+@click.option(
+    '--stamp',
+    type=click.Path(exists=False),
+    default=None,
+    help='A file to touch once the templates are compiled (for build systems)')
+def main(cache_dir, stamp):
+    """
+    Compiles all codegen.py templates ahead of time into a template cache
+    directory, so that code generation runs do not compile templates.
+    """
+    logging.basicConfig(
+        level=logging.WARN,
+        format='%(asctime)s %(levelname)-7s %(message)s',
+    )
+
+    count = compile_templates(cache_dir)
+    logging.info("Compiled %d templates into %s" % (count, cache_dir))
+
+    if stamp:
+        os.makedirs(os.path.dirname(os.path.abspath(stamp)), exist_ok=True)
+        with open(stamp, 'wt'):
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -14,11 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import itertools
 import logging
 import multiprocessing
 import os
 import sys
+import tempfile
 
 import click
 
@@ -30,6 +32,7 @@ except ImportError:
 
 from pregenerate.executors import DryRunner, ShellRunner
 from pregenerate.type_definitions import IdlFileType
+from pregenerate.using_codegen import CodegenTarget
 
 try:
     import coloredlogs
@@ -47,6 +50,24 @@ __LOG_LEVELS__ = {
 }
 
 
+def _BatchGenerate(targets, output_dir, parallel, parse_cache_dir):
+    """
+    Runs codegen targets within this process (or a pool of workers) instead
+    of one codegen.py process per target.
+    """
+    from matter.idl.generators.batch import BatchTarget, ParseOptions, PrintTimings, RunBatch
+
+    batch = [
+        BatchTarget(
+            idl_path=target.idl.full_path,
+            generator=target.generator,
+            output_dir=target.OutputDir(output_dir),
+            options=ParseOptions(target.options),
+        ) for target in targets
+    ]
+    PrintTimings(RunBatch(batch, parse_cache_dir=parse_cache_dir, parallel=parallel))
+
+
 def _ParallelGenerateOne(arg):
     """
     Helper method to be passed to multiprocessing parallel generation of
@@ -88,8 +109,17 @@ def _ParallelGenerateOne(arg):
     default=None,
     multiple=True,
     help='Path to an external app root (where .zap/.matter files exist).')
+@click.option(
+    '--batch-codegen/--no-batch-codegen',
+    default=True,
+    help='Run codegen targets in a shared pool of workers instead of one codegen.py process per target.')
+@click.option(
+    '--parse-cache-dir',
+    default=None,
+    help='Directory where parsed .matter files are cached across codegen runs. Defaults to a temporary directory.')
 @click.argument('output_dir')
-def main(log_level, parallel, dry_run, generator, input_glob, sdk_root, external_root, output_dir):
+def main(log_level, parallel, dry_run, generator, input_glob, sdk_root, external_root, batch_codegen, parse_cache_dir,
+         output_dir):
     if _has_coloredlogs:
         coloredlogs.install(level=__LOG_LEVELS__[
                             log_level], fmt='%(asctime)s %(levelname)-7s %(message)s')
@@ -125,17 +155,27 @@ def main(log_level, parallel, dry_run, generator, input_glob, sdk_root, external
     elif generator == 'codegen':
         filter.file_type = IdlFileType.MATTER
 
-    targets = FindPregenerationTargets(sdk_root, external_root, filter, runner)
+    with contextlib.ExitStack() as stack:
+        if not parse_cache_dir:
+            # Still share parse results between the generators of this run
+            parse_cache_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix='idl-parse-cache-'))
 
-    runner.ensure_directory_exists(output_dir)
-    if parallel:
-        target_and_dir = zip(targets, itertools.repeat(output_dir))
-        with multiprocessing.Pool() as pool:
-            for _ in pool.imap_unordered(_ParallelGenerateOne, target_and_dir):
-                pass
-    else:
-        for target in targets:
-            target.Generate(output_dir)
+        targets = list(FindPregenerationTargets(sdk_root, external_root, filter, runner, parse_cache_dir=parse_cache_dir))
+
+        runner.ensure_directory_exists(output_dir)
+
+        if batch_codegen and not dry_run:
+            _BatchGenerate([t for t in targets if isinstance(t, CodegenTarget)], output_dir, parallel, parse_cache_dir)
+            targets = [t for t in targets if not isinstance(t, CodegenTarget)]
+
+        if parallel:
+            target_and_dir = zip(targets, itertools.repeat(output_dir))
+            with multiprocessing.Pool() as pool:
+                for _ in pool.imap_unordered(_ParallelGenerateOne, target_and_dir):
+                    pass
+        else:
+            for target in targets:
+                target.Generate(output_dir)
 
     logging.info("Done")
 
@@ -82,21 +82,25 @@ class GlobMatcher:
         return fnmatch.fnmatch(s, self.pattern)
 
 
-def FindPregenerationTargets(sdk_root: str, external_roots: Optional[List[str]], filter: TargetFilter, runner):
+def FindPregenerationTargets(sdk_root: str, external_roots: Optional[List[str]], filter: TargetFilter, runner,
+                             parse_cache_dir: Optional[str] = None):
     """Finds all relevand pre-generation targets in the given
        SDK root.
 
        Pre-generation targets are based on zap and matter files with options
        on what rules to pregenerate and how.
+
+       If `parse_cache_dir` is set, codegen targets share parsed `.matter`
+       files through it.
     """
 
     generators = [
         # Jinja-based codegen
-        CodegenJavaJNIPregenerator(sdk_root),
-        CodegenJavaClassPregenerator(sdk_root),
-        CodegenCppAppPregenerator(sdk_root),
-        CodegenCppClustersTLVMetaPregenerator(sdk_root),
-        CodegenCppProtocolsTLVMetaPregenerator(sdk_root),
+        CodegenJavaJNIPregenerator(sdk_root, parse_cache_dir),
+        CodegenJavaClassPregenerator(sdk_root, parse_cache_dir),
+        CodegenCppAppPregenerator(sdk_root, parse_cache_dir),
+        CodegenCppClustersTLVMetaPregenerator(sdk_root, parse_cache_dir),
+        CodegenCppProtocolsTLVMetaPregenerator(sdk_root, parse_cache_dir),
 
         # ZAP codegen
         ZapApplicationPregenerator(sdk_root),
@@ -24,22 +24,25 @@ CODEGEN_PY_PATH = os.path.abspath(os.path.join(
 class CodegenTarget:
     """A target that uses `scripts/codegen.py` to generate files."""
 
-    def __init__(self, idl: InputIdlFile, generator: str, sdk_root: str, runner, options=[]):
+    def __init__(self, idl: InputIdlFile, generator: str, sdk_root: str, runner, options=[], parse_cache_dir=None):
         self.idl = idl
         self.generator = generator
         self.sdk_root = sdk_root
         self.runner = runner
         self.options = options
+        self.parse_cache_dir = parse_cache_dir
 
         if idl.file_type != IdlFileType.MATTER:
             raise Exception(
                 f"Can only code generate for `*.matter` input files, not for {idl}")
 
+    def OutputDir(self, output_root: str):
+        return os.path.join(output_root, self.idl.pregen_subdir, self.generator)
+
     def Generate(self, output_root: str):
         '''Runs codegen.py to generate in the specified directory'''
 
-        output_dir = os.path.join(
-            output_root, self.idl.pregen_subdir, self.generator)
+        output_dir = self.OutputDir(output_root)
 
         logging.info(
             f"Generating: {self.generator}:{self.idl.full_path} into {output_dir}")
@@ -54,6 +57,11 @@ class CodegenTarget:
             cmd.append("--option")
             cmd.append(option)
 
+        if self.parse_cache_dir:
+            # Several generators run over the same idl: parse it only once
+            cmd.append("--parse-cache-dir")
+            cmd.append(self.parse_cache_dir)
+
         cmd.append(self.idl.full_path)
 
         logging.debug(f"Executing {cmd}")
@@ -63,22 +71,25 @@ class CodegenTarget:
 class CodegenJavaJNIPregenerator:
     """Pregeneration logic for "java" codegen.py outputs"""
 
-    def __init__(self, sdk_root):
+    def __init__(self, sdk_root, parse_cache_dir=None):
         self.sdk_root = sdk_root
+        self.parse_cache_dir = parse_cache_dir
 
     def Accept(self, idl: InputIdlFile):
         # Java is highly specific, a single path is acceptable for codegen
         return idl.relative_path == "src/controller/data_model/controller-clusters.matter"
 
     def CreateTarget(self, idl: InputIdlFile, runner):
-        return CodegenTarget(sdk_root=self.sdk_root, idl=idl, generator="java-jni", runner=runner)
+        return CodegenTarget(sdk_root=self.sdk_root, idl=idl, generator="java-jni", runner=runner,
+                             parse_cache_dir=self.parse_cache_dir)
 
 
 class CodegenJavaClassPregenerator:
     """Pregeneration logic for "java" codegen.py outputs"""
 
-    def __init__(self, sdk_root):
+    def __init__(self, sdk_root, parse_cache_dir=None):
         self.sdk_root = sdk_root
+        self.parse_cache_dir = parse_cache_dir
 
     def Accept(self, idl: InputIdlFile):
         # Java is highly specific, a single path is acceptable for dynamic
@@ -86,14 +97,16 @@ class CodegenJavaClassPregenerator:
         return idl.relative_path == "src/controller/data_model/controller-clusters.matter"
 
     def CreateTarget(self, idl: InputIdlFile, runner):
-        return CodegenTarget(sdk_root=self.sdk_root, idl=idl, generator="java-class", runner=runner)
+        return CodegenTarget(sdk_root=self.sdk_root, idl=idl, generator="java-class", runner=runner,
+                             parse_cache_dir=self.parse_cache_dir)
 
 
 class CodegenCppAppPregenerator:
     """Pregeneration logic for "cpp-app" codegen.py outputs"""
 
-    def __init__(self, sdk_root):
+    def __init__(self, sdk_root, parse_cache_dir=None):
         self.sdk_root = sdk_root
+        self.parse_cache_dir = parse_cache_dir
 
     def Accept(self, idl: InputIdlFile):
         if idl.file_type != IdlFileType.MATTER:
@@ -109,30 +122,35 @@ class CodegenCppAppPregenerator:
         return True
 
     def CreateTarget(self, idl: InputIdlFile, runner):
-        return CodegenTarget(sdk_root=self.sdk_root, idl=idl, generator="cpp-app", runner=runner)
+        return CodegenTarget(sdk_root=self.sdk_root, idl=idl, generator="cpp-app", runner=runner,
+                             parse_cache_dir=self.parse_cache_dir)
 
 
 class CodegenCppProtocolsTLVMetaPregenerator:
     """Pregeneration logic for "cpp-app" codegen.py outputs"""
 
-    def __init__(self, sdk_root):
+    def __init__(self, sdk_root, parse_cache_dir=None):
         self.sdk_root = sdk_root
+        self.parse_cache_dir = parse_cache_dir
 
     def Accept(self, idl: InputIdlFile):
         return (idl.file_type == IdlFileType.MATTER) and idl.relative_path.endswith('/protocol_messages.matter')
 
     def CreateTarget(self, idl: InputIdlFile, runner):
-        return CodegenTarget(sdk_root=self.sdk_root, idl=idl, generator="cpp-tlvmeta", options=["table_name:protocols_meta"], runner=runner)
+        return CodegenTarget(sdk_root=self.sdk_root, idl=idl, generator="cpp-tlvmeta", options=["table_name:protocols_meta"], runner=runner,
+                             parse_cache_dir=self.parse_cache_dir)
 
 
 class CodegenCppClustersTLVMetaPregenerator:
     """Pregeneration logic for "cpp-app" codegen.py outputs"""
 
-    def __init__(self, sdk_root):
+    def __init__(self, sdk_root, parse_cache_dir=None):
         self.sdk_root = sdk_root
+        self.parse_cache_dir = parse_cache_dir
 
     def Accept(self, idl: InputIdlFile):
         return (idl.file_type == IdlFileType.MATTER) and idl.relative_path.endswith('/controller-clusters.matter')
 
     def CreateTarget(self, idl: InputIdlFile, runner):
-        return CodegenTarget(sdk_root=self.sdk_root, idl=idl, generator="cpp-tlvmeta", options=["table_name:clusters_meta"], runner=runner)
+        return CodegenTarget(sdk_root=self.sdk_root, idl=idl, generator="cpp-tlvmeta", options=["table_name:clusters_meta"], runner=runner,
+                             parse_cache_dir=self.parse_cache_dir)
@@ -12,17 +12,67 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import inspect
 import logging
 import os
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import jinja2
 
 from matter.idl.matter_idl_types import Idl
 
 from .filters import RegisterCommonFilters
+from .incremental import IncrementalGeneration, generator_python_sources, template_files
 from .storage import GeneratorStorage
 
+# Jinja environments reused across generators while `shared_jinja_environments`
+# is active, keyed by generator type and template search path.
+_shared_environments: Optional[Dict[Tuple[type, str], jinja2.Environment]] = None
+
+
+# Cache of compiled templates, see `set_template_cache_dir`
+_bytecode_cache: Optional[jinja2.BytecodeCache] = None
+
+
+def set_template_cache_dir(cache_dir: Optional[str]):
+    """
+    Makes generators created afterwards load compiled templates from (and
+    store them into) `cache_dir`, rather than compiling them on every run.
+
+    Cache entries are keyed by template path and validated against a
+    checksum of the template source and the jinja/python versions, so that
+    a stale entry is never used. The directory may be shared by concurrent
+    processes. `None` disables the cache.
+    """
+    global _bytecode_cache
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        _bytecode_cache = jinja2.FileSystemBytecodeCache(cache_dir)
+    else:
+        _bytecode_cache = None
+
+
+@contextlib.contextmanager
+def shared_jinja_environments():
+    """
+    Makes generators created within this context reuse a single jinja
+    environment per generator type, so that templates are compiled once
+    rather than once per generator.
+
+    Only applies to generators using the default file system loader. Generators
+    must configure their environment the same way for every instance (i.e.
+    filters that do not depend on generator state), which is the case for all
+    built-in generators.
+    """
+    global _shared_environments
+    previous = _shared_environments
+    _shared_environments = {} if previous is None else previous
+    try:
+        yield
+    finally:
+        _shared_environments = previous
+
 
 class CodeGenerator:
     """
@@ -51,19 +101,46 @@ class CodeGenerator:
            fs_loader_searchpath: if a loader is NOT given, this controls the search path
               of a default FileSystemLoader that will be used
         """
+        shared_key = None
         if not loader:
             if not fs_loader_searchpath:
                 fs_loader_searchpath = os.path.dirname(__file__)
+            if _shared_environments is not None:
+                shared_key = (type(self), fs_loader_searchpath)
             loader = jinja2.FileSystemLoader(searchpath=fs_loader_searchpath)
 
         self.storage = storage
         self.idl = idl
-        self.jinja_env = jinja2.Environment(
-            loader=loader, keep_trailing_newline=True)
+        if shared_key is not None and shared_key in _shared_environments:
+            self.jinja_env = _shared_environments[shared_key]
+        else:
+            self.jinja_env = jinja2.Environment(
+                loader=loader, keep_trailing_newline=True, bytecode_cache=_bytecode_cache)
+            if shared_key is not None:
+                _shared_environments[shared_key] = self.jinja_env
         self.dry_run = False
+        self.incremental = None
 
         RegisterCommonFilters(self.jinja_env.filters)
 
+    def enable_incremental(self, state_path: str):
+        """
+        Makes `render` only render outputs whose inputs changed since the
+        previous run that used the same `state_path`.
+
+        See `matter.idl.generators.incremental` for how dependencies of
+        outputs are tracked.
+        """
+        self.incremental = IncrementalGeneration(self, state_path)
+        self.idl = self.incremental.tracker.idl
+
+    def source_files(self) -> List[str]:
+        """Templates and python sources that generated outputs depend on (e.g. for depfiles)."""
+        sources = set(generator_python_sources())
+        sources.add(os.path.abspath(inspect.getsourcefile(type(self))))
+        sources.update(template_files(self.jinja_env) or [])
+        return sorted(sources)
+
     def render(self, dry_run=False):
         """
         Renders  all required files given the idl contained in the code generator.
@@ -76,6 +153,9 @@ class CodeGenerator:
         self.dry_run = dry_run
         self.internal_render_all()
 
+        if self.incremental is not None and not dry_run:
+            self.incremental.save()
+
     def internal_render_all(self):
         """This method is to be implemented by subclasses to run all generation
            as needed.
@@ -104,7 +184,17 @@ class CodeGenerator:
             return
 
         logging.info(f"Template path: {template_path}, CWD: {os.getcwd()}")
-        rendered = self.jinja_env.get_template(template_path).render(vars)
+        if self.incremental is not None:
+            rendered = self.incremental.render(
+                output_file_name, template_path, vars,
+                render=lambda: self.jinja_env.get_template(template_path).render(vars),
+                existing=lambda: self.storage.get_existing_data(output_file_name))
+            if rendered is None:
+                logging.info("File inputs not changed")
+                self.storage.report_output_file(output_file_name)
+                return
+        else:
+            rendered = self.jinja_env.get_template(template_path).render(vars)
 
         # Report regardless if it has changed or not. This is because even if
         # files are unchanged, validation of what the correct output is should
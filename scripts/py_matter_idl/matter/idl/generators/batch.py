@@ -0,0 +1,172 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Runs several code generation targets (idl, generator, output directory,
+options) within a pool of worker processes instead of one `codegen.py`
+process per target.
+
+Every worker keeps its jinja environments (and with them the compiled
+templates) across the targets it runs and all workers share parsed IDL
+files through a parse cache, so that each IDL file is parsed once.
+"""
+
+import contextlib
+import json
+import logging
+import multiprocessing
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from matter.idl.generators import set_template_cache_dir, shared_jinja_environments
+from matter.idl.generators.registry import CodeGenerator
+from matter.idl.generators.storage import FileSystemGeneratorStorage
+from matter.idl.matter_idl_parser import CreateParser
+
+
+@dataclass
+class BatchTarget:
+    idl_path: str
+    generator: str
+    output_dir: str
+    options: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class BatchTargetResult:
+    target: BatchTarget
+    parse_time: float
+    generate_time: float
+    # Paths relative to the target output directory
+    generated_paths: List[str] = field(default_factory=list)
+
+
+def ParseOptions(options: List[str]) -> Dict[str, str]:
+    """
+    Converts `key:value` strings (as given to `codegen.py --option`) into a
+    dictionary of generator arguments.
+    """
+    result = {}
+    for o in options:
+        if ':' not in o:
+            raise ValueError("Please specify options as '<key>:<value>'. %r is not valid." % o)
+        key, value = o.split(':', 1)
+        result[key] = value
+    return result
+
+
+def LoadManifest(path: str) -> List[BatchTarget]:
+    """
+    Loads a JSON manifest of targets, of the form:
+
+        [
+          {
+            "idl": "src/controller/data_model/controller-clusters.matter",
+            "generator": "java-class",
+            "output_dir": "src/controller/java/generated",
+            "options": ["key:value"]
+          },
+          ...
+        ]
+
+    "options" is optional.
+    """
+    with open(path, 'rt') as f:
+        entries = json.load(f)
+
+    return [
+        BatchTarget(
+            idl_path=entry['idl'],
+            generator=entry['generator'],
+            output_dir=entry['output_dir'],
+            options=ParseOptions(entry.get('options', [])),
+        ) for entry in entries
+    ]
+
+
+# Per worker state, set up by `_InitializeWorker`
+_worker_parse_cache_dir: Optional[str] = None
+_worker_stack: Optional[contextlib.ExitStack] = None
+
+
+def _InitializeWorker(parse_cache_dir: Optional[str], template_cache_dir: Optional[str]):
+    global _worker_parse_cache_dir, _worker_stack
+    _worker_parse_cache_dir = parse_cache_dir
+    set_template_cache_dir(template_cache_dir)
+
+    # Kept for the lifetime of the worker
+    _worker_stack = contextlib.ExitStack()
+    _worker_stack.enter_context(shared_jinja_environments())
+
+
+def _GenerateOne(target: BatchTarget) -> BatchTargetResult:
+    logging.info("Generating %s from %s into %s", target.generator, target.idl_path, target.output_dir)
+
+    parse_start = time.time()
+    with open(target.idl_path, 'rt') as f:
+        idl = CreateParser(cache_dir=_worker_parse_cache_dir).parse(f.read(), file_name=target.idl_path)
+
+    generate_start = time.time()
+    storage = FileSystemGeneratorStorage(target.output_dir)
+    CodeGenerator.FromString(target.generator).Create(storage, idl=idl, **target.options).render()
+    generate_end = time.time()
+
+    return BatchTargetResult(
+        target=target,
+        parse_time=generate_start - parse_start,
+        generate_time=generate_end - generate_start,
+        generated_paths=sorted(storage.generated_paths),
+    )
+
+
+def RunBatch(targets: List[BatchTarget], parse_cache_dir: Optional[str] = None, parallel: bool = True,
+             template_cache_dir: Optional[str] = None) -> List[BatchTargetResult]:
+    """
+    Generates all the given targets, returning their results in the order
+    of the targets.
+
+    If `parse_cache_dir` is not given, a temporary cache is used for the run.
+    If `template_cache_dir` is given, compiled templates are also shared
+    between workers and runs through it.
+    """
+    with contextlib.ExitStack() as stack:
+        if not parse_cache_dir:
+            parse_cache_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix='idl-parse-cache-'))
+
+        if not parallel:
+            _InitializeWorker(parse_cache_dir, template_cache_dir)
+            try:
+                return [_GenerateOne(target) for target in targets]
+            finally:
+                _worker_stack.close()
+
+        with multiprocessing.Pool(initializer=_InitializeWorker, initargs=(parse_cache_dir, template_cache_dir)) as pool:
+            return pool.map(_GenerateOne, targets, chunksize=1)
+
+
+def PrintTimings(results: List[BatchTargetResult]):
+    """
+    Prints a table of per-target timings, slowest last.
+    """
+    print(" Time (s) | Parse (s) | {:^30} | {:^50}".format("Generator", "IDL"))
+    for result in sorted(results, key=lambda r: r.parse_time + r.generate_time):
+        idl_path = result.target.idl_path
+        print(" %8.2f | %9.2f | %30s | %50s" % (
+            result.parse_time + result.generate_time,
+            result.parse_time,
+            result.target.generator,
+            ".." + idl_path[len(idl_path) - 48:] if len(idl_path) > 50 else idl_path,
+        ))
@@ -0,0 +1,479 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Incremental code generation: outputs are only rendered again if the parts
+of the IDL they depend on changed since the previous run.
+
+While an output is rendered, every top level AST node it reads is recorded as
+a dependency of that output. Top level nodes are the clusters, endpoints and
+global bitmaps/enums/structs; reading any part of a node (e.g. a field of a
+struct of a cluster) depends on the whole node. Iterating over a list of the
+`Idl` (e.g. `idl.clusters`) depends on the whole list. Reads are recorded:
+  - from templates, by tracking jinja attribute and item access
+  - from python code (filters, lookup contexts), by tracking the use of the
+    `Idl` lists and of the AST nodes passed in the template variables
+
+Together with a hash of every dependency, the state file stores a hash of
+the template variables (with AST nodes replaced by references, so that data
+derived from the IDL by the generator is compared by value) and of the
+rendered content. On the next run, an output is not rendered if its
+variables and dependencies are unchanged and the existing output still has
+the content rendered previously.
+
+The state is only valid for the same generator code and templates: any
+change to those invalidates it.
+"""
+
+import contextlib
+import dataclasses
+import enum
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import jinja2
+
+from matter.idl.matter_idl_types import Idl
+
+# Increase on incompatible changes of the state file or dependency tracking
+STATE_FORMAT_VERSION = 1
+
+# Lists of the Idl containing top level AST nodes
+_IDL_NODE_LISTS = ['clusters', 'endpoints', 'global_bitmaps', 'global_enums', 'global_structs']
+
+# Tracker of the output being rendered, if any
+_active_tracker: Optional['DependencyTracker'] = None
+
+
+def _sha256(data: str) -> str:
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class _Fingerprint:
+    """
+    Computes a hash of a value by walking through its content.
+
+    Objects found in `refs` (AST nodes) are hashed by reference rather than by
+    content and reported to `on_ref`.
+    """
+
+    def __init__(self, refs: Dict[int, str], on_ref: Callable[[str], None]):
+        self.refs = refs
+        self.on_ref = on_ref
+        self.hash = hashlib.sha256()
+        self.active: Set[int] = set()
+
+    def add(self, value):
+        h = self.hash
+
+        if value is None or isinstance(value, (bool, int, float, str, bytes)):
+            h.update(f"{type(value).__name__}:{value!r};".encode())
+            return
+
+        if isinstance(value, enum.Enum):
+            h.update(f"{type(value).__qualname__}:{value.value!r};".encode())
+            return
+
+        ref = self.refs.get(id(value))
+        if ref is not None:
+            self.on_ref(ref)
+            h.update(f"ref:{ref};".encode())
+            return
+
+        if id(value) in self.active:
+            h.update(b"cycle;")
+            return
+
+        self.active.add(id(value))
+        try:
+            h.update(f"{type(value).__module__}.{type(value).__qualname__}(".encode())
+            if dataclasses.is_dataclass(value) and not isinstance(value, type):
+                for f in dataclasses.fields(value):
+                    # Fields not part of the value, like parse metadata, do
+                    # not change generated content
+                    if f.compare:
+                        h.update(f"{f.name}=".encode())
+                        self.add(getattr(value, f.name))
+            elif isinstance(value, dict):
+                for k in sorted(value, key=repr):
+                    self.add(k)
+                    self.add(value[k])
+            elif isinstance(value, (list, tuple)):
+                for item in value:
+                    self.add(item)
+            elif isinstance(value, (set, frozenset)):
+                for item in sorted(value, key=repr):
+                    self.add(item)
+            elif inspect.isroutine(value) or isinstance(value, type):
+                h.update(f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', '')}".encode())
+            elif hasattr(value, '__dict__'):
+                self.add(vars(value))
+            else:
+                h.update(repr(value).encode())
+            h.update(b");")
+        finally:
+            self.active.discard(id(value))
+
+    def hexdigest(self) -> str:
+        return self.hash.hexdigest()
+
+
+def _node_key(list_name: str, node, used: Set[str]) -> str:
+    name = getattr(node, 'name', None)
+    if name is None:
+        name = getattr(node, 'number', None)
+
+    key = f"{list_name}/{name}"
+    suffix = 1
+    while key in used:
+        suffix += 1
+        key = f"{list_name}/{name}#{suffix}"
+    used.add(key)
+    return key
+
+
+def _nested_objects(node) -> Iterable:
+    """All AST objects (dataclasses) contained in a node, including itself."""
+    pending = [node]
+    while pending:
+        value = pending.pop()
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            yield value
+            pending.extend(getattr(value, f.name) for f in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+
+
+class _RecordingList(list):
+    """A list of the `Idl` that records its use as a dependency."""
+
+    def __init__(self, items, key: str, tracker: 'DependencyTracker'):
+        super().__init__(items)
+        self._key = key
+        self._tracker = tracker
+
+    def _record(self):
+        self._tracker.record(self._key)
+
+    def __iter__(self):
+        self._record()
+        return super().__iter__()
+
+    def __reversed__(self):
+        self._record()
+        return super().__reversed__()
+
+    def __len__(self):
+        self._record()
+        return super().__len__()
+
+    def __getitem__(self, index):
+        self._record()
+        return super().__getitem__(index)
+
+    def __contains__(self, item):
+        self._record()
+        return super().__contains__(item)
+
+    def __eq__(self, other):
+        self._record()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        self._record()
+        return super().__ne__(other)
+
+    def __add__(self, other):
+        self._record()
+        return list(super().__iter__()) + other
+
+    def __radd__(self, other):
+        self._record()
+        return other + list(super().__iter__())
+
+    def __mul__(self, count):
+        self._record()
+        return list(super().__iter__()) * count
+
+    def copy(self):
+        self._record()
+        return list(super().__iter__())
+
+    def index(self, *args):
+        self._record()
+        return super().index(*args)
+
+    def count(self, item):
+        self._record()
+        return super().count(item)
+
+    def __reduce_ex__(self, protocol):
+        # Copies (e.g. pickles) are plain lists
+        return (list, (list(super().__iter__()),))
+
+
+class DependencyTracker:
+    """
+    Tracks which top level nodes of an `Idl` are read.
+
+    `idl` is a copy of the given IDL to be used for generation: it shares all
+    the AST nodes of the original, with lists that record their use.
+    """
+
+    def __init__(self, idl: Idl):
+        self.idl = dataclasses.replace(idl, **{
+            name: _RecordingList(getattr(idl, name), f"idl.{name}", self) for name in _IDL_NODE_LISTS
+        })
+
+        # Hash of every possible dependency
+        self.hashes: Dict[str, str] = {}
+
+        # Object id to the dependency it belongs to
+        self.refs: Dict[int, str] = {id(self.idl): 'idl'}
+
+        for name in _IDL_NODE_LISTS:
+            nodes = getattr(idl, name)
+            self.refs[id(getattr(self.idl, name))] = f"idl.{name}"
+
+            used: Set[str] = set()
+            keys = []
+            for node in nodes:
+                key = _node_key(name, node, used)
+                keys.append(key)
+                for value in _nested_objects(node):
+                    self.refs.setdefault(id(value), key)
+
+                fingerprint = _Fingerprint({}, lambda ref: None)
+                fingerprint.add(node)
+                self.hashes[key] = fingerprint.hexdigest()
+
+            self.hashes[f"idl.{name}"] = _sha256(";".join(f"{key}={self.hashes[key]}" for key in keys))
+
+        for f in dataclasses.fields(Idl):
+            if f.name not in _IDL_NODE_LISTS:
+                self.hashes[f"idl.{f.name}"] = _sha256(repr(getattr(idl, f.name)))
+
+        # The IDL itself (e.g. passed to python code that is not tracked)
+        # depends on all of it
+        self.hashes['idl'] = _sha256(";".join(f"{key}={value}" for key, value in sorted(self.hashes.items())))
+
+        self._current: Optional[Set[str]] = None
+
+    def record(self, key: str):
+        if self._current is not None:
+            self._current.add(key)
+
+    def record_read(self, obj, attribute):
+        key = self.refs.get(id(obj))
+        if key == 'idl':
+            key = f"idl.{attribute}"
+        if key is not None:
+            self.record(key)
+
+    def fingerprint(self, value, on_ref: Callable[[str], None]) -> str:
+        fingerprint = _Fingerprint(self.refs, on_ref)
+        fingerprint.add(value)
+        return fingerprint.hexdigest()
+
+    @contextlib.contextmanager
+    def recording(self, dependencies: Set[str]):
+        global _active_tracker
+        previous_tracker, previous_current = _active_tracker, self._current
+        _active_tracker, self._current = self, dependencies
+        try:
+            yield
+        finally:
+            _active_tracker, self._current = previous_tracker, previous_current
+
+
+def _install_read_tracking(env: jinja2.Environment):
+    """Makes attribute and item reads of templates of `env` recorded by the active tracker."""
+    if getattr(env, '_matter_idl_read_tracking', False):
+        return
+
+    env_getattr, env_getitem = env.getattr, env.getitem
+
+    def tracking_getattr(obj, attribute):
+        if _active_tracker is not None:
+            _active_tracker.record_read(obj, attribute)
+        return env_getattr(obj, attribute)
+
+    def tracking_getitem(obj, argument):
+        if _active_tracker is not None:
+            _active_tracker.record_read(obj, argument)
+        return env_getitem(obj, argument)
+
+    env.getattr = tracking_getattr
+    env.getitem = tracking_getitem
+    env._matter_idl_read_tracking = True
+
+
+@functools.cache
+def _package_sources_hash() -> str:
+    """Hash of the python sources generated content depends on."""
+    h = hashlib.sha256(f"{STATE_FORMAT_VERSION}:{jinja2.__version__}".encode())
+    for path in generator_python_sources():
+        h.update(path.encode())
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+@functools.cache
+def generator_python_sources() -> List[str]:
+    """Python sources of the IDL types and built-in generators."""
+    idl_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sources = [os.path.join(idl_dir, 'matter_idl_types.py')]
+    for root, dirs, files in os.walk(os.path.join(idl_dir, 'generators')):
+        dirs.sort()
+        sources.extend(os.path.join(root, name) for name in sorted(files) if name.endswith('.py'))
+    return sources
+
+
+def template_files(env: jinja2.Environment) -> Optional[List[str]]:
+    """All template files available to `env`, None if the loader cannot list them."""
+    if not isinstance(env.loader, jinja2.FileSystemLoader):
+        return None
+
+    files = []
+    for name in env.list_templates():
+        _, filename, _ = env.loader.get_source(env, name)
+        files.append(filename)
+    return files
+
+
+class IncrementalGeneration:
+    """
+    Renders the outputs of a generator incrementally, based on the state
+    saved in `state_path` by the previous run.
+    """
+
+    def __init__(self, generator, state_path: str):
+        self.state_path = state_path
+        self.tracker = DependencyTracker(generator.idl)
+        self.outputs: Dict[str, Dict] = {}
+        self.rendered = 0
+        self.skipped = 0
+
+        _install_read_tracking(generator.jinja_env)
+        self.version = self._version(generator)
+        self.previous = self._load()
+
+    def _version(self, generator) -> Optional[str]:
+        templates = template_files(generator.jinja_env)
+        if templates is None:
+            logging.warning("Templates cannot be listed: incremental generation disabled")
+            return None
+
+        h = hashlib.sha256(_package_sources_hash().encode())
+        generator_type = type(generator)
+        h.update(f"{generator_type.__module__}.{generator_type.__qualname__}".encode())
+        for path in [inspect.getsourcefile(generator_type)] + sorted(templates):
+            h.update(path.encode())
+            with open(path, 'rb') as f:
+                h.update(f.read())
+        return h.hexdigest()
+
+    def _load(self) -> Dict[str, Dict]:
+        if self.version is None:
+            return {}
+
+        try:
+            with open(self.state_path, 'rt') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning("Ignoring invalid incremental generation state %s: %s", self.state_path, e)
+            return {}
+
+        if not isinstance(state, dict) or state.get('version') != self.version:
+            logging.info("Generator changed, all outputs will be rendered")
+            return {}
+
+        return state.get('outputs', {})
+
+    def render(self, output_file_name: str, template_path: str, vars: Dict,
+               render: Callable[[], str], existing: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        Renders an output if any of its inputs changed.
+
+        Returns the rendered content or None if the existing output is up to date.
+        """
+        dependencies: Set[str] = set()
+        inputs = self.tracker.fingerprint((template_path, vars), dependencies.add)
+
+        previous = self.previous.get(output_file_name)
+        if (previous is not None and previous.get('inputs') == inputs and
+                all(value is not None and self.tracker.hashes.get(key) == value
+                    for key, value in previous.get('dependencies', {}).items())):
+            content = existing()
+            if content is not None and _sha256(content) == previous.get('content'):
+                self.outputs[output_file_name] = previous
+                self.skipped += 1
+                return None
+
+        with self.tracker.recording(dependencies):
+            rendered = render()
+
+        self.outputs[output_file_name] = {
+            'inputs': inputs,
+            'dependencies': {key: self.tracker.hashes.get(key) for key in sorted(dependencies)},
+            'content': _sha256(rendered),
+        }
+        self.rendered += 1
+        return rendered
+
+    def save(self):
+        if self.version is None:
+            return
+
+        logging.info("Incremental generation: %d outputs rendered, %d up to date", self.rendered, self.skipped)
+
+        state_dir = os.path.dirname(os.path.abspath(self.state_path))
+        os.makedirs(state_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=state_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wt') as f:
+                json.dump({'version': self.version, 'outputs': self.outputs}, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.state_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+
+def _escape_depfile_path(path: str) -> str:
+    return path.replace('\\', '\\\\').replace(' ', '\\ ').replace('#', '\\#').replace('$', '$$')
+
+
+def write_depfile(path: str, outputs: List[str], inputs: List[str]):
+    """
+    Writes a makefile style depfile (as consumed by GN/ninja) declaring that
+    `outputs` depend on `inputs`.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wt') as f:
+        f.write(" ".join(_escape_depfile_path(o) for o in outputs))
+        f.write(":")
+        for i in inputs:
+            f.write(" \\\n  ")
+            f.write(_escape_depfile_path(i))
+        f.write("\n")
@@ -14,7 +14,9 @@
 
 import enum
 import importlib
+import logging
 
+from matter.idl.generators import set_template_cache_dir
 from matter.idl.generators.cpp.application import CppApplicationGenerator
 from matter.idl.generators.cpp.sdk import SdkGenerator
 from matter.idl.generators.cpp.tlvmeta import TLVMetaDataGenerator
@@ -22,6 +24,7 @@ from matter.idl.generators.idl import IdlGenerator
 from matter.idl.generators.java import JavaClassGenerator, JavaJNIGenerator
 from matter.idl.generators.kotlin import KotlinClassGenerator
 from matter.idl.generators.markdown import SummaryMarkdownGenerator
+from matter.idl.matter_idl_types import Idl
 
 
 class CodeGenerator(enum.Enum):
@@ -92,3 +95,28 @@ GENERATORS = {
     'summary-markdown': CodeGenerator.SUMMARY_MARKDOWN,
     'custom': CodeGenerator.CUSTOM,
 }
+
+
+def compile_templates(cache_dir: str) -> int:
+    """
+    Compiles the templates of all built-in generators ahead of time into the
+    template cache `cache_dir` (see `set_template_cache_dir`), so that code
+    generation runs using that cache do not compile any template. The cache
+    remains configured for generators created afterwards.
+
+    Returns the number of templates compiled.
+    """
+    set_template_cache_dir(cache_dir)
+
+    compiled = set()
+    for generator in CodeGenerator:
+        if generator == CodeGenerator.CUSTOM:
+            continue
+
+        env = generator.Create(storage=None, idl=Idl()).jinja_env
+        for name in env.list_templates(extensions=['jinja']):
+            template = env.get_template(name)
+            logging.debug("Compiled %s" % template.filename)
+            compiled.add(template.filename)
+
+    return len(compiled)
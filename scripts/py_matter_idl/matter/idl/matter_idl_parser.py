@@ -28,6 +28,7 @@ from matter.idl.matter_idl_types import (AccessPrivilege, ApiMaturity, Attribute
                                          CommandQuality, ConstantEntry, DataType, DeviceType, Endpoint, Enum, Event, EventPriority,
                                          EventQuality, Field, FieldQuality, Idl, ParseMetaData, ServerClusterInstantiation, Struct,
                                          StructQuality, StructTag)
+from matter.idl.parse_cache import ParseCache
 
 
 def UnionOfAllFlags(flags_list):
@@ -645,16 +646,22 @@ def _merge_global_types_into_clusters(idl: Idl) -> Idl:
 
 
 class ParserWithLines:
-    def __init__(self, skip_meta: bool, merge_globals: bool):
+    def __init__(self, skip_meta: bool, merge_globals: bool, cache: Optional[ParseCache] = None):
+        self.skip_meta = skip_meta
         self.transformer = MatterIdlTransformer(skip_meta)
         self.merge_globals = merge_globals
+        self.cache = cache
+        # Created on first use, so that parses served from the cache do not
+        # pay for building the parser tables.
+        self.parser = None
 
+    def _create_lark(self):
         # NOTE: LALR parser is fast. While Earley could parse more ambigous grammars,
         #       earley is much slower:
         #    - 0.39s LALR parsing of all-clusters-app.matter
         #    - 2.26s Earley parsing of the same thing.
         # For this reason, every attempt should be made to make the grammar context free
-        self.parser = Lark.open(
+        return Lark.open(
             'matter_grammar.lark', rel_to=__file__, start='idl', parser='lalr', propagate_positions=True,
             maybe_placeholders=True,
             # separate callbacks to ignore from regular parsing (no tokens)
@@ -665,8 +672,19 @@ class ParserWithLines:
         )
 
     def parse(self, file: str, file_name: Optional[str] = None):
-        idl = self.transformer.transform(self.parser.parse(file))
+        if self.cache is None:
+            idl = self._parse(file)
+        else:
+            idl = self.cache.get_or_parse(file, self.skip_meta, self.merge_globals, lambda: self._parse(file))
+
         idl.parse_file_name = file_name
+        return idl
+
+    def _parse(self, file: str):
+        if self.parser is None:
+            self.parser = self._create_lark()
+
+        idl = self.transformer.transform(self.parser.parse(file))
 
         # ZAP may generate the same definition of clusters several times.
         # Validate that if a cluster is defined, its definition is IDENTICAL
@@ -699,7 +717,7 @@ class ParserWithLines:
         return idl
 
 
-def CreateParser(skip_meta: bool = False, merge_globals=True):
+def CreateParser(skip_meta: bool = False, merge_globals=True, cache_dir: Optional[str] = None):
     """
     Generates a parser that will process a ".matter" file into a IDL
 
@@ -713,8 +731,13 @@ def CreateParser(skip_meta: bool = False, merge_globals=True):
                        are self-sufficient. Useful as a backwards-compatible
                        code generation if global definitions are not supported.
 
+       cache_dir - if set, parse results are cached in this directory and
+                   reused for identical input, see `matter.idl.parse_cache`.
+                   The directory may be shared by concurrent processes.
+
     """
-    return ParserWithLines(skip_meta, merge_globals)
+    cache = ParseCache(cache_dir) if cache_dir else None
+    return ParserWithLines(skip_meta, merge_globals, cache)
 
 
 # Supported log levels, mapping string values required for argument
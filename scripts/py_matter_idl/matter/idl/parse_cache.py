@@ -0,0 +1,164 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk cache of parsed ".matter" files.
+
+Parsing a large ".matter" file (e.g. all-clusters-app.matter) takes a
+significant fraction of a code generation run and every generator run over
+the same file would parse it again. This cache stores the resulting `Idl`
+as a pickle, keyed by:
+  - the content of the ".matter" file
+  - the parser options (skip_meta/merge_globals)
+  - the parser version: content of the grammar and of the parser and type
+    definition sources, so that any change in them invalidates the cache
+
+Entries are written atomically and creating an entry is serialized across
+processes (where file locking is available), so several code generation
+processes sharing a cache directory parse each file only once.
+"""
+
+import contextlib
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from typing import Callable, Optional
+
+from matter.idl.matter_idl_types import Idl
+
+try:
+    import fcntl
+    _has_fcntl = True
+except ImportError:
+    _has_fcntl = False
+
+# Increase when the cache layout changes in a way not covered by the
+# parser sources.
+CACHE_FORMAT_VERSION = 1
+
+# Sources that determine the parse result
+_PARSER_SOURCES = [
+    'matter_grammar.lark',
+    'matter_idl_parser.py',
+    'matter_idl_types.py',
+]
+
+
+@functools.cache
+def parser_version() -> str:
+    """
+    Returns a hash identifying the grammar and transformer in use.
+    """
+    h = hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{sys.version_info[:2]}".encode())
+    for name in _PARSER_SOURCES:
+        with open(os.path.join(os.path.dirname(__file__), name), 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+class ParseCache:
+    """
+    A directory of parsed IDLs, that may be shared by several processes.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, content: str, skip_meta: bool, merge_globals: bool) -> str:
+        h = hashlib.sha256(parser_version().encode())
+        h.update(f":{skip_meta}:{merge_globals}:".encode())
+        h.update(content.encode())
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + '.pickle')
+
+    def load(self, key: str) -> Optional[Idl]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                idl = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # A corrupt entry is the same as a missing one: it gets replaced.
+            logging.warning("Ignoring invalid IDL parse cache entry %s: %s", self._path(key), e)
+            return None
+
+        if not isinstance(idl, Idl):
+            logging.warning("Ignoring invalid IDL parse cache entry %s", self._path(key))
+            return None
+
+        return idl
+
+    def store(self, key: str, idl: Idl):
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Write to a temporary file and rename, so that readers never see
+        # a partially written entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=key, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(idl, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    @contextlib.contextmanager
+    def _locked(self, key: str):
+        if not _has_fcntl:
+            yield
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(os.path.join(self.cache_dir, key + '.lock'), 'wb') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def get_or_parse(self, content: str, skip_meta: bool, merge_globals: bool, parse: Callable[[], Idl]) -> Idl:
+        """
+        Returns the cached IDL for the given content, calling `parse` and
+        caching its result if there is none.
+        """
+        return self.get_or_create(self.key(content, skip_meta, merge_globals), parse)
+
+    def get_or_create(self, key: str, create: Callable[[], Idl]) -> Idl:
+        """
+        Returns the cached IDL for the given key, calling `create` and
+        caching its result if there is none.
+        """
+        idl = self.load(key)
+        if idl is None:
+            # Another process may be parsing the same content: wait for it
+            # rather than parsing again.
+            with self._locked(key):
+                idl = self.load(key)
+                if idl is None:
+                    self.misses += 1
+                    idl = create()
+                    self.store(key, idl)
+                    return idl
+
+        self.hits += 1
+        return idl
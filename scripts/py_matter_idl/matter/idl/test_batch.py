@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from matter.idl.generators.batch import BatchTarget, LoadManifest, RunBatch
+except ModuleNotFoundError:
+    sys.path.append(str(Path(__file__).resolve().parent / ".." / ".."))
+    from matter.idl.generators.batch import BatchTarget, LoadManifest, RunBatch
+
+from matter.idl.generators import shared_jinja_environments
+from matter.idl.generators.idl import IdlGenerator
+from matter.idl.generators.registry import CodeGenerator
+from matter.idl.generators.storage import FileSystemGeneratorStorage
+from matter.idl.matter_idl_parser import CreateParser
+
+TESTS_DIR = os.path.join(os.path.dirname(__file__), "tests", "inputs")
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_dir.cleanup)
+
+    def test_load_manifest(self):
+        manifest = os.path.join(self.output_dir.name, "manifest.json")
+        with open(manifest, "wt") as f:
+            json.dump([
+                {"idl": "a.matter", "generator": "java-jni", "output_dir": "out/java"},
+                {"idl": "a.matter", "generator": "cpp-tlvmeta", "output_dir": "out/tlv", "options": ["table_name:meta"]},
+            ], f)
+
+        self.assertEqual(LoadManifest(manifest), [
+            BatchTarget(idl_path="a.matter", generator="java-jni", output_dir="out/java"),
+            BatchTarget(idl_path="a.matter", generator="cpp-tlvmeta", output_dir="out/tlv", options={"table_name": "meta"}),
+        ])
+
+    def test_shared_environments(self):
+        idl = CreateParser().parse("")
+
+        with shared_jinja_environments():
+            first = IdlGenerator(storage=None, idl=idl)
+            second = IdlGenerator(storage=None, idl=idl)
+            self.assertIs(first.jinja_env, second.jinja_env)
+
+        self.assertIsNot(IdlGenerator(storage=None, idl=idl).jinja_env, first.jinja_env)
+
+    def test_run_batch(self):
+        idl_path = os.path.join(TESTS_DIR, "several_clusters.matter")
+        targets = [
+            BatchTarget(idl_path=idl_path, generator=generator, output_dir=os.path.join(self.output_dir.name, generator))
+            for generator in ["idl", "java-class", "cpp-sdk"]
+        ]
+
+        results = RunBatch(targets, parallel=False)
+        self.assertEqual([r.target for r in results], targets)
+
+        # Same output as individual generation
+        for result in results:
+            self.assertTrue(result.generated_paths)
+
+            expected_dir = os.path.join(self.output_dir.name, "expected", result.target.generator)
+            idl = CreateParser().parse(open(idl_path, "rt").read(), file_name=idl_path)
+            CodeGenerator.FromString(result.target.generator).Create(FileSystemGeneratorStorage(expected_dir), idl=idl).render()
+
+            for path in result.generated_paths:
+                with open(os.path.join(expected_dir, path), "rt") as expected:
+                    with open(os.path.join(result.target.output_dir, path), "rt") as actual:
+                        self.assertEqual(actual.read(), expected.read(), path)
+
+
+if __name__ == '__main__':
+    unittest.main()
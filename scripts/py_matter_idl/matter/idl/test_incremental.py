@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from matter.idl.generators.registry import CodeGenerator
+except ModuleNotFoundError:
+    sys.path.append(str(Path(__file__).resolve().parent / ".." / ".."))
+    from matter.idl.generators.registry import CodeGenerator
+
+from matter.idl.generators.incremental import write_depfile
+from matter.idl.generators.storage import GeneratorStorage
+from matter.idl.matter_idl_parser import CreateParser
+
+TESTS_DIR = os.path.join(os.path.dirname(__file__), "tests", "inputs")
+
+
+class GeneratorContentStorage(GeneratorStorage):
+    def __init__(self, content):
+        super().__init__()
+        self.content = content
+        self.written = set()
+
+    def get_existing_data(self, relative_path: str):
+        return self.content.get(relative_path)
+
+    def write_new_data(self, relative_path: str, content: str):
+        self.content[relative_path] = content
+        self.written.add(relative_path)
+
+
+class TestIncremental(unittest.TestCase):
+
+    def setUp(self):
+        self.state_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.state_dir.cleanup)
+        self.state_path = os.path.join(self.state_dir.name, "state.json")
+
+        with open(os.path.join(TESTS_DIR, "several_clusters.matter"), "rt") as f:
+            self.idl_text = f.read()
+
+        self.content = {}
+
+    def _render(self, generator: str, idl_text: str, incremental=True):
+        storage = GeneratorContentStorage(self.content)
+        codegen = CodeGenerator.FromString(generator).Create(storage, idl=CreateParser().parse(idl_text))
+        if incremental:
+            codegen.enable_incremental(self.state_path)
+        codegen.render()
+        return codegen, storage
+
+    def test_changed_cluster(self):
+        codegen, storage = self._render("cpp-sdk", self.idl_text)
+        self.assertEqual(codegen.incremental.skipped, 0)
+        all_outputs = set(storage.generated_paths)
+
+        codegen, storage = self._render("cpp-sdk", self.idl_text)
+        self.assertEqual(codegen.incremental.rendered, 0)
+        self.assertEqual(storage.generated_paths, all_outputs)
+        self.assertEqual(storage.written, set())
+
+        changed_text = self.idl_text.replace("someEnum = 10", "someEnum = 11")
+        codegen, storage = self._render("cpp-sdk", changed_text)
+        self.assertEqual(storage.generated_paths, all_outputs)
+
+        # Only outputs of the changed cluster are rendered again
+        self.assertGreater(codegen.incremental.rendered, 0)
+        self.assertGreater(codegen.incremental.skipped, 0)
+        self.assertTrue(storage.written)
+        for path in storage.written:
+            self.assertTrue(path.startswith("Third/"), path)
+
+        incremental_content = dict(self.content)
+        self.content = {}
+        self._render("cpp-sdk", changed_text, incremental=False)
+        self.assertEqual(incremental_content, self.content)
+
+    def test_changed_output(self):
+        self._render("java-class", self.idl_text)
+
+        # Outputs changed since the previous run are rendered again
+        path = sorted(self.content)[0]
+        expected = self.content[path]
+        self.content[path] = "modified"
+
+        codegen, storage = self._render("java-class", self.idl_text)
+        self.assertEqual(codegen.incremental.rendered, 1)
+        self.assertEqual(storage.written, {path})
+        self.assertEqual(self.content[path], expected)
+
+    def test_invalid_state(self):
+        with open(self.state_path, "wt") as f:
+            f.write("not json")
+
+        codegen, _ = self._render("idl", self.idl_text)
+        self.assertEqual(codegen.incremental.rendered, 1)
+
+        codegen, _ = self._render("idl", self.idl_text)
+        self.assertEqual(codegen.incremental.skipped, 1)
+
+    def test_whole_idl_dependency(self):
+        self._render("idl", self.idl_text)
+
+        # An output only depending on the whole IDL is rendered again on any change
+        with open(self.state_path, "rt") as f:
+            state = json.load(f)
+        for output in state["outputs"].values():
+            self.assertIsNotNone(output["dependencies"]["idl"])
+            output["dependencies"] = {"idl": output["dependencies"]["idl"]}
+        with open(self.state_path, "wt") as f:
+            json.dump(state, f)
+
+        codegen, _ = self._render("idl", self.idl_text)
+        self.assertEqual(codegen.incremental.skipped, 1)
+
+        codegen, _ = self._render("idl", self.idl_text.replace("someEnum = 10", "someEnum = 11"))
+        self.assertEqual(codegen.incremental.rendered, 1)
+
+    def test_depfile(self):
+        depfile = os.path.join(self.state_dir.name, "out.d")
+        write_depfile(depfile, ["gen/a.h", "gen/with space.h"], ["input.matter", "templates/$a.jinja"])
+
+        with open(depfile, "rt") as f:
+            self.assertEqual(f.read(), "gen/a.h gen/with\\ space.h: \\\n  input.matter \\\n  templates/$$a.jinja\n")
+
+        codegen, _ = self._render("cpp-sdk", self.idl_text)
+        sources = codegen.source_files()
+        self.assertIn(os.path.abspath(os.path.join(os.path.dirname(__file__), "matter_idl_types.py")), sources)
+        self.assertTrue(any(source.endswith(".jinja") for source in sources))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from matter.idl.matter_idl_parser import CreateParser
+except ModuleNotFoundError:
+    sys.path.append(str(Path(__file__).resolve().parent / ".." / ".."))
+    from matter.idl.matter_idl_parser import CreateParser
+
+from matter.idl.parse_cache import ParseCache
+
+TESTS_DIR = os.path.join(os.path.dirname(__file__), "tests", "inputs")
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(TESTS_DIR, name), "rt") as f:
+        return f.read()
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+
+    def test_cached_parse_matches(self):
+        content = _read("large_lighting_app.matter")
+        expected = CreateParser().parse(content, file_name="lighting.matter")
+
+        first = CreateParser(cache_dir=self.cache_dir.name)
+        self.assertEqual(first.parse(content, file_name="lighting.matter"), expected)
+        self.assertEqual((first.cache.hits, first.cache.misses), (0, 1))
+
+        # A new parser (e.g. another process) does not parse again
+        second = CreateParser(cache_dir=self.cache_dir.name)
+        idl = second.parse(content, file_name="other.matter")
+        self.assertIsNone(second.parser)
+        self.assertEqual((second.cache.hits, second.cache.misses), (1, 0))
+        self.assertEqual(idl.parse_file_name, "other.matter")
+        self.assertEqual(dataclasses.replace(idl, parse_file_name="lighting.matter"), expected)
+
+    def test_key(self):
+        cache = ParseCache(self.cache_dir.name)
+        content = _read("simple_attribute.matter")
+
+        self.assertEqual(cache.key(content, False, True), cache.key(content, False, True))
+        self.assertNotEqual(cache.key(content, False, True), cache.key(content + "\n", False, True))
+        self.assertNotEqual(cache.key(content, False, True), cache.key(content, True, True))
+        self.assertNotEqual(cache.key(content, False, True), cache.key(content, False, False))
+
+        # Parser options are part of the key
+        CreateParser(cache_dir=self.cache_dir.name).parse(content)
+        parser = CreateParser(skip_meta=True, cache_dir=self.cache_dir.name)
+        parser.parse(content)
+        self.assertEqual(parser.cache.misses, 1)
+
+    def test_invalid_entry(self):
+        content = _read("several_clusters.matter")
+        parser = CreateParser(cache_dir=self.cache_dir.name)
+        expected = parser.parse(content)
+
+        key = parser.cache.key(content, False, True)
+        with open(os.path.join(self.cache_dir.name, key + ".pickle"), "wb") as f:
+            f.write(b"not a pickle")
+
+        parser = CreateParser(cache_dir=self.cache_dir.name)
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(parser.parse(content), expected)
+        self.assertEqual(parser.cache.misses, 1)
+
+        # The entry was replaced
+        self.assertEqual(ParseCache(self.cache_dir.name).load(key), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
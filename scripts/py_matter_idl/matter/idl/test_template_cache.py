@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+try:
+    from matter.idl.generators.registry import CodeGenerator, compile_templates
+except ModuleNotFoundError:
+    sys.path.append(str(Path(__file__).resolve().parent / ".." / ".."))
+    from matter.idl.generators.registry import CodeGenerator, compile_templates
+
+import jinja2
+
+from matter.idl.generators import set_template_cache_dir
+from matter.idl.generators.storage import GeneratorStorage
+from matter.idl.matter_idl_parser import CreateParser
+
+TESTS_DIR = os.path.join(os.path.dirname(__file__), "tests", "inputs")
+
+
+class GeneratorContentStorage(GeneratorStorage):
+    def __init__(self):
+        super().__init__()
+        self.content = {}
+
+    def get_existing_data(self, relative_path: str):
+        return None
+
+    def write_new_data(self, relative_path: str, content: str):
+        self.content[relative_path] = content
+
+
+def _render(generator: str):
+    with open(os.path.join(TESTS_DIR, "several_clusters.matter"), "rt") as f:
+        idl = CreateParser().parse(f.read())
+
+    storage = GeneratorContentStorage()
+    CodeGenerator.FromString(generator).Create(storage, idl=idl).render()
+    return storage.content
+
+
+class TestTemplateCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.addCleanup(set_template_cache_dir, None)
+
+    def test_compile_templates(self):
+        expected = {generator: _render(generator) for generator in ["cpp-sdk", "idl", "java-class"]}
+
+        count = compile_templates(self.cache_dir.name)
+        self.assertGreater(count, 0)
+        self.assertEqual(len(os.listdir(self.cache_dir.name)), count)
+
+        # Rendering only uses the compiled templates, with the same output
+        with mock.patch.object(jinja2.Environment, "compile", side_effect=AssertionError("template compiled")):
+            for generator, content in expected.items():
+                self.assertEqual(_render(generator), content)
+
+    def test_changed_template(self):
+        # Entries are validated against the template source
+        templates_dir = os.path.join(self.cache_dir.name, "templates")
+        os.makedirs(templates_dir)
+        template_path = os.path.join(templates_dir, "test.jinja")
+
+        set_template_cache_dir(os.path.join(self.cache_dir.name, "cache"))
+        for source in ["first", "other"]:
+            with open(template_path, "wt") as f:
+                f.write(source)
+            # Same size and mtime as the previous content
+            os.utime(template_path, (0, 0))
+
+            storage = GeneratorContentStorage()
+            generator = CodeGenerator.IDL.Create(storage, idl=CreateParser().parse(""))
+            generator.jinja_env.loader = jinja2.FileSystemLoader(templates_dir)
+            self.assertEqual(generator.jinja_env.get_template("test.jinja").render(), source)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,10 +14,13 @@
 # limitations under the License.
 
 import io
+import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 from typing import List, Union
+from unittest import mock
 
 try:
     from matter.idl.zapxml import ParseSource, ParseXmls
@@ -30,7 +33,7 @@ from matter.idl.matter_idl_types import (AccessPrivilege, Attribute, AttributeQu
                                          StructQuality, StructTag)
 
 
-def XmlToIdl(what: Union[str, List[str]]) -> Idl:
+def XmlToIdl(what: Union[str, List[str]], **kwargs) -> Idl:
     if not isinstance(what, list):
         what = [what]
 
@@ -39,7 +42,50 @@ def XmlToIdl(what: Union[str, List[str]]) -> Idl:
         sources.append(ParseSource(source=io.StringIO(
             txt), name=("Input %d" % (idx + 1))))
 
-    return ParseXmls(sources, include_meta_data=False)
+    kwargs.setdefault('include_meta_data', False)
+    return ParseXmls(sources, **kwargs)
+
+
+# Definitions depending on each other across files
+_MULTIPLE_FILES = [
+    '''<?xml version="1.0"?>
+        <configurator>
+          <global>
+            <attribute side="server" code="0xFFFD" type="INT16U">ClusterRevision</attribute>
+          </global>
+        </configurator>
+    ''',
+    '''<?xml version="1.0"?>
+        <configurator>
+          <cluster>
+            <name>First</name>
+            <code>10</code>
+            <globalAttribute side="server" code="0xFFFD" value="2"/>
+          </cluster>
+          <unknownTag />
+          <enum name="SharedEnum" type="ENUM8">
+            <cluster code="10" />
+            <cluster code="20" />
+            <item value="1" name="One" />
+          </enum>
+        </configurator>
+    ''',
+    '''<?xml version="1.0"?>
+        <configurator>
+          <clusterExtension code="10">
+            <attribute side="server" code="5" type="INT8U">extended</attribute>
+          </clusterExtension>
+          <cluster>
+            <name>Second</name>
+            <code>20</code>
+          </cluster>
+          <unknownTag />
+          <bitmap name="GlobalBitmap" type="BITMAP8">
+            <field name="first" mask="0x1" />
+          </bitmap>
+        </configurator>
+    ''',
+]
 
 
 class TestXmlParser(unittest.TestCase):
@@ -485,6 +531,36 @@ Some copyright here... testing that we skip over comments
                                              readacl=AccessPrivilege.VIEW,
                                              writeacl=AccessPrivilege.OPERATE)]), ]))
 
+    def testParallelParsing(self):
+        with self.assertLogs(level='WARNING') as logs:
+            expected = XmlToIdl(_MULTIPLE_FILES, include_meta_data=True)
+        self.assertEqual([c.name for c in expected.clusters], ['First', 'Second'])
+        self.assertEqual(len(expected.clusters[0].attributes), 2)
+
+        with mock.patch('matter.idl.zapxml._MIN_PARALLEL_SOURCES', 1), mock.patch('os.cpu_count', return_value=2):
+            with self.assertLogs(level='WARNING') as parallel_logs:
+                idl = XmlToIdl(_MULTIPLE_FILES, include_meta_data=True, parallel=True)
+
+        self.assertEqual(idl, expected)
+        # Tags not handled are reported once, as when parsing sequentially
+        self.assertEqual(len(logs.output), 1)
+        self.assertEqual(parallel_logs.output, logs.output)
+        self.assertEqual([c.parse_meta for c in idl.clusters], [c.parse_meta for c in expected.clusters])
+
+    def testParseCache(self):
+        expected = XmlToIdl(_MULTIPLE_FILES)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.assertEqual(XmlToIdl(_MULTIPLE_FILES, cache_dir=cache_dir), expected)
+            self.assertEqual(len([name for name in os.listdir(cache_dir) if name.endswith('.pickle')]), 1)
+
+            # Cached results are used for the same inputs only
+            with mock.patch('matter.idl.zapxml._ParseContents', side_effect=AssertionError("parsed")):
+                self.assertEqual(XmlToIdl(_MULTIPLE_FILES, cache_dir=cache_dir), expected)
+
+            changed = _MULTIPLE_FILES[:2] + [_MULTIPLE_FILES[2].replace('Second', 'Other')]
+            self.assertEqual(XmlToIdl(changed, cache_dir=cache_dir).clusters[1].name, 'Other')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,17 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import functools
+import hashlib
+import io
+import itertools
 import logging
+import os
+import sys
 import typing
 import xml.sax.handler
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import click
 
 from matter.idl.generators.idl import IdlGenerator
 from matter.idl.generators.storage import InMemoryStorage
 from matter.idl.matter_idl_types import Idl
+from matter.idl.parse_cache import ParseCache
 from matter.idl.zapxml.handlers import Context, ZapXmlHandler
 
 
@@ -56,6 +64,21 @@ class ParseHandler(xml.sax.handler.ContentHandler):
 
         self._context.file_name = filename
 
+    def MergeFragment(self, idl: Idl, context: Context):
+        """Adds the result of parsing files with a separate handler (see `_ParseFragment`).
+
+        Fragments merged in the order of their sources give the same result as
+        parsing all sources with this handler.
+        """
+        self._idl.clusters.extend(idl.clusters)
+        self._idl.global_bitmaps.extend(idl.global_bitmaps)
+        self._idl.global_enums.extend(idl.global_enums)
+        self._idl.global_structs.extend(idl.global_structs)
+        if self._include_meta_data:
+            self._idl.parse_file_name = idl.parse_file_name
+
+        self._context.Merge(context)
+
     def Finish(self) -> Idl:
         self._context.PostProcess(self._idl)
         return self._idl
@@ -106,24 +129,114 @@ class ParseSource:
         return self.source  # assume string
 
 
-def ParseXmls(sources: List[ParseSource], include_meta_data=True) -> Idl:
+# Increase when the cache layout changes in a way not covered by the
+# parser sources.
+CACHE_FORMAT_VERSION = 1
+
+# Parallel parsing is not worth starting worker processes for fewer sources
+_MIN_PARALLEL_SOURCES = 16
+
+
+def _Parse(handler: ParseHandler, source: ParseSource):
+    logging.info('Parsing %s...' % source.source_file_name)
+    handler.PrepareParsing(source.source_file_name)
+
+    parser = xml.sax.make_parser()
+    parser.setContentHandler(handler)
+    parser.parse(source.source)
+
+
+def _ParseFragment(name: str, content: bytes, include_meta_data: bool) -> Tuple[Idl, Context]:
+    """Parses a single XML file, without post processing.
+
+    Returns the partial Idl and the context to be merged with the ones of
+    other files by `ParseHandler.MergeFragment`.
+    """
+    handler = ParseHandler(include_meta_data=include_meta_data)
+    # Logged once merged, rather than once per worker
+    handler._context.log_not_handled = False
+    _Parse(handler, ParseSource(source=io.BytesIO(content), name=name))
+    return handler._idl, handler._context
+
+
+def _ReadSource(source: ParseSource) -> bytes:
+    if isinstance(source.source, str):
+        with open(source.source, 'rb') as f:
+            return f.read()
+
+    content = source.source.read()
+    if isinstance(content, str):
+        content = content.encode()
+    return content
+
+
+@functools.cache
+def _ParserVersion() -> str:
+    """Returns a hash identifying the XML parsing code in use."""
+    idl_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    paths = [os.path.join(idl_dir, 'matter_idl_types.py')]
+    for root, dirs, files in os.walk(os.path.dirname(os.path.abspath(__file__))):
+        dirs.sort()
+        paths.extend(os.path.join(root, name) for name in sorted(files) if name.endswith('.py'))
+
+    h = hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{sys.version_info[:2]}".encode())
+    for path in paths:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def _CacheKey(contents: List[Tuple[str, bytes]], include_meta_data: bool) -> str:
+    h = hashlib.sha256(f"zapxml:{_ParserVersion()}:{include_meta_data}".encode())
+    for name, content in contents:
+        h.update(f":{name}:{hashlib.sha256(content).hexdigest()}".encode())
+    return h.hexdigest()
+
+
+def _ParseContents(contents: List[Tuple[str, bytes]], include_meta_data: bool, parallel: bool) -> Idl:
+    handler = ParseHandler(include_meta_data=include_meta_data)
+
+    if parallel and len(contents) >= _MIN_PARALLEL_SOURCES and (os.cpu_count() or 1) > 1:
+        names = [name for name, _ in contents]
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            # Results are in the order of the sources, so the merge is deterministic
+            fragments = executor.map(_ParseFragment, names, [content for _, content in contents],
+                                     itertools.repeat(include_meta_data), chunksize=4)
+            for fragment_idl, fragment_context in fragments:
+                handler.MergeFragment(fragment_idl, fragment_context)
+    else:
+        for name, content in contents:
+            _Parse(handler, ParseSource(source=io.BytesIO(content), name=name))
+
+    return handler.Finish()
+
+
+def ParseXmls(sources: List[ParseSource], include_meta_data=True, parallel=False, cache_dir: Optional[str] = None) -> Idl:
     """Parse one or more XML inputs and return the resulting Idl data.
 
     Params:
        sources - what to parse
        include_meta_data - if parsing location data should be included in the Idl
+       parallel - parse files in a pool of worker processes (only used for
+                  larger numbers of sources)
+       cache_dir - if set, a directory where parse results are cached, keyed
+                   by the names and content of all sources (see
+                   `matter.idl.parse_cache.ParseCache`)
     """
-    handler = ParseHandler(include_meta_data=include_meta_data)
+    if not parallel and not cache_dir:
+        handler = ParseHandler(include_meta_data=include_meta_data)
+        for source in sources:
+            _Parse(handler, source)
+        return handler.Finish()
 
-    for source in sources:
-        logging.info('Parsing %s...' % source.source_file_name)
-        handler.PrepareParsing(source.source_file_name)
+    contents = [(source.source_file_name, _ReadSource(source)) for source in sources]
 
-        parser = xml.sax.make_parser()
-        parser.setContentHandler(handler)
-        parser.parse(source.source)
+    if not cache_dir:
+        return _ParseContents(contents, include_meta_data, parallel)
 
-    return handler.Finish()
+    return ParseCache(cache_dir).get_or_create(
+        _CacheKey(contents, include_meta_data),
+        lambda: _ParseContents(contents, include_meta_data, parallel))
 
 
 # Supported log levels, mapping string values required for argument
@@ -17,7 +17,7 @@ import enum
 from .context import Context
 
 
-class HandledDepth:
+class HandledDepth(enum.Enum):
     """Defines how deep a XML element has been handled."""
     NOT_HANDLED = enum.auto()  # Unknown/parsed element
     ENTIRE_TREE = enum.auto()  # Entire tree can be ignored
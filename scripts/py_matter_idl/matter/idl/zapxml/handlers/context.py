@@ -82,7 +82,12 @@ class Context:
         self.path = ProcessingPath()
         self.locator = locator
         self.file_name = None
-        self._not_handled = set()
+        # Map of path -> warning of tags not handled
+        self._not_handled = {}
+        # Whether tags not handled are logged, rather than only recorded to be logged by the context merging
+        # this one
+        self.log_not_handled = True
+        self._priority_post_processors = []
         self._idl_post_processors = []
 
         # Map of code -> attribute
@@ -131,17 +136,50 @@ class Context:
             if where:
                 msg = msg + " at " + where
 
+            self._AddNotHandled(path, msg)
+
+    def _AddNotHandled(self, path: str, msg: str):
+        if self.log_not_handled:
             logging.warning(msg)
-            self._not_handled.add(path)
+        self._not_handled[path] = msg
 
     def AddIdlPostProcessor(self, processor: IdlPostProcessor, has_priority: bool = False):
         if has_priority:
-            self._idl_post_processors.insert(0, processor)
+            self._priority_post_processors.insert(0, processor)
         else:
             self._idl_post_processors.append(processor)
 
     def PostProcess(self, idl: Idl):
-        for p in self._idl_post_processors:
+        for p in self._priority_post_processors + self._idl_post_processors:
             p.FinalizeProcessing(idl)
 
+        self._priority_post_processors = []
         self._idl_post_processors = []
+
+    def Merge(self, other: 'Context'):
+        """Merges in the state of a context used to parse other files.
+
+        The result is the same as if the other files had been parsed using
+        this context after the files already parsed with it. Post processors
+        of `other` are moved to this context.
+        """
+        for path, msg in other._not_handled.items():
+            if path not in self._not_handled:
+                self._AddNotHandled(path, msg)
+        self._global_attributes.update(other._global_attributes)
+
+        for p in other._priority_post_processors + other._idl_post_processors:
+            p.context = self
+
+        self._priority_post_processors = other._priority_post_processors + self._priority_post_processors
+        self._idl_post_processors.extend(other._idl_post_processors)
+
+        other._priority_post_processors = []
+        other._idl_post_processors = []
+
+    def __getstate__(self):
+        # The locator of the XML parser in use cannot be pickled and is
+        # meaningless once parsing is done.
+        state = self.__dict__.copy()
+        state['locator'] = None
+        return state
@@ -16,6 +16,7 @@
 import enum
 import glob
 import io
+import os
 from typing import List, Optional
 
 from matter.idl.matter_idl_types import (Attribute, Bitmap, Cluster, Command, Enum, Event, FieldQuality, Struct, StructQuality,
@@ -38,7 +39,7 @@ class _ItemType(enum.Enum):
 
 class SpecDefinitions:
 
-    def __init__(self, sources: List[ParseSource]):
+    def __init__(self, sources: List[ParseSource], cache_directory: Optional[str] = None, parallel: bool = False):
         self.__clusters_by_id: dict[int, Cluster] = {}
         self.__commands_by_id: dict[int, dict[int, Command]] = {}
         self.__responses_by_id: dict[int, dict[int, Struct]] = {}
@@ -55,7 +56,10 @@ class SpecDefinitions:
         self.__enums_by_name: dict[str, dict[str, Enum]] = {}
         self.__structs_by_name: dict[str, dict[str, Struct]] = {}
 
-        idl = ParseXmls(sources)
+        # Parsing all the data model XML files is a significant part of the startup time of
+        # test runners: cache the result if a cache directory is given. Parsing in parallel
+        # forks worker processes, which callers running threads (e.g. the Matter stack) must not do.
+        idl = ParseXmls(sources, parallel=parallel, cache_dir=cache_directory)
 
         for cluster in idl.clusters:
             code: int = cluster.code
@@ -283,7 +287,13 @@ class SpecDefinitions:
         return target | global_target
 
 
-def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: Optional[PseudoClusters] = PseudoClusters([])):
+def get_default_cache_directory() -> str:
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'matter_yamltests', 'definitions')
+
+
+def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: Optional[PseudoClusters] = PseudoClusters([]),
+                             cache_directory: Optional[str] = None, parallel: bool = False):
     filenames = []
     for path in paths:
         if '*' in path or '?' in path:
@@ -300,4 +310,4 @@ def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: Optional[PseudoCluster
             sources = (
                 sources + [ParseSource(source=io.StringIO(definition), name=name)])
 
-    return SpecDefinitions(sources)
+    return SpecDefinitions(sources, cache_directory, parallel)
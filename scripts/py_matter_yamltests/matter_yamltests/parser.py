@@ -1295,6 +1295,16 @@ class YamlTests:
 
         raise StopIteration
 
+    def peek(self) -> Optional[_TestStepWithPlaceholders]:
+        '''Returns the step the next call to next() is built from, without advancing.
+
+        The returned step still holds its placeholders: runtime variables are only substituted
+        once next() creates the TestStep.
+        '''
+        if self._index < self.count:
+            return self._tests[self._index]
+        return None
+
 
 @dataclass
 class TestParserConfig:
@@ -15,6 +15,8 @@
 #    limitations under the License.
 
 import io
+import os
+import tempfile
 import unittest
 
 from matter_yamltests.definitions import Attribute, Bitmap, Command, Enum, Event, ParseSource, SpecDefinitions, Struct
@@ -197,6 +199,14 @@ class TestSpecDefinitions(unittest.TestCase):
         self.assertIsNone(definitions.get_cluster_name(0x4321))
         self.assertEqual(definitions.get_cluster_name(0x1234), 'Test')
 
+    def test_cache_directory(self):
+        with tempfile.TemporaryDirectory() as cache_directory:
+            for _ in range(2):
+                definitions = SpecDefinitions(
+                    [ParseSource(source=io.StringIO(source_cluster), name='source_cluster')], cache_directory)
+                self.assertEqual(definitions.get_cluster_name(0x1234), 'Test')
+            self.assertEqual(len([name for name in os.listdir(cache_directory) if name.endswith('.pickle')]), 1)
+
     def test_command_name(self):
         definitions = SpecDefinitions(
             [ParseSource(source=io.StringIO(source_command), name='source_command')])
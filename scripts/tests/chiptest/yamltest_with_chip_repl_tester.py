@@ -50,8 +50,9 @@ import chip.CertificateAuthority
 import chip.native
 import click
 from chip.ChipStack import ChipStack
+from chip.yaml.pipeline import execute_steps
 from chip.yaml.runner import ReplTestRunner
-from matter_yamltests.definitions import SpecDefinitionsFromPaths
+from matter_yamltests.definitions import SpecDefinitionsFromPaths, get_default_cache_directory
 from matter_yamltests.parser import PostProcessCheckStatus, TestParser, TestParserConfig
 
 _DEFAULT_CHIP_ROOT = os.path.abspath(
@@ -62,18 +63,9 @@ _CLUSTER_XML_DIRECTORY_PATH = os.path.abspath(
 certificateAuthorityManager = None
 
 
-async def execute_test(yaml, runner):
-    # Executing and validating test
-    for test_step in yaml.tests:
-        if not test_step.is_pics_enabled:
-            continue
-        test_action = runner.encode(test_step)
-        if test_action is None:
-            raise Exception(
-                f'Failed to encode test step {test_step.label}')
-
-        response = await runner.execute(test_action)
-        decoded_response = runner.decode(response)
+async def execute_test(yaml, runner, max_inflight=1):
+    # Executing and validating test, independent steps run concurrently when max_inflight > 1
+    async for test_step, decoded_response in execute_steps(yaml.tests, runner, max_inflight):
         post_processing_result = test_step.post_process_response(
             decoded_response)
         if not post_processing_result.is_success():
@@ -109,8 +101,13 @@ def asyncio_executor(f):
     '--pics-file',
     default=None,
     help='Optional PICS file')
+@click.option(
+    '--max-inflight',
+    default=1,
+    type=click.IntRange(min=1),
+    help='Maximum number of independent read and invoke steps executing at once')
 @asyncio_executor
-async def main(setup_code, yaml_path, node_id, pics_file):
+async def main(setup_code, yaml_path, node_id, pics_file, max_inflight):
     # Setting up python environment for running YAML CI tests using python parser.
     with tempfile.NamedTemporaryFile() as chip_stack_storage:
         chip.native.Init()
@@ -144,7 +141,7 @@ async def main(setup_code, yaml_path, node_id, pics_file):
             # Creating Cluster definition.
             clusters_definitions = SpecDefinitionsFromPaths([
                 _CLUSTER_XML_DIRECTORY_PATH + '/chip/*.xml',
-            ])
+            ], cache_directory=get_default_cache_directory())
 
             # Parsing YAML test and setting up chip-repl yamltests runner.
             parser_config = TestParserConfig(pics_file, clusters_definitions)
@@ -152,7 +149,7 @@ async def main(setup_code, yaml_path, node_id, pics_file):
             runner = ReplTestRunner(
                 clusters_definitions, certificate_authority_manager, dev_ctrl)
 
-            await execute_test(yaml, runner)
+            await execute_test(yaml, runner, max_inflight)
 
         except Exception:
             print(traceback.format_exc())
@@ -24,7 +24,7 @@ import traceback
 from dataclasses import dataclass
 
 import click
-from matter_yamltests.definitions import SpecDefinitionsFromPaths
+from matter_yamltests.definitions import SpecDefinitionsFromPaths, get_default_cache_directory
 from matter_yamltests.parser import TestParserConfig
 from matter_yamltests.parser_builder import TestParserBuilderConfig
 from matter_yamltests.parser_config import TestConfigParser
@@ -67,6 +67,9 @@ def test_parser_options(f):
                      help='Path to the directory containing the tests configuration.')(f)
     f = click.option('--specifications_paths', type=click.Path(), show_default=True, default=_DEFAULT_SPECIFICATIONS_DIR,
                      help='Path to a set of files containing clusters definitions.')(f)
+    f = click.option('--specifications_cache_directory', type=click.Path(), show_default=True,
+                     default=get_default_cache_directory(),
+                     help='Path to a directory where parsed clusters definitions are cached. Use an empty value to disable.')(f)
     f = click.option('--PICS', type=click.Path(exists=True), show_default=True, default=_DEFAULT_PICS_FILE,
                      help='Path to the PICS file to use.')(f)
     f = click.option('--stop_on_error', type=bool, show_default=True, default=True,
@@ -254,10 +257,11 @@ CONTEXT_SETTINGS = dict(
 @click.argument('test_name')
 @test_parser_options
 @click.pass_context
-def runner_base(ctx, configuration_directory: str, test_name: str, configuration_name: str, pics: str, specifications_paths: str, stop_on_error: bool, use_default_pseudo_clusters: bool, additional_pseudo_clusters_directory: str, **kwargs):
+def runner_base(ctx, configuration_directory: str, test_name: str, configuration_name: str, pics: str, specifications_paths: str, specifications_cache_directory: str, stop_on_error: bool, use_default_pseudo_clusters: bool, additional_pseudo_clusters_directory: str, **kwargs):
     pseudo_clusters = get_custom_pseudo_clusters(
         additional_pseudo_clusters_directory) if use_default_pseudo_clusters else PseudoClusters([])
-    specifications = SpecDefinitionsFromPaths(specifications_paths.split(','), pseudo_clusters)
+    specifications = SpecDefinitionsFromPaths(specifications_paths.split(','), pseudo_clusters,
+                                              specifications_cache_directory or None, parallel=True)
     tests_finder = TestsFinder(configuration_directory, configuration_name)
 
     test_list = tests_finder.get(test_name)
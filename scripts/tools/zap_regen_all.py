@@ -307,9 +307,10 @@ class JinjaCodegenTarget():
         except Exception:
             traceback.print_exc()
 
-    def codeFormat(self):
-        outputs = subprocess.check_output(["./scripts/codegen.py", "--name-only", "--generator",
-                                           self.generator, "--log-level", "fatal", self.idl_path]).decode("utf8").split("\n")
+    def codeFormat(self, outputs=None):
+        if outputs is None:
+            outputs = subprocess.check_output(["./scripts/codegen.py", "--name-only", "--generator",
+                                               self.generator, "--log-level", "fatal", self.idl_path]).decode("utf8").split("\n")
         outputs = [os.path.join(self.output_directory, name) for name in outputs if name]
 
         # Split output files by extension,
@@ -350,6 +351,33 @@ class JinjaCodegenTarget():
         logging.info("  %s" % " ".join(self.command))
 
 
+def generateCodegenTargets(targets: List[JinjaCodegenTarget], parallel: bool) -> List[TargetRunStats]:
+    """Generates all codegen targets as a single batch (see scripts/codegen_batch.py)
+       rather than one codegen.py process per target.
+    """
+    if not targets:
+        return []
+
+    from matter.idl.generators.batch import BatchTarget, RunBatch
+
+    results = RunBatch([BatchTarget(idl_path=t.idl_path, generator=t.generator, output_dir=t.output_directory) for t in targets],
+                       parallel=parallel)
+
+    timings = []
+    for target, result in zip(targets, results):
+        format_start = time.time()
+        target.codeFormat(result.generated_paths)
+        format_end = time.time()
+
+        timings.append(TargetRunStats(
+            generate_time=result.parse_time + result.generate_time + (format_end - format_start),
+            config=f'codegen:{target.generator}',
+            template=target.idl_path,
+        ))
+
+    return timings
+
+
 def checkPythonVersion():
     if sys.version_info[0] < 3:
         print('Must use Python 3. Current version is ' +
@@ -562,10 +590,12 @@ def main():
         #   - ZAP will generate ".matter" files
         #   - various codegen may generate from ".matter" files (like java)
         # We split codegen into two generations to not be racy
-        first, second = [], []
+        first, second, codegen = [], [], []
         for target in targets:
             if isinstance(target, ZAPGenerateTarget) and target.is_matter_idl_generation:
                 first.append(target)
+            elif isinstance(target, JinjaCodegenTarget):
+                codegen.append(target)
             else:
                 second.append(target)
 
@@ -574,8 +604,14 @@ def main():
                 for timing in pool.imap_unordered(_ParallelGenerateOne, items):
                     timings.append(timing)
     else:
+        codegen = []
         for target in targets:
-            timings.append(target.generate())
+            if isinstance(target, JinjaCodegenTarget):
+                codegen.append(target)
+            else:
+                timings.append(target.generate())
+
+    timings.extend(generateCodegenTargets(codegen, args.parallel))
 
     timings.sort(key=lambda t: t.generate_time)
 
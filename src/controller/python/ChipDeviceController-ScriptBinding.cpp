@@ -763,7 +763,7 @@ PyChipError pychip_DeviceController_OpenCommissioningWindow(chip::Controller::De
                                                               .SetTimeout(timeout)
                                                               .SetIteration(iteration)
                                                               .SetDiscriminator(discriminator)
-                                                              .SetCallback(pairingDelegate->GetOpenWindowCallback(opener)),
+                                                              .SetCallback(pairingDelegate->GetOpenWindowCallback(nodeid, opener)),
                                                           payload));
         return err;
     }
@@ -155,10 +155,11 @@ void ScriptDevicePairingDelegate::OnOpenCommissioningWindow(NodeId deviceId, CHI
         mOnWindowOpenCompleteCallback(deviceId, payload.setUpPINCode, setupManualCode.c_str(), setupQRCode.c_str(),
                                       ToPyChipError(status));
     }
-    if (mWindowOpener != nullptr)
+    auto opener = mWindowOpeners.find(deviceId);
+    if (opener != mWindowOpeners.end())
     {
-        Platform::Delete(mWindowOpener);
-        mWindowOpener = nullptr;
+        Platform::Delete(opener->second);
+        mWindowOpeners.erase(opener);
     }
 }
 
@@ -179,9 +180,9 @@ void ScriptDevicePairingDelegate::OnFabricCheck(NodeId matchingNodeId)
 }
 
 Callback::Callback<Controller::OnOpenCommissioningWindow> *
-ScriptDevicePairingDelegate::GetOpenWindowCallback(Controller::CommissioningWindowOpener * context)
+ScriptDevicePairingDelegate::GetOpenWindowCallback(NodeId deviceId, Controller::CommissioningWindowOpener * context)
 {
-    mWindowOpener = context;
+    mWindowOpeners[deviceId] = context;
     return &mOpenWindowCallback;
 }
 
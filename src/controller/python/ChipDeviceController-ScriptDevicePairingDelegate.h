@@ -30,6 +30,8 @@
 #include <controller/python/chip/icd/PyChipCheckInDelegate.h>
 #include <controller/python/chip/native/PyChipError.h>
 
+#include <map>
+
 namespace chip {
 namespace Controller {
 
@@ -72,8 +74,8 @@ public:
     void OnICDRegistrationComplete(ScopedNodeId deviceId, uint32_t icdCounter) override;
     void OnICDStayActiveComplete(ScopedNodeId deviceId, uint32_t promisedActiveDuration) override;
     void OnFabricCheck(NodeId matchingNodeId) override;
-    Callback::Callback<Controller::OnOpenCommissioningWindow> *
-    GetOpenWindowCallback(Controller::CommissioningWindowOpener * context);
+    Callback::Callback<Controller::OnOpenCommissioningWindow> * GetOpenWindowCallback(NodeId deviceId,
+                                                                                    Controller::CommissioningWindowOpener * context);
     void OnOpenCommissioningWindow(NodeId deviceId, CHIP_ERROR status, SetupPayload payload);
     void SetExpectingPairingComplete(bool value) { expectingPairingComplete = value; }
     void SetFabricIndex(FabricIndex fabricIndex) { mFabricIndex = fabricIndex; }
@@ -87,7 +89,8 @@ private:
     DevicePairingDelegate_OnCommissioningStatusUpdateFunct mOnCommissioningStatusUpdateCallback = nullptr;
     DevicePairingDelegate_OnFabricCheckFunct mOnFabricCheckCallback                             = nullptr;
     Callback::Callback<Controller::OnOpenCommissioningWindow> mOpenWindowCallback;
-    Controller::CommissioningWindowOpener * mWindowOpener = nullptr;
+    // Commissioning windows can be opened on several nodes at once, the opener of each is deleted once it completes.
+    std::map<NodeId, Controller::CommissioningWindowOpener *> mWindowOpeners;
 
     bool expectingPairingComplete = false;
     FabricIndex mFabricIndex      = 0;
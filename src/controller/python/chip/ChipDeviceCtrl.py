@@ -38,6 +38,7 @@ import json
 import logging
 import secrets
 import threading
+import time
 import typing
 from ctypes import (CDLL, CFUNCTYPE, POINTER, Structure, byref, c_bool, c_char, c_char_p, c_int, c_int32, c_size_t, c_uint8,
                     c_uint16, c_uint32, c_uint64, c_void_p, cast, create_string_buffer, pointer, py_object, resize, string_at)
@@ -52,10 +53,14 @@ from .bdx import Bdx
 from .clusters import Attribute as ClusterAttribute
 from .clusters import ClusterObjects as ClusterObjects
 from .clusters import Command as ClusterCommand
+from .clusters import EventNumberCursor, PersistentAttributeCache
 from .clusters.CHIPClusters import ChipClusters
 from .crypto import p256keypair
 from .interaction_model import SessionParameters, SessionParametersStruct
 from .native import PyChipError
+from .SessionPool import SessionPool
+from .SubscriptionMultiplexer import SubscriptionMultiplexer
+from .tracing import metrics as TracingMetrics
 
 __all__ = ["ChipDeviceController", "CommissioningParameters"]
 
@@ -130,6 +135,30 @@ class ICDRegistrationParameters:
         return ICDRegistrationParameters.CStruct(self.symmetricKey, len(self.symmetricKey), self.checkInNodeId, self.monitoredSubject, self.stayActiveMs, self.clientType.value)
 
 
+@dataclass
+class NodeReadResult:
+    ''' The outcome of reading from (or subscribing to) a single node as part of ReadMany or SubscribeMany.
+
+        response holds what Read returned for the node (a ReadResponse, or a SubscriptionTransaction for
+        subscriptions) and error the exception raised instead. The times are in seconds: sessionEstablishmentTime
+        is spent getting a connected device (which includes establishing a CASE session if there was none),
+        interactionTime is spent on the read or subscribe interaction itself.
+    '''
+    nodeId: int
+    response: typing.Any = None
+    error: typing.Optional[BaseException] = None
+    sessionEstablishmentTime: float = 0.0
+    interactionTime: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    @property
+    def totalTime(self) -> float:
+        return self.sessionEstablishmentTime + self.interactionTime
+
+
 @_DeviceAvailableCallbackFunct
 def _DeviceAvailableCallback(closure, device, err):
     closure.deviceAvailable(device, err)
@@ -243,6 +272,43 @@ def _singleton(cls):
     return wrapper
 
 
+@dataclass
+class CallbackContextStats:
+    ''' Contention counters of a CallbackContext or ShardedCallbackContext.
+    '''
+    acquisitions: int = 0
+    # Acquisitions that had to wait for another operation using the same callbacks to complete.
+    contended: int = 0
+    # Callers currently waiting, and the most that ever waited at once.
+    waiting: int = 0
+    maxWaiting: int = 0
+    totalWaitSec: float = 0.0
+    maxWaitSec: float = 0.0
+
+    @property
+    def contentionRatio(self) -> float:
+        return self.contended / self.acquisitions if self.acquisitions else 0.0
+
+
+async def _AcquireCallbackLock(lock: asyncio.Lock, stats: CallbackContextStats):
+    stats.acquisitions += 1
+    if not lock.locked():
+        await lock.acquire()
+        return
+
+    stats.contended += 1
+    stats.waiting += 1
+    stats.maxWaiting = max(stats.maxWaiting, stats.waiting)
+    start = time.monotonic()
+    try:
+        await lock.acquire()
+    finally:
+        stats.waiting -= 1
+        waitSec = time.monotonic() - start
+        stats.totalWaitSec += waitSec
+        stats.maxWaitSec = max(stats.maxWaitSec, waitSec)
+
+
 class CallbackContext:
     """A context manager for handling callbacks that are expected to be called exactly once.
 
@@ -250,12 +316,13 @@ class CallbackContext:
     handlers are executed.
     """
 
-    def __init__(self, lock: asyncio.Lock) -> None:
+    def __init__(self, lock: asyncio.Lock, stats: typing.Optional[CallbackContextStats] = None) -> None:
         self._lock = lock
         self._future = None
+        self._stats = stats if stats is not None else CallbackContextStats()
 
     async def __aenter__(self):
-        await self._lock.acquire()
+        await _AcquireCallbackLock(self._lock, self._stats)
         self._future = concurrent.futures.Future()
         return self
 
@@ -263,6 +330,10 @@ class CallbackContext:
     def future(self) -> typing.Optional[concurrent.futures.Future]:
         return self._future
 
+    @property
+    def stats(self) -> CallbackContextStats:
+        return self._stats
+
     async def __aexit__(self, exc_type, exc_value, traceback):
         if not self._future.done():
             # In case the initial call (which sets up for the callback) fails,
@@ -273,6 +344,66 @@ class CallbackContext:
         self._lock.release()
 
 
+class _CallbackContextShard(CallbackContext):
+    def __init__(self, owner: ShardedCallbackContext, key) -> None:
+        super().__init__(asyncio.Lock(), owner.stats)
+        self._owner = owner
+        self._key = key
+        self._users = 0
+
+    async def __aenter__(self):
+        self._users += 1
+        try:
+            return await super().__aenter__()
+        except BaseException:
+            self._Release()
+            raise
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await super().__aexit__(exc_type, exc_value, traceback)
+        self._Release()
+
+    def _Release(self):
+        self._users -= 1
+        if self._users == 0:
+            self._owner._RemoveShard(self._key)
+
+
+class ShardedCallbackContext:
+    """A CallbackContext for each key, usually a node ID, for callbacks that identify the operation they complete.
+
+    Operations for different keys can be in flight at the same time, operations for the same key are
+    still executed one after the other. Shards only exist while an operation uses them.
+    """
+
+    def __init__(self) -> None:
+        self._shards: typing.Dict[typing.Any, _CallbackContextShard] = {}
+        self._stats = CallbackContextStats()
+
+    def Shard(self, key) -> CallbackContext:
+        shard = self._shards.get(key)
+        if shard is None:
+            shard = self._shards[key] = _CallbackContextShard(self, key)
+        return shard
+
+    def _RemoveShard(self, key):
+        self._shards.pop(key, None)
+
+    def GetFuture(self, key) -> typing.Optional[concurrent.futures.Future]:
+        ''' Returns the future of the operation in flight for key, may be called from the Matter thread.
+        '''
+        shard = self._shards.get(key)
+        return shard.future if shard is not None else None
+
+    @property
+    def inFlight(self) -> int:
+        return len(self._shards)
+
+    @property
+    def stats(self) -> CallbackContextStats:
+        return self._stats
+
+
 class CommissioningContext(CallbackContext):
     """A context manager for handling commissioning callbacks that are expected to be called exactly once.
 
@@ -462,9 +593,17 @@ class ChipDeviceControllerBase():
         self._Cluster.InitLib(self._dmLib)
         self._commissioning_lock: asyncio.Lock = asyncio.Lock()
         self._commissioning_context: CommissioningContext = CommissioningContext(self, self._commissioning_lock)
-        self._open_window_context: CallbackContext = CallbackContext(asyncio.Lock())
-        self._unpair_device_context: CallbackContext = CallbackContext(asyncio.Lock())
+        # Commissioning window and unpair callbacks carry the node ID, so these operations only
+        # exclude each other for the same node.
+        self._open_window_context: ShardedCallbackContext = ShardedCallbackContext()
+        self._unpair_device_context: ShardedCallbackContext = ShardedCallbackContext()
         self._pase_establishment_context: CallbackContext = CallbackContext(self._commissioning_lock)
+        # ReadMany and SubscribeMany work on one node at a time per node, and on any number of nodes at once.
+        self._read_many_context: ShardedCallbackContext = ShardedCallbackContext()
+        self._persistentAttributeCache: typing.Optional[PersistentAttributeCache.PersistentAttributeCache] = None
+        self._eventNumberCursor: typing.Optional[EventNumberCursor.EventNumberCursor] = None
+        self._sessionPool: typing.Optional[SessionPool] = None
+        self._subscriptionMultiplexer: typing.Optional[SubscriptionMultiplexer] = None
 
     def _set_dev_ctrl(self, devCtrl, pairingDelegate):
         def HandleCommissioningComplete(nodeId: int, err: PyChipError):
@@ -500,14 +639,15 @@ class ChipDeviceControllerBase():
             else:
                 LOGGER.warning("Failed to open commissioning window: {}".format(err))
 
-            if self._open_window_context.future is None:
+            future = self._open_window_context.GetFuture(nodeid)
+            if future is None:
                 LOGGER.exception("HandleOpenWindowComplete called unexpectedly")
                 return
 
             if err.is_success:
-                self._open_window_context.future.set_result(commissioningParameters)
+                future.set_result(commissioningParameters)
             else:
-                self._open_window_context.future.set_exception(err.to_exception())
+                future.set_exception(err.to_exception())
 
         def HandleUnpairDeviceComplete(nodeid: int, err: PyChipError):
             if err.is_success:
@@ -515,14 +655,15 @@ class ChipDeviceControllerBase():
             else:
                 LOGGER.warning("Failed to unpair device: {}".format(err))
 
-            if self._unpair_device_context.future is None:
+            future = self._unpair_device_context.GetFuture(nodeid)
+            if future is None:
                 LOGGER.exception("HandleUnpairDeviceComplete called unexpectedly")
                 return
 
             if err.is_success:
-                self._unpair_device_context.future.set_result(None)
+                future.set_result(None)
             else:
-                self._unpair_device_context.future.set_exception(err.to_exception())
+                future.set_exception(err.to_exception())
 
         def HandlePASEEstablishmentComplete(err: PyChipError):
             if not err.is_success:
@@ -618,6 +759,13 @@ class ChipDeviceControllerBase():
         if not self._isActive:
             return
 
+        self.StopSessionPool()
+        if self._subscriptionMultiplexer is not None:
+            self._subscriptionMultiplexer.Shutdown()
+            self._subscriptionMultiplexer = None
+        if self._eventNumberCursor is not None:
+            self._eventNumberCursor.Flush()
+
         if self.devCtrl is not None:
             self._ChipStack.Call(
                 lambda: self._dmLib.pychip_DeviceController_DeleteDeviceController(
@@ -629,6 +777,96 @@ class ChipDeviceControllerBase():
         ChipDeviceController.activeList.remove(self)
         self._isActive = False
 
+    def SetPersistentAttributeCache(self, cache: typing.Optional[PersistentAttributeCache.PersistentAttributeCache]):
+        '''
+        Sets the on-disk cache used for attribute reads and subscriptions, or disables it when None.
+
+        While set, attribute reads and subscriptions that do not provide their own dataVersionFilters and are
+        fabric-filtered request DataVersionFilters for the clusters already in the cache, so nodes only report
+        the clusters that changed. The cached data of the other clusters is merged into the results, and the
+        reported data is written back to the cache.
+
+        Args:
+            cache: PersistentAttributeCache to use, which can be shared between controllers.
+        '''
+        self._persistentAttributeCache = cache
+
+    def SetEventNumberCursor(self, cursor: typing.Optional[EventNumberCursor.EventNumberCursor]):
+        '''
+        Sets the record of the events received from nodes, or disables it when None.
+
+        While set, the highest event number received is recorded for each node and set of event paths subscribed to,
+        and subscriptions to events that do not provide their own eventNumberFilter only ask for the events after it.
+        Created with a PersistentStorage, the cursor is kept across controller restarts.
+
+        Args:
+            cursor: EventNumberCursor to use, which can be shared between controllers.
+        '''
+        self._eventNumberCursor = cursor
+
+    async def StartSessionPool(self, nodeids: typing.Iterable[int], idleTimeoutSec: float = 300,
+                               refreshMarginSec: float = 30, checkIntervalSec: float = 10, maxConcurrency: int = 8,
+                               payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD) -> SessionPool:
+        '''
+        Keeps CASE sessions with a working set of nodes established, so interactions with them do not have to wait for
+        session establishment.
+
+        Sessions with the nodes are established before this returns. Afterwards a session that has not been used for
+        idleTimeoutSec - refreshMarginSec is refreshed with a minimal read, and re-established if that fails. The
+        pool replaces any pool started before. See SessionPool for the arguments and the counters it keeps.
+
+        Returns:
+            The SessionPool, which can be used to change the working set and to get the counters.
+        '''
+        self.CheckIsActive()
+        self.StopSessionPool()
+
+        pool = SessionPool(self, nodeids, idleTimeoutSec=idleTimeoutSec, refreshMarginSec=refreshMarginSec,
+                           checkIntervalSec=checkIntervalSec, maxConcurrency=maxConcurrency,
+                           payloadCapability=payloadCapability)
+        self._sessionPool = pool
+        await pool.Warm()
+        pool.Start()
+        return pool
+
+    def StopSessionPool(self):
+        '''
+        Stops keeping the sessions of the session pool (if any) established. Established sessions are not closed.
+        Can be called from any thread.
+        '''
+        if self._sessionPool is not None:
+            self._sessionPool.Stop()
+            self._sessionPool = None
+
+    @property
+    def sessionPool(self) -> typing.Optional[SessionPool]:
+        return self._sessionPool
+
+    @property
+    def subscriptionMultiplexer(self) -> SubscriptionMultiplexer:
+        ''' The SubscriptionMultiplexer sharing subscriptions among the consumers subscribing through it, created on
+            first use. Its subscriptions are shut down with this controller.
+        '''
+        if self._subscriptionMultiplexer is None:
+            self._subscriptionMultiplexer = SubscriptionMultiplexer(self)
+        return self._subscriptionMultiplexer
+
+    @property
+    def callbackContextStats(self) -> typing.Dict[str, CallbackContextStats]:
+        ''' Counters of the callers that had to wait for another operation using the same callbacks, by operation.
+
+            Commissioning and PASE establishment wait for each other on any node, opening a commissioning
+            window, unpairing and the reads of ReadMany and SubscribeMany only wait for the same operation on
+            the same node.
+        '''
+        return {
+            'commissioning': self._commissioning_context.stats,
+            'paseEstablishment': self._pase_establishment_context.stats,
+            'openCommissioningWindow': self._open_window_context.stats,
+            'unpairDevice': self._unpair_device_context.stats,
+            'readMany': self._read_many_context.stats,
+        }
+
     def ShutdownAll(self):
         ''' Shut down all active controllers and reclaim any used resources.
         '''
@@ -706,7 +944,7 @@ class ChipDeviceControllerBase():
         '''
         self.CheckIsActive()
 
-        async with self._unpair_device_context as ctx:
+        async with self._unpair_device_context.Shard(nodeid) as ctx:
             await self._ChipStack.CallAsync(
                 lambda: self._dmLib.pychip_DeviceController_UnpairDevice(
                     self.devCtrl, nodeid, self.cbHandleDeviceUnpairCompleteFunct)
@@ -1030,7 +1268,7 @@ class ChipDeviceControllerBase():
         '''
         self.CheckIsActive()
 
-        async with self._open_window_context as ctx:
+        async with self._open_window_context.Shard(nodeid) as ctx:
             await self._ChipStack.CallAsync(
                 lambda: self._dmLib.pychip_DeviceController_OpenCommissioningWindow(
                     self.devCtrl, self.pairingDelegate, nodeid, timeout, iteration, discriminator, option)
@@ -1244,6 +1482,18 @@ class ChipDeviceControllerBase():
         '''
         self.CheckIsActive()
 
+        with TracingMetrics.MeasureInteraction(TracingMetrics.InteractionType.CONNECT, nodeid):
+            if self._sessionPool is None or nodeid not in self._sessionPool:
+                return await self._GetConnectedDevice(nodeid, allowPASE, timeoutMs, payloadCapability)
+
+            warm = self._sessionPool.IsWarm(nodeid)
+            start = time.monotonic()
+            device = await self._GetConnectedDevice(nodeid, allowPASE, timeoutMs, payloadCapability)
+            self._sessionPool.RecordRequest(nodeid, warm, time.monotonic() - start)
+            return device
+
+    async def _GetConnectedDevice(self, nodeid, allowPASE: bool = True, timeoutMs: typing.Optional[int] = None,
+                                  payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD):
         if allowPASE:
             returnDevice = c_void_p(None)
             res = await self._ChipStack.CallAsyncWithResult(lambda: self._dmLib.pychip_GetDeviceBeingCommissioned(
@@ -1305,9 +1555,11 @@ class ChipDeviceControllerBase():
             int: The computed timeout value in milliseconds, representing the round-trip time.
         '''
         device = self.GetConnectedDeviceSync(nodeid)
-        res = self._ChipStack.Call(lambda: self._dmLib.pychip_DeviceProxy_ComputeRoundTripTimeout(
+        return self._ComputeRoundTripTimeoutForDevice(device, upperLayerProcessingTimeoutMs)
+
+    def _ComputeRoundTripTimeoutForDevice(self, device: DeviceProxyWrapper, upperLayerProcessingTimeoutMs: int = 0) -> int:
+        return self._ChipStack.Call(lambda: self._dmLib.pychip_DeviceProxy_ComputeRoundTripTimeout(
             device.deviceProxy, upperLayerProcessingTimeoutMs))
-        return res
 
     def GetRemoteSessionParameters(self, nodeid) -> typing.Optional[SessionParameters]:
         '''
@@ -1319,11 +1571,13 @@ class ChipDeviceControllerBase():
         Returns:
             SessionParameters: The session parameters.
         '''
+        device = self.GetConnectedDeviceSync(nodeid)
+        return self._GetRemoteSessionParametersForDevice(device)
 
+    def _GetRemoteSessionParametersForDevice(self, device: DeviceProxyWrapper) -> SessionParameters:
         # First creating the struct to make building the ByteArray to be sent to CFFI easier.
         sessionParametersStruct = SessionParametersStruct.parse(b'\x00' * SessionParametersStruct.sizeof())
         sessionParametersByteArray = SessionParametersStruct.build(sessionParametersStruct)
-        device = self.GetConnectedDeviceSync(nodeid)
         self._ChipStack.Call(lambda: self._dmLib.pychip_DeviceProxy_GetRemoteSessionParameters(
             device.deviceProxy, ctypes.c_char_p(sessionParametersByteArray))).raise_on_error()
 
@@ -1419,15 +1673,16 @@ class ChipDeviceControllerBase():
         future = eventLoop.create_future()
 
         device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
-        res = await ClusterCommand.SendCommand(
-            future, eventLoop, responseType, device.deviceProxy, ClusterCommand.CommandPath(
-                EndpointId=endpoint,
-                ClusterId=payload.cluster_id,
-                CommandId=payload.command_id,
-            ), payload, timedRequestTimeoutMs=timedRequestTimeoutMs,
-            interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse)
-        res.raise_on_error()
-        return await future
+        with TracingMetrics.MeasureInteraction(TracingMetrics.InteractionType.INVOKE, nodeid, (payload.cluster_id,)):
+            res = await ClusterCommand.SendCommand(
+                future, eventLoop, responseType, device.deviceProxy, ClusterCommand.CommandPath(
+                    EndpointId=endpoint,
+                    ClusterId=payload.cluster_id,
+                    CommandId=payload.command_id,
+                ), payload, timedRequestTimeoutMs=timedRequestTimeoutMs,
+                interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse)
+            res.raise_on_error()
+            return await future
 
     async def SendBatchCommands(self, nodeid: int, commands: typing.List[ClusterCommand.InvokeRequestInfo],
                                 timedRequestTimeoutMs: typing.Optional[int] = None,
@@ -1463,18 +1718,22 @@ class ChipDeviceControllerBase():
 
         device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
 
-        res = await ClusterCommand.SendBatchCommands(
-            future, eventLoop, device.deviceProxy, commands,
-            timedRequestTimeoutMs=timedRequestTimeoutMs,
-            interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse)
-        res.raise_on_error()
-        return await future
+        with TracingMetrics.MeasureInteraction(TracingMetrics.InteractionType.INVOKE, nodeid,
+                                               (command.Command.cluster_id for command in commands)):
+            res = await ClusterCommand.SendBatchCommands(
+                future, eventLoop, device.deviceProxy, commands,
+                timedRequestTimeoutMs=timedRequestTimeoutMs,
+                interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse)
+            res.raise_on_error()
+            return await future
 
     def SendGroupCommand(self, groupid: int, payload: ClusterObjects.ClusterCommand, busyWaitMs: typing.Optional[int] = None):
         '''
         Send a group cluster-object encapsulated command to a group_id and get returned a future
         that can be awaited upon to get confirmation command was sent.
 
+        To send many group commands back to back, use a chip.GroupMessagePipeline.GroupMessagePipeline.
+
         Returns:
             None: responses are not sent to group commands.
 
@@ -1529,16 +1788,33 @@ class ChipDeviceControllerBase():
                 attrs.append(ClusterAttribute.AttributeWriteRequest(
                     v[0], v[1], v[2], 1, v[1].value))
 
-        ClusterAttribute.WriteAttributes(
-            future, eventLoop, device.deviceProxy, attrs, timedRequestTimeoutMs=timedRequestTimeoutMs,
-            interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs).raise_on_error()
-        return await future
+        with TracingMetrics.MeasureInteraction(TracingMetrics.InteractionType.WRITE, nodeid,
+                                               (v[1].cluster_id for v in attributes)):
+            ClusterAttribute.WriteAttributes(
+                future, eventLoop, device.deviceProxy, attrs, timedRequestTimeoutMs=timedRequestTimeoutMs,
+                interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs).raise_on_error()
+            return await future
+
+    @staticmethod
+    def _GroupAttributeWriteRequests(attributes) -> typing.List[ClusterAttribute.AttributeWriteRequest]:
+        attrs = []
+        invalid_endpoint = 0xFFFF
+        for v in attributes:
+            if len(v) == 2:
+                attrs.append(ClusterAttribute.AttributeWriteRequest(
+                    invalid_endpoint, v[0], v[1], 1, v[0].value))
+            else:
+                attrs.append(ClusterAttribute.AttributeWriteRequest(
+                    invalid_endpoint, v[0], 0, 0, v[0].value))
+        return attrs
 
     def WriteGroupAttribute(
             self, groupid: int, attributes: typing.List[typing.Tuple[ClusterObjects.ClusterAttributeDescriptor, int]], busyWaitMs: typing.Optional[int] = None):
         '''
         Write a list of attributes on a target group.
 
+        To send many group writes back to back, use a chip.GroupMessagePipeline.GroupMessagePipeline.
+
         groupid: Group ID to send write attribute to.
         attributes: A list of tuples of type (cluster-object, data-version). The data-version can be omitted.
 
@@ -1553,18 +1829,8 @@ class ChipDeviceControllerBase():
         '''
         self.CheckIsActive()
 
-        attrs = []
-        invalid_endpoint = 0xFFFF
-        for v in attributes:
-            if len(v) == 2:
-                attrs.append(ClusterAttribute.AttributeWriteRequest(
-                    invalid_endpoint, v[0], v[1], 1, v[0].value))
-            else:
-                attrs.append(ClusterAttribute.AttributeWriteRequest(
-                    invalid_endpoint, v[0], 0, 0, v[0].value))
-
         ClusterAttribute.WriteGroupAttributes(
-            groupid, self.devCtrl, attrs, busyWaitMs=busyWaitMs).raise_on_error()
+            groupid, self.devCtrl, self._GroupAttributeWriteRequests(attributes), busyWaitMs=busyWaitMs).raise_on_error()
 
         # An empty list is the expected return for sending group write attribute.
         return []
@@ -1668,8 +1934,12 @@ class ChipDeviceControllerBase():
         typing.Tuple[int, typing.Type[ClusterObjects.Cluster], int],
         # Concrete path
         typing.Tuple[int,
-                     typing.Type[ClusterObjects.ClusterEvent], int]
+                     typing.Type[ClusterObjects.ClusterEvent], int],
+        # Directly specified event path
+        ClusterAttribute.EventPath
     ]):
+        if isinstance(pathTuple, ClusterAttribute.EventPath):
+            return pathTuple
         if pathTuple in [('*'), ()]:
             # Wildcard
             return ClusterAttribute.EventPath()
@@ -1729,7 +1999,7 @@ class ChipDeviceControllerBase():
         eventNumberFilter: typing.Optional[int] = None,
         returnClusterObject: bool = False, reportInterval: typing.Optional[typing.Tuple[int, int]] = None,
         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
-        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, batchReports: bool = False
     ):
         '''
         Read a list of attributes and/or events from a target node
@@ -1752,7 +2022,8 @@ class ChipDeviceControllerBase():
 
             An AttributePath can also be specified directly by [chip.cluster.Attribute.AttributePath(...)]
 
-        dataVersionFilters: A list of tuples of (endpoint, cluster, data version).
+        dataVersionFilters: A list of tuples of (endpoint, cluster, data version). When not provided and a persistent
+            attribute cache is set (see SetPersistentAttributeCache), the filters are derived from the cache.
 
         events: A list of tuples of varying types depending on the type of read being requested:
             (endpoint, Clusters.ClusterA.EventA, urgent):       Endpoint = specific,
@@ -1765,7 +2036,10 @@ class ChipDeviceControllerBase():
             Clusters.ClusterA:                          Endpoint = *,          Cluster = specific,    Event = *, Urgent = True/False
             '*' or ():                                  Endpoint = *,          Cluster = *,          Event = *, Urgent = True/False
 
-        eventNumberFilter: Optional minimum event number filter.
+            An EventPath can also be specified directly by [chip.cluster.Attribute.EventPath(...)]
+
+        eventNumberFilter: Optional minimum event number filter. When not provided for a subscription and an event number
+            cursor is set (see SetEventNumberCursor), the filter is derived from the cursor.
 
         returnClusterObject: This returns the data as consolidated cluster objects, with all attributes for a cluster inside
                              a single cluster-wide cluster object.
@@ -1779,6 +2053,8 @@ class ChipDeviceControllerBase():
         autoResubscribe: Automatically resubscribe to the subscription if subscription is lost. The automatic re-subscription only
             applies if the subscription establishes on first try. If the first subscription establishment attempt fails the function
             returns right away.
+        batchReports: If True, the attribute and event data of each report is delivered from the Matter stack in a single buffer
+            at the end of the report, instead of one callback per attribute and event. This is faster for large reports.
 
         Returns:
             - AsyncReadTransaction.ReadResponse. Please see ReadAttribute and ReadEvent for examples of how to access data.
@@ -1789,10 +2065,20 @@ class ChipDeviceControllerBase():
         '''
         self.CheckIsActive()
 
+        device = await self.GetConnectedDevice(nodeid, payloadCapability=payloadCapability)
+        return await self._ReadWithDevice(device, nodeid, attributes=attributes, dataVersionFilters=dataVersionFilters,
+                                          events=events, eventNumberFilter=eventNumberFilter,
+                                          returnClusterObject=returnClusterObject, reportInterval=reportInterval,
+                                          fabricFiltered=fabricFiltered, keepSubscriptions=keepSubscriptions,
+                                          autoResubscribe=autoResubscribe, batchReports=batchReports)
+
+    async def _ReadWithDevice(self, device: DeviceProxyWrapper, nodeid: int, attributes=None, dataVersionFilters=None,
+                              events=None, eventNumberFilter: typing.Optional[int] = None, returnClusterObject: bool = False,
+                              reportInterval: typing.Optional[typing.Tuple[int, int]] = None, fabricFiltered: bool = True,
+                              keepSubscriptions: bool = False, autoResubscribe: bool = True, batchReports: bool = False):
         eventLoop = asyncio.get_running_loop()
         future = eventLoop.create_future()
 
-        device = await self.GetConnectedDevice(nodeid, payloadCapability=payloadCapability)
         attributePaths = [self._parseAttributePathTuple(
             v) for v in attributes] if attributes else None
         clusterDataVersionFilters = [self._parseDataVersionFilterTuple(
@@ -1800,15 +2086,38 @@ class ChipDeviceControllerBase():
         eventPaths = [self._parseEventPathTuple(
             v) for v in events] if events else None
 
-        transaction = ClusterAttribute.AsyncReadTransaction(future, eventLoop, self, returnClusterObject)
-        ClusterAttribute.Read(transaction, device=device.deviceProxy,
-                              attributes=attributePaths, dataVersionFilters=clusterDataVersionFilters, events=eventPaths,
-                              eventNumberFilter=eventNumberFilter,
-                              subscriptionParameters=ClusterAttribute.SubscriptionParameters(
-                                  reportInterval[0], reportInterval[1]) if reportInterval else None,
-                              fabricFiltered=fabricFiltered,
-                              keepSubscriptions=keepSubscriptions, autoResubscribe=autoResubscribe).raise_on_error()
-        await future
+        persistentRead = None
+        if self._persistentAttributeCache is not None and attributePaths and not dataVersionFilters and fabricFiltered:
+            persistentRead = self._persistentAttributeCache.BeginRead(self.GetCompressedFabricId(), nodeid, attributePaths)
+            clusterDataVersionFilters = persistentRead.DataVersionFilters() or None
+
+        eventStream = None
+        if self._eventNumberCursor is not None and eventPaths and reportInterval:
+            eventStream = self._eventNumberCursor.BeginSubscription(self.GetCompressedFabricId(), nodeid, eventPaths)
+            if eventNumberFilter is None:
+                eventNumberFilter = eventStream.EventNumberFilter()
+
+        transaction = ClusterAttribute.AsyncReadTransaction(future, eventLoop, self, returnClusterObject, persistentRead,
+                                                            eventStream)
+        with TracingMetrics.MeasureInteraction(
+                TracingMetrics.InteractionType.SUBSCRIBE if reportInterval else TracingMetrics.InteractionType.READ, nodeid,
+                (path.ClusterId for paths in (attributePaths or (), eventPaths or ()) for path in paths)):
+            ClusterAttribute.Read(transaction, device=device.deviceProxy,
+                                  attributes=attributePaths, dataVersionFilters=clusterDataVersionFilters, events=eventPaths,
+                                  eventNumberFilter=eventNumberFilter,
+                                  subscriptionParameters=ClusterAttribute.SubscriptionParameters(
+                                      reportInterval[0], reportInterval[1]) if reportInterval else None,
+                                  fabricFiltered=fabricFiltered,
+                                  keepSubscriptions=keepSubscriptions, autoResubscribe=autoResubscribe,
+                                  batchReports=batchReports).raise_on_error()
+            try:
+                await future
+            except asyncio.CancelledError:
+                # The subscription was established right before the caller went away, nobody else will shut it down.
+                # Subscriptions established after are shut down by the transaction.
+                if (subscription := transaction.GetSubscriptionHandler()) is not None:
+                    subscription.Shutdown()
+                raise
 
         if result := transaction.GetSubscriptionHandler():
             return result
@@ -1978,6 +2287,113 @@ class ChipDeviceControllerBase():
         else:
             return res.events
 
+    async def _ReadNode(self, nodeid: int, semaphore: asyncio.Semaphore, payloadCapability: int, readArgs: dict) -> NodeReadResult:
+        result = NodeReadResult(nodeId=nodeid)
+        # Another fan-out working on the same node is waited for before taking one of the maxConcurrency slots.
+        async with self._read_many_context.Shard(nodeid), semaphore:
+            start = time.monotonic()
+            try:
+                device = await self.GetConnectedDevice(nodeid, payloadCapability=payloadCapability)
+            except Exception as ex:
+                result.error = ex
+                return result
+            finally:
+                result.sessionEstablishmentTime = time.monotonic() - start
+
+            start = time.monotonic()
+            try:
+                result.response = await self._ReadWithDevice(device, nodeid, **readArgs)
+            except Exception as ex:
+                result.error = ex
+            finally:
+                result.interactionTime = time.monotonic() - start
+        return result
+
+    async def ReadMany(self, nodeids: typing.Iterable[int], attributes=None, dataVersionFilters=None, events=None,
+                       eventNumberFilter: typing.Optional[int] = None, returnClusterObject: bool = False,
+                       reportInterval: typing.Optional[typing.Tuple[int, int]] = None, fabricFiltered: bool = True,
+                       keepSubscriptions: bool = False, autoResubscribe: bool = True,
+                       payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, batchReports: bool = False,
+                       maxConcurrency: int = 16) -> typing.AsyncIterator[NodeReadResult]:
+        '''
+        Read the same attributes and/or events from several nodes concurrently.
+
+        Sessions with the nodes are established in parallel and the reads are issued as soon as a node's session is
+        available, with at most maxConcurrency nodes being worked on at any time. The remaining arguments are the same
+        as for Read and apply to every node.
+
+        nodeids: The Node IDs to read from. Each node is read once, even if it is listed more than once.
+        maxConcurrency: The maximum number of nodes with a session establishment or interaction in progress.
+
+        Returns:
+            - An async iterator yielding a NodeReadResult for each node, in the order the nodes complete. A failure
+              on one node is reported in its NodeReadResult.error and does not affect the other nodes.
+
+        Closing the iterator early (e.g. with contextlib.aclosing, or when it is garbage collected) cancels the nodes in
+        progress and shuts down the subscriptions that were not yielded; reads already sent complete in the Matter
+        stack and their results are dropped.
+
+        e.g.
+            async for result in devCtrl.ReadMany([1, 2, 3], attributes=[(0, Clusters.BasicInformation)]):
+                if result.success:
+                    print(result.nodeId, result.totalTime, result.response.attributes)
+        '''
+        self.CheckIsActive()
+
+        if maxConcurrency < 1:
+            raise ValueError("maxConcurrency must be at least 1")
+
+        readArgs = dict(attributes=attributes, dataVersionFilters=dataVersionFilters, events=events,
+                        eventNumberFilter=eventNumberFilter, returnClusterObject=returnClusterObject,
+                        reportInterval=reportInterval, fabricFiltered=fabricFiltered, keepSubscriptions=keepSubscriptions,
+                        autoResubscribe=autoResubscribe, batchReports=batchReports)
+        semaphore = asyncio.Semaphore(maxConcurrency)
+        tasks = [asyncio.create_task(self._ReadNode(nodeid, semaphore, payloadCapability, readArgs))
+                 for nodeid in dict.fromkeys(nodeids)]
+        yielded = set()
+        try:
+            for task in asyncio.as_completed(tasks):
+                result = await task
+                yielded.add(result.nodeId)
+                yield result
+        finally:
+            # The caller stopped iterating early, don't leave the remaining nodes running in the background. Cancelled
+            # subscriptions are shut down once established, the ones that completed without being yielded right away.
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled() and task.result().nodeId not in yielded:
+                    response = task.result().response
+                    if isinstance(response, ClusterAttribute.SubscriptionTransaction):
+                        response.Shutdown()
+
+    async def SubscribeMany(self, nodeids: typing.Iterable[int], reportInterval: typing.Tuple[int, int], attributes=None,
+                            dataVersionFilters=None, events=None, eventNumberFilter: typing.Optional[int] = None,
+                            returnClusterObject: bool = False, fabricFiltered: bool = True, keepSubscriptions: bool = False,
+                            autoResubscribe: bool = True, payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD,
+                            batchReports: bool = False, maxConcurrency: int = 16) -> typing.AsyncIterator[NodeReadResult]:
+        '''
+        Subscribe to the same attributes and/or events on several nodes concurrently, this is a wrapper of
+        DeviceController.ReadMany().
+
+        reportInterval: A tuple of two int-s for (MinIntervalFloor, MaxIntervalCeiling).
+
+        Returns:
+            - An async iterator yielding a NodeReadResult for each node, in the order the subscriptions are established.
+              NodeReadResult.response is the ClusterAttribute.SubscriptionTransaction of the node.
+        '''
+        results = self.ReadMany(nodeids, attributes=attributes, dataVersionFilters=dataVersionFilters, events=events,
+                                eventNumberFilter=eventNumberFilter, returnClusterObject=returnClusterObject,
+                                reportInterval=reportInterval, fabricFiltered=fabricFiltered,
+                                keepSubscriptions=keepSubscriptions, autoResubscribe=autoResubscribe,
+                                payloadCapability=payloadCapability, batchReports=batchReports, maxConcurrency=maxConcurrency)
+        try:
+            async for result in results:
+                yield result
+        finally:
+            # Closing this iterator closes the fan-out right away, rather than when it is garbage collected.
+            await results.aclose()
+
     def SetIpk(self, ipk: bytes):
         '''
         Sets the Identity Protection Key (IPK) for the device controller.
@@ -2663,6 +3079,12 @@ class ChipDeviceController(ChipDeviceControllerBase):
 
             return await asyncio.futures.wrap_future(ctx.future)
 
+    @property
+    def callbackContextStats(self) -> typing.Dict[str, CallbackContextStats]:
+        stats = super().callbackContextStats
+        stats['issueNOCChain'] = self._issue_node_chain_context.stats
+        return stats
+
     def NOCChainCallback(self, nocChain):
         '''
         Callback function for handling the NOC chain result.
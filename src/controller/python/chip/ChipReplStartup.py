@@ -103,7 +103,8 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "-p", "--storagepath",
-        help="Path to persistent storage configuration file (default: /tmp/repl-storage.json)",
+        help="Path to persistent storage configuration file (default: /tmp/repl-storage.json). "
+        "Paths ending in .sqlite are stored in an SQLite database, migrating the .json file of the same name if present.",
         action="store",
         default="/tmp/repl-storage.json")
     parser.add_argument(
@@ -0,0 +1,275 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Rate limited pipeline for group commands and group attribute writes.
+
+Group messages are not acknowledged, so SendGroupCommand and WriteGroupAttribute return as soon as a message
+has been sent and callers that send many of them back to back have to pace them themselves (busyWaitMs). A
+GroupMessagePipeline queues group messages and sends them from the event loop at a configurable rate: receivers
+only accept group messages whose counter is within CHIP_CONFIG_MESSAGE_COUNTER_WINDOW_SIZE of the last one they
+processed, so the burst defaults to that window. Payloads are encoded once per distinct command or write and
+reused for every group they are sent to.
+'''
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import time
+import typing
+from dataclasses import dataclass, field
+
+from .clusters import Attribute as ClusterAttribute
+from .clusters import ClusterObjects as ClusterObjects
+from .clusters import Command as ClusterCommand
+from .native import PyChipError
+
+LOGGER = logging.getLogger(__name__)
+
+# Matches CHIP_CONFIG_MESSAGE_COUNTER_WINDOW_SIZE in src/lib/core/CHIPConfig.h.
+MESSAGE_COUNTER_WINDOW_SIZE = 32
+
+
+@dataclass
+class GroupMessageStats:
+    sent: int = 0
+    # Messages that were not sent because the queue was full or they waited longer than maxQueueDelaySec.
+    dropped: int = 0
+    # Messages the Matter stack failed to send.
+    failed: int = 0
+    # Times in seconds from queueing a message until it was sent, limited to the last maxLatencySamples.
+    latencies: typing.Deque[float] = field(default_factory=collections.deque)
+
+    @property
+    def averageLatency(self) -> float:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    @property
+    def maxLatency(self) -> float:
+        return max(self.latencies, default=0.0)
+
+
+@dataclass
+class _QueuedMessage:
+    groupId: int
+    message: typing.Union[ClusterCommand.EncodedGroupCommand, ClusterAttribute.EncodedGroupWrite]
+    queuedAt: float
+    future: asyncio.Future
+
+
+class GroupMessagePipeline:
+    ''' Queues group commands and group attribute writes and sends them at a limited rate.
+
+        devCtrl: ChipDeviceControllerBase to send the messages with.
+        messagesPerSec: Rate at which messages are sent, once the burst has been used up.
+        burst: The number of messages that can be sent back to back.
+        maxQueueSize: The maximum number of queued messages, further messages are dropped.
+        maxQueueDelaySec: Messages that waited longer than this in the queue are dropped instead of sent.
+        maxEncodedPayloads: The number of distinct encoded commands and writes that are kept for reuse.
+        maxLatencySamples: The number of latencies kept for each group.
+    '''
+
+    def __init__(self, devCtrl, messagesPerSec: float = 100, burst: int = MESSAGE_COUNTER_WINDOW_SIZE,
+                 maxQueueSize: int = 4096, maxQueueDelaySec: typing.Optional[float] = None, maxEncodedPayloads: int = 256,
+                 maxLatencySamples: int = 1000):
+        if messagesPerSec <= 0:
+            raise ValueError("messagesPerSec must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self._devCtrl = devCtrl
+        self._messagesPerSec = messagesPerSec
+        self._burst = burst
+        self._maxQueueSize = maxQueueSize
+        self._maxQueueDelaySec = maxQueueDelaySec
+        self._maxEncodedPayloads = maxEncodedPayloads
+        self._maxLatencySamples = maxLatencySamples
+        self._queue: typing.Deque[_QueuedMessage] = collections.deque()
+        self._queueChanged: typing.Optional[asyncio.Event] = None
+        self._encoded: typing.OrderedDict[typing.Any, typing.Any] = collections.OrderedDict()
+        self._tokens = float(burst)
+        self._tokensUpdated = time.monotonic()
+        self._task: typing.Optional[asyncio.Task] = None
+        self._groupStats: typing.Dict[int, GroupMessageStats] = {}
+
+    @property
+    def queueSize(self) -> int:
+        return len(self._queue)
+
+    @property
+    def groupStats(self) -> typing.Dict[int, GroupMessageStats]:
+        ''' The counters of each group messages were queued for.
+        '''
+        return self._groupStats
+
+    @property
+    def stats(self) -> GroupMessageStats:
+        ''' The counters of all groups combined.
+        '''
+        total = GroupMessageStats()
+        for stats in self._groupStats.values():
+            total.sent += stats.sent
+            total.dropped += stats.dropped
+            total.failed += stats.failed
+            total.latencies.extend(stats.latencies)
+        return total
+
+    def ResetStats(self):
+        self._groupStats.clear()
+
+    def _GetStats(self, groupId: int) -> GroupMessageStats:
+        stats = self._groupStats.get(groupId)
+        if stats is None:
+            stats = self._groupStats[groupId] = GroupMessageStats(latencies=collections.deque(maxlen=self._maxLatencySamples))
+        return stats
+
+    def _Encoded(self, key, encode):
+        # Cluster objects are mutable dataclasses and not hashable, their repr identifies their contents.
+        encoded = self._encoded.get(key)
+        if encoded is None:
+            encoded = encode()
+            self._encoded[key] = encoded
+            if len(self._encoded) > self._maxEncodedPayloads:
+                self._encoded.popitem(last=False)
+        else:
+            self._encoded.move_to_end(key)
+        return encoded
+
+    def _Enqueue(self, groupId: int, message) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if len(self._queue) >= self._maxQueueSize:
+            self._GetStats(groupId).dropped += 1
+            future.set_result(False)
+            return future
+
+        self._GetStats(groupId)
+        self._queue.append(_QueuedMessage(groupId, message, time.monotonic(), future))
+        if self._queueChanged is not None:
+            self._queueChanged.set()
+        return future
+
+    def SendCommand(self, groupId: int, payload: ClusterObjects.ClusterCommand) -> asyncio.Future:
+        ''' Queues a group command, see ChipDeviceControllerBase.SendGroupCommand.
+
+            Returns:
+                A future that is set to True once the command has been sent, or False if it was dropped or failed.
+        '''
+        command = self._Encoded((type(payload), repr(payload)), lambda: ClusterCommand.EncodeGroupCommand(payload))
+        return self._Enqueue(groupId, command)
+
+    def WriteAttribute(self, groupId: int,
+                       attributes: typing.List[typing.Tuple[ClusterObjects.ClusterAttributeDescriptor, int]]) -> asyncio.Future:
+        ''' Queues a group attribute write, see ChipDeviceControllerBase.WriteGroupAttribute.
+
+            Returns:
+                A future that is set to True once the write has been sent, or False if it was dropped or failed.
+        '''
+        write = self._Encoded(tuple((type(v[0]), repr(v)) for v in attributes), lambda: ClusterAttribute.EncodedGroupWrite(
+            self._devCtrl._GroupAttributeWriteRequests(attributes)))
+        return self._Enqueue(groupId, write)
+
+    async def _Send(self, groupId: int, message) -> PyChipError:
+        self._devCtrl.CheckIsActive()
+        if isinstance(message, ClusterCommand.EncodedGroupCommand):
+            return await ClusterCommand.SendEncodedGroupCommandAsync(groupId, self._devCtrl.devCtrl, message)
+        return await ClusterAttribute.WriteEncodedGroupAttributesAsync(groupId, self._devCtrl.devCtrl, message)
+
+    def _TokenDelay(self) -> float:
+        ''' Returns the time in seconds until a message can be sent, 0 if one can be sent now.
+        '''
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._tokensUpdated) * self._messagesPerSec)
+        self._tokensUpdated = now
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self._messagesPerSec
+
+    async def _Run(self):
+        while True:
+            if not self._queue:
+                self._queueChanged.clear()
+                await self._queueChanged.wait()
+                continue
+
+            # Cancelled and stale messages are not sent, they do not use up the rate.
+            item = self._queue[0]
+            stats = self._GetStats(item.groupId)
+            if item.future.cancelled():
+                self._queue.popleft()
+                continue
+            if self._maxQueueDelaySec is not None and time.monotonic() - item.queuedAt > self._maxQueueDelaySec:
+                self._queue.popleft()
+                stats.dropped += 1
+                item.future.set_result(False)
+                continue
+
+            delay = self._TokenDelay()
+            if delay > 0:
+                # The message may be cancelled or become stale in the meantime, it is checked again.
+                await asyncio.sleep(delay)
+                continue
+            self._tokens -= 1
+            self._queue.popleft()
+
+            try:
+                (await self._Send(item.groupId, item.message)).raise_on_error()
+            except asyncio.CancelledError:
+                item.future.cancel()
+                raise
+            except Exception as ex:
+                LOGGER.warning(f"Failed to send group message to group {item.groupId}: {ex}")
+                stats.failed += 1
+                if not item.future.done():
+                    item.future.set_result(False)
+                continue
+
+            stats.sent += 1
+            stats.latencies.append(time.monotonic() - item.queuedAt)
+            if not item.future.done():
+                item.future.set_result(True)
+
+    def Start(self):
+        ''' Starts sending the queued messages on the running event loop.
+        '''
+        if self._task is None:
+            self._queueChanged = asyncio.Event()
+            self._queueChanged.set()
+            self._task = asyncio.get_running_loop().create_task(self._Run())
+
+    async def Flush(self):
+        ''' Waits until all messages queued so far have been sent or dropped.
+
+            Returns immediately if the pipeline is not started, as the queued messages are only sent once it is.
+        '''
+        if self._task is None:
+            return
+        futures = [item.future for item in self._queue]
+        if futures:
+            await asyncio.wait(futures)
+
+    def Stop(self):
+        ''' Stops sending messages, the messages still queued are dropped.
+        '''
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        while self._queue:
+            item = self._queue.popleft()
+            self._GetStats(item.groupId).dropped += 1
+            if not item.future.done():
+                item.future.set_result(False)
@@ -0,0 +1,264 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Pool of pre-established CASE sessions for a working set of nodes.
+
+A SessionPool is started through ChipDeviceControllerBase.StartSessionPool. It establishes sessions with its nodes
+up front and keeps them in use: a session that has not carried an interaction for a while is refreshed with a
+minimal read before the node could have dropped it, and re-established if the refresh fails. Interactions with
+the nodes of the pool are counted as hits when the pool believes their session to be established, and as misses
+otherwise.
+'''
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import typing
+from dataclasses import dataclass, field
+
+from .clusters import Objects as GeneratedObjects
+from .interaction_model import SessionParameters
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionPoolNode:
+    nodeId: int
+    # time.monotonic() of the last successful establishment or use of the session, None when the session is not
+    # believed to be established.
+    lastActive: typing.Optional[float] = None
+    establishmentTime: typing.Optional[float] = None
+    roundTripTimeoutMs: typing.Optional[int] = None
+    sessionParameters: typing.Optional[SessionParameters] = None
+    lastError: typing.Optional[BaseException] = None
+
+
+@dataclass
+class SessionPoolStats:
+    hits: int = 0
+    misses: int = 0
+    establishments: int = 0
+    establishmentFailures: int = 0
+    refreshes: int = 0
+    refreshFailures: int = 0
+    # Times in seconds of the establishments done by the pool and of the requests that missed the pool.
+    establishmentLatencies: typing.List[float] = field(default_factory=list)
+    missLatencies: typing.List[float] = field(default_factory=list)
+
+    @property
+    def hitRatio(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    @property
+    def averageEstablishmentLatency(self) -> float:
+        return sum(self.establishmentLatencies) / len(self.establishmentLatencies) if self.establishmentLatencies else 0.0
+
+    @property
+    def maxEstablishmentLatency(self) -> float:
+        return max(self.establishmentLatencies, default=0.0)
+
+
+class SessionPool:
+    ''' Keeps CASE sessions with a working set of nodes established.
+
+        devCtrl: ChipDeviceControllerBase the sessions belong to.
+        nodeIds: The initial working set.
+        idleTimeoutSec: Time after which a session that has not been used is no longer considered established.
+        refreshMarginSec: How long before idleTimeoutSec an unused session gets refreshed.
+        checkIntervalSec: Interval at which the sessions are checked once Start has been called.
+        maxConcurrency: The maximum number of sessions established or refreshed at the same time.
+        maxLatencySamples: The number of latencies kept in the stats.
+    '''
+
+    def __init__(self, devCtrl, nodeIds: typing.Iterable[int] = (), idleTimeoutSec: float = 300, refreshMarginSec: float = 30,
+                 checkIntervalSec: float = 10, maxConcurrency: int = 8, payloadCapability: int = 0,
+                 maxLatencySamples: int = 1000):
+        if refreshMarginSec >= idleTimeoutSec:
+            raise ValueError("refreshMarginSec must be smaller than idleTimeoutSec")
+        if maxConcurrency < 1:
+            raise ValueError("maxConcurrency must be at least 1")
+
+        self._devCtrl = devCtrl
+        self._idleTimeoutSec = idleTimeoutSec
+        self._refreshMarginSec = refreshMarginSec
+        self._checkIntervalSec = checkIntervalSec
+        self._maxConcurrency = maxConcurrency
+        self._payloadCapability = payloadCapability
+        self._maxLatencySamples = maxLatencySamples
+        self._nodes: typing.Dict[int, SessionPoolNode] = {}
+        self._task: typing.Optional[asyncio.Task] = None
+        self._loop: typing.Optional[asyncio.AbstractEventLoop] = None
+        self.stats = SessionPoolStats()
+        self.AddNodes(nodeIds)
+
+    def __contains__(self, nodeId: int) -> bool:
+        return nodeId in self._nodes
+
+    @property
+    def nodeIds(self) -> typing.List[int]:
+        return list(self._nodes)
+
+    def GetNode(self, nodeId: int) -> SessionPoolNode:
+        return self._nodes[nodeId]
+
+    def AddNodes(self, nodeIds: typing.Iterable[int]):
+        ''' Adds nodes to the working set. Their sessions are established by Warm, or by the next check once started.
+        '''
+        for nodeId in nodeIds:
+            self._nodes.setdefault(nodeId, SessionPoolNode(nodeId))
+
+    def RemoveNodes(self, nodeIds: typing.Iterable[int]):
+        ''' Removes nodes from the working set. Their sessions are left as they are.
+        '''
+        for nodeId in nodeIds:
+            self._nodes.pop(nodeId, None)
+
+    def IsWarm(self, nodeId: int, now: typing.Optional[float] = None) -> bool:
+        ''' Returns whether the session with the node is believed to be established.
+        '''
+        node = self._nodes.get(nodeId)
+        if node is None or node.lastActive is None:
+            return False
+        return (time.monotonic() if now is None else now) - node.lastActive < self._idleTimeoutSec
+
+    def ResetStats(self):
+        self.stats = SessionPoolStats()
+
+    def _AddSample(self, samples: typing.List[float], value: float):
+        samples.append(value)
+        if len(samples) > self._maxLatencySamples:
+            del samples[:len(samples) - self._maxLatencySamples]
+
+    def RecordRequest(self, nodeId: int, warm: bool, latency: float):
+        ''' Called by the device controller for each GetConnectedDevice on a node of the pool.
+        '''
+        if warm:
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+            self._AddSample(self.stats.missLatencies, latency)
+
+        node = self._nodes.get(nodeId)
+        if node is not None:
+            node.lastActive = time.monotonic()
+
+    async def _Establish(self, node: SessionPoolNode):
+        start = time.monotonic()
+        try:
+            device = await self._devCtrl._GetConnectedDevice(node.nodeId, allowPASE=False,
+                                                             payloadCapability=self._payloadCapability)
+        except Exception as ex:
+            LOGGER.warning(f"Session pool failed to establish a session with node {node.nodeId}: {ex}")
+            self.stats.establishmentFailures += 1
+            node.lastActive = None
+            node.lastError = ex
+            return None
+
+        node.establishmentTime = time.monotonic() - start
+        node.lastActive = time.monotonic()
+        node.lastError = None
+        self.stats.establishments += 1
+        self._AddSample(self.stats.establishmentLatencies, node.establishmentTime)
+
+        try:
+            node.roundTripTimeoutMs = self._devCtrl._ComputeRoundTripTimeoutForDevice(device)
+            node.sessionParameters = self._devCtrl._GetRemoteSessionParametersForDevice(device)
+        except Exception as ex:
+            LOGGER.warning(f"Session pool failed to get the session parameters of node {node.nodeId}: {ex}")
+        return device
+
+    async def _Refresh(self, node: SessionPoolNode):
+        if node.lastActive is None:
+            await self._Establish(node)
+            return
+
+        self.stats.refreshes += 1
+        try:
+            device = await self._devCtrl._GetConnectedDevice(node.nodeId, allowPASE=False,
+                                                             payloadCapability=self._payloadCapability)
+            # Every node has this attribute on its root endpoint.
+            await self._devCtrl._ReadWithDevice(
+                device, node.nodeId, attributes=[(0, GeneratedObjects.BasicInformation.Attributes.DataModelRevision)])
+        except Exception as ex:
+            LOGGER.info(f"Session pool failed to refresh the session with node {node.nodeId}, re-establishing: {ex}")
+            self.stats.refreshFailures += 1
+            node.lastActive = None
+            node.lastError = ex
+            try:
+                self._devCtrl.ExpireSessions(node.nodeId)
+            except Exception:
+                LOGGER.exception(f"Session pool failed to expire the sessions with node {node.nodeId}")
+            await self._Establish(node)
+            return
+
+        node.lastActive = time.monotonic()
+
+    async def _ForEach(self, coro, nodes: typing.List[SessionPoolNode]):
+        semaphore = asyncio.Semaphore(self._maxConcurrency)
+
+        async def run(node: SessionPoolNode):
+            async with semaphore:
+                await coro(node)
+
+        await asyncio.gather(*(run(node) for node in nodes))
+
+    async def Warm(self, nodeIds: typing.Optional[typing.Iterable[int]] = None):
+        ''' Establishes the sessions with the given nodes of the pool (all by default) that are not believed to be established.
+        '''
+        now = time.monotonic()
+        nodes = [self._nodes[n] for n in (self._nodes if nodeIds is None else nodeIds) if n in self._nodes]
+        await self._ForEach(self._Establish, [node for node in nodes if not self.IsWarm(node.nodeId, now)])
+
+    async def Check(self):
+        ''' Refreshes the sessions that are about to idle out and re-establishes the ones that are not established.
+        '''
+        deadline = time.monotonic() - (self._idleTimeoutSec - self._refreshMarginSec)
+        await self._ForEach(self._Refresh, [node for node in self._nodes.values()
+                                            if node.lastActive is None or node.lastActive <= deadline])
+
+    async def _Run(self):
+        while True:
+            await asyncio.sleep(self._checkIntervalSec)
+            try:
+                await self.Check()
+            except Exception:
+                LOGGER.exception("Session pool check failed")
+
+    def Start(self):
+        ''' Starts checking the sessions every checkIntervalSec on the running event loop.
+        '''
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._task = self._loop.create_task(self._Run())
+
+    def Stop(self):
+        ''' Stops checking the sessions. Can be called from any thread, including after the event loop is closed.
+        '''
+        if self._task is None:
+            return
+        task, loop = self._task, self._loop
+        self._task = self._loop = None
+        try:
+            loop.call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            # The loop is closed, and the task with it.
+            pass
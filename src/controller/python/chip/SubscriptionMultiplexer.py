@@ -0,0 +1,412 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Sharing of subscriptions among many consumers.
+
+Consumers subscribe through a SubscriptionMultiplexer (see ChipDeviceControllerBase.subscriptionMultiplexer)
+instead of each establishing its own subscription. For each node and report interval, the multiplexer merges the
+paths of all consumers into the smallest set of paths covering them, establishes the device subscriptions for that
+set, and fans the reports out to the consumers whose paths match. The device subscriptions are planned again when
+consumers come and go: the new subscriptions are established before the ones they replace are shut down, so no
+report is missed, and subscriptions whose paths did not change are kept. While both are established, the reports
+of the outgoing subscriptions are not delivered for the paths a new subscription already covers.
+'''
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import typing
+from dataclasses import dataclass
+
+from .clusters import Attribute as ClusterAttribute
+
+LOGGER = logging.getLogger(__name__)
+
+_Path = typing.Union[ClusterAttribute.AttributePath, ClusterAttribute.EventPath]
+# Attribute paths and event paths of a device subscription.
+_SubscriptionPaths = typing.Tuple[typing.Tuple[ClusterAttribute.AttributePath, ...], typing.Tuple[ClusterAttribute.EventPath, ...]]
+
+
+def _PathIds(path: _Path) -> typing.Tuple[typing.Optional[int], ...]:
+    if isinstance(path, ClusterAttribute.EventPath):
+        return (path.EndpointId, path.ClusterId, path.EventId)
+    return (path.EndpointId, path.ClusterId, path.AttributeId)
+
+
+def _MatchesIds(ids: typing.Tuple[typing.Optional[int], ...], concreteIds: typing.Tuple[int, ...]) -> bool:
+    return all(id is None or id == concreteId for id, concreteId in zip(ids, concreteIds))
+
+
+def _Overlap(paths: typing.Iterable[_Path], otherPaths: typing.Iterable[_Path]) -> bool:
+    ''' Returns whether an attribute or event can be selected both by one of paths and one of otherPaths.
+    '''
+    return any(all(id is None or otherId is None or id == otherId for id, otherId in zip(_PathIds(path), _PathIds(other)))
+               for path in paths for other in otherPaths)
+
+
+def PathCovers(path: _Path, other: _Path) -> bool:
+    ''' Returns whether every attribute or event of other is also selected by path, the wildcards of path matching
+        any ID. An event path only covers urgent event paths if it is urgent itself.
+    '''
+    if type(path) is not type(other):
+        return False
+    if isinstance(path, ClusterAttribute.EventPath) and other.Urgent and not path.Urgent:
+        return False
+    return all(id is None or id == otherId for id, otherId in zip(_PathIds(path), _PathIds(other)))
+
+
+def _PathOrder(path: _Path):
+    return tuple(-1 if id is None else id for id in _PathIds(path)) + (
+        (int(bool(path.Urgent)),) if isinstance(path, ClusterAttribute.EventPath) else ())
+
+
+def MinimalCoveringPaths(paths: typing.Iterable[_Path]) -> typing.List[_Path]:
+    ''' Returns the paths that are not covered by another one of paths, which together select the same attributes
+        and events, sorted.
+    '''
+    # The broadest paths come first, so a path is only kept when none of the kept paths covers it.
+    candidates = sorted(set(paths), key=lambda path: (-sum(id is None for id in _PathIds(path)),
+                                                      -int(bool(getattr(path, 'Urgent', False))), _PathOrder(path)))
+    covering: typing.List[_Path] = []
+    for path in candidates:
+        if not any(PathCovers(kept, path) for kept in covering):
+            covering.append(path)
+    return sorted(covering, key=_PathOrder)
+
+
+def PlanSubscriptions(attributes: typing.Iterable[ClusterAttribute.AttributePath],
+                      events: typing.Iterable[ClusterAttribute.EventPath],
+                      maxPathsPerSubscription: typing.Optional[int] = None) -> typing.List[_SubscriptionPaths]:
+    ''' Returns the paths of the device subscriptions covering attributes and events: a single subscription, or
+        as few as possible with at most maxPathsPerSubscription attribute paths and event paths each.
+    '''
+    attributes = MinimalCoveringPaths(attributes)
+    events = MinimalCoveringPaths(events)
+    if not attributes and not events:
+        return []
+    size = maxPathsPerSubscription or max(len(attributes), len(events))
+    return [(tuple(attributes[start:start + size]), tuple(events[start:start + size]))
+            for start in range(0, max(len(attributes), len(events)), size)]
+
+
+@dataclass
+class SubscriptionMultiplexerStats:
+    consumers: int = 0
+    # Device subscriptions currently established.
+    subscriptions: int = 0
+    # Device subscriptions established and shut down since the multiplexer was created.
+    established: int = 0
+    shutDown: int = 0
+    replans: int = 0
+
+
+class MultiplexedSubscription:
+    ''' A consumer of a SubscriptionMultiplexer, which receives the reports of the device subscriptions that match
+        its paths. Created by SubscriptionMultiplexer.Subscribe.
+
+        The callbacks have the signatures of the SubscriptionTransaction callbacks, and are called on the Matter
+        thread with the device subscription the report was received on.
+    '''
+
+    def __init__(self, multiplexer: SubscriptionMultiplexer, nodeId: int, reportInterval: typing.Tuple[int, int],
+                 attributes: typing.Sequence[ClusterAttribute.AttributePath],
+                 events: typing.Sequence[ClusterAttribute.EventPath]):
+        self._multiplexer = multiplexer
+        self.nodeId = nodeId
+        self.reportInterval = reportInterval
+        self.attributes = tuple(attributes)
+        self.events = tuple(events)
+        self._attributeIds = tuple(_PathIds(path) for path in self.attributes)
+        self._eventIds = tuple(_PathIds(path) for path in self.events)
+        self._onAttributeChangeCb: typing.Optional[typing.Callable[[ClusterAttribute.TypedAttributePath,
+                                                                    ClusterAttribute.SubscriptionTransaction], None]] = None
+        self._onEventChangeCb: typing.Optional[typing.Callable[[ClusterAttribute.EventReadResult,
+                                                                ClusterAttribute.SubscriptionTransaction], None]] = None
+        self._onErrorCb: typing.Optional[typing.Callable[[int, ClusterAttribute.SubscriptionTransaction], None]] = None
+        self._isDone = False
+
+    def SetAttributeUpdateCallback(self, callback: typing.Callable[[ClusterAttribute.TypedAttributePath,
+                                                                    ClusterAttribute.SubscriptionTransaction], None]):
+        self._onAttributeChangeCb = callback
+
+    def SetEventUpdateCallback(self, callback: typing.Callable[[ClusterAttribute.EventReadResult,
+                                                                ClusterAttribute.SubscriptionTransaction], None]):
+        self._onEventChangeCb = callback
+
+    def SetErrorCallback(self, callback: typing.Callable[[int, ClusterAttribute.SubscriptionTransaction], None]):
+        self._onErrorCb = callback
+
+    def MatchesAttribute(self, path: ClusterAttribute.AttributePath) -> bool:
+        concreteIds = _PathIds(path)
+        return any(_MatchesIds(ids, concreteIds) for ids in self._attributeIds)
+
+    def MatchesEvent(self, header: ClusterAttribute.EventHeader) -> bool:
+        concreteIds = (header.EndpointId, header.ClusterId, header.EventId)
+        return any(_MatchesIds(ids, concreteIds) for ids in self._eventIds)
+
+    def GetAttribute(self, path: ClusterAttribute.TypedAttributePath) -> typing.Any:
+        ''' Returns the latest value of an attribute matching the paths of this consumer.
+        '''
+        if not self.MatchesAttribute(path.Path):
+            raise KeyError(f"Attribute {path.Path} is not subscribed by this consumer")
+        for (attributes, _), transaction in self._multiplexer._Subscriptions(self):
+            if any(_MatchesIds(_PathIds(covering), _PathIds(path.Path)) for covering in attributes):
+                return transaction.GetAttribute(path)
+        raise KeyError(f"Attribute {path.Path} is not subscribed")
+
+    def GetAttributes(self) -> typing.Dict[int, typing.Dict[typing.Any, typing.Dict[typing.Any, typing.Any]]]:
+        ''' Returns the latest values of the attributes matching the paths of this consumer, like
+            SubscriptionTransaction.GetAttributes without returnClusterObject.
+        '''
+        result: typing.Dict[int, typing.Dict[typing.Any, typing.Dict[typing.Any, typing.Any]]] = {}
+        for _, transaction in self._multiplexer._Subscriptions(self):
+            for endpointId, clusters in transaction.GetAttributes().items():
+                for clusterType, attributes in clusters.items():
+                    for attributeType, value in attributes.items():
+                        if attributeType is ClusterAttribute.DataVersion or not self.MatchesAttribute(
+                                ClusterAttribute.AttributePath(endpointId, clusterType.id, attributeType.attribute_id)):
+                            continue
+                        clusterResult = result.setdefault(endpointId, {}).setdefault(clusterType, {})
+                        clusterResult[attributeType] = value
+                        clusterResult[ClusterAttribute.DataVersion] = attributes.get(ClusterAttribute.DataVersion)
+        return result
+
+    async def Shutdown(self):
+        ''' Stops receiving reports. The device subscriptions are planned again without the paths of this consumer.
+        '''
+        if self._isDone:
+            return
+        self._isDone = True
+        await self._multiplexer._Remove(self)
+
+    def __repr__(self):
+        return f'<MultiplexedSubscription (NodeId={self.nodeId}, Attributes={len(self.attributes)}, Events={len(self.events)})>'
+
+
+class _Channel:
+    ''' The consumers and device subscriptions of a node with a report interval.
+    '''
+
+    def __init__(self, nodeId: int, reportInterval: typing.Tuple[int, int]):
+        self.nodeId = nodeId
+        self.reportInterval = reportInterval
+        self.lock = asyncio.Lock()
+        # Replaced rather than modified, so the Matter thread can iterate them while consumers come and go.
+        self.consumers: typing.Tuple[MultiplexedSubscription, ...] = ()
+        self.subscriptions: typing.Dict[_SubscriptionPaths, ClusterAttribute.SubscriptionTransaction] = {}
+        # During a replan, the subscriptions being replaced and the paths of the new subscriptions established so far.
+        self.outgoing: typing.Tuple[ClusterAttribute.SubscriptionTransaction, ...] = ()
+        self.replacements: typing.Tuple[_SubscriptionPaths, ...] = ()
+
+    def IsSuperseded(self, transaction: ClusterAttribute.SubscriptionTransaction, index: int,
+                     concreteIds: typing.Tuple[int, ...]) -> bool:
+        ''' Returns whether a report of transaction is also delivered by a new subscription replacing it, index
+            selecting the attribute (0) or event (1) paths.
+        '''
+        if not any(outgoing is transaction for outgoing in self.outgoing):
+            return False
+        return any(_MatchesIds(_PathIds(path), concreteIds) for paths in self.replacements for path in paths[index])
+
+
+class SubscriptionMultiplexer:
+    ''' Shares device subscriptions among consumers subscribing to overlapping paths on the same nodes.
+
+        devCtrl: ChipDeviceControllerBase establishing the subscriptions.
+        maxPathsPerSubscription: The maximum number of attribute paths, and of event paths, in a device subscription.
+            Nodes are only required to support 3 of each per subscription. When None, each node and report interval
+            gets a single subscription with all the paths.
+        fabricFiltered: Whether the subscriptions are fabric-filtered.
+    '''
+
+    def __init__(self, devCtrl, maxPathsPerSubscription: typing.Optional[int] = None, fabricFiltered: bool = True):
+        if maxPathsPerSubscription is not None and maxPathsPerSubscription < 1:
+            raise ValueError("maxPathsPerSubscription must be at least 1")
+        self._devCtrl = devCtrl
+        self._maxPathsPerSubscription = maxPathsPerSubscription
+        self._fabricFiltered = fabricFiltered
+        self._channels: typing.Dict[typing.Tuple[int, typing.Tuple[int, int]], _Channel] = {}
+        self.stats = SubscriptionMultiplexerStats()
+
+    async def Subscribe(self, nodeId: int, reportInterval: typing.Tuple[int, int], attributes=None,
+                        events=None) -> MultiplexedSubscription:
+        ''' Adds a consumer of the reports of attributes and events of a node.
+
+            attributes and events take the path forms of ChipDeviceControllerBase.Read, or AttributePath and
+            EventPath objects. Consumers with the same nodeId and reportInterval share device subscriptions.
+
+            Returns:
+                The MultiplexedSubscription, once device subscriptions covering its paths are established. The
+                latest values of its attributes are available through GetAttribute(s) at that point.
+
+            Raises:
+                InteractionModelError or ChipStackError when a device subscription cannot be established, in which
+                case the consumer is not added.
+        '''
+        attributePaths = [self._devCtrl._parseAttributePathTuple(path) for path in attributes or ()]
+        eventPaths = [self._devCtrl._parseEventPathTuple(path) for path in events or ()]
+        if not attributePaths and not eventPaths:
+            raise ValueError("At least one attribute or event path is required")
+
+        reportInterval = tuple(reportInterval)
+        consumer = MultiplexedSubscription(self, nodeId, reportInterval, attributePaths, eventPaths)
+        async with self._LockedChannel((nodeId, reportInterval), create=True) as channel:
+            try:
+                await self._Replan(channel, channel.consumers + (consumer,))
+            finally:
+                self._DiscardIfUnused(channel)
+        return consumer
+
+    async def _Remove(self, consumer: MultiplexedSubscription):
+        async with self._LockedChannel((consumer.nodeId, consumer.reportInterval), create=False) as channel:
+            if channel is None:
+                return
+            consumers = tuple(c for c in channel.consumers if c is not consumer)
+            try:
+                await self._Replan(channel, consumers)
+            except Exception as ex:
+                # The remaining consumers are still served by the current subscriptions, which cover more than they need.
+                LOGGER.warning(f"Failed to plan the subscriptions of node {consumer.nodeId} again: {ex}")
+                self._SetConsumers(channel, consumers)
+            self._DiscardIfUnused(channel)
+
+    @contextlib.asynccontextmanager
+    async def _LockedChannel(self, key: typing.Tuple[int, typing.Tuple[int, int]], create: bool):
+        ''' Yields the channel registered for key with its lock held, creating it when create is True, or None.
+
+            A channel removed while waiting for its lock (no consumers left, or the multiplexer shut down) is not
+            used: subscriptions established on it would no longer be reachable through the multiplexer.
+        '''
+        while True:
+            channel = self._channels.get(key)
+            if channel is None:
+                if not create:
+                    yield None
+                    return
+                channel = self._channels[key] = _Channel(*key)
+            async with channel.lock:
+                if self._channels.get(key) is channel:
+                    yield channel
+                    return
+
+    def _DiscardIfUnused(self, channel: _Channel):
+        key = (channel.nodeId, channel.reportInterval)
+        if not channel.consumers and not channel.subscriptions and self._channels.get(key) is channel:
+            del self._channels[key]
+
+    def _SetConsumers(self, channel: _Channel, consumers: typing.Tuple[MultiplexedSubscription, ...]):
+        self.stats.consumers += len(consumers) - len(channel.consumers)
+        channel.consumers = consumers
+
+    async def _Replan(self, channel: _Channel, consumers: typing.Tuple[MultiplexedSubscription, ...]):
+        plan = PlanSubscriptions([path for consumer in consumers for path in consumer.attributes],
+                                 [path for consumer in consumers for path in consumer.events],
+                                 self._maxPathsPerSubscription)
+        if set(plan) == set(channel.subscriptions):
+            self._SetConsumers(channel, consumers)
+            return
+
+        self.stats.replans += 1
+        obsolete = [transaction for paths, transaction in channel.subscriptions.items() if paths not in plan]
+        established: typing.Dict[_SubscriptionPaths, ClusterAttribute.SubscriptionTransaction] = {}
+        channel.outgoing = tuple(obsolete)
+        try:
+            try:
+                for paths in plan:
+                    if paths not in channel.subscriptions:
+                        established[paths] = await self._Establish(channel, paths)
+                        channel.replacements += (paths,)
+            except Exception:
+                for transaction in established.values():
+                    self._ShutdownTransaction(transaction)
+                raise
+
+            # The new subscriptions already deliver reports to the consumers, the ones they replace are shut down after.
+            self._SetConsumers(channel, consumers)
+            channel.subscriptions = {paths: established[paths] if paths in established else channel.subscriptions[paths]
+                                     for paths in plan}
+            for transaction in obsolete:
+                self._ShutdownTransaction(transaction)
+        finally:
+            channel.outgoing = ()
+            channel.replacements = ()
+
+    async def _Establish(self, channel: _Channel, paths: _SubscriptionPaths) -> ClusterAttribute.SubscriptionTransaction:
+        attributes, events = paths
+        transaction = await self._devCtrl.Read(channel.nodeId, attributes=list(attributes) or None,
+                                               events=list(events) or None, reportInterval=channel.reportInterval,
+                                               fabricFiltered=self._fabricFiltered, keepSubscriptions=True)
+
+        def onAttributeChange(path: ClusterAttribute.TypedAttributePath, transaction: ClusterAttribute.SubscriptionTransaction):
+            if channel.IsSuperseded(transaction, 0, _PathIds(path.Path)):
+                return
+            for consumer in channel.consumers:
+                if consumer._onAttributeChangeCb is not None and consumer.MatchesAttribute(path.Path):
+                    consumer._onAttributeChangeCb(path, transaction)
+
+        def onEventChange(event: ClusterAttribute.EventReadResult, transaction: ClusterAttribute.SubscriptionTransaction):
+            if channel.IsSuperseded(transaction, 1, (event.Header.EndpointId, event.Header.ClusterId, event.Header.EventId)):
+                return
+            for consumer in channel.consumers:
+                if consumer._onEventChangeCb is not None and consumer.MatchesEvent(event.Header):
+                    consumer._onEventChangeCb(event, transaction)
+
+        def onError(chipError: int, transaction: ClusterAttribute.SubscriptionTransaction):
+            for consumer in channel.consumers:
+                if consumer._onErrorCb is not None and (_Overlap(attributes, consumer.attributes) or
+                                                        _Overlap(events, consumer.events)):
+                    consumer._onErrorCb(chipError, transaction)
+
+        transaction.SetAttributeUpdateCallback(onAttributeChange)
+        transaction.SetEventUpdateCallback(onEventChange)
+        transaction.SetErrorCallback(onError)
+        self.stats.established += 1
+        self.stats.subscriptions += 1
+        return transaction
+
+    def _ShutdownTransaction(self, transaction: ClusterAttribute.SubscriptionTransaction):
+        try:
+            transaction.Shutdown()
+        except Exception as ex:
+            LOGGER.warning(f"Failed to shut down {transaction}: {ex}")
+        self.stats.shutDown += 1
+        self.stats.subscriptions -= 1
+
+    def _Subscriptions(self, consumer: MultiplexedSubscription) -> typing.List[typing.Tuple[
+            _SubscriptionPaths, ClusterAttribute.SubscriptionTransaction]]:
+        channel = self._channels.get((consumer.nodeId, consumer.reportInterval))
+        return list(channel.subscriptions.items()) if channel is not None else []
+
+    def GetSubscriptions(self, nodeId: int) -> typing.List[ClusterAttribute.SubscriptionTransaction]:
+        ''' Returns the device subscriptions currently established with a node, for all report intervals.
+        '''
+        return [transaction for (channelNodeId, _), channel in self._channels.items() if channelNodeId == nodeId
+                for transaction in channel.subscriptions.values()]
+
+    def Shutdown(self):
+        ''' Shuts down all device subscriptions. The consumers no longer receive reports.
+        '''
+        for channel in self._channels.values():
+            for transaction in channel.subscriptions.values():
+                self._ShutdownTransaction(transaction)
+            for consumer in channel.consumers:
+                consumer._isDone = True
+            self._SetConsumers(channel, ())
+            channel.subscriptions = {}
+        self._channels.clear()
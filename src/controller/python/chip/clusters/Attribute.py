@@ -18,13 +18,17 @@
 # Needed to use types in type hints before they are fully defined.
 from __future__ import annotations
 
+import asyncio
 import builtins
 import ctypes
-import inspect
+import itertools
 import logging
-import sys
+import struct
+import threading
+import time
 from asyncio.futures import Future
-from ctypes import CFUNCTYPE, POINTER, c_size_t, c_uint8, c_uint16, c_uint32, c_uint64, c_void_p, cast, py_object
+from collections import OrderedDict, deque
+from ctypes import CFUNCTYPE, POINTER, c_bool, c_size_t, c_uint8, c_uint16, c_uint32, c_uint64, c_void_p, cast, py_object
 from dataclasses import dataclass, field
 from enum import Enum, unique
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
@@ -37,8 +41,10 @@ from ..interaction_model import (AttributePathIBstruct, DataVersionFilterIBstruc
 from ..interaction_model import Status as InteractionModelStatus
 from ..native import ErrorSDKPart, GetLibraryHandle, NativeLibraryHandleMethodArguments, PyChipError
 from ..tlv import TLVReader
+from . import LazyObjects
 from . import Objects as GeneratedObjects  # noqa: F401
-from .ClusterObjects import Cluster, ClusterAttributeDescriptor, ClusterEvent
+from . import ObjectsIndex
+from .ClusterObjects import Cluster, ClusterAttributeDescriptor, ClusterEvent, GetClusterObjectCodec
 
 LOGGER = logging.getLogger(__name__)
 
@@ -121,14 +127,9 @@ class TypedAttributePath:
 
         # If Path is provided, derive ClusterType and AttributeType from it
         if self.Path is not None:
-            for cluster, attribute in _AttributeIndex:
-                attributeType = _AttributeIndex[(cluster, attribute)][0]
-                clusterType = _AttributeIndex[(cluster, attribute)][1]
-
-                if clusterType.id == self.Path.ClusterId and attributeType.attribute_id == self.Path.AttributeId:
-                    self.ClusterType = clusterType
-                    self.AttributeType = attributeType
-                    break
+            entry = _GetAttributeIndexEntry(self.Path.ClusterId, self.Path.AttributeId)
+            if entry is not None:
+                self.AttributeType, self.ClusterType = entry
 
             if self.ClusterType is None or self.AttributeType is None:
                 raise KeyError(f"No Schema found for Attribute {self.Path}")
@@ -251,34 +252,57 @@ _ClusterIndex = {}
 
 def _BuildAttributeIndex():
     ''' Build internal attribute index for locating the corresponding cluster object by path in the future.
-        We do this because this operation will take a long time when there are lots of attributes,
-        it takes about 300ms for a single query.
-        This is acceptable during init, but unacceptable when the server returns lots of attributes at the same time.
+        We do this because looking up attributes by path is done for every attribute the server returns.
+        The attributes are resolved from the generated ObjectsIndex, which takes O(n) time and does not need to
+        inspect the classes defined in Objects.py. Requires the cluster index to have been built.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Attributes') in str(subclass)):
-                    for attributeName, attribute in inspect.getmembers(subclass):
-                        if inspect.isclass(attribute):
-                            base_classes = inspect.getmro(attribute)
-
-                            # Only match on classes that extend the ClusterAttributeDescriptor class
-                            matched = [
-                                value for value in base_classes if 'ClusterAttributeDescriptor' in str(value)]
-                            if (matched == []):
-                                continue
-
-                            _AttributeIndex[(attribute.cluster_id, attribute.attribute_id)] = (eval(
-                                'GeneratedObjects.' + clusterName + '.Attributes.' + attributeName), obj)
+    for (clusterId, attributeId), attributeName in ObjectsIndex.ATTRIBUTES.items():
+        clusterType = _ClusterIndex[clusterId]
+        _AttributeIndex[(clusterId, attributeId)] = (getattr(clusterType.Attributes, attributeName), clusterType)
 
 
 def _BuildClusterIndex():
     ''' Build internal cluster index for locating the corresponding cluster object by path in the future.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj) and issubclass(obj, Cluster):
-            _ClusterIndex[obj.id] = obj
+    for clusterId in ObjectsIndex.CLUSTERS:
+        _ClusterIndex[clusterId] = LazyObjects.GetClusterObjectById(clusterId)
+
+
+def _IndexLazyCluster(clusterType):
+    ''' Add a cluster object that was loaded on demand, along with its attributes and events, to the internal indexes.
+    '''
+    _ClusterIndex[clusterType.id] = clusterType
+    for attribute in vars(getattr(clusterType, 'Attributes', object)).values():
+        if isinstance(attribute, type) and issubclass(attribute, ClusterAttributeDescriptor):
+            _AttributeIndex[(attribute.cluster_id, attribute.attribute_id)] = (attribute, clusterType)
+    for event in vars(getattr(clusterType, 'Events', object)).values():
+        if isinstance(event, type) and issubclass(event, ClusterEvent):
+            _EventIndex[str(EventPath(ClusterId=event.cluster_id, EventId=event.event_id))] = event
+
+
+def _GetClusterType(clusterId: int) -> Optional[type]:
+    clusterType = _ClusterIndex.get(clusterId)
+    if clusterType is None and LazyObjects.IsInstalled():
+        clusterType = LazyObjects.GetClusterObjectById(clusterId)
+        if clusterType is not None:
+            _IndexLazyCluster(clusterType)
+    return clusterType
+
+
+def _GetAttributeIndexEntry(clusterId: int, attributeId: int) -> Optional[Tuple[type, type]]:
+    ''' Returns the (attribute type, cluster type) for an attribute path, or None if it is unknown.
+    '''
+    entry = _AttributeIndex.get((clusterId, attributeId))
+    if entry is None and clusterId not in _ClusterIndex and _GetClusterType(clusterId) is not None:
+        entry = _AttributeIndex.get((clusterId, attributeId))
+    return entry
+
+
+def _GetEventType(path: EventPath) -> Optional[type]:
+    eventType = _EventIndex.get(str(path))
+    if eventType is None and path.ClusterId not in _ClusterIndex and _GetClusterType(path.ClusterId) is not None:
+        eventType = _EventIndex.get(str(path))
+    return eventType
 
 
 @dataclass
@@ -312,6 +336,11 @@ class AttributeCache:
                 Clusters.UnitTesting.Attributes.Int16u is the listeral key for indexing an attribute in the test cluster.
 
         This strongly typed keys permit a more natural and safer form of indexing.
+
+        The cache is updated incrementally: only the clusters that received new data since the last call to
+        GetUpdatedAttributeCache() are converted again, and in the cluster-view, cluster objects that were already
+        decoded are patched in place with the attributes that changed. Attribute data reported with the same
+        DataVersion as the cached value is unchanged and is not decoded again (see IsUnchanged()).
     '''
     returnClusterObject: bool = False
     attributeTLVCache: Dict[int, Dict[int, Dict[int, bytes]]] = field(
@@ -319,12 +348,27 @@ class AttributeCache:
     versionList: Dict[int, Dict[int, Dict[int, int]]] = field(
         default_factory=lambda: {})
 
-    _attributeCacheUpdateNeeded: set[AttributePath] = field(
-        default_factory=lambda: set())
+    # EndpointId -> ClusterId -> AttributeIds updated since the last call to GetUpdatedAttributeCache().
+    _attributeCacheUpdateNeeded: Dict[int, Dict[int, Set[int]]] = field(
+        default_factory=lambda: {})
+    # EndpointId -> ClusterId -> AttributeId -> DataVersion of the successfully reported attribute data.
+    _attributeVersions: Dict[int, Dict[int, Dict[int, int]]] = field(
+        default_factory=lambda: {})
     _attributeCache: Dict[int, List[Cluster]] = field(
         default_factory=lambda: {})
 
-    def UpdateTLV(self, path: AttributePath, dataVersion: int,  data: Union[bytes, ValueDecodeFailure]):
+    def IsUnchanged(self, path: AttributePath, dataVersion: Optional[int]) -> bool:
+        ''' Returns whether the attribute data for this path was already stored with the same data version.
+
+            Since the data version of a cluster changes whenever any of its attributes change, such a report
+            carries the data that is already in the cache and does not need to be decoded again. Data reported
+            without a data version (None) is never considered unchanged.
+        '''
+        if dataVersion is None:
+            return False
+        return self._attributeVersions.get(path.EndpointId, {}).get(path.ClusterId, {}).get(path.AttributeId) == dataVersion
+
+    def UpdateTLV(self, path: AttributePath, dataVersion: Optional[int],  data: Union[bytes, ValueDecodeFailure]):
         ''' Store data in TLV since that makes it easiest to eventually convert to either the
             cluster or attribute view representations (see below in GetUpdatedAttributeCache()).
         '''
@@ -341,7 +385,8 @@ class AttributeCache:
 
         # All attributes from the same cluster instance should have the same dataVersion,
         # so we can set the dataVersion of the cluster to the dataVersion with a random attribute.
-        endpointVersion[path.ClusterId] = dataVersion
+        if dataVersion is not None:
+            endpointVersion[path.ClusterId] = dataVersion
 
         clusterCache = endpointCache[path.ClusterId]
         if (path.AttributeId not in clusterCache):
@@ -349,8 +394,15 @@ class AttributeCache:
 
         clusterCache[path.AttributeId] = data
 
+        attributeVersions = self._attributeVersions.setdefault(path.EndpointId, {}).setdefault(path.ClusterId, {})
+        if isinstance(data, ValueDecodeFailure) or dataVersion is None:
+            attributeVersions.pop(path.AttributeId, None)
+        else:
+            attributeVersions[path.AttributeId] = dataVersion
+
         # For this path the attribute cache still requires an update.
-        self._attributeCacheUpdateNeeded.add(path)
+        self._attributeCacheUpdateNeeded.setdefault(path.EndpointId, {}).setdefault(
+            path.ClusterId, set()).add(path.AttributeId)
 
     def GetUpdatedAttributeCache(self) -> Dict[int, List[Cluster]]:
         ''' This converts the raw TLV data into a cluster object format.
@@ -369,18 +421,45 @@ class AttributeCache:
             regardless of the subset of attributes read. For attributes not returned in the report,
             defaults are used. If a cluster cannot be decoded,
             instead of a cluster object value, a ValueDecodeFailure shall be present.
+            Cluster objects returned by a previous call are updated in place with the attributes that changed since.
         '''
 
         def handle_cluster_view(endpointId, clusterId, clusterType):
             try:
                 decodedData = clusterType.FromDict(
-                    data=clusterType.descriptor.TagDictToLabelDict([], self.attributeTLVCache[endpointId][clusterId]))
+                    data=GetClusterObjectCodec(clusterType).TagDictToLabelDict([], self.attributeTLVCache[endpointId][clusterId]))
                 decodedData.SetDataVersion(
                     self.versionList.get(endpointId, {}).get(clusterId))
                 return decodedData
             except Exception as ex:
                 return ValueDecodeFailure(self.attributeTLVCache[endpointId][clusterId], ex)
 
+        def patch_cluster_view(endpointId, clusterId, clusterType, clusterObject, attributeIds) -> bool:
+            ''' Updates the attributes of a previously decoded cluster object. Returns False if the whole cluster
+                has to be decoded again instead, e.g. because the new data cannot be decoded.
+            '''
+            codec = GetClusterObjectCodec(clusterType)
+            clusterData = self.attributeTLVCache[endpointId][clusterId]
+            values = []
+            for attributeId in attributeIds:
+                compiledField = codec.GetFieldByTag(attributeId)
+                if compiledField is None:
+                    # Attributes unknown to the cluster object are not part of it.
+                    continue
+                attributeEntry = _GetAttributeIndexEntry(clusterId, attributeId)
+                value = clusterData[attributeId]
+                if attributeEntry is None or isinstance(value, ValueDecodeFailure):
+                    return False
+                try:
+                    values.append((compiledField.Label, attributeEntry[0].FromTagDictOrRawValue(value)))
+                except Exception:
+                    return False
+
+            for label, value in values:
+                setattr(clusterObject, label, value)
+            clusterObject.SetDataVersion(self.versionList.get(endpointId, {}).get(clusterId))
+            return True
+
         def handle_attribute_view(endpointId, clusterId, attributeId, attributeType):
             value = self.attributeTLVCache[endpointId][clusterId][attributeId]
             if isinstance(value, ValueDecodeFailure):
@@ -390,46 +469,200 @@ class AttributeCache:
             except Exception as ex:
                 return ValueDecodeFailure(value, ex)
 
-        for attributePath in self._attributeCacheUpdateNeeded:
-            endpointId, clusterId, attributeId = attributePath.EndpointId, attributePath.ClusterId, attributePath.AttributeId
-
+        for endpointId, clusters in self._attributeCacheUpdateNeeded.items():
             if endpointId not in self._attributeCache:
                 self._attributeCache[endpointId] = {}
             endpointCache = self._attributeCache[endpointId]
 
-            if clusterId not in _ClusterIndex:
-                #
-                # #22599 tracks dealing with unknown clusters more
-                # gracefully so that clients can still access this data.
-                #
-                continue
+            for clusterId, attributeIds in clusters.items():
+                clusterType = _GetClusterType(clusterId)
+                if clusterType is None:
+                    #
+                    # #22599 tracks dealing with unknown clusters more
+                    # gracefully so that clients can still access this data.
+                    #
+                    continue
 
-            clusterType = _ClusterIndex[clusterId]
+                if self.returnClusterObject:
+                    clusterObject = endpointCache.get(clusterType)
+                    if not isinstance(clusterObject, clusterType) or not patch_cluster_view(
+                            endpointId, clusterId, clusterType, clusterObject, attributeIds):
+                        endpointCache[clusterType] = handle_cluster_view(
+                            endpointId, clusterId, clusterType)
+                    continue
 
-            if self.returnClusterObject:
-                endpointCache[clusterType] = handle_cluster_view(
-                    endpointId, clusterId, clusterType)
-            else:
                 if clusterType not in endpointCache:
                     endpointCache[clusterType] = {}
                 clusterCache = endpointCache[clusterType]
                 clusterCache[DataVersion] = self.versionList.get(
                     endpointId, {}).get(clusterId)
 
-                if (clusterId, attributeId) not in _AttributeIndex:
-                    #
-                    # #22599 tracks dealing with unknown clusters more
-                    # gracefully so that clients can still access this data.
-                    #
-                    continue
-
-                attributeType = _AttributeIndex[(clusterId, attributeId)][0]
-                clusterCache[attributeType] = handle_attribute_view(
-                    endpointId, clusterId, attributeId, attributeType)
+                for attributeId in attributeIds:
+                    attributeEntry = _GetAttributeIndexEntry(clusterId, attributeId)
+                    if attributeEntry is None:
+                        #
+                        # #22599 tracks dealing with unknown clusters more
+                        # gracefully so that clients can still access this data.
+                        #
+                        continue
+
+                    attributeType = attributeEntry[0]
+                    clusterCache[attributeType] = handle_attribute_view(
+                        endpointId, clusterId, attributeId, attributeType)
         self._attributeCacheUpdateNeeded.clear()
         return self._attributeCache
 
 
+@unique
+class ReportQueuePolicy(Enum):
+    ''' What SubscriptionReports does with a report when its queue is full.
+    '''
+    # A report of an attribute that is still queued replaces the queued one, others drop the oldest report.
+    COALESCE = 'coalesce'
+    DROP_OLDEST = 'drop_oldest'
+    # The Matter thread waits for the consumer, which holds off the node, for up to blockTimeoutSec after which
+    # the oldest report is dropped. The consumer must not wait for the Matter thread meanwhile.
+    BLOCK = 'block'
+
+
+@dataclass
+class AttributeReport:
+    Path: TypedAttributePath
+    # The value of the attribute when it was reported, see SubscriptionTransaction.GetAttribute.
+    Value: Any
+
+
+@dataclass
+class SubscriptionReportsStats:
+    depth: int = 0
+    maxDepth: int = 0
+    enqueued: int = 0
+    delivered: int = 0
+    # Attribute reports replaced by a later report of the same attribute.
+    coalesced: int = 0
+    dropped: int = 0
+    blockedSec: float = 0.0
+
+
+class SubscriptionReports:
+    ''' Asynchronous iterator over the attribute and event reports of a subscription, see SubscriptionTransaction.reports.
+
+        Yields an AttributeReport for each attribute change and an EventReadResult for each event, in the order they
+        were reported. The iteration ends when the subscription is shut down or terminates, raising the error it
+        terminated with if any, once the queued reports were consumed.
+
+        A consumer that stops iterating before that must close the iterator, with aclose() or by using it as an
+        asynchronous context manager, so reports are no longer queued for it.
+    '''
+
+    def __init__(self, eventLoop, maxsize: int, policy: ReportQueuePolicy, blockTimeoutSec: Optional[float],
+                 onClose: Optional[Callable[[SubscriptionReports], None]] = None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._eventLoop = eventLoop
+        self._maxsize = maxsize
+        self._policy = policy
+        self._blockTimeoutSec = blockTimeoutSec
+        self._condition = threading.Condition()
+        # Keyed by the AttributePath for attribute reports that can be coalesced, by a sequence number otherwise.
+        self._reports: OrderedDict[Any, Union[AttributeReport, EventReadResult]] = OrderedDict()
+        self._sequence = itertools.count()
+        self._ready = asyncio.Event()
+        self._waiting = False
+        self._closed = False
+        self._error: Optional[Exception] = None
+        self._onClose = onClose
+        self.stats = SubscriptionReportsStats()
+
+    def __aiter__(self) -> SubscriptionReports:
+        return self
+
+    async def __aenter__(self) -> SubscriptionReports:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def __anext__(self) -> Union[AttributeReport, EventReadResult]:
+        while True:
+            with self._condition:
+                if self._reports:
+                    _, report = self._reports.popitem(last=False)
+                    self.stats.depth = len(self._reports)
+                    self.stats.delivered += 1
+                    self._condition.notify()
+                    return report
+                if self._closed:
+                    if self._error is not None:
+                        error, self._error = self._error, None
+                        raise error
+                    raise StopAsyncIteration
+                self._ready.clear()
+                self._waiting = True
+            await self._ready.wait()
+
+    def _Put(self, key, report: Union[AttributeReport, EventReadResult]):
+        ''' Queues a report, called on the Matter thread.
+        '''
+        with self._condition:
+            if self._closed:
+                return
+            self.stats.enqueued += 1
+            if self._policy == ReportQueuePolicy.COALESCE and key in self._reports:
+                self._reports[key] = report
+                self._reports.move_to_end(key)
+                self.stats.coalesced += 1
+                return
+            if len(self._reports) >= self._maxsize and self._policy == ReportQueuePolicy.BLOCK:
+                start = time.monotonic()
+                self._condition.wait_for(lambda: len(self._reports) < self._maxsize or self._closed, self._blockTimeoutSec)
+                self.stats.blockedSec += time.monotonic() - start
+                if self._closed:
+                    return
+            while len(self._reports) >= self._maxsize:
+                self._reports.popitem(last=False)
+                self.stats.dropped += 1
+            self._reports[next(self._sequence) if key is None else key] = report
+            self.stats.depth = len(self._reports)
+            self.stats.maxDepth = max(self.stats.maxDepth, self.stats.depth)
+            self._Wake()
+
+    def _Wake(self):
+        if self._waiting:
+            self._waiting = False
+            self._eventLoop.call_soon_threadsafe(self._ready.set)
+
+    def PutAttribute(self, path: TypedAttributePath, value: Any):
+        self._Put(path.Path if self._policy == ReportQueuePolicy.COALESCE else None, AttributeReport(Path=path, Value=value))
+
+    def PutEvent(self, event: EventReadResult):
+        self._Put(None, event)
+
+    def Close(self, error: Optional[Exception] = None):
+        ''' Ends the iteration once the queued reports are consumed, with error if provided. The iterator no longer
+            receives reports.
+        '''
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._error = error
+            self._condition.notify_all()
+            if not self._eventLoop.is_closed():
+                self._eventLoop.call_soon_threadsafe(self._ready.set)
+        if self._onClose is not None:
+            self._onClose(self)
+
+    async def aclose(self):
+        ''' Stops the iteration, for consumers that no longer iterate: the queued reports are discarded.
+        '''
+        self.Close()
+        with self._condition:
+            self._reports.clear()
+            self._error = None
+            self.stats.depth = 0
+
+
 class SubscriptionTransaction:
     def __init__(self, transaction: AsyncReadTransaction, subscriptionId, devCtrl):
         self._onResubscriptionAttemptedCb: Callable[[SubscriptionTransaction,
@@ -448,6 +681,8 @@ class SubscriptionTransaction:
             SubscriptionTransaction], None]] = None
         self._onResubscriptionSucceededCb_isAsync = False
         self._onResubscriptionAttemptedCb_isAsync = False
+        # Replaced rather than modified, so the Matter thread can iterate it while consumers come and go.
+        self._reports: Tuple[SubscriptionReports, ...] = ()
         builtins.chipStack.RegisterSubscription(self)
 
     def GetAttributes(self):
@@ -578,18 +813,71 @@ class SubscriptionTransaction:
     def subscriptionId(self) -> int:
         return self._subscriptionId
 
+    def reports(self, maxsize: int = 1000, policy: ReportQueuePolicy = ReportQueuePolicy.COALESCE,
+                blockTimeoutSec: Optional[float] = 5.0) -> SubscriptionReports:
+        '''
+        Returns an asynchronous iterator over the reports received from now on, in addition to the callbacks:
+
+            async for report in subscription.reports(maxsize=100, policy=ReportQueuePolicy.DROP_OLDEST):
+                ...
+
+        At most maxsize reports are queued for a consumer that is behind, what happens to the others is set by
+        policy. The depth of the queue and the reports dropped are counted in the stats of the iterator.
+
+        Reports are queued until the subscription ends: a consumer that stops iterating before that, e.g. with a
+        break out of the loop, must close the iterator. With ReportQueuePolicy.BLOCK, a full queue nobody consumes
+        otherwise holds off every later report for blockTimeoutSec.
+
+            async with subscription.reports() as reports:
+                async for report in reports:
+                    ...
+        '''
+        reports = SubscriptionReports(self._readTransaction._event_loop, maxsize, policy, blockTimeoutSec,
+                                      onClose=self._RemoveReports)
+        if self._isDone:
+            reports.Close()
+        else:
+            self._reports = self._reports + (reports,)
+        return reports
+
+    def _RemoveReports(self, reports: SubscriptionReports):
+        self._reports = tuple(iterator for iterator in self._reports if iterator is not reports)
+
+    def _PublishAttribute(self, path: TypedAttributePath):
+        if not self._reports:
+            return
+        try:
+            value = self.GetAttribute(path)
+        except Exception as ex:
+            LOGGER.exception(ex)
+            return
+        for reports in self._reports:
+            reports.PutAttribute(path, value)
+
+    def _PublishEvent(self, event: EventReadResult):
+        for reports in self._reports:
+            reports.PutEvent(event)
+
+    def _CloseReports(self, error: Optional[Exception] = None):
+        reports, self._reports = self._reports, ()
+        for iterator in reports:
+            iterator.Close(error)
+
     def Shutdown(self):
         if self._isDone:
             LOGGER.warning(
                 "Subscription 0x%08x was already terminated previously!", self.subscriptionId)
             return
 
+        # Closing the reports first releases the Matter thread if it waits for a consumer to take a report, the
+        # shutdown below runs on that thread.
+        self._isDone = True
+        self._CloseReports()
         handle = GetLibraryHandle()
         builtins.chipStack.UnregisterSubscription(self)
         builtins.chipStack.Call(
             lambda: handle.pychip_ReadClient_ShutdownSubscription(
                 self._readTransaction._pReadClient))
-        self._isDone = True
 
     def __repr__(self):
         return f'<Subscription (Id={self._subscriptionId})>'
@@ -624,25 +912,35 @@ def DefaultErrorCallback(chipError: int, transaction: SubscriptionTransaction):
 
 def _BuildEventIndex():
     ''' Build internal event index for locating the corresponding cluster object by path in the future.
-    We do this because this operation will take a long time when there are lots of events, it takes about 300ms for a single query.
-    This is acceptable during init, but unacceptable when the server returns lots of events at the same time.
+    The events are resolved from the generated ObjectsIndex. Requires the cluster index to have been built.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Events' == objName)):
-                    for eventName, event in inspect.getmembers(subclass):
-                        if inspect.isclass(event):
-                            base_classes = inspect.getmro(event)
+    for (clusterId, eventId), eventName in ObjectsIndex.EVENTS.items():
+        _EventIndex[str(EventPath(ClusterId=clusterId, EventId=eventId))] = getattr(_ClusterIndex[clusterId].Events, eventName)
+
 
-                            # Only match on classes that extend the ClusterEvent class
-                            matched = [
-                                value for value in base_classes if 'ClusterEvent' in str(value)]
-                            if (matched == []):
-                                continue
+class _RecentEventNumbers:
+    ''' The numbers of the last events received from a node, to drop the events that are reported again.
+    '''
 
-                            _EventIndex[str(EventPath(ClusterId=event.cluster_id, EventId=event.event_id))] = eval(
-                                'GeneratedObjects.' + clusterName + '.Events.' + eventName)
+    def __init__(self, maxSize: int):
+        self._maxSize = maxSize
+        self._numbers: Set[int] = set()
+        self._order: deque = deque()
+
+    def Add(self, eventNumber: int) -> bool:
+        ''' Returns False if the event number was already received.
+        '''
+        if eventNumber in self._numbers:
+            return False
+        self._numbers.add(eventNumber)
+        self._order.append(eventNumber)
+        if len(self._order) > self._maxSize:
+            self._numbers.discard(self._order.popleft())
+        return True
+
+
+# The number of recent event numbers a read or subscription remembers to drop duplicate events.
+_MAX_RECENT_EVENT_NUMBERS = 1024
 
 
 class AsyncReadTransaction:
@@ -652,17 +950,28 @@ class AsyncReadTransaction:
         events: list[ClusterEvent]
         tlvAttributes: dict[int, Any]
 
-    def __init__(self, future: Future, eventLoop, devCtrl, returnClusterObject: bool):
+    def __init__(self, future: Future, eventLoop, devCtrl, returnClusterObject: bool, persistentRead=None, eventStream=None):
         self._event_loop = eventLoop
         self._future = future
         self._subscription_handler = None
         self._events: List[EventReadResult] = []
+        self._recentEventNumbers = _RecentEventNumbers(_MAX_RECENT_EVENT_NUMBERS)
+        self.duplicateEvents = 0
         self._devCtrl = devCtrl
         self._cache = AttributeCache(returnClusterObject=returnClusterObject)
         self._changedPathSet: Set[AttributePath] = set()
         self._pReadClient = None
         self._resultError: Optional[PyChipError] = None
 
+        # Optional PersistentAttributeCache.PersistentRead, which provides the data of the clusters that are
+        # filtered out by data version and stores what the node reports.
+        self._persistentRead = persistentRead
+        if persistentRead is not None:
+            persistentRead.Prime(self._cache)
+
+        # Optional EventNumberCursor.EventStream, which records the events received.
+        self._eventStream = eventStream
+
     def SetClientObjPointers(self, pReadClient):
         self._pReadClient = pReadClient
 
@@ -681,10 +990,18 @@ class AsyncReadTransaction:
         """Returns subscription transaction."""
         return self._subscription_handler
 
-    def handleAttributeData(self, path: AttributePath, dataVersion: int, status: int, data: bytes):
+    def handleAttributeData(self, path: AttributePath, dataVersion: Optional[int], status: int, data: bytes):
         try:
             imStatus = InteractionModelStatus(status)
 
+            if self._persistentRead is not None:
+                self._persistentRead.Record(path, dataVersion, imStatus == InteractionModelStatus.Success, data)
+
+            if (imStatus == InteractionModelStatus.Success and self._cache.IsUnchanged(path, dataVersion)):
+                # The cache already holds the data for this data version, there is nothing to decode.
+                self._changedPathSet.add(path)
+                return
+
             if (imStatus != InteractionModelStatus.Success):
                 attributeValue = ValueDecodeFailure(
                     None, InteractionModelError(imStatus))
@@ -698,9 +1015,41 @@ class AsyncReadTransaction:
         except Exception as ex:
             LOGGER.exception(ex)
 
+    def handleReportData(self, data: bytes):
+        ''' Handles the attribute and event data of a report, received in a single buffer of records when
+            report batching is enabled.
+        '''
+        offset = 0
+        while offset < len(data):
+            recordType = data[offset]
+            if recordType == _REPORT_RECORD_ATTRIBUTE_DATA:
+                (_, endpoint, cluster, attribute, dataVersion, hasDataVersion, status,
+                 dataLen) = _AttributeReportRecord.unpack_from(data, offset)
+                offset += _AttributeReportRecord.size
+                self.handleAttributeData(AttributePath(EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute),
+                                         dataVersion if hasDataVersion else None, status, data[offset:offset + dataLen])
+            elif recordType == _REPORT_RECORD_EVENT_DATA:
+                (_, endpoint, cluster, event, number, priority, timestamp, timestampType, status,
+                 dataLen) = _EventReportRecord.unpack_from(data, offset)
+                offset += _EventReportRecord.size
+                _HandleEventData(self, endpoint, cluster, event, number, priority, timestamp, timestampType,
+                                 data[offset:offset + dataLen], status)
+            else:
+                LOGGER.error(f"Unknown report record type {recordType}, dropping the rest of the report")
+                return
+            offset += dataLen
+
     def handleEventData(self, header: EventHeader, path: EventPath, data: bytes, status: int):
         try:
-            eventType = _EventIndex.get(str(path), None)
+            if header is not None and not self._recentEventNumbers.Add(header.EventNumber):
+                # Reported again, e.g. by a node that resent a report whose acknowledgement it missed.
+                self.duplicateEvents += 1
+                LOGGER.debug(f"Dropping event {header.EventNumber} received again")
+                return
+            if header is not None and self._eventStream is not None:
+                self._eventStream.Record(header.Priority, header.EventNumber)
+
+            eventType = _GetEventType(path)
             eventValue = None
 
             if data:
@@ -734,6 +1083,7 @@ class AsyncReadTransaction:
             if (self._subscription_handler is not None):
                 self._subscription_handler.OnEventChangeCb(
                     eventResult, self._subscription_handler)
+                self._subscription_handler._PublishEvent(eventResult)
 
         except Exception as ex:
             LOGGER.exception(ex)
@@ -745,6 +1095,12 @@ class AsyncReadTransaction:
         self._resultError = chipError
 
     def _handleSubscriptionEstablished(self, subscriptionId):
+        if self._future.cancelled():
+            # The caller went away while the subscription was being established: nothing will ever shut it down.
+            if self._subscription_handler is None:
+                self._subscription_handler = SubscriptionTransaction(self, subscriptionId, self._devCtrl)
+                self._subscription_handler.Shutdown()
+            return
         if not self._future.done():
             self._subscription_handler = SubscriptionTransaction(
                 self, subscriptionId, self._devCtrl)
@@ -778,6 +1134,18 @@ class AsyncReadTransaction:
         pass
 
     def _handleReportEnd(self):
+        if self._persistentRead is not None:
+            try:
+                self._persistentRead.Commit()
+            except Exception as ex:
+                LOGGER.exception(f"Failed to update the persistent attribute cache: {ex}")
+
+        if self._eventStream is not None:
+            try:
+                self._eventStream.Commit()
+            except Exception as ex:
+                LOGGER.exception(f"Failed to update the event number cursor: {ex}")
+
         if self._subscription_handler is not None:
             for change in self._changedPathSet:
                 try:
@@ -788,6 +1156,7 @@ class AsyncReadTransaction:
                     continue
                 self._subscription_handler.OnAttributeChangeCb(
                     attribute_path, self._subscription_handler)
+                self._subscription_handler._PublishAttribute(attribute_path)
 
             # Clear it out once we've notified of all changes in this transaction.
         self._changedPathSet = set()
@@ -805,6 +1174,10 @@ class AsyncReadTransaction:
             else:
                 self._future.set_result(self)
 
+        if self._subscription_handler is not None:
+            self._subscription_handler._CloseReports(
+                self._resultError.to_exception() if self._resultError is not None else None)
+
         #
         # Decrement the ref on ourselves to match the increment that happened at allocation.
         # This happens synchronously as part of handling done to ensure the object remains valid
@@ -870,7 +1243,7 @@ class AsyncWriteTransaction:
 
 
 _OnReadAttributeDataCallbackFunct = CFUNCTYPE(
-    None, py_object, c_uint32, c_uint16, c_uint32, c_uint32, c_uint8, c_void_p, c_size_t)
+    None, py_object, c_uint32, c_bool, c_uint16, c_uint32, c_uint32, c_uint8, c_void_p, c_size_t)
 _OnSubscriptionEstablishedCallbackFunct = CFUNCTYPE(None, py_object, c_uint32)
 _OnResubscriptionAttemptedCallbackFunct = CFUNCTYPE(
     None, py_object, PyChipError, c_uint32)
@@ -884,19 +1257,28 @@ _OnReportBeginCallbackFunct = CFUNCTYPE(
     None, py_object)
 _OnReportEndCallbackFunct = CFUNCTYPE(
     None, py_object)
+_OnReadReportDataCallbackFunct = CFUNCTYPE(
+    None, py_object, c_void_p, c_size_t)
+
+# These match the AttributeReportRecord and EventReportRecord structs in attribute.cpp, which make up the
+# buffer passed to _OnReadReportDataCallback when report batching is enabled.
+_REPORT_RECORD_ATTRIBUTE_DATA = 0
+_REPORT_RECORD_EVENT_DATA = 1
+_AttributeReportRecord = struct.Struct('<BHIIIBBI')
+_EventReportRecord = struct.Struct('<BHIIQBQBBI')
 
 
 @_OnReadAttributeDataCallbackFunct
-def _OnReadAttributeDataCallback(closure, dataVersion: int, endpoint: int, cluster: int, attribute: int, status, data, len):
+def _OnReadAttributeDataCallback(closure, dataVersion: int, hasDataVersion: bool, endpoint: int, cluster: int, attribute: int,
+                                 status, data, len):
     dataBytes = ctypes.string_at(data, len)
     closure.handleAttributeData(AttributePath(
-        EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute), dataVersion, status, dataBytes[:])
+        EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute), dataVersion if hasDataVersion else None, status,
+        dataBytes[:])
 
 
-@_OnReadEventDataCallbackFunct
-def _OnReadEventDataCallback(closure, endpoint: int, cluster: int, event: c_uint64,
-                             number: int, priority: int, timestamp: int, timestampType: int, data, len, status):
-    dataBytes = ctypes.string_at(data, len)
+def _HandleEventData(closure, endpoint: int, cluster: int, event: int,
+                     number: int, priority: int, timestamp: int, timestampType: int, dataBytes: bytes, status: int):
     path = EventPath(ClusterId=cluster, EventId=event)
 
     # EventHeader is valid only when successful
@@ -904,7 +1286,19 @@ def _OnReadEventDataCallback(closure, endpoint: int, cluster: int, event: c_uint
     if status == InteractionModelStatus.Success.value:
         eventHeader = EventHeader(
             EndpointId=endpoint, ClusterId=cluster, EventId=event, EventNumber=number, Priority=EventPriority(priority), Timestamp=timestamp, TimestampType=EventTimestampType(timestampType))
-    closure.handleEventData(eventHeader, path, dataBytes[:], status)
+    closure.handleEventData(eventHeader, path, dataBytes, status)
+
+
+@_OnReadEventDataCallbackFunct
+def _OnReadEventDataCallback(closure, endpoint: int, cluster: int, event: c_uint64,
+                             number: int, priority: int, timestamp: int, timestampType: int, data, len, status):
+    dataBytes = ctypes.string_at(data, len)
+    _HandleEventData(closure, endpoint, cluster, event, number, priority, timestamp, timestampType, dataBytes[:], status)
+
+
+@_OnReadReportDataCallbackFunct
+def _OnReadReportDataCallback(closure, data, len):
+    closure.handleReportData(ctypes.string_at(data, len))
 
 
 @_OnSubscriptionEstablishedCallbackFunct
@@ -1008,35 +1402,55 @@ def WriteAttributes(future: Future, eventLoop, device,
     return res
 
 
+class EncodedGroupWrite:
+    ''' A group write with its attribute data already encoded, so it can be sent any number of times.
+    '''
+
+    def __init__(self, attributes: List[AttributeWriteRequest]):
+        self._tlvs = [bytes(attr.Attribute.ToTLV(None, attr.Data)) for attr in attributes]
+        self._data = (PyWriteAttributeData * len(attributes))()
+        for idx, (attr, tlv) in enumerate(zip(attributes, self._tlvs)):
+            self._data[idx].attributePath.endpointId = c_uint16(attr.EndpointId)
+            self._data[idx].attributePath.clusterId = c_uint32(attr.Attribute.cluster_id)
+            self._data[idx].attributePath.attributeId = c_uint32(attr.Attribute.attribute_id)
+            self._data[idx].attributePath.dataVersion = c_uint32(attr.DataVersion)
+            self._data[idx].attributePath.hasDataVersion = c_uint8(attr.HasDataVersion)
+            self._data[idx].tlvData = cast(ctypes.c_char_p(tlv), c_void_p)
+            self._data[idx].tlvLength = c_size_t(len(tlv))
+
+    def __len__(self) -> int:
+        return len(self._tlvs)
+
+    @property
+    def data(self):
+        return self._data
+
+
+def _WriteEncodedGroupAttributes(handle, groupId: int, devCtrl: c_void_p, write: EncodedGroupWrite,
+                                 busyWaitMs: Union[None, int]) -> PyChipError:
+    return handle.pychip_WriteClient_WriteGroupAttributes(
+        ctypes.c_size_t(groupId), devCtrl,
+        ctypes.c_size_t(0 if busyWaitMs is None else busyWaitMs),
+        write.data, ctypes.c_size_t(len(write)))
+
+
 def WriteGroupAttributes(groupId: int, devCtrl: c_void_p, attributes: List[AttributeWriteRequest], busyWaitMs: Union[None, int] = None) -> PyChipError:
     handle = GetLibraryHandle()
 
-    numberOfAttributes = len(attributes)
-    pyWriteAttributesArrayType = PyWriteAttributeData * numberOfAttributes
-    pyWriteAttributes = pyWriteAttributesArrayType()
-    for idx, attr in enumerate(attributes):
+    write = EncodedGroupWrite(attributes)
+    return builtins.chipStack.Call(
+        lambda: _WriteEncodedGroupAttributes(handle, groupId, devCtrl, write, busyWaitMs)
+    )
 
-        tlv = attr.Attribute.ToTLV(None, attr.Data)
 
-        pyWriteAttributes[idx].attributePath.endpointId = c_uint16(
-            attr.EndpointId)
-        pyWriteAttributes[idx].attributePath.clusterId = c_uint32(
-            attr.Attribute.cluster_id)
-        pyWriteAttributes[idx].attributePath.attributeId = c_uint32(
-            attr.Attribute.attribute_id)
-        pyWriteAttributes[idx].attributePath.dataVersion = c_uint32(
-            attr.DataVersion)
-        pyWriteAttributes[idx].attributePath.hasDataVersion = c_uint8(
-            attr.HasDataVersion)
-        pyWriteAttributes[idx].tlvData = cast(
-            ctypes.c_char_p(bytes(tlv)), c_void_p)
-        pyWriteAttributes[idx].tlvLength = c_size_t(len(tlv))
+async def WriteEncodedGroupAttributesAsync(groupId: int, devCtrl: c_void_p, write: EncodedGroupWrite,
+                                           busyWaitMs: Union[None, int] = None) -> PyChipError:
+    ''' Send a pre-encoded group write, waiting for the Matter stack in an asyncio friendly manner.
+    '''
+    handle = GetLibraryHandle()
 
-    return builtins.chipStack.Call(
-        lambda: handle.pychip_WriteClient_WriteGroupAttributes(
-            ctypes.c_size_t(groupId), devCtrl,
-            ctypes.c_size_t(0 if busyWaitMs is None else busyWaitMs),
-            pyWriteAttributes, ctypes.c_size_t(numberOfAttributes))
+    return await builtins.chipStack.CallAsyncWithResult(
+        lambda: _WriteEncodedGroupAttributes(handle, groupId, devCtrl, write, busyWaitMs)
     )
 
 
@@ -1048,6 +1462,7 @@ _ReadParams = construct.Struct(
     "IsFabricFiltered" / construct.Flag,
     "KeepSubscriptions" / construct.Flag,
     "AutoResubscribe" / construct.Flag,
+    "BatchReports" / construct.Flag,
 )
 
 
@@ -1055,7 +1470,8 @@ def Read(transaction: AsyncReadTransaction, device,
          attributes: Optional[List[AttributePath]] = None, dataVersionFilters: Optional[List[DataVersionFilter]] = None,
          events: Optional[List[EventPath]] = None, eventNumberFilter: Optional[int] = None,
          subscriptionParameters: Optional[SubscriptionParameters] = None,
-         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True) -> PyChipError:
+         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
+         batchReports: bool = False) -> PyChipError:
     if (not attributes) and dataVersionFilters:
         raise ValueError(
             "Must provide valid attribute list when data version filters is not null")
@@ -1139,6 +1555,7 @@ def Read(transaction: AsyncReadTransaction, device,
         params.IsSubscription = True
         params.KeepSubscriptions = keepSubscriptions
     params.IsFabricFiltered = fabricFiltered
+    params.BatchReports = batchReports
     params = _ReadParams.build(params)
     eventNumberFilterPtr = ctypes.POINTER(ctypes.c_ulonglong)()
     if eventNumberFilter is not None:
@@ -1198,15 +1615,17 @@ def Init():
                    _OnReadAttributeDataCallbackFunct, _OnReadEventDataCallbackFunct,
                    _OnSubscriptionEstablishedCallbackFunct, _OnResubscriptionAttemptedCallbackFunct,
                    _OnReadErrorCallbackFunct, _OnReadDoneCallbackFunct,
-                   _OnReportBeginCallbackFunct, _OnReportEndCallbackFunct])
+                   _OnReportBeginCallbackFunct, _OnReportEndCallbackFunct, _OnReadReportDataCallbackFunct])
 
     handle.pychip_WriteClient_InitCallbacks(
         _OnWriteResponseCallback, _OnWriteErrorCallback, _OnWriteDoneCallback)
     handle.pychip_ReadClient_InitCallbacks(
         _OnReadAttributeDataCallback, _OnReadEventDataCallback,
         _OnSubscriptionEstablishedCallback, _OnResubscriptionAttemptedCallback, _OnReadErrorCallback, _OnReadDoneCallback,
-        _OnReportBeginCallback, _OnReportEndCallback)
+        _OnReportBeginCallback, _OnReportEndCallback, _OnReadReportDataCallback)
 
-    _BuildAttributeIndex()
-    _BuildClusterIndex()
-    _BuildEventIndex()
+    # When cluster objects are loaded on demand, the indexes are filled in as clusters are looked up.
+    if not LazyObjects.IsInstalled():
+        _BuildClusterIndex()
+        _BuildAttributeIndex()
+        _BuildEventIndex()
@@ -191,9 +191,198 @@ class ClusterObjectDescriptor:
         return bytes(tlvwriter.encoding)
 
 
+class _CompiledField:
+    ''' Encode/decode routines for a single ClusterObjectFieldDescriptor.
+
+        All the typing introspection done by ClusterObjectFieldDescriptor.PutFieldToTLV and
+        ClusterObjectDescriptor.TagDictToLabelDict is done once here, and the result is captured
+        in closures. Types the compiler does not know how to specialise fall back to the
+        reflective implementation, so the behavior (including error messages) is the same.
+    '''
+
+    def __init__(self, descriptor: ClusterObjectDescriptor, fieldDescriptor: ClusterObjectFieldDescriptor):
+        self.Label = fieldDescriptor.Label
+        self.Tag = fieldDescriptor.Tag
+        self.decode = self._CompileDecoder(descriptor, fieldDescriptor)
+        self.encode = self._CompileEncoder(fieldDescriptor)
+
+    @staticmethod
+    def _CompileNonArrayDecoder(descriptor: ClusterObjectDescriptor, elementType):
+        if not isinstance(elementType, type):
+            return lambda debugPath, value: descriptor._ConvertNonArray(debugPath, elementType, value)
+
+        if issubclass(elementType, ClusterObject):
+            def decodeStruct(debugPath, value):
+                if not isinstance(value, Mapping):
+                    raise ValueError(
+                        f"Failed to decode field {debugPath}, struct expected.")
+                return GetClusterObjectCodec(elementType).TagDictToLabelDict(debugPath, value)
+            return decodeStruct
+
+        isEnum = issubclass(elementType, enum.Enum)
+
+        def decodeValue(debugPath, value):
+            if isEnum:
+                value = elementType(value)
+            if not isinstance(value, elementType):
+                raise ValueError(
+                    f"Failed to decode field {debugPath}, expected type {elementType}, got {type(value)}")
+            return value
+        return decodeValue
+
+    def _CompileDecoder(self, descriptor: ClusterObjectDescriptor, fieldDescriptor: ClusterObjectFieldDescriptor):
+        label = fieldDescriptor.Label
+        valueType = fieldDescriptor.Type
+        if (typing.get_origin(valueType) == typing.Union):
+            valueType = GetUnionUnderlyingType(valueType)
+            if (valueType is None):
+                def decodeInvalid(debugPath, value):
+                    if value is None:
+                        return NullValue
+                    raise ValueError(
+                        f"Field {debugPath}.{label} has no valid underlying data model type")
+                return decodeInvalid
+
+        if (typing.get_origin(valueType) == list):
+            decodeElement = self._CompileNonArrayDecoder(descriptor, typing.get_args(valueType)[0])
+
+            def decodeList(debugPath, value):
+                if value is None:
+                    return NullValue
+                return [decodeElement(f'{debugPath}[{i}]', v) for i, v in enumerate(value)]
+            return decodeList
+
+        decodeElement = self._CompileNonArrayDecoder(descriptor, valueType)
+
+        def decode(debugPath, value):
+            if value is None:
+                return NullValue
+            return decodeElement(f'{debugPath}.{label}', value)
+        return decode
+
+    @staticmethod
+    def _CompileNonArrayEncoder(fieldDescriptor: ClusterObjectFieldDescriptor, elementType):
+        if not isinstance(elementType, type):
+            def encodeFallback(tag, val, writer, debugPath):
+                fieldDescriptor._PutSingleElementToTLV(tag, val, elementType, writer, debugPath)
+            return encodeFallback
+
+        label = fieldDescriptor.Label
+        if issubclass(elementType, ClusterObject):
+            def encodeStruct(tag, val, writer, debugPath):
+                if not isinstance(val, dict):
+                    raise ValueError(
+                        f"Field {debugPath}.{label} expected a struct, but got {type(val)}")
+                GetClusterObjectCodec(elementType).DictToTLVWithWriter(f'{debugPath}.{label}', tag, val, writer)
+            return encodeStruct
+
+        def encodeValue(tag, val, writer, debugPath):
+            try:
+                val = elementType(val)
+            except Exception:
+                raise ValueError(
+                    f"Field {debugPath}.{label} expected {elementType}, but got {type(val)}")
+            writer.put(tag, val)
+        return encodeValue
+
+    def _CompileEncoder(self, fieldDescriptor: ClusterObjectFieldDescriptor):
+        label = fieldDescriptor.Label
+        isNullable = GetUnionUnderlyingType(fieldDescriptor.Type, Nullable) is not None
+        isOptional = GetUnionUnderlyingType(fieldDescriptor.Type, type(None)) is not None
+
+        elementType = GetUnionUnderlyingType(fieldDescriptor.Type)
+        if (elementType is None):
+            elementType = fieldDescriptor.Type
+
+        encodeElement = self._CompileNonArrayEncoder(fieldDescriptor, elementType)
+        listElementTypes = typing.get_args(elementType)
+        if len(listElementTypes) == 1:
+            encodeListElement = self._CompileNonArrayEncoder(fieldDescriptor, listElementTypes[0])
+        else:
+            encodeListElement = None
+
+        def encode(tag, val, writer, debugPath):
+            if (val == NullValue):
+                if not isNullable:
+                    raise ValueError(
+                        f"Field {debugPath}.{label} was not nullable, but got a null")
+                writer.put(tag, None)
+            elif (val is None):
+                if not isOptional:
+                    raise ValueError(
+                        f"Field {debugPath}.{label} was not optional, but encountered None")
+            elif not isinstance(val, List):
+                encodeElement(tag, val, writer, debugPath)
+            elif encodeListElement is None:
+                fieldDescriptor.PutFieldToTLV(tag, val, writer, debugPath)
+            else:
+                writer.startArray(tag)
+                for i, v in enumerate(val):
+                    encodeListElement(None, v, writer, debugPath + f'[{i}]')
+                writer.endContainer()
+        return encode
+
+
+class ClusterObjectCodec:
+    ''' Encode/decode routines specialised for a single ClusterObject type.
+
+        This provides the same operations as ClusterObjectDescriptor, but the per-field type
+        inspection is done once when the codec is built instead of on every value. Codecs are
+        built on first use and cached, see GetClusterObjectCodec().
+    '''
+
+    def __init__(self, descriptor: ClusterObjectDescriptor):
+        self._fields = [_CompiledField(descriptor, f) for f in descriptor.Fields]
+        self._fieldsByTag = {f.Tag: f for f in reversed(self._fields)}
+
+    def TagDictToLabelDict(self, debugPath: str, tlvData: Dict[int, Any]) -> Dict[str, Any]:
+        ret: typing.Dict[Any, Any] = {}
+        fieldsByTag = self._fieldsByTag
+        for tag, value in tlvData.items():
+            compiledField = fieldsByTag.get(tag)
+            if compiledField is None:
+                # We do not have enough information for this field.
+                ret[tag] = value
+                continue
+            ret[compiledField.Label] = compiledField.decode(debugPath, value)
+        return ret
+
+    def GetFieldByTag(self, tag: int) -> typing.Optional[_CompiledField]:
+        return self._fieldsByTag.get(tag)
+
+    def TLVToDict(self, tlvBuf: bytes) -> Dict[str, Any]:
+        tlvData = tlv.TLVReader(tlvBuf).get().get('Any', {})
+        return self.TagDictToLabelDict('', tlvData)
+
+    def DictToTLVWithWriter(self, debugPath: str, tag, data: Mapping, writer: tlv.TLVWriter):
+        writer.startStructure(tag)
+        for compiledField in self._fields:
+            compiledField.encode(compiledField.Tag, data.get(compiledField.Label, None),
+                                 writer, debugPath + f'.{compiledField.Label}')
+        writer.endContainer()
+
+    def DictToTLV(self, data: dict) -> bytes:
+        tlvwriter = tlv.TLVWriter(bytearray())
+        self.DictToTLVWithWriter('', None, data, tlvwriter)
+        return bytes(tlvwriter.encoding)
+
+
+_ClusterObjectCodecs: typing.Dict[type, ClusterObjectCodec] = {}
+
+
+def GetClusterObjectCodec(clusterObjectType) -> ClusterObjectCodec:
+    ''' Returns the codec for a ClusterObject subclass, building it on first use.
+    '''
+    codec = _ClusterObjectCodecs.get(clusterObjectType)
+    if codec is None:
+        codec = ClusterObjectCodec(clusterObjectType.descriptor)
+        _ClusterObjectCodecs[clusterObjectType] = codec
+    return codec
+
+
 class ClusterObject:
     def ToTLV(self):
-        return self.descriptor.DictToTLV(asdict(self))
+        return GetClusterObjectCodec(type(self)).DictToTLV(asdict(self))
 
     @classmethod
     def FromDict(cls, data: dict):
@@ -201,7 +390,7 @@ class ClusterObject:
 
     @classmethod
     def FromTLV(cls, data: bytes):
-        return cls.FromDict(data=cls.descriptor.TLVToDict(data))
+        return cls.FromDict(data=GetClusterObjectCodec(cls).TLVToDict(data))
 
     @ChipUtility.classproperty
     def descriptor(cls):
@@ -308,20 +497,29 @@ class ClusterAttributeDescriptor:
     def ToTLV(cls, tag: Union[int, None], value):
         writer = tlv.TLVWriter()
         wrapped_value = cls._cluster_object(Value=value)
-        cls.attribute_type.PutFieldToTLV(tag,
-                                         asdict(wrapped_value)['Value'], writer, '')
+        cls._compiled_attribute_type().encode(tag,
+                                              asdict(wrapped_value)['Value'], writer, '')
         return writer.encoding
 
     @classmethod
     def FromTLV(cls, tlvBuffer: bytes):
         obj_class = cls._cluster_object
         return obj_class.FromDict(
-            obj_class.descriptor.TagDictToLabelDict('', {0: tlv.TLVReader(tlvBuffer).get().get('Any', {})})).Value
+            GetClusterObjectCodec(obj_class).TagDictToLabelDict('', {0: tlv.TLVReader(tlvBuffer).get().get('Any', {})})).Value
 
     @classmethod
     def FromTagDictOrRawValue(cls, val: Any):
         obj_class = cls._cluster_object
-        return obj_class.FromDict(obj_class.descriptor.TagDictToLabelDict('', {0: val})).Value
+        return obj_class.FromDict(GetClusterObjectCodec(obj_class).TagDictToLabelDict('', {0: val})).Value
+
+    @classmethod
+    def _compiled_attribute_type(cls) -> _CompiledField:
+        compiled = _AttributeFieldCodecs.get(cls)
+        if compiled is None:
+            attributeType = cls.attribute_type
+            compiled = _CompiledField(ClusterObjectDescriptor(Fields=[attributeType]), attributeType)
+            _AttributeFieldCodecs[cls] = compiled
+        return compiled
 
     @ChipUtility.classproperty
     def cluster_id(self) -> int:
@@ -345,6 +543,15 @@ class ClusterAttributeDescriptor:
 
     @ChipUtility.classproperty
     def _cluster_object(cls) -> ClusterObject:
+        # The wrapper class is cached per attribute so its codec is only compiled once.
+        obj_class = _AttributeClusterObjects.get(cls)
+        if obj_class is None:
+            obj_class = cls._make_cluster_object()
+            _AttributeClusterObjects[cls] = obj_class
+        return obj_class
+
+    @classmethod
+    def _make_cluster_object(cls) -> ClusterObject:
         return make_dataclass('InternalClass',
                               [
                                   ('Value', cls.attribute_type.Type,
@@ -361,6 +568,10 @@ class ClusterAttributeDescriptor:
                               bases=(ClusterObject,))
 
 
+_AttributeClusterObjects: typing.Dict[type, ClusterObject] = {}
+_AttributeFieldCodecs: typing.Dict[type, _CompiledField] = {}
+
+
 class ClusterEvent(ClusterObject):
     def __init_subclass__(cls, *args, **kwargs) -> None:
         """Register a subclass."""
@@ -17,9 +17,7 @@
 
 import builtins
 import ctypes
-import inspect
 import logging
-import sys
 from asyncio.futures import Future
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_char_p, c_size_t, c_uint8, c_uint16, c_uint32, c_void_p, cast, py_object
 from dataclasses import dataclass
@@ -29,8 +27,9 @@ from ..interaction_model import InteractionModelError, PyInvokeRequestData
 from ..interaction_model import Status as InteractionModelStatus
 from ..interaction_model import TestOnlyPyBatchCommandsOverrides, TestOnlyPyOnDoneInfo
 from ..native import GetLibraryHandle, NativeLibraryHandleMethodArguments, PyChipError
+from . import LazyObjects
 from . import Objects as GeneratedObjects  # noqa: F401
-from .ClusterObjects import ClusterCommand
+from .ClusterObjects import ALL_ACCEPTED_COMMANDS, ALL_GENERATED_COMMANDS, ClusterCommand
 
 logger = logging.getLogger('chip.cluster.Command')
 logger.setLevel(logging.ERROR)
@@ -70,18 +69,14 @@ def FindCommandClusterObject(isClientSideCommand: bool, path: CommandPath):
 
         Returns the type of the cluster object if one is found. Otherwise, returns None.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Commands') in str(subclass)):
-                    for commandName, command in inspect.getmembers(subclass):
-                        if inspect.isclass(command):
-                            for name, field in inspect.getmembers(command):
-                                if ('__dataclass_fields__' in name):
-                                    if (field['cluster_id'].default == path.ClusterId) and (field['command_id'].default ==
-                                                                                            path.CommandId) and (field['is_client'].default == isClientSideCommand):
-                                        return eval('GeneratedObjects.' + clusterName + '.Commands.' + commandName)
-    return None
+    # Generated commands register themselves in these tables when their cluster is defined.
+    commands = ALL_ACCEPTED_COMMANDS if isClientSideCommand else ALL_GENERATED_COMMANDS
+    clusterCommands = commands.get(path.ClusterId)
+    if clusterCommands is None and LazyObjects.GetClusterObjectById(path.ClusterId) is not None:
+        clusterCommands = commands.get(path.ClusterId)
+    if clusterCommands is None:
+        return None
+    return clusterCommands.get(path.CommandId)
 
 
 class AsyncCommandTransaction:
@@ -442,6 +437,28 @@ def TestOnlySendBatchCommands(future: Future, eventLoop, device, commands: List[
     )
 
 
+@dataclass(frozen=True)
+class EncodedGroupCommand:
+    ''' A group command with its payload already encoded, so it can be sent any number of times.
+    '''
+    ClusterId: int
+    CommandId: int
+    PayloadTLV: bytes
+
+
+def EncodeGroupCommand(payload: ClusterCommand) -> EncodedGroupCommand:
+    return EncodedGroupCommand(payload.cluster_id, payload.command_id, bytes(payload.ToTLV()))
+
+
+def _SendEncodedGroupCommand(handle, groupId: int, devCtrl: c_void_p, command: EncodedGroupCommand,
+                             busyWaitMs: Union[None, int]) -> PyChipError:
+    return handle.pychip_CommandSender_SendGroupCommand(
+        c_uint16(groupId), devCtrl,
+        command.ClusterId, command.CommandId, command.PayloadTLV, len(command.PayloadTLV),
+        ctypes.c_uint16(0 if busyWaitMs is None else busyWaitMs),
+    )
+
+
 def SendGroupCommand(groupId: int, devCtrl: c_void_p, payload: ClusterCommand, busyWaitMs: Union[None, int] = None) -> PyChipError:
     ''' Send a cluster-object encapsulated group command to a device and does the following:
             - None (on a successful response containing no data)
@@ -449,13 +466,19 @@ def SendGroupCommand(groupId: int, devCtrl: c_void_p, payload: ClusterCommand, b
     '''
     handle = GetLibraryHandle()
 
-    payloadTLV = payload.ToTLV()
+    command = EncodeGroupCommand(payload)
     return builtins.chipStack.Call(
-        lambda: handle.pychip_CommandSender_SendGroupCommand(
-            c_uint16(groupId), devCtrl,
-            payload.cluster_id, payload.command_id, payloadTLV, len(payloadTLV),
-            ctypes.c_uint16(0 if busyWaitMs is None else busyWaitMs),
-        ))
+        lambda: _SendEncodedGroupCommand(handle, groupId, devCtrl, command, busyWaitMs))
+
+
+async def SendEncodedGroupCommandAsync(groupId: int, devCtrl: c_void_p, command: EncodedGroupCommand,
+                                       busyWaitMs: Union[None, int] = None) -> PyChipError:
+    ''' Send a pre-encoded group command, waiting for the Matter stack in an asyncio friendly manner.
+    '''
+    handle = GetLibraryHandle()
+
+    return await builtins.chipStack.CallAsyncWithResult(
+        lambda: _SendEncodedGroupCommand(handle, groupId, devCtrl, command, busyWaitMs))
 
 
 def Init():
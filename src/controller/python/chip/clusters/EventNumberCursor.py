@@ -0,0 +1,186 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+An opt-in record of the events received from nodes, so that event subscriptions resume where they left off.
+
+The cursor stores, for each (fabric, node, event paths), the highest event number received at each priority. When it
+is set on a controller (see ChipDeviceControllerBase.SetEventNumberCursor()), subscriptions to events that do not
+provide their own eventNumberFilter ask the node for the events after the highest one received for the same event
+paths, so that a new subscription, e.g. after a restart of the controller, does not replay the events that were
+already received. Resubscriptions of a subscription resume from the last event it received in any case.
+
+The cursor is kept per set of event paths: event numbers are assigned by the node across all events, so a cursor
+advanced by a subscription to some events would make a subscription to other events miss the ones it never received.
+With a PersistentStorage, the cursor is stored in a REPL key and kept across restarts. Writes are delayed by
+storeDelaySec so that high rate event streams do not rewrite the storage on every report: the last events received
+before an unclean exit may be reported again after a restart. Flush() writes the pending changes, which
+ChipDeviceControllerBase.Shutdown() does.
+'''
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from .Attribute import EventPath, EventPriority
+
+LOGGER = logging.getLogger(__name__)
+
+# REPL key of the PersistentStorage holding the cursors.
+STORAGE_KEY = 'eventNumberCursor'
+
+
+def _NodeKey(fabricId: int, nodeId: int) -> str:
+    return f'{fabricId:016X}-{nodeId:016X}'
+
+
+def _PathsKey(events: List[EventPath]) -> str:
+    # Urgency only changes when events are reported, not which ones.
+    return ','.join(sorted({'/'.join('*' if id is None else str(id) for id in (path.EndpointId, path.ClusterId, path.EventId))
+                            for path in events}))
+
+
+class EventStream:
+    ''' The cursor state of a single subscription to the events of a node.
+
+        This is created by EventNumberCursor.BeginSubscription() before the subscription is started. Received events are
+        recorded from the Matter thread and written to the cursor at the end of every report.
+    '''
+
+    def __init__(self, cursor: EventNumberCursor, node: str, paths: str):
+        self._cursor = cursor
+        self._node = node
+        self._paths = paths
+        self._pending: Dict[EventPriority, int] = {}
+
+    def EventNumberFilter(self) -> Optional[int]:
+        ''' Returns the number of the first event not received yet, None if no event was received.
+        '''
+        highest = self._cursor._Get(self._node, self._paths)
+        return max(highest.values()) + 1 if highest else None
+
+    def Record(self, priority: EventPriority, eventNumber: int):
+        if eventNumber > self._pending.get(priority, -1):
+            self._pending[priority] = eventNumber
+
+    def Commit(self):
+        ''' Writes the event numbers recorded since the last commit to the cursor.
+        '''
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self._cursor._Update(self._node, self._paths, pending)
+
+
+class EventNumberCursor:
+    ''' Stores the highest event number received per (fabric, node, event paths) and priority, in memory or in a
+        PersistentStorage.
+
+        An instance can be shared by several controllers, and used from both the Matter thread and the asyncio event
+        loop; the cursors of different fabrics are kept apart. Changes are written to the storage at most
+        storeDelaySec after they are made, or right away when storeDelaySec is 0.
+    '''
+
+    def __init__(self, storage=None, storeDelaySec: float = 1.0):
+        self._storage = storage
+        self._storeDelaySec = storeDelaySec
+        self._storeTimer: Optional[threading.Timer] = None
+        self._dirty = False
+        # Updated from the Matter thread, stored on a timer thread.
+        self._lock = threading.Lock()
+        # Node key -> paths key -> priority value -> highest event number.
+        self._cursors: Dict[str, Dict[str, Dict[int, int]]] = {}
+        if storage is not None:
+            stored = storage.GetReplKey(STORAGE_KEY) or {}
+            try:
+                self._cursors = {node: {paths: {int(priority): int(number) for priority, number in numbers.items()}
+                                        for paths, numbers in streams.items()}
+                                 for node, streams in stored.items()}
+            except (AttributeError, TypeError, ValueError) as ex:
+                LOGGER.warning(f"Ignoring invalid event number cursors in the storage: {ex}")
+
+    def BeginSubscription(self, fabricId: int, nodeId: int, events: List[EventPath]) -> EventStream:
+        ''' Returns the state for a subscription to the events of a node, see EventStream.
+
+            fabricId should identify the fabric globally, e.g. be the compressed fabric id.
+        '''
+        return EventStream(self, _NodeKey(fabricId, nodeId), _PathsKey(events))
+
+    def GetHighestEventNumbers(self, fabricId: int, nodeId: int, events: List[EventPath]) -> Dict[EventPriority, int]:
+        ''' Returns the highest event number received by priority, for subscriptions to these event paths.
+        '''
+        return self._Get(_NodeKey(fabricId, nodeId), _PathsKey(events))
+
+    def Clear(self, fabricId: Optional[int] = None, nodeId: Optional[int] = None):
+        ''' Removes the cursors of a node, or of all nodes if no node is given.
+        '''
+        with self._lock:
+            if fabricId is None or nodeId is None:
+                self._cursors = {}
+            else:
+                self._cursors.pop(_NodeKey(fabricId, nodeId), None)
+            self._Store()
+
+    def Flush(self):
+        ''' Writes the changes not stored yet to the storage.
+        '''
+        with self._lock:
+            if self._dirty:
+                self._Store()
+
+    def _Get(self, node: str, paths: str) -> Dict[EventPriority, int]:
+        with self._lock:
+            return {EventPriority(priority): number for priority, number in self._cursors.get(node, {}).get(paths, {}).items()}
+
+    def _Update(self, node: str, paths: str, numbers: Dict[EventPriority, int]):
+        with self._lock:
+            stream = self._cursors.setdefault(node, {}).setdefault(paths, {})
+            changed = False
+            for priority, number in numbers.items():
+                if number > stream.get(priority.value, -1):
+                    stream[priority.value] = number
+                    changed = True
+            if changed:
+                self._ScheduleStore()
+
+    def _ScheduleStore(self):
+        if self._storage is None:
+            return
+        if self._storeDelaySec <= 0:
+            self._Store()
+            return
+
+        # Not restarted by later changes, so that a continuous stream of events is still stored regularly.
+        self._dirty = True
+        if self._storeTimer is None:
+            self._storeTimer = threading.Timer(self._storeDelaySec, self.Flush)
+            self._storeTimer.daemon = True
+            self._storeTimer.start()
+
+    def _Store(self):
+        if self._storeTimer is not None:
+            self._storeTimer.cancel()
+            self._storeTimer = None
+        self._dirty = False
+        if self._storage is None:
+            return
+        # JSON objects only have string keys.
+        self._storage.SetReplKey(STORAGE_KEY, {node: {paths: {str(priority): number for priority, number in numbers.items()}
+                                                      for paths, numbers in streams.items()}
+                                               for node, streams in self._cursors.items()})
@@ -0,0 +1,169 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+On-demand loading of the generated cluster objects.
+
+Importing chip.clusters.Objects defines every cluster object up front, which accounts for most of the
+time spent importing chip.clusters. When lazy loading is enabled (by setting CHIP_LAZY_CLUSTER_OBJECTS=1
+in the environment before chip.clusters is imported), chip.clusters.Objects is instead created with only
+its common definitions (imports and Globals). Each cluster is defined from its own section of Objects.py
+the first time it is accessed, either by name through the module level __getattr__ or by id through
+the generated ObjectsIndex.
+
+Cluster objects loaded this way are identical to the ones defined by a regular import: they live in the
+chip.clusters.Objects module, have the same qualified names and register themselves with the
+ClusterObjects lookup tables when defined.
+'''
+
+import __future__
+
+import importlib
+import importlib.util
+import os
+import re
+import sys
+import threading
+import types
+import typing
+
+from . import ObjectsIndex
+
+LAZY_LOADING_ENV = 'CHIP_LAZY_CLUSTER_OBJECTS'
+
+_OBJECTS_MODULE = __package__ + '.Objects'
+
+# Generated clusters only reference their own definitions and Globals, so each section can be
+# defined on its own once the common part of the module has been executed.
+_CLUSTER_SECTION = re.compile(r'^@dataclass\nclass (\w+)\(Cluster\):$', re.MULTILINE)
+
+
+class _LazyObjectsLoader:
+    def __init__(self, module: types.ModuleType, path: str, source: str):
+        self._module = module
+        self._path = path
+        self._source = source
+        self._lock = threading.RLock()
+        self._sections: typing.Dict[str, typing.Tuple[int, int, int]] = {}
+
+        matches = list(_CLUSTER_SECTION.finditer(source))
+        ends = [m.start() for m in matches[1:]] + [len(source)]
+        line = 0
+        lastOffset = 0
+        for match, end in zip(matches, ends):
+            line += source.count('\n', lastOffset, match.start())
+            lastOffset = match.start()
+            self._sections[match.group(1)] = (match.start(), end, line)
+
+        self._commonEnd = matches[0].start() if matches else len(source)
+
+    def Init(self):
+        exec(compile(self._source[:self._commonEnd], self._path, 'exec', dont_inherit=True), self._module.__dict__)
+        self._module.__dict__['__getattr__'] = self.GetAttr
+
+    def Load(self, name: str):
+        with self._lock:
+            namespace = self._module.__dict__
+            if name not in namespace:
+                start, end, line = self._sections[name]
+                # Pad with newlines so tracebacks point at the right line of Objects.py.
+                code = compile('\n' * line + self._source[start:end], self._path, 'exec',
+                               flags=__future__.annotations.compiler_flag, dont_inherit=True)
+                exec(code, namespace)
+            return namespace[name]
+
+    def LoadAll(self):
+        for name in self._sections:
+            self.Load(name)
+
+    def GetAttr(self, name: str):
+        if name in self._sections:
+            return self.Load(name)
+        raise AttributeError(f"module {_OBJECTS_MODULE!r} has no attribute {name!r}")
+
+
+_loader: typing.Optional[_LazyObjectsLoader] = None
+
+
+def IsEnabled() -> bool:
+    ''' Returns whether lazy loading was requested through the environment.
+    '''
+    return os.environ.get(LAZY_LOADING_ENV, '0') not in ('', '0')
+
+
+def IsInstalled() -> bool:
+    ''' Returns whether chip.clusters.Objects is being loaded on demand.
+    '''
+    return _loader is not None
+
+
+def Install() -> bool:
+    ''' Creates chip.clusters.Objects as a module that defines its clusters on first access.
+
+        This has to be done before anything imports chip.clusters.Objects. Returns False, leaving the
+        regular import in place, if the module has already been imported or its source is not available.
+    '''
+    global _loader
+
+    if _loader is not None:
+        return True
+    if _OBJECTS_MODULE in sys.modules:
+        return False
+
+    spec = importlib.util.find_spec(_OBJECTS_MODULE)
+    if spec is None or spec.origin is None or not spec.origin.endswith('.py'):
+        return False
+    try:
+        with open(spec.origin, encoding='utf-8') as f:
+            source = f.read()
+    except OSError:
+        return False
+
+    module = importlib.util.module_from_spec(spec)
+    loader = _LazyObjectsLoader(module, spec.origin, source)
+    sys.modules[_OBJECTS_MODULE] = module
+    try:
+        loader.Init()
+    except BaseException:
+        del sys.modules[_OBJECTS_MODULE]
+        raise
+    setattr(sys.modules[__package__], 'Objects', module)
+    _loader = loader
+    return True
+
+
+def LoadAll():
+    ''' Defines all cluster objects that have not been loaded yet.
+    '''
+    if _loader is not None:
+        _loader.LoadAll()
+
+
+def _Resolve(module: str, qualname: str):
+    obj = importlib.import_module(module)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    return obj
+
+
+def GetClusterObjectById(clusterId: int):
+    ''' Returns the cluster object type for a cluster id, defining it if needed, or None if it is unknown.
+    '''
+    entry = ObjectsIndex.CLUSTERS.get(clusterId)
+    if entry is None:
+        return None
+    return _Resolve(*entry)
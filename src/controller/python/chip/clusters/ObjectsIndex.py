@@ -0,0 +1,2132 @@
+'''
+/*
+ *
+ *    Copyright (c) 2022 Project CHIP Authors
+ *
+ *    Licensed under the Apache License, Version 2.0 (the "License");
+ *    you may not use this file except in compliance with the License.
+ *    You may obtain a copy of the License at
+ *
+ *        http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *    Unless required by applicable law or agreed to in writing, software
+ *    distributed under the License is distributed on an "AS IS" BASIS,
+ *    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *    See the License for the specific language governing permissions and
+ *    limitations under the License.
+ */
+
+// THIS FILE IS GENERATED BY ZAP
+'''
+
+# This file contains a generated index of the cluster objects defined in Objects.py.
+# It allows mapping ids to cluster object types without importing Objects.py or inspecting
+# its contents, which is used to build the attribute and event indexes in Attribute.py and
+# to load cluster objects on demand (see LazyObjects.py).
+import typing
+
+__all__ = [
+    "CLUSTERS",
+    "ATTRIBUTES",
+    "EVENTS",
+]
+
+# Cluster id -> (module, qualified name) of the cluster object.
+CLUSTERS: typing.Dict[int, typing.Tuple[str, str]] = {
+    0x00000003: ("chip.clusters.Objects", "Identify"),
+    0x00000004: ("chip.clusters.Objects", "Groups"),
+    0x00000006: ("chip.clusters.Objects", "OnOff"),
+    0x00000008: ("chip.clusters.Objects", "LevelControl"),
+    0x0000001C: ("chip.clusters.Objects", "PulseWidthModulation"),
+    0x0000001D: ("chip.clusters.Objects", "Descriptor"),
+    0x0000001E: ("chip.clusters.Objects", "Binding"),
+    0x0000001F: ("chip.clusters.Objects", "AccessControl"),
+    0x00000025: ("chip.clusters.Objects", "Actions"),
+    0x00000028: ("chip.clusters.Objects", "BasicInformation"),
+    0x00000029: ("chip.clusters.Objects", "OtaSoftwareUpdateProvider"),
+    0x0000002A: ("chip.clusters.Objects", "OtaSoftwareUpdateRequestor"),
+    0x0000002B: ("chip.clusters.Objects", "LocalizationConfiguration"),
+    0x0000002C: ("chip.clusters.Objects", "TimeFormatLocalization"),
+    0x0000002D: ("chip.clusters.Objects", "UnitLocalization"),
+    0x0000002E: ("chip.clusters.Objects", "PowerSourceConfiguration"),
+    0x0000002F: ("chip.clusters.Objects", "PowerSource"),
+    0x00000030: ("chip.clusters.Objects", "GeneralCommissioning"),
+    0x00000031: ("chip.clusters.Objects", "NetworkCommissioning"),
+    0x00000032: ("chip.clusters.Objects", "DiagnosticLogs"),
+    0x00000033: ("chip.clusters.Objects", "GeneralDiagnostics"),
+    0x00000034: ("chip.clusters.Objects", "SoftwareDiagnostics"),
+    0x00000035: ("chip.clusters.Objects", "ThreadNetworkDiagnostics"),
+    0x00000036: ("chip.clusters.Objects", "WiFiNetworkDiagnostics"),
+    0x00000037: ("chip.clusters.Objects", "EthernetNetworkDiagnostics"),
+    0x00000038: ("chip.clusters.Objects", "TimeSynchronization"),
+    0x00000039: ("chip.clusters.Objects", "BridgedDeviceBasicInformation"),
+    0x0000003B: ("chip.clusters.Objects", "Switch"),
+    0x0000003C: ("chip.clusters.Objects", "AdministratorCommissioning"),
+    0x0000003E: ("chip.clusters.Objects", "OperationalCredentials"),
+    0x0000003F: ("chip.clusters.Objects", "GroupKeyManagement"),
+    0x00000040: ("chip.clusters.Objects", "FixedLabel"),
+    0x00000041: ("chip.clusters.Objects", "UserLabel"),
+    0x00000042: ("chip.clusters.Objects", "ProxyConfiguration"),
+    0x00000043: ("chip.clusters.Objects", "ProxyDiscovery"),
+    0x00000044: ("chip.clusters.Objects", "ProxyValid"),
+    0x00000045: ("chip.clusters.Objects", "BooleanState"),
+    0x00000046: ("chip.clusters.Objects", "IcdManagement"),
+    0x00000047: ("chip.clusters.Objects", "Timer"),
+    0x00000048: ("chip.clusters.Objects", "OvenCavityOperationalState"),
+    0x00000049: ("chip.clusters.Objects", "OvenMode"),
+    0x0000004A: ("chip.clusters.Objects", "LaundryDryerControls"),
+    0x00000050: ("chip.clusters.Objects", "ModeSelect"),
+    0x00000051: ("chip.clusters.Objects", "LaundryWasherMode"),
+    0x00000052: ("chip.clusters.Objects", "RefrigeratorAndTemperatureControlledCabinetMode"),
+    0x00000053: ("chip.clusters.Objects", "LaundryWasherControls"),
+    0x00000054: ("chip.clusters.Objects", "RvcRunMode"),
+    0x00000055: ("chip.clusters.Objects", "RvcCleanMode"),
+    0x00000056: ("chip.clusters.Objects", "TemperatureControl"),
+    0x00000057: ("chip.clusters.Objects", "RefrigeratorAlarm"),
+    0x00000059: ("chip.clusters.Objects", "DishwasherMode"),
+    0x0000005B: ("chip.clusters.Objects", "AirQuality"),
+    0x0000005C: ("chip.clusters.Objects", "SmokeCoAlarm"),
+    0x0000005D: ("chip.clusters.Objects", "DishwasherAlarm"),
+    0x0000005E: ("chip.clusters.Objects", "MicrowaveOvenMode"),
+    0x0000005F: ("chip.clusters.Objects", "MicrowaveOvenControl"),
+    0x00000060: ("chip.clusters.Objects", "OperationalState"),
+    0x00000061: ("chip.clusters.Objects", "RvcOperationalState"),
+    0x00000062: ("chip.clusters.Objects", "ScenesManagement"),
+    0x00000071: ("chip.clusters.Objects", "HepaFilterMonitoring"),
+    0x00000072: ("chip.clusters.Objects", "ActivatedCarbonFilterMonitoring"),
+    0x00000080: ("chip.clusters.Objects", "BooleanStateConfiguration"),
+    0x00000081: ("chip.clusters.Objects", "ValveConfigurationAndControl"),
+    0x00000090: ("chip.clusters.Objects", "ElectricalPowerMeasurement"),
+    0x00000091: ("chip.clusters.Objects", "ElectricalEnergyMeasurement"),
+    0x00000094: ("chip.clusters.Objects", "WaterHeaterManagement"),
+    0x00000095: ("chip.clusters.Objects", "CommodityPrice"),
+    0x00000097: ("chip.clusters.Objects", "Messages"),
+    0x00000098: ("chip.clusters.Objects", "DeviceEnergyManagement"),
+    0x00000099: ("chip.clusters.Objects", "EnergyEvse"),
+    0x0000009B: ("chip.clusters.Objects", "EnergyPreference"),
+    0x0000009C: ("chip.clusters.Objects", "PowerTopology"),
+    0x0000009D: ("chip.clusters.Objects", "EnergyEvseMode"),
+    0x0000009E: ("chip.clusters.Objects", "WaterHeaterMode"),
+    0x0000009F: ("chip.clusters.Objects", "DeviceEnergyManagementMode"),
+    0x000000A0: ("chip.clusters.Objects", "ElectricalGridConditions"),
+    0x00000101: ("chip.clusters.Objects", "DoorLock"),
+    0x00000102: ("chip.clusters.Objects", "WindowCovering"),
+    0x00000104: ("chip.clusters.Objects", "ClosureControl"),
+    0x00000105: ("chip.clusters.Objects", "ClosureDimension"),
+    0x00000150: ("chip.clusters.Objects", "ServiceArea"),
+    0x00000200: ("chip.clusters.Objects", "PumpConfigurationAndControl"),
+    0x00000201: ("chip.clusters.Objects", "Thermostat"),
+    0x00000202: ("chip.clusters.Objects", "FanControl"),
+    0x00000204: ("chip.clusters.Objects", "ThermostatUserInterfaceConfiguration"),
+    0x00000300: ("chip.clusters.Objects", "ColorControl"),
+    0x00000301: ("chip.clusters.Objects", "BallastConfiguration"),
+    0x00000400: ("chip.clusters.Objects", "IlluminanceMeasurement"),
+    0x00000402: ("chip.clusters.Objects", "TemperatureMeasurement"),
+    0x00000403: ("chip.clusters.Objects", "PressureMeasurement"),
+    0x00000404: ("chip.clusters.Objects", "FlowMeasurement"),
+    0x00000405: ("chip.clusters.Objects", "RelativeHumidityMeasurement"),
+    0x00000406: ("chip.clusters.Objects", "OccupancySensing"),
+    0x0000040C: ("chip.clusters.Objects", "CarbonMonoxideConcentrationMeasurement"),
+    0x0000040D: ("chip.clusters.Objects", "CarbonDioxideConcentrationMeasurement"),
+    0x00000413: ("chip.clusters.Objects", "NitrogenDioxideConcentrationMeasurement"),
+    0x00000415: ("chip.clusters.Objects", "OzoneConcentrationMeasurement"),
+    0x0000042A: ("chip.clusters.Objects", "Pm25ConcentrationMeasurement"),
+    0x0000042B: ("chip.clusters.Objects", "FormaldehydeConcentrationMeasurement"),
+    0x0000042C: ("chip.clusters.Objects", "Pm1ConcentrationMeasurement"),
+    0x0000042D: ("chip.clusters.Objects", "Pm10ConcentrationMeasurement"),
+    0x0000042E: ("chip.clusters.Objects", "TotalVolatileOrganicCompoundsConcentrationMeasurement"),
+    0x0000042F: ("chip.clusters.Objects", "RadonConcentrationMeasurement"),
+    0x00000430: ("chip.clusters.Objects", "SoilMeasurement"),
+    0x00000451: ("chip.clusters.Objects", "WiFiNetworkManagement"),
+    0x00000452: ("chip.clusters.Objects", "ThreadBorderRouterManagement"),
+    0x00000453: ("chip.clusters.Objects", "ThreadNetworkDirectory"),
+    0x00000503: ("chip.clusters.Objects", "WakeOnLan"),
+    0x00000504: ("chip.clusters.Objects", "Channel"),
+    0x00000505: ("chip.clusters.Objects", "TargetNavigator"),
+    0x00000506: ("chip.clusters.Objects", "MediaPlayback"),
+    0x00000507: ("chip.clusters.Objects", "MediaInput"),
+    0x00000508: ("chip.clusters.Objects", "LowPower"),
+    0x00000509: ("chip.clusters.Objects", "KeypadInput"),
+    0x0000050A: ("chip.clusters.Objects", "ContentLauncher"),
+    0x0000050B: ("chip.clusters.Objects", "AudioOutput"),
+    0x0000050C: ("chip.clusters.Objects", "ApplicationLauncher"),
+    0x0000050D: ("chip.clusters.Objects", "ApplicationBasic"),
+    0x0000050E: ("chip.clusters.Objects", "AccountLogin"),
+    0x0000050F: ("chip.clusters.Objects", "ContentControl"),
+    0x00000510: ("chip.clusters.Objects", "ContentAppObserver"),
+    0x00000550: ("chip.clusters.Objects", "ZoneManagement"),
+    0x00000551: ("chip.clusters.Objects", "CameraAvStreamManagement"),
+    0x00000552: ("chip.clusters.Objects", "CameraAvSettingsUserLevelManagement"),
+    0x00000553: ("chip.clusters.Objects", "WebRTCTransportProvider"),
+    0x00000554: ("chip.clusters.Objects", "WebRTCTransportRequestor"),
+    0x00000555: ("chip.clusters.Objects", "PushAvStreamTransport"),
+    0x00000556: ("chip.clusters.Objects", "Chime"),
+    0x00000700: ("chip.clusters.Objects", "CommodityTariff"),
+    0x00000750: ("chip.clusters.Objects", "EcosystemInformation"),
+    0x00000751: ("chip.clusters.Objects", "CommissionerControl"),
+    0x00000801: ("chip.clusters.Objects", "TlsCertificateManagement"),
+    0x00000802: ("chip.clusters.Objects", "TlsClientManagement"),
+    0x00000B06: ("chip.clusters.Objects", "MeterIdentification"),
+    0x00000B07: ("chip.clusters.Objects", "CommodityMetering"),
+    0xFFF1FC05: ("chip.clusters.Objects", "UnitTesting"),
+    0xFFF1FC06: ("chip.clusters.Objects", "FaultInjection"),
+    0xFFF1FC20: ("chip.clusters.Objects", "SampleMei"),
+}
+
+# (cluster id, attribute id) -> name of the attribute in the Attributes class of the cluster object.
+ATTRIBUTES: typing.Dict[typing.Tuple[int, int], str] = {
+    (0x00000003, 0x00000000): "IdentifyTime",
+    (0x00000003, 0x00000001): "IdentifyType",
+    (0x00000003, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000003, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000003, 0x0000FFFB): "AttributeList",
+    (0x00000003, 0x0000FFFC): "FeatureMap",
+    (0x00000003, 0x0000FFFD): "ClusterRevision",
+    (0x00000004, 0x00000000): "NameSupport",
+    (0x00000004, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000004, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000004, 0x0000FFFB): "AttributeList",
+    (0x00000004, 0x0000FFFC): "FeatureMap",
+    (0x00000004, 0x0000FFFD): "ClusterRevision",
+    (0x00000006, 0x00000000): "OnOff",
+    (0x00000006, 0x00004000): "GlobalSceneControl",
+    (0x00000006, 0x00004001): "OnTime",
+    (0x00000006, 0x00004002): "OffWaitTime",
+    (0x00000006, 0x00004003): "StartUpOnOff",
+    (0x00000006, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000006, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000006, 0x0000FFFB): "AttributeList",
+    (0x00000006, 0x0000FFFC): "FeatureMap",
+    (0x00000006, 0x0000FFFD): "ClusterRevision",
+    (0x00000008, 0x00000000): "CurrentLevel",
+    (0x00000008, 0x00000001): "RemainingTime",
+    (0x00000008, 0x00000002): "MinLevel",
+    (0x00000008, 0x00000003): "MaxLevel",
+    (0x00000008, 0x00000004): "CurrentFrequency",
+    (0x00000008, 0x00000005): "MinFrequency",
+    (0x00000008, 0x00000006): "MaxFrequency",
+    (0x00000008, 0x0000000F): "Options",
+    (0x00000008, 0x00000010): "OnOffTransitionTime",
+    (0x00000008, 0x00000011): "OnLevel",
+    (0x00000008, 0x00000012): "OnTransitionTime",
+    (0x00000008, 0x00000013): "OffTransitionTime",
+    (0x00000008, 0x00000014): "DefaultMoveRate",
+    (0x00000008, 0x00004000): "StartUpCurrentLevel",
+    (0x00000008, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000008, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000008, 0x0000FFFB): "AttributeList",
+    (0x00000008, 0x0000FFFC): "FeatureMap",
+    (0x00000008, 0x0000FFFD): "ClusterRevision",
+    (0x0000001C, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000001C, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000001C, 0x0000FFFB): "AttributeList",
+    (0x0000001C, 0x0000FFFC): "FeatureMap",
+    (0x0000001C, 0x0000FFFD): "ClusterRevision",
+    (0x0000001D, 0x00000000): "DeviceTypeList",
+    (0x0000001D, 0x00000001): "ServerList",
+    (0x0000001D, 0x00000002): "ClientList",
+    (0x0000001D, 0x00000003): "PartsList",
+    (0x0000001D, 0x00000004): "TagList",
+    (0x0000001D, 0x00000005): "EndpointUniqueID",
+    (0x0000001D, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000001D, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000001D, 0x0000FFFB): "AttributeList",
+    (0x0000001D, 0x0000FFFC): "FeatureMap",
+    (0x0000001D, 0x0000FFFD): "ClusterRevision",
+    (0x0000001E, 0x00000000): "Binding",
+    (0x0000001E, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000001E, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000001E, 0x0000FFFB): "AttributeList",
+    (0x0000001E, 0x0000FFFC): "FeatureMap",
+    (0x0000001E, 0x0000FFFD): "ClusterRevision",
+    (0x0000001F, 0x00000000): "Acl",
+    (0x0000001F, 0x00000001): "Extension",
+    (0x0000001F, 0x00000002): "SubjectsPerAccessControlEntry",
+    (0x0000001F, 0x00000003): "TargetsPerAccessControlEntry",
+    (0x0000001F, 0x00000004): "AccessControlEntriesPerFabric",
+    (0x0000001F, 0x00000005): "CommissioningARL",
+    (0x0000001F, 0x00000006): "Arl",
+    (0x0000001F, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000001F, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000001F, 0x0000FFFB): "AttributeList",
+    (0x0000001F, 0x0000FFFC): "FeatureMap",
+    (0x0000001F, 0x0000FFFD): "ClusterRevision",
+    (0x00000025, 0x00000000): "ActionList",
+    (0x00000025, 0x00000001): "EndpointLists",
+    (0x00000025, 0x00000002): "SetupURL",
+    (0x00000025, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000025, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000025, 0x0000FFFB): "AttributeList",
+    (0x00000025, 0x0000FFFC): "FeatureMap",
+    (0x00000025, 0x0000FFFD): "ClusterRevision",
+    (0x00000028, 0x00000000): "DataModelRevision",
+    (0x00000028, 0x00000001): "VendorName",
+    (0x00000028, 0x00000002): "VendorID",
+    (0x00000028, 0x00000003): "ProductName",
+    (0x00000028, 0x00000004): "ProductID",
+    (0x00000028, 0x00000005): "NodeLabel",
+    (0x00000028, 0x00000006): "Location",
+    (0x00000028, 0x00000007): "HardwareVersion",
+    (0x00000028, 0x00000008): "HardwareVersionString",
+    (0x00000028, 0x00000009): "SoftwareVersion",
+    (0x00000028, 0x0000000A): "SoftwareVersionString",
+    (0x00000028, 0x0000000B): "ManufacturingDate",
+    (0x00000028, 0x0000000C): "PartNumber",
+    (0x00000028, 0x0000000D): "ProductURL",
+    (0x00000028, 0x0000000E): "ProductLabel",
+    (0x00000028, 0x0000000F): "SerialNumber",
+    (0x00000028, 0x00000010): "LocalConfigDisabled",
+    (0x00000028, 0x00000011): "Reachable",
+    (0x00000028, 0x00000012): "UniqueID",
+    (0x00000028, 0x00000013): "CapabilityMinima",
+    (0x00000028, 0x00000014): "ProductAppearance",
+    (0x00000028, 0x00000015): "SpecificationVersion",
+    (0x00000028, 0x00000016): "MaxPathsPerInvoke",
+    (0x00000028, 0x00000018): "ConfigurationVersion",
+    (0x00000028, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000028, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000028, 0x0000FFFB): "AttributeList",
+    (0x00000028, 0x0000FFFC): "FeatureMap",
+    (0x00000028, 0x0000FFFD): "ClusterRevision",
+    (0x00000029, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000029, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000029, 0x0000FFFB): "AttributeList",
+    (0x00000029, 0x0000FFFC): "FeatureMap",
+    (0x00000029, 0x0000FFFD): "ClusterRevision",
+    (0x0000002A, 0x00000000): "DefaultOTAProviders",
+    (0x0000002A, 0x00000001): "UpdatePossible",
+    (0x0000002A, 0x00000002): "UpdateState",
+    (0x0000002A, 0x00000003): "UpdateStateProgress",
+    (0x0000002A, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000002A, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000002A, 0x0000FFFB): "AttributeList",
+    (0x0000002A, 0x0000FFFC): "FeatureMap",
+    (0x0000002A, 0x0000FFFD): "ClusterRevision",
+    (0x0000002B, 0x00000000): "ActiveLocale",
+    (0x0000002B, 0x00000001): "SupportedLocales",
+    (0x0000002B, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000002B, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000002B, 0x0000FFFB): "AttributeList",
+    (0x0000002B, 0x0000FFFC): "FeatureMap",
+    (0x0000002B, 0x0000FFFD): "ClusterRevision",
+    (0x0000002C, 0x00000000): "HourFormat",
+    (0x0000002C, 0x00000001): "ActiveCalendarType",
+    (0x0000002C, 0x00000002): "SupportedCalendarTypes",
+    (0x0000002C, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000002C, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000002C, 0x0000FFFB): "AttributeList",
+    (0x0000002C, 0x0000FFFC): "FeatureMap",
+    (0x0000002C, 0x0000FFFD): "ClusterRevision",
+    (0x0000002D, 0x00000000): "TemperatureUnit",
+    (0x0000002D, 0x00000001): "SupportedTemperatureUnits",
+    (0x0000002D, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000002D, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000002D, 0x0000FFFB): "AttributeList",
+    (0x0000002D, 0x0000FFFC): "FeatureMap",
+    (0x0000002D, 0x0000FFFD): "ClusterRevision",
+    (0x0000002E, 0x00000000): "Sources",
+    (0x0000002E, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000002E, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000002E, 0x0000FFFB): "AttributeList",
+    (0x0000002E, 0x0000FFFC): "FeatureMap",
+    (0x0000002E, 0x0000FFFD): "ClusterRevision",
+    (0x0000002F, 0x00000000): "Status",
+    (0x0000002F, 0x00000001): "Order",
+    (0x0000002F, 0x00000002): "Description",
+    (0x0000002F, 0x00000003): "WiredAssessedInputVoltage",
+    (0x0000002F, 0x00000004): "WiredAssessedInputFrequency",
+    (0x0000002F, 0x00000005): "WiredCurrentType",
+    (0x0000002F, 0x00000006): "WiredAssessedCurrent",
+    (0x0000002F, 0x00000007): "WiredNominalVoltage",
+    (0x0000002F, 0x00000008): "WiredMaximumCurrent",
+    (0x0000002F, 0x00000009): "WiredPresent",
+    (0x0000002F, 0x0000000A): "ActiveWiredFaults",
+    (0x0000002F, 0x0000000B): "BatVoltage",
+    (0x0000002F, 0x0000000C): "BatPercentRemaining",
+    (0x0000002F, 0x0000000D): "BatTimeRemaining",
+    (0x0000002F, 0x0000000E): "BatChargeLevel",
+    (0x0000002F, 0x0000000F): "BatReplacementNeeded",
+    (0x0000002F, 0x00000010): "BatReplaceability",
+    (0x0000002F, 0x00000011): "BatPresent",
+    (0x0000002F, 0x00000012): "ActiveBatFaults",
+    (0x0000002F, 0x00000013): "BatReplacementDescription",
+    (0x0000002F, 0x00000014): "BatCommonDesignation",
+    (0x0000002F, 0x00000015): "BatANSIDesignation",
+    (0x0000002F, 0x00000016): "BatIECDesignation",
+    (0x0000002F, 0x00000017): "BatApprovedChemistry",
+    (0x0000002F, 0x00000018): "BatCapacity",
+    (0x0000002F, 0x00000019): "BatQuantity",
+    (0x0000002F, 0x0000001A): "BatChargeState",
+    (0x0000002F, 0x0000001B): "BatTimeToFullCharge",
+    (0x0000002F, 0x0000001C): "BatFunctionalWhileCharging",
+    (0x0000002F, 0x0000001D): "BatChargingCurrent",
+    (0x0000002F, 0x0000001E): "ActiveBatChargeFaults",
+    (0x0000002F, 0x0000001F): "EndpointList",
+    (0x0000002F, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000002F, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000002F, 0x0000FFFB): "AttributeList",
+    (0x0000002F, 0x0000FFFC): "FeatureMap",
+    (0x0000002F, 0x0000FFFD): "ClusterRevision",
+    (0x00000030, 0x00000000): "Breadcrumb",
+    (0x00000030, 0x00000001): "BasicCommissioningInfo",
+    (0x00000030, 0x00000002): "RegulatoryConfig",
+    (0x00000030, 0x00000003): "LocationCapability",
+    (0x00000030, 0x00000004): "SupportsConcurrentConnection",
+    (0x00000030, 0x00000005): "TCAcceptedVersion",
+    (0x00000030, 0x00000006): "TCMinRequiredVersion",
+    (0x00000030, 0x00000007): "TCAcknowledgements",
+    (0x00000030, 0x00000008): "TCAcknowledgementsRequired",
+    (0x00000030, 0x00000009): "TCUpdateDeadline",
+    (0x00000030, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000030, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000030, 0x0000FFFB): "AttributeList",
+    (0x00000030, 0x0000FFFC): "FeatureMap",
+    (0x00000030, 0x0000FFFD): "ClusterRevision",
+    (0x00000031, 0x00000000): "MaxNetworks",
+    (0x00000031, 0x00000001): "Networks",
+    (0x00000031, 0x00000002): "ScanMaxTimeSeconds",
+    (0x00000031, 0x00000003): "ConnectMaxTimeSeconds",
+    (0x00000031, 0x00000004): "InterfaceEnabled",
+    (0x00000031, 0x00000005): "LastNetworkingStatus",
+    (0x00000031, 0x00000006): "LastNetworkID",
+    (0x00000031, 0x00000007): "LastConnectErrorValue",
+    (0x00000031, 0x00000008): "SupportedWiFiBands",
+    (0x00000031, 0x00000009): "SupportedThreadFeatures",
+    (0x00000031, 0x0000000A): "ThreadVersion",
+    (0x00000031, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000031, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000031, 0x0000FFFB): "AttributeList",
+    (0x00000031, 0x0000FFFC): "FeatureMap",
+    (0x00000031, 0x0000FFFD): "ClusterRevision",
+    (0x00000032, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000032, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000032, 0x0000FFFB): "AttributeList",
+    (0x00000032, 0x0000FFFC): "FeatureMap",
+    (0x00000032, 0x0000FFFD): "ClusterRevision",
+    (0x00000033, 0x00000000): "NetworkInterfaces",
+    (0x00000033, 0x00000001): "RebootCount",
+    (0x00000033, 0x00000002): "UpTime",
+    (0x00000033, 0x00000003): "TotalOperationalHours",
+    (0x00000033, 0x00000004): "BootReason",
+    (0x00000033, 0x00000005): "ActiveHardwareFaults",
+    (0x00000033, 0x00000006): "ActiveRadioFaults",
+    (0x00000033, 0x00000007): "ActiveNetworkFaults",
+    (0x00000033, 0x00000008): "TestEventTriggersEnabled",
+    (0x00000033, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000033, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000033, 0x0000FFFB): "AttributeList",
+    (0x00000033, 0x0000FFFC): "FeatureMap",
+    (0x00000033, 0x0000FFFD): "ClusterRevision",
+    (0x00000034, 0x00000000): "ThreadMetrics",
+    (0x00000034, 0x00000001): "CurrentHeapFree",
+    (0x00000034, 0x00000002): "CurrentHeapUsed",
+    (0x00000034, 0x00000003): "CurrentHeapHighWatermark",
+    (0x00000034, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000034, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000034, 0x0000FFFB): "AttributeList",
+    (0x00000034, 0x0000FFFC): "FeatureMap",
+    (0x00000034, 0x0000FFFD): "ClusterRevision",
+    (0x00000035, 0x00000000): "Channel",
+    (0x00000035, 0x00000001): "RoutingRole",
+    (0x00000035, 0x00000002): "NetworkName",
+    (0x00000035, 0x00000003): "PanId",
+    (0x00000035, 0x00000004): "ExtendedPanId",
+    (0x00000035, 0x00000005): "MeshLocalPrefix",
+    (0x00000035, 0x00000006): "OverrunCount",
+    (0x00000035, 0x00000007): "NeighborTable",
+    (0x00000035, 0x00000008): "RouteTable",
+    (0x00000035, 0x00000009): "PartitionId",
+    (0x00000035, 0x0000000A): "Weighting",
+    (0x00000035, 0x0000000B): "DataVersion",
+    (0x00000035, 0x0000000C): "StableDataVersion",
+    (0x00000035, 0x0000000D): "LeaderRouterId",
+    (0x00000035, 0x0000000E): "DetachedRoleCount",
+    (0x00000035, 0x0000000F): "ChildRoleCount",
+    (0x00000035, 0x00000010): "RouterRoleCount",
+    (0x00000035, 0x00000011): "LeaderRoleCount",
+    (0x00000035, 0x00000012): "AttachAttemptCount",
+    (0x00000035, 0x00000013): "PartitionIdChangeCount",
+    (0x00000035, 0x00000014): "BetterPartitionAttachAttemptCount",
+    (0x00000035, 0x00000015): "ParentChangeCount",
+    (0x00000035, 0x00000016): "TxTotalCount",
+    (0x00000035, 0x00000017): "TxUnicastCount",
+    (0x00000035, 0x00000018): "TxBroadcastCount",
+    (0x00000035, 0x00000019): "TxAckRequestedCount",
+    (0x00000035, 0x0000001A): "TxAckedCount",
+    (0x00000035, 0x0000001B): "TxNoAckRequestedCount",
+    (0x00000035, 0x0000001C): "TxDataCount",
+    (0x00000035, 0x0000001D): "TxDataPollCount",
+    (0x00000035, 0x0000001E): "TxBeaconCount",
+    (0x00000035, 0x0000001F): "TxBeaconRequestCount",
+    (0x00000035, 0x00000020): "TxOtherCount",
+    (0x00000035, 0x00000021): "TxRetryCount",
+    (0x00000035, 0x00000022): "TxDirectMaxRetryExpiryCount",
+    (0x00000035, 0x00000023): "TxIndirectMaxRetryExpiryCount",
+    (0x00000035, 0x00000024): "TxErrCcaCount",
+    (0x00000035, 0x00000025): "TxErrAbortCount",
+    (0x00000035, 0x00000026): "TxErrBusyChannelCount",
+    (0x00000035, 0x00000027): "RxTotalCount",
+    (0x00000035, 0x00000028): "RxUnicastCount",
+    (0x00000035, 0x00000029): "RxBroadcastCount",
+    (0x00000035, 0x0000002A): "RxDataCount",
+    (0x00000035, 0x0000002B): "RxDataPollCount",
+    (0x00000035, 0x0000002C): "RxBeaconCount",
+    (0x00000035, 0x0000002D): "RxBeaconRequestCount",
+    (0x00000035, 0x0000002E): "RxOtherCount",
+    (0x00000035, 0x0000002F): "RxAddressFilteredCount",
+    (0x00000035, 0x00000030): "RxDestAddrFilteredCount",
+    (0x00000035, 0x00000031): "RxDuplicatedCount",
+    (0x00000035, 0x00000032): "RxErrNoFrameCount",
+    (0x00000035, 0x00000033): "RxErrUnknownNeighborCount",
+    (0x00000035, 0x00000034): "RxErrInvalidSrcAddrCount",
+    (0x00000035, 0x00000035): "RxErrSecCount",
+    (0x00000035, 0x00000036): "RxErrFcsCount",
+    (0x00000035, 0x00000037): "RxErrOtherCount",
+    (0x00000035, 0x00000038): "ActiveTimestamp",
+    (0x00000035, 0x00000039): "PendingTimestamp",
+    (0x00000035, 0x0000003A): "Delay",
+    (0x00000035, 0x0000003B): "SecurityPolicy",
+    (0x00000035, 0x0000003C): "ChannelPage0Mask",
+    (0x00000035, 0x0000003D): "OperationalDatasetComponents",
+    (0x00000035, 0x0000003E): "ActiveNetworkFaultsList",
+    (0x00000035, 0x0000003F): "ExtAddress",
+    (0x00000035, 0x00000040): "Rloc16",
+    (0x00000035, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000035, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000035, 0x0000FFFB): "AttributeList",
+    (0x00000035, 0x0000FFFC): "FeatureMap",
+    (0x00000035, 0x0000FFFD): "ClusterRevision",
+    (0x00000036, 0x00000000): "Bssid",
+    (0x00000036, 0x00000001): "SecurityType",
+    (0x00000036, 0x00000002): "WiFiVersion",
+    (0x00000036, 0x00000003): "ChannelNumber",
+    (0x00000036, 0x00000004): "Rssi",
+    (0x00000036, 0x00000005): "BeaconLostCount",
+    (0x00000036, 0x00000006): "BeaconRxCount",
+    (0x00000036, 0x00000007): "PacketMulticastRxCount",
+    (0x00000036, 0x00000008): "PacketMulticastTxCount",
+    (0x00000036, 0x00000009): "PacketUnicastRxCount",
+    (0x00000036, 0x0000000A): "PacketUnicastTxCount",
+    (0x00000036, 0x0000000B): "CurrentMaxRate",
+    (0x00000036, 0x0000000C): "OverrunCount",
+    (0x00000036, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000036, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000036, 0x0000FFFB): "AttributeList",
+    (0x00000036, 0x0000FFFC): "FeatureMap",
+    (0x00000036, 0x0000FFFD): "ClusterRevision",
+    (0x00000037, 0x00000000): "PHYRate",
+    (0x00000037, 0x00000001): "FullDuplex",
+    (0x00000037, 0x00000002): "PacketRxCount",
+    (0x00000037, 0x00000003): "PacketTxCount",
+    (0x00000037, 0x00000004): "TxErrCount",
+    (0x00000037, 0x00000005): "CollisionCount",
+    (0x00000037, 0x00000006): "OverrunCount",
+    (0x00000037, 0x00000007): "CarrierDetect",
+    (0x00000037, 0x00000008): "TimeSinceReset",
+    (0x00000037, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000037, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000037, 0x0000FFFB): "AttributeList",
+    (0x00000037, 0x0000FFFC): "FeatureMap",
+    (0x00000037, 0x0000FFFD): "ClusterRevision",
+    (0x00000038, 0x00000000): "UTCTime",
+    (0x00000038, 0x00000001): "Granularity",
+    (0x00000038, 0x00000002): "TimeSource",
+    (0x00000038, 0x00000003): "TrustedTimeSource",
+    (0x00000038, 0x00000004): "DefaultNTP",
+    (0x00000038, 0x00000005): "TimeZone",
+    (0x00000038, 0x00000006): "DSTOffset",
+    (0x00000038, 0x00000007): "LocalTime",
+    (0x00000038, 0x00000008): "TimeZoneDatabase",
+    (0x00000038, 0x00000009): "NTPServerAvailable",
+    (0x00000038, 0x0000000A): "TimeZoneListMaxSize",
+    (0x00000038, 0x0000000B): "DSTOffsetListMaxSize",
+    (0x00000038, 0x0000000C): "SupportsDNSResolve",
+    (0x00000038, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000038, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000038, 0x0000FFFB): "AttributeList",
+    (0x00000038, 0x0000FFFC): "FeatureMap",
+    (0x00000038, 0x0000FFFD): "ClusterRevision",
+    (0x00000039, 0x00000001): "VendorName",
+    (0x00000039, 0x00000002): "VendorID",
+    (0x00000039, 0x00000003): "ProductName",
+    (0x00000039, 0x00000004): "ProductID",
+    (0x00000039, 0x00000005): "NodeLabel",
+    (0x00000039, 0x00000007): "HardwareVersion",
+    (0x00000039, 0x00000008): "HardwareVersionString",
+    (0x00000039, 0x00000009): "SoftwareVersion",
+    (0x00000039, 0x0000000A): "SoftwareVersionString",
+    (0x00000039, 0x0000000B): "ManufacturingDate",
+    (0x00000039, 0x0000000C): "PartNumber",
+    (0x00000039, 0x0000000D): "ProductURL",
+    (0x00000039, 0x0000000E): "ProductLabel",
+    (0x00000039, 0x0000000F): "SerialNumber",
+    (0x00000039, 0x00000011): "Reachable",
+    (0x00000039, 0x00000012): "UniqueID",
+    (0x00000039, 0x00000014): "ProductAppearance",
+    (0x00000039, 0x00000018): "ConfigurationVersion",
+    (0x00000039, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000039, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000039, 0x0000FFFB): "AttributeList",
+    (0x00000039, 0x0000FFFC): "FeatureMap",
+    (0x00000039, 0x0000FFFD): "ClusterRevision",
+    (0x0000003B, 0x00000000): "NumberOfPositions",
+    (0x0000003B, 0x00000001): "CurrentPosition",
+    (0x0000003B, 0x00000002): "MultiPressMax",
+    (0x0000003B, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000003B, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000003B, 0x0000FFFB): "AttributeList",
+    (0x0000003B, 0x0000FFFC): "FeatureMap",
+    (0x0000003B, 0x0000FFFD): "ClusterRevision",
+    (0x0000003C, 0x00000000): "WindowStatus",
+    (0x0000003C, 0x00000001): "AdminFabricIndex",
+    (0x0000003C, 0x00000002): "AdminVendorId",
+    (0x0000003C, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000003C, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000003C, 0x0000FFFB): "AttributeList",
+    (0x0000003C, 0x0000FFFC): "FeatureMap",
+    (0x0000003C, 0x0000FFFD): "ClusterRevision",
+    (0x0000003E, 0x00000000): "NOCs",
+    (0x0000003E, 0x00000001): "Fabrics",
+    (0x0000003E, 0x00000002): "SupportedFabrics",
+    (0x0000003E, 0x00000003): "CommissionedFabrics",
+    (0x0000003E, 0x00000004): "TrustedRootCertificates",
+    (0x0000003E, 0x00000005): "CurrentFabricIndex",
+    (0x0000003E, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000003E, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000003E, 0x0000FFFB): "AttributeList",
+    (0x0000003E, 0x0000FFFC): "FeatureMap",
+    (0x0000003E, 0x0000FFFD): "ClusterRevision",
+    (0x0000003F, 0x00000000): "GroupKeyMap",
+    (0x0000003F, 0x00000001): "GroupTable",
+    (0x0000003F, 0x00000002): "MaxGroupsPerFabric",
+    (0x0000003F, 0x00000003): "MaxGroupKeysPerFabric",
+    (0x0000003F, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000003F, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000003F, 0x0000FFFB): "AttributeList",
+    (0x0000003F, 0x0000FFFC): "FeatureMap",
+    (0x0000003F, 0x0000FFFD): "ClusterRevision",
+    (0x00000040, 0x00000000): "LabelList",
+    (0x00000040, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000040, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000040, 0x0000FFFB): "AttributeList",
+    (0x00000040, 0x0000FFFC): "FeatureMap",
+    (0x00000040, 0x0000FFFD): "ClusterRevision",
+    (0x00000041, 0x00000000): "LabelList",
+    (0x00000041, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000041, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000041, 0x0000FFFB): "AttributeList",
+    (0x00000041, 0x0000FFFC): "FeatureMap",
+    (0x00000041, 0x0000FFFD): "ClusterRevision",
+    (0x00000042, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000042, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000042, 0x0000FFFB): "AttributeList",
+    (0x00000042, 0x0000FFFC): "FeatureMap",
+    (0x00000042, 0x0000FFFD): "ClusterRevision",
+    (0x00000043, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000043, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000043, 0x0000FFFB): "AttributeList",
+    (0x00000043, 0x0000FFFC): "FeatureMap",
+    (0x00000043, 0x0000FFFD): "ClusterRevision",
+    (0x00000044, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000044, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000044, 0x0000FFFB): "AttributeList",
+    (0x00000044, 0x0000FFFC): "FeatureMap",
+    (0x00000044, 0x0000FFFD): "ClusterRevision",
+    (0x00000045, 0x00000000): "StateValue",
+    (0x00000045, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000045, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000045, 0x0000FFFB): "AttributeList",
+    (0x00000045, 0x0000FFFC): "FeatureMap",
+    (0x00000045, 0x0000FFFD): "ClusterRevision",
+    (0x00000046, 0x00000000): "IdleModeDuration",
+    (0x00000046, 0x00000001): "ActiveModeDuration",
+    (0x00000046, 0x00000002): "ActiveModeThreshold",
+    (0x00000046, 0x00000003): "RegisteredClients",
+    (0x00000046, 0x00000004): "ICDCounter",
+    (0x00000046, 0x00000005): "ClientsSupportedPerFabric",
+    (0x00000046, 0x00000006): "UserActiveModeTriggerHint",
+    (0x00000046, 0x00000007): "UserActiveModeTriggerInstruction",
+    (0x00000046, 0x00000008): "OperatingMode",
+    (0x00000046, 0x00000009): "MaximumCheckInBackOff",
+    (0x00000046, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000046, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000046, 0x0000FFFB): "AttributeList",
+    (0x00000046, 0x0000FFFC): "FeatureMap",
+    (0x00000046, 0x0000FFFD): "ClusterRevision",
+    (0x00000047, 0x00000000): "SetTime",
+    (0x00000047, 0x00000001): "TimeRemaining",
+    (0x00000047, 0x00000002): "TimerState",
+    (0x00000047, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000047, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000047, 0x0000FFFB): "AttributeList",
+    (0x00000047, 0x0000FFFC): "FeatureMap",
+    (0x00000047, 0x0000FFFD): "ClusterRevision",
+    (0x00000048, 0x00000000): "PhaseList",
+    (0x00000048, 0x00000001): "CurrentPhase",
+    (0x00000048, 0x00000002): "CountdownTime",
+    (0x00000048, 0x00000003): "OperationalStateList",
+    (0x00000048, 0x00000004): "OperationalState",
+    (0x00000048, 0x00000005): "OperationalError",
+    (0x00000048, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000048, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000048, 0x0000FFFB): "AttributeList",
+    (0x00000048, 0x0000FFFC): "FeatureMap",
+    (0x00000048, 0x0000FFFD): "ClusterRevision",
+    (0x00000049, 0x00000000): "SupportedModes",
+    (0x00000049, 0x00000001): "CurrentMode",
+    (0x00000049, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000049, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000049, 0x0000FFFB): "AttributeList",
+    (0x00000049, 0x0000FFFC): "FeatureMap",
+    (0x00000049, 0x0000FFFD): "ClusterRevision",
+    (0x0000004A, 0x00000000): "SupportedDrynessLevels",
+    (0x0000004A, 0x00000001): "SelectedDrynessLevel",
+    (0x0000004A, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000004A, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000004A, 0x0000FFFB): "AttributeList",
+    (0x0000004A, 0x0000FFFC): "FeatureMap",
+    (0x0000004A, 0x0000FFFD): "ClusterRevision",
+    (0x00000050, 0x00000000): "Description",
+    (0x00000050, 0x00000001): "StandardNamespace",
+    (0x00000050, 0x00000002): "SupportedModes",
+    (0x00000050, 0x00000003): "CurrentMode",
+    (0x00000050, 0x00000004): "StartUpMode",
+    (0x00000050, 0x00000005): "OnMode",
+    (0x00000050, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000050, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000050, 0x0000FFFB): "AttributeList",
+    (0x00000050, 0x0000FFFC): "FeatureMap",
+    (0x00000050, 0x0000FFFD): "ClusterRevision",
+    (0x00000051, 0x00000000): "SupportedModes",
+    (0x00000051, 0x00000001): "CurrentMode",
+    (0x00000051, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000051, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000051, 0x0000FFFB): "AttributeList",
+    (0x00000051, 0x0000FFFC): "FeatureMap",
+    (0x00000051, 0x0000FFFD): "ClusterRevision",
+    (0x00000052, 0x00000000): "SupportedModes",
+    (0x00000052, 0x00000001): "CurrentMode",
+    (0x00000052, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000052, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000052, 0x0000FFFB): "AttributeList",
+    (0x00000052, 0x0000FFFC): "FeatureMap",
+    (0x00000052, 0x0000FFFD): "ClusterRevision",
+    (0x00000053, 0x00000000): "SpinSpeeds",
+    (0x00000053, 0x00000001): "SpinSpeedCurrent",
+    (0x00000053, 0x00000002): "NumberOfRinses",
+    (0x00000053, 0x00000003): "SupportedRinses",
+    (0x00000053, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000053, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000053, 0x0000FFFB): "AttributeList",
+    (0x00000053, 0x0000FFFC): "FeatureMap",
+    (0x00000053, 0x0000FFFD): "ClusterRevision",
+    (0x00000054, 0x00000000): "SupportedModes",
+    (0x00000054, 0x00000001): "CurrentMode",
+    (0x00000054, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000054, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000054, 0x0000FFFB): "AttributeList",
+    (0x00000054, 0x0000FFFC): "FeatureMap",
+    (0x00000054, 0x0000FFFD): "ClusterRevision",
+    (0x00000055, 0x00000000): "SupportedModes",
+    (0x00000055, 0x00000001): "CurrentMode",
+    (0x00000055, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000055, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000055, 0x0000FFFB): "AttributeList",
+    (0x00000055, 0x0000FFFC): "FeatureMap",
+    (0x00000055, 0x0000FFFD): "ClusterRevision",
+    (0x00000056, 0x00000000): "TemperatureSetpoint",
+    (0x00000056, 0x00000001): "MinTemperature",
+    (0x00000056, 0x00000002): "MaxTemperature",
+    (0x00000056, 0x00000003): "Step",
+    (0x00000056, 0x00000004): "SelectedTemperatureLevel",
+    (0x00000056, 0x00000005): "SupportedTemperatureLevels",
+    (0x00000056, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000056, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000056, 0x0000FFFB): "AttributeList",
+    (0x00000056, 0x0000FFFC): "FeatureMap",
+    (0x00000056, 0x0000FFFD): "ClusterRevision",
+    (0x00000057, 0x00000000): "Mask",
+    (0x00000057, 0x00000002): "State",
+    (0x00000057, 0x00000003): "Supported",
+    (0x00000057, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000057, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000057, 0x0000FFFB): "AttributeList",
+    (0x00000057, 0x0000FFFC): "FeatureMap",
+    (0x00000057, 0x0000FFFD): "ClusterRevision",
+    (0x00000059, 0x00000000): "SupportedModes",
+    (0x00000059, 0x00000001): "CurrentMode",
+    (0x00000059, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000059, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000059, 0x0000FFFB): "AttributeList",
+    (0x00000059, 0x0000FFFC): "FeatureMap",
+    (0x00000059, 0x0000FFFD): "ClusterRevision",
+    (0x0000005B, 0x00000000): "AirQuality",
+    (0x0000005B, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000005B, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000005B, 0x0000FFFB): "AttributeList",
+    (0x0000005B, 0x0000FFFC): "FeatureMap",
+    (0x0000005B, 0x0000FFFD): "ClusterRevision",
+    (0x0000005C, 0x00000000): "ExpressedState",
+    (0x0000005C, 0x00000001): "SmokeState",
+    (0x0000005C, 0x00000002): "COState",
+    (0x0000005C, 0x00000003): "BatteryAlert",
+    (0x0000005C, 0x00000004): "DeviceMuted",
+    (0x0000005C, 0x00000005): "TestInProgress",
+    (0x0000005C, 0x00000006): "HardwareFaultAlert",
+    (0x0000005C, 0x00000007): "EndOfServiceAlert",
+    (0x0000005C, 0x00000008): "InterconnectSmokeAlarm",
+    (0x0000005C, 0x00000009): "InterconnectCOAlarm",
+    (0x0000005C, 0x0000000A): "ContaminationState",
+    (0x0000005C, 0x0000000B): "SmokeSensitivityLevel",
+    (0x0000005C, 0x0000000C): "ExpiryDate",
+    (0x0000005C, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000005C, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000005C, 0x0000FFFB): "AttributeList",
+    (0x0000005C, 0x0000FFFC): "FeatureMap",
+    (0x0000005C, 0x0000FFFD): "ClusterRevision",
+    (0x0000005D, 0x00000000): "Mask",
+    (0x0000005D, 0x00000001): "Latch",
+    (0x0000005D, 0x00000002): "State",
+    (0x0000005D, 0x00000003): "Supported",
+    (0x0000005D, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000005D, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000005D, 0x0000FFFB): "AttributeList",
+    (0x0000005D, 0x0000FFFC): "FeatureMap",
+    (0x0000005D, 0x0000FFFD): "ClusterRevision",
+    (0x0000005E, 0x00000000): "SupportedModes",
+    (0x0000005E, 0x00000001): "CurrentMode",
+    (0x0000005E, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000005E, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000005E, 0x0000FFFB): "AttributeList",
+    (0x0000005E, 0x0000FFFC): "FeatureMap",
+    (0x0000005E, 0x0000FFFD): "ClusterRevision",
+    (0x0000005F, 0x00000000): "CookTime",
+    (0x0000005F, 0x00000001): "MaxCookTime",
+    (0x0000005F, 0x00000002): "PowerSetting",
+    (0x0000005F, 0x00000003): "MinPower",
+    (0x0000005F, 0x00000004): "MaxPower",
+    (0x0000005F, 0x00000005): "PowerStep",
+    (0x0000005F, 0x00000006): "SupportedWatts",
+    (0x0000005F, 0x00000007): "SelectedWattIndex",
+    (0x0000005F, 0x00000008): "WattRating",
+    (0x0000005F, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000005F, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000005F, 0x0000FFFB): "AttributeList",
+    (0x0000005F, 0x0000FFFC): "FeatureMap",
+    (0x0000005F, 0x0000FFFD): "ClusterRevision",
+    (0x00000060, 0x00000000): "PhaseList",
+    (0x00000060, 0x00000001): "CurrentPhase",
+    (0x00000060, 0x00000002): "CountdownTime",
+    (0x00000060, 0x00000003): "OperationalStateList",
+    (0x00000060, 0x00000004): "OperationalState",
+    (0x00000060, 0x00000005): "OperationalError",
+    (0x00000060, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000060, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000060, 0x0000FFFB): "AttributeList",
+    (0x00000060, 0x0000FFFC): "FeatureMap",
+    (0x00000060, 0x0000FFFD): "ClusterRevision",
+    (0x00000061, 0x00000000): "PhaseList",
+    (0x00000061, 0x00000001): "CurrentPhase",
+    (0x00000061, 0x00000002): "CountdownTime",
+    (0x00000061, 0x00000003): "OperationalStateList",
+    (0x00000061, 0x00000004): "OperationalState",
+    (0x00000061, 0x00000005): "OperationalError",
+    (0x00000061, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000061, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000061, 0x0000FFFB): "AttributeList",
+    (0x00000061, 0x0000FFFC): "FeatureMap",
+    (0x00000061, 0x0000FFFD): "ClusterRevision",
+    (0x00000062, 0x00000001): "SceneTableSize",
+    (0x00000062, 0x00000002): "FabricSceneInfo",
+    (0x00000062, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000062, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000062, 0x0000FFFB): "AttributeList",
+    (0x00000062, 0x0000FFFC): "FeatureMap",
+    (0x00000062, 0x0000FFFD): "ClusterRevision",
+    (0x00000071, 0x00000000): "Condition",
+    (0x00000071, 0x00000001): "DegradationDirection",
+    (0x00000071, 0x00000002): "ChangeIndication",
+    (0x00000071, 0x00000003): "InPlaceIndicator",
+    (0x00000071, 0x00000004): "LastChangedTime",
+    (0x00000071, 0x00000005): "ReplacementProductList",
+    (0x00000071, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000071, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000071, 0x0000FFFB): "AttributeList",
+    (0x00000071, 0x0000FFFC): "FeatureMap",
+    (0x00000071, 0x0000FFFD): "ClusterRevision",
+    (0x00000072, 0x00000000): "Condition",
+    (0x00000072, 0x00000001): "DegradationDirection",
+    (0x00000072, 0x00000002): "ChangeIndication",
+    (0x00000072, 0x00000003): "InPlaceIndicator",
+    (0x00000072, 0x00000004): "LastChangedTime",
+    (0x00000072, 0x00000005): "ReplacementProductList",
+    (0x00000072, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000072, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000072, 0x0000FFFB): "AttributeList",
+    (0x00000072, 0x0000FFFC): "FeatureMap",
+    (0x00000072, 0x0000FFFD): "ClusterRevision",
+    (0x00000080, 0x00000000): "CurrentSensitivityLevel",
+    (0x00000080, 0x00000001): "SupportedSensitivityLevels",
+    (0x00000080, 0x00000002): "DefaultSensitivityLevel",
+    (0x00000080, 0x00000003): "AlarmsActive",
+    (0x00000080, 0x00000004): "AlarmsSuppressed",
+    (0x00000080, 0x00000005): "AlarmsEnabled",
+    (0x00000080, 0x00000006): "AlarmsSupported",
+    (0x00000080, 0x00000007): "SensorFault",
+    (0x00000080, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000080, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000080, 0x0000FFFB): "AttributeList",
+    (0x00000080, 0x0000FFFC): "FeatureMap",
+    (0x00000080, 0x0000FFFD): "ClusterRevision",
+    (0x00000081, 0x00000000): "OpenDuration",
+    (0x00000081, 0x00000001): "DefaultOpenDuration",
+    (0x00000081, 0x00000002): "AutoCloseTime",
+    (0x00000081, 0x00000003): "RemainingDuration",
+    (0x00000081, 0x00000004): "CurrentState",
+    (0x00000081, 0x00000005): "TargetState",
+    (0x00000081, 0x00000006): "CurrentLevel",
+    (0x00000081, 0x00000007): "TargetLevel",
+    (0x00000081, 0x00000008): "DefaultOpenLevel",
+    (0x00000081, 0x00000009): "ValveFault",
+    (0x00000081, 0x0000000A): "LevelStep",
+    (0x00000081, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000081, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000081, 0x0000FFFB): "AttributeList",
+    (0x00000081, 0x0000FFFC): "FeatureMap",
+    (0x00000081, 0x0000FFFD): "ClusterRevision",
+    (0x00000090, 0x00000000): "PowerMode",
+    (0x00000090, 0x00000001): "NumberOfMeasurementTypes",
+    (0x00000090, 0x00000002): "Accuracy",
+    (0x00000090, 0x00000003): "Ranges",
+    (0x00000090, 0x00000004): "Voltage",
+    (0x00000090, 0x00000005): "ActiveCurrent",
+    (0x00000090, 0x00000006): "ReactiveCurrent",
+    (0x00000090, 0x00000007): "ApparentCurrent",
+    (0x00000090, 0x00000008): "ActivePower",
+    (0x00000090, 0x00000009): "ReactivePower",
+    (0x00000090, 0x0000000A): "ApparentPower",
+    (0x00000090, 0x0000000B): "RMSVoltage",
+    (0x00000090, 0x0000000C): "RMSCurrent",
+    (0x00000090, 0x0000000D): "RMSPower",
+    (0x00000090, 0x0000000E): "Frequency",
+    (0x00000090, 0x0000000F): "HarmonicCurrents",
+    (0x00000090, 0x00000010): "HarmonicPhases",
+    (0x00000090, 0x00000011): "PowerFactor",
+    (0x00000090, 0x00000012): "NeutralCurrent",
+    (0x00000090, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000090, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000090, 0x0000FFFB): "AttributeList",
+    (0x00000090, 0x0000FFFC): "FeatureMap",
+    (0x00000090, 0x0000FFFD): "ClusterRevision",
+    (0x00000091, 0x00000000): "Accuracy",
+    (0x00000091, 0x00000001): "CumulativeEnergyImported",
+    (0x00000091, 0x00000002): "CumulativeEnergyExported",
+    (0x00000091, 0x00000003): "PeriodicEnergyImported",
+    (0x00000091, 0x00000004): "PeriodicEnergyExported",
+    (0x00000091, 0x00000005): "CumulativeEnergyReset",
+    (0x00000091, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000091, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000091, 0x0000FFFB): "AttributeList",
+    (0x00000091, 0x0000FFFC): "FeatureMap",
+    (0x00000091, 0x0000FFFD): "ClusterRevision",
+    (0x00000094, 0x00000000): "HeaterTypes",
+    (0x00000094, 0x00000001): "HeatDemand",
+    (0x00000094, 0x00000002): "TankVolume",
+    (0x00000094, 0x00000003): "EstimatedHeatRequired",
+    (0x00000094, 0x00000004): "TankPercentage",
+    (0x00000094, 0x00000005): "BoostState",
+    (0x00000094, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000094, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000094, 0x0000FFFB): "AttributeList",
+    (0x00000094, 0x0000FFFC): "FeatureMap",
+    (0x00000094, 0x0000FFFD): "ClusterRevision",
+    (0x00000095, 0x00000000): "TariffUnit",
+    (0x00000095, 0x00000001): "Currency",
+    (0x00000095, 0x00000002): "CurrentPrice",
+    (0x00000095, 0x00000003): "PriceForecast",
+    (0x00000095, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000095, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000095, 0x0000FFFB): "AttributeList",
+    (0x00000095, 0x0000FFFC): "FeatureMap",
+    (0x00000095, 0x0000FFFD): "ClusterRevision",
+    (0x00000097, 0x00000000): "Messages",
+    (0x00000097, 0x00000001): "ActiveMessageIDs",
+    (0x00000097, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000097, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000097, 0x0000FFFB): "AttributeList",
+    (0x00000097, 0x0000FFFC): "FeatureMap",
+    (0x00000097, 0x0000FFFD): "ClusterRevision",
+    (0x00000098, 0x00000000): "ESAType",
+    (0x00000098, 0x00000001): "ESACanGenerate",
+    (0x00000098, 0x00000002): "ESAState",
+    (0x00000098, 0x00000003): "AbsMinPower",
+    (0x00000098, 0x00000004): "AbsMaxPower",
+    (0x00000098, 0x00000005): "PowerAdjustmentCapability",
+    (0x00000098, 0x00000006): "Forecast",
+    (0x00000098, 0x00000007): "OptOutState",
+    (0x00000098, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000098, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000098, 0x0000FFFB): "AttributeList",
+    (0x00000098, 0x0000FFFC): "FeatureMap",
+    (0x00000098, 0x0000FFFD): "ClusterRevision",
+    (0x00000099, 0x00000000): "State",
+    (0x00000099, 0x00000001): "SupplyState",
+    (0x00000099, 0x00000002): "FaultState",
+    (0x00000099, 0x00000003): "ChargingEnabledUntil",
+    (0x00000099, 0x00000004): "DischargingEnabledUntil",
+    (0x00000099, 0x00000005): "CircuitCapacity",
+    (0x00000099, 0x00000006): "MinimumChargeCurrent",
+    (0x00000099, 0x00000007): "MaximumChargeCurrent",
+    (0x00000099, 0x00000008): "MaximumDischargeCurrent",
+    (0x00000099, 0x00000009): "UserMaximumChargeCurrent",
+    (0x00000099, 0x0000000A): "RandomizationDelayWindow",
+    (0x00000099, 0x00000023): "NextChargeStartTime",
+    (0x00000099, 0x00000024): "NextChargeTargetTime",
+    (0x00000099, 0x00000025): "NextChargeRequiredEnergy",
+    (0x00000099, 0x00000026): "NextChargeTargetSoC",
+    (0x00000099, 0x00000027): "ApproximateEVEfficiency",
+    (0x00000099, 0x00000030): "StateOfCharge",
+    (0x00000099, 0x00000031): "BatteryCapacity",
+    (0x00000099, 0x00000032): "VehicleID",
+    (0x00000099, 0x00000040): "SessionID",
+    (0x00000099, 0x00000041): "SessionDuration",
+    (0x00000099, 0x00000042): "SessionEnergyCharged",
+    (0x00000099, 0x00000043): "SessionEnergyDischarged",
+    (0x00000099, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000099, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000099, 0x0000FFFB): "AttributeList",
+    (0x00000099, 0x0000FFFC): "FeatureMap",
+    (0x00000099, 0x0000FFFD): "ClusterRevision",
+    (0x0000009B, 0x00000000): "EnergyBalances",
+    (0x0000009B, 0x00000001): "CurrentEnergyBalance",
+    (0x0000009B, 0x00000002): "EnergyPriorities",
+    (0x0000009B, 0x00000003): "LowPowerModeSensitivities",
+    (0x0000009B, 0x00000004): "CurrentLowPowerModeSensitivity",
+    (0x0000009B, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000009B, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000009B, 0x0000FFFB): "AttributeList",
+    (0x0000009B, 0x0000FFFC): "FeatureMap",
+    (0x0000009B, 0x0000FFFD): "ClusterRevision",
+    (0x0000009C, 0x00000000): "AvailableEndpoints",
+    (0x0000009C, 0x00000001): "ActiveEndpoints",
+    (0x0000009C, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000009C, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000009C, 0x0000FFFB): "AttributeList",
+    (0x0000009C, 0x0000FFFC): "FeatureMap",
+    (0x0000009C, 0x0000FFFD): "ClusterRevision",
+    (0x0000009D, 0x00000000): "SupportedModes",
+    (0x0000009D, 0x00000001): "CurrentMode",
+    (0x0000009D, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000009D, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000009D, 0x0000FFFB): "AttributeList",
+    (0x0000009D, 0x0000FFFC): "FeatureMap",
+    (0x0000009D, 0x0000FFFD): "ClusterRevision",
+    (0x0000009E, 0x00000000): "SupportedModes",
+    (0x0000009E, 0x00000001): "CurrentMode",
+    (0x0000009E, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000009E, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000009E, 0x0000FFFB): "AttributeList",
+    (0x0000009E, 0x0000FFFC): "FeatureMap",
+    (0x0000009E, 0x0000FFFD): "ClusterRevision",
+    (0x0000009F, 0x00000000): "SupportedModes",
+    (0x0000009F, 0x00000001): "CurrentMode",
+    (0x0000009F, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000009F, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000009F, 0x0000FFFB): "AttributeList",
+    (0x0000009F, 0x0000FFFC): "FeatureMap",
+    (0x0000009F, 0x0000FFFD): "ClusterRevision",
+    (0x000000A0, 0x00000000): "LocalGenerationAvailable",
+    (0x000000A0, 0x00000001): "CurrentConditions",
+    (0x000000A0, 0x00000002): "ForecastConditions",
+    (0x000000A0, 0x0000FFF8): "GeneratedCommandList",
+    (0x000000A0, 0x0000FFF9): "AcceptedCommandList",
+    (0x000000A0, 0x0000FFFB): "AttributeList",
+    (0x000000A0, 0x0000FFFC): "FeatureMap",
+    (0x000000A0, 0x0000FFFD): "ClusterRevision",
+    (0x00000101, 0x00000000): "LockState",
+    (0x00000101, 0x00000001): "LockType",
+    (0x00000101, 0x00000002): "ActuatorEnabled",
+    (0x00000101, 0x00000003): "DoorState",
+    (0x00000101, 0x00000004): "DoorOpenEvents",
+    (0x00000101, 0x00000005): "DoorClosedEvents",
+    (0x00000101, 0x00000006): "OpenPeriod",
+    (0x00000101, 0x00000011): "NumberOfTotalUsersSupported",
+    (0x00000101, 0x00000012): "NumberOfPINUsersSupported",
+    (0x00000101, 0x00000013): "NumberOfRFIDUsersSupported",
+    (0x00000101, 0x00000014): "NumberOfWeekDaySchedulesSupportedPerUser",
+    (0x00000101, 0x00000015): "NumberOfYearDaySchedulesSupportedPerUser",
+    (0x00000101, 0x00000016): "NumberOfHolidaySchedulesSupported",
+    (0x00000101, 0x00000017): "MaxPINCodeLength",
+    (0x00000101, 0x00000018): "MinPINCodeLength",
+    (0x00000101, 0x00000019): "MaxRFIDCodeLength",
+    (0x00000101, 0x0000001A): "MinRFIDCodeLength",
+    (0x00000101, 0x0000001B): "CredentialRulesSupport",
+    (0x00000101, 0x0000001C): "NumberOfCredentialsSupportedPerUser",
+    (0x00000101, 0x00000021): "Language",
+    (0x00000101, 0x00000022): "LEDSettings",
+    (0x00000101, 0x00000023): "AutoRelockTime",
+    (0x00000101, 0x00000024): "SoundVolume",
+    (0x00000101, 0x00000025): "OperatingMode",
+    (0x00000101, 0x00000026): "SupportedOperatingModes",
+    (0x00000101, 0x00000027): "DefaultConfigurationRegister",
+    (0x00000101, 0x00000028): "EnableLocalProgramming",
+    (0x00000101, 0x00000029): "EnableOneTouchLocking",
+    (0x00000101, 0x0000002A): "EnableInsideStatusLED",
+    (0x00000101, 0x0000002B): "EnablePrivacyModeButton",
+    (0x00000101, 0x0000002C): "LocalProgrammingFeatures",
+    (0x00000101, 0x00000030): "WrongCodeEntryLimit",
+    (0x00000101, 0x00000031): "UserCodeTemporaryDisableTime",
+    (0x00000101, 0x00000032): "SendPINOverTheAir",
+    (0x00000101, 0x00000033): "RequirePINforRemoteOperation",
+    (0x00000101, 0x00000035): "ExpiringUserTimeout",
+    (0x00000101, 0x00000080): "AliroReaderVerificationKey",
+    (0x00000101, 0x00000081): "AliroReaderGroupIdentifier",
+    (0x00000101, 0x00000082): "AliroReaderGroupSubIdentifier",
+    (0x00000101, 0x00000083): "AliroExpeditedTransactionSupportedProtocolVersions",
+    (0x00000101, 0x00000084): "AliroGroupResolvingKey",
+    (0x00000101, 0x00000085): "AliroSupportedBLEUWBProtocolVersions",
+    (0x00000101, 0x00000086): "AliroBLEAdvertisingVersion",
+    (0x00000101, 0x00000087): "NumberOfAliroCredentialIssuerKeysSupported",
+    (0x00000101, 0x00000088): "NumberOfAliroEndpointKeysSupported",
+    (0x00000101, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000101, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000101, 0x0000FFFB): "AttributeList",
+    (0x00000101, 0x0000FFFC): "FeatureMap",
+    (0x00000101, 0x0000FFFD): "ClusterRevision",
+    (0x00000102, 0x00000000): "Type",
+    (0x00000102, 0x00000001): "PhysicalClosedLimitLift",
+    (0x00000102, 0x00000002): "PhysicalClosedLimitTilt",
+    (0x00000102, 0x00000003): "CurrentPositionLift",
+    (0x00000102, 0x00000004): "CurrentPositionTilt",
+    (0x00000102, 0x00000005): "NumberOfActuationsLift",
+    (0x00000102, 0x00000006): "NumberOfActuationsTilt",
+    (0x00000102, 0x00000007): "ConfigStatus",
+    (0x00000102, 0x00000008): "CurrentPositionLiftPercentage",
+    (0x00000102, 0x00000009): "CurrentPositionTiltPercentage",
+    (0x00000102, 0x0000000A): "OperationalStatus",
+    (0x00000102, 0x0000000B): "TargetPositionLiftPercent100ths",
+    (0x00000102, 0x0000000C): "TargetPositionTiltPercent100ths",
+    (0x00000102, 0x0000000D): "EndProductType",
+    (0x00000102, 0x0000000E): "CurrentPositionLiftPercent100ths",
+    (0x00000102, 0x0000000F): "CurrentPositionTiltPercent100ths",
+    (0x00000102, 0x00000010): "InstalledOpenLimitLift",
+    (0x00000102, 0x00000011): "InstalledClosedLimitLift",
+    (0x00000102, 0x00000012): "InstalledOpenLimitTilt",
+    (0x00000102, 0x00000013): "InstalledClosedLimitTilt",
+    (0x00000102, 0x00000017): "Mode",
+    (0x00000102, 0x0000001A): "SafetyStatus",
+    (0x00000102, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000102, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000102, 0x0000FFFB): "AttributeList",
+    (0x00000102, 0x0000FFFC): "FeatureMap",
+    (0x00000102, 0x0000FFFD): "ClusterRevision",
+    (0x00000104, 0x00000000): "CountdownTime",
+    (0x00000104, 0x00000001): "MainState",
+    (0x00000104, 0x00000002): "CurrentErrorList",
+    (0x00000104, 0x00000003): "OverallState",
+    (0x00000104, 0x00000004): "OverallTarget",
+    (0x00000104, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000104, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000104, 0x0000FFFB): "AttributeList",
+    (0x00000104, 0x0000FFFC): "FeatureMap",
+    (0x00000104, 0x0000FFFD): "ClusterRevision",
+    (0x00000105, 0x00000000): "CurrentState",
+    (0x00000105, 0x00000001): "Target",
+    (0x00000105, 0x00000002): "Resolution",
+    (0x00000105, 0x00000003): "StepValue",
+    (0x00000105, 0x00000004): "Unit",
+    (0x00000105, 0x00000005): "UnitRange",
+    (0x00000105, 0x00000006): "LimitRange",
+    (0x00000105, 0x00000007): "TranslationDirection",
+    (0x00000105, 0x00000008): "RotationAxis",
+    (0x00000105, 0x00000009): "Overflow",
+    (0x00000105, 0x0000000A): "ModulationType",
+    (0x00000105, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000105, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000105, 0x0000FFFB): "AttributeList",
+    (0x00000105, 0x0000FFFC): "FeatureMap",
+    (0x00000105, 0x0000FFFD): "ClusterRevision",
+    (0x00000150, 0x00000000): "SupportedAreas",
+    (0x00000150, 0x00000001): "SupportedMaps",
+    (0x00000150, 0x00000002): "SelectedAreas",
+    (0x00000150, 0x00000003): "CurrentArea",
+    (0x00000150, 0x00000004): "EstimatedEndTime",
+    (0x00000150, 0x00000005): "Progress",
+    (0x00000150, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000150, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000150, 0x0000FFFB): "AttributeList",
+    (0x00000150, 0x0000FFFC): "FeatureMap",
+    (0x00000150, 0x0000FFFD): "ClusterRevision",
+    (0x00000200, 0x00000000): "MaxPressure",
+    (0x00000200, 0x00000001): "MaxSpeed",
+    (0x00000200, 0x00000002): "MaxFlow",
+    (0x00000200, 0x00000003): "MinConstPressure",
+    (0x00000200, 0x00000004): "MaxConstPressure",
+    (0x00000200, 0x00000005): "MinCompPressure",
+    (0x00000200, 0x00000006): "MaxCompPressure",
+    (0x00000200, 0x00000007): "MinConstSpeed",
+    (0x00000200, 0x00000008): "MaxConstSpeed",
+    (0x00000200, 0x00000009): "MinConstFlow",
+    (0x00000200, 0x0000000A): "MaxConstFlow",
+    (0x00000200, 0x0000000B): "MinConstTemp",
+    (0x00000200, 0x0000000C): "MaxConstTemp",
+    (0x00000200, 0x00000010): "PumpStatus",
+    (0x00000200, 0x00000011): "EffectiveOperationMode",
+    (0x00000200, 0x00000012): "EffectiveControlMode",
+    (0x00000200, 0x00000013): "Capacity",
+    (0x00000200, 0x00000014): "Speed",
+    (0x00000200, 0x00000015): "LifetimeRunningHours",
+    (0x00000200, 0x00000016): "Power",
+    (0x00000200, 0x00000017): "LifetimeEnergyConsumed",
+    (0x00000200, 0x00000020): "OperationMode",
+    (0x00000200, 0x00000021): "ControlMode",
+    (0x00000200, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000200, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000200, 0x0000FFFB): "AttributeList",
+    (0x00000200, 0x0000FFFC): "FeatureMap",
+    (0x00000200, 0x0000FFFD): "ClusterRevision",
+    (0x00000201, 0x00000000): "LocalTemperature",
+    (0x00000201, 0x00000001): "OutdoorTemperature",
+    (0x00000201, 0x00000002): "Occupancy",
+    (0x00000201, 0x00000003): "AbsMinHeatSetpointLimit",
+    (0x00000201, 0x00000004): "AbsMaxHeatSetpointLimit",
+    (0x00000201, 0x00000005): "AbsMinCoolSetpointLimit",
+    (0x00000201, 0x00000006): "AbsMaxCoolSetpointLimit",
+    (0x00000201, 0x00000007): "PICoolingDemand",
+    (0x00000201, 0x00000008): "PIHeatingDemand",
+    (0x00000201, 0x00000009): "HVACSystemTypeConfiguration",
+    (0x00000201, 0x00000010): "LocalTemperatureCalibration",
+    (0x00000201, 0x00000011): "OccupiedCoolingSetpoint",
+    (0x00000201, 0x00000012): "OccupiedHeatingSetpoint",
+    (0x00000201, 0x00000013): "UnoccupiedCoolingSetpoint",
+    (0x00000201, 0x00000014): "UnoccupiedHeatingSetpoint",
+    (0x00000201, 0x00000015): "MinHeatSetpointLimit",
+    (0x00000201, 0x00000016): "MaxHeatSetpointLimit",
+    (0x00000201, 0x00000017): "MinCoolSetpointLimit",
+    (0x00000201, 0x00000018): "MaxCoolSetpointLimit",
+    (0x00000201, 0x00000019): "MinSetpointDeadBand",
+    (0x00000201, 0x0000001A): "RemoteSensing",
+    (0x00000201, 0x0000001B): "ControlSequenceOfOperation",
+    (0x00000201, 0x0000001C): "SystemMode",
+    (0x00000201, 0x0000001E): "ThermostatRunningMode",
+    (0x00000201, 0x00000020): "StartOfWeek",
+    (0x00000201, 0x00000021): "NumberOfWeeklyTransitions",
+    (0x00000201, 0x00000022): "NumberOfDailyTransitions",
+    (0x00000201, 0x00000023): "TemperatureSetpointHold",
+    (0x00000201, 0x00000024): "TemperatureSetpointHoldDuration",
+    (0x00000201, 0x00000025): "ThermostatProgrammingOperationMode",
+    (0x00000201, 0x00000029): "ThermostatRunningState",
+    (0x00000201, 0x00000030): "SetpointChangeSource",
+    (0x00000201, 0x00000031): "SetpointChangeAmount",
+    (0x00000201, 0x00000032): "SetpointChangeSourceTimestamp",
+    (0x00000201, 0x00000034): "OccupiedSetback",
+    (0x00000201, 0x00000035): "OccupiedSetbackMin",
+    (0x00000201, 0x00000036): "OccupiedSetbackMax",
+    (0x00000201, 0x00000037): "UnoccupiedSetback",
+    (0x00000201, 0x00000038): "UnoccupiedSetbackMin",
+    (0x00000201, 0x00000039): "UnoccupiedSetbackMax",
+    (0x00000201, 0x0000003A): "EmergencyHeatDelta",
+    (0x00000201, 0x00000040): "ACType",
+    (0x00000201, 0x00000041): "ACCapacity",
+    (0x00000201, 0x00000042): "ACRefrigerantType",
+    (0x00000201, 0x00000043): "ACCompressorType",
+    (0x00000201, 0x00000044): "ACErrorCode",
+    (0x00000201, 0x00000045): "ACLouverPosition",
+    (0x00000201, 0x00000046): "ACCoilTemperature",
+    (0x00000201, 0x00000047): "ACCapacityformat",
+    (0x00000201, 0x00000048): "PresetTypes",
+    (0x00000201, 0x00000049): "ScheduleTypes",
+    (0x00000201, 0x0000004A): "NumberOfPresets",
+    (0x00000201, 0x0000004B): "NumberOfSchedules",
+    (0x00000201, 0x0000004C): "NumberOfScheduleTransitions",
+    (0x00000201, 0x0000004D): "NumberOfScheduleTransitionPerDay",
+    (0x00000201, 0x0000004E): "ActivePresetHandle",
+    (0x00000201, 0x0000004F): "ActiveScheduleHandle",
+    (0x00000201, 0x00000050): "Presets",
+    (0x00000201, 0x00000051): "Schedules",
+    (0x00000201, 0x00000052): "SetpointHoldExpiryTimestamp",
+    (0x00000201, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000201, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000201, 0x0000FFFB): "AttributeList",
+    (0x00000201, 0x0000FFFC): "FeatureMap",
+    (0x00000201, 0x0000FFFD): "ClusterRevision",
+    (0x00000202, 0x00000000): "FanMode",
+    (0x00000202, 0x00000001): "FanModeSequence",
+    (0x00000202, 0x00000002): "PercentSetting",
+    (0x00000202, 0x00000003): "PercentCurrent",
+    (0x00000202, 0x00000004): "SpeedMax",
+    (0x00000202, 0x00000005): "SpeedSetting",
+    (0x00000202, 0x00000006): "SpeedCurrent",
+    (0x00000202, 0x00000007): "RockSupport",
+    (0x00000202, 0x00000008): "RockSetting",
+    (0x00000202, 0x00000009): "WindSupport",
+    (0x00000202, 0x0000000A): "WindSetting",
+    (0x00000202, 0x0000000B): "AirflowDirection",
+    (0x00000202, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000202, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000202, 0x0000FFFB): "AttributeList",
+    (0x00000202, 0x0000FFFC): "FeatureMap",
+    (0x00000202, 0x0000FFFD): "ClusterRevision",
+    (0x00000204, 0x00000000): "TemperatureDisplayMode",
+    (0x00000204, 0x00000001): "KeypadLockout",
+    (0x00000204, 0x00000002): "ScheduleProgrammingVisibility",
+    (0x00000204, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000204, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000204, 0x0000FFFB): "AttributeList",
+    (0x00000204, 0x0000FFFC): "FeatureMap",
+    (0x00000204, 0x0000FFFD): "ClusterRevision",
+    (0x00000300, 0x00000000): "CurrentHue",
+    (0x00000300, 0x00000001): "CurrentSaturation",
+    (0x00000300, 0x00000002): "RemainingTime",
+    (0x00000300, 0x00000003): "CurrentX",
+    (0x00000300, 0x00000004): "CurrentY",
+    (0x00000300, 0x00000005): "DriftCompensation",
+    (0x00000300, 0x00000006): "CompensationText",
+    (0x00000300, 0x00000007): "ColorTemperatureMireds",
+    (0x00000300, 0x00000008): "ColorMode",
+    (0x00000300, 0x0000000F): "Options",
+    (0x00000300, 0x00000010): "NumberOfPrimaries",
+    (0x00000300, 0x00000011): "Primary1X",
+    (0x00000300, 0x00000012): "Primary1Y",
+    (0x00000300, 0x00000013): "Primary1Intensity",
+    (0x00000300, 0x00000015): "Primary2X",
+    (0x00000300, 0x00000016): "Primary2Y",
+    (0x00000300, 0x00000017): "Primary2Intensity",
+    (0x00000300, 0x00000019): "Primary3X",
+    (0x00000300, 0x0000001A): "Primary3Y",
+    (0x00000300, 0x0000001B): "Primary3Intensity",
+    (0x00000300, 0x00000020): "Primary4X",
+    (0x00000300, 0x00000021): "Primary4Y",
+    (0x00000300, 0x00000022): "Primary4Intensity",
+    (0x00000300, 0x00000024): "Primary5X",
+    (0x00000300, 0x00000025): "Primary5Y",
+    (0x00000300, 0x00000026): "Primary5Intensity",
+    (0x00000300, 0x00000028): "Primary6X",
+    (0x00000300, 0x00000029): "Primary6Y",
+    (0x00000300, 0x0000002A): "Primary6Intensity",
+    (0x00000300, 0x00000030): "WhitePointX",
+    (0x00000300, 0x00000031): "WhitePointY",
+    (0x00000300, 0x00000032): "ColorPointRX",
+    (0x00000300, 0x00000033): "ColorPointRY",
+    (0x00000300, 0x00000034): "ColorPointRIntensity",
+    (0x00000300, 0x00000036): "ColorPointGX",
+    (0x00000300, 0x00000037): "ColorPointGY",
+    (0x00000300, 0x00000038): "ColorPointGIntensity",
+    (0x00000300, 0x0000003A): "ColorPointBX",
+    (0x00000300, 0x0000003B): "ColorPointBY",
+    (0x00000300, 0x0000003C): "ColorPointBIntensity",
+    (0x00000300, 0x00004000): "EnhancedCurrentHue",
+    (0x00000300, 0x00004001): "EnhancedColorMode",
+    (0x00000300, 0x00004002): "ColorLoopActive",
+    (0x00000300, 0x00004003): "ColorLoopDirection",
+    (0x00000300, 0x00004004): "ColorLoopTime",
+    (0x00000300, 0x00004005): "ColorLoopStartEnhancedHue",
+    (0x00000300, 0x00004006): "ColorLoopStoredEnhancedHue",
+    (0x00000300, 0x0000400A): "ColorCapabilities",
+    (0x00000300, 0x0000400B): "ColorTempPhysicalMinMireds",
+    (0x00000300, 0x0000400C): "ColorTempPhysicalMaxMireds",
+    (0x00000300, 0x0000400D): "CoupleColorTempToLevelMinMireds",
+    (0x00000300, 0x00004010): "StartUpColorTemperatureMireds",
+    (0x00000300, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000300, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000300, 0x0000FFFB): "AttributeList",
+    (0x00000300, 0x0000FFFC): "FeatureMap",
+    (0x00000300, 0x0000FFFD): "ClusterRevision",
+    (0x00000301, 0x00000000): "PhysicalMinLevel",
+    (0x00000301, 0x00000001): "PhysicalMaxLevel",
+    (0x00000301, 0x00000002): "BallastStatus",
+    (0x00000301, 0x00000010): "MinLevel",
+    (0x00000301, 0x00000011): "MaxLevel",
+    (0x00000301, 0x00000014): "IntrinsicBallastFactor",
+    (0x00000301, 0x00000015): "BallastFactorAdjustment",
+    (0x00000301, 0x00000020): "LampQuantity",
+    (0x00000301, 0x00000030): "LampType",
+    (0x00000301, 0x00000031): "LampManufacturer",
+    (0x00000301, 0x00000032): "LampRatedHours",
+    (0x00000301, 0x00000033): "LampBurnHours",
+    (0x00000301, 0x00000034): "LampAlarmMode",
+    (0x00000301, 0x00000035): "LampBurnHoursTripPoint",
+    (0x00000301, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000301, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000301, 0x0000FFFB): "AttributeList",
+    (0x00000301, 0x0000FFFC): "FeatureMap",
+    (0x00000301, 0x0000FFFD): "ClusterRevision",
+    (0x00000400, 0x00000000): "MeasuredValue",
+    (0x00000400, 0x00000001): "MinMeasuredValue",
+    (0x00000400, 0x00000002): "MaxMeasuredValue",
+    (0x00000400, 0x00000003): "Tolerance",
+    (0x00000400, 0x00000004): "LightSensorType",
+    (0x00000400, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000400, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000400, 0x0000FFFB): "AttributeList",
+    (0x00000400, 0x0000FFFC): "FeatureMap",
+    (0x00000400, 0x0000FFFD): "ClusterRevision",
+    (0x00000402, 0x00000000): "MeasuredValue",
+    (0x00000402, 0x00000001): "MinMeasuredValue",
+    (0x00000402, 0x00000002): "MaxMeasuredValue",
+    (0x00000402, 0x00000003): "Tolerance",
+    (0x00000402, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000402, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000402, 0x0000FFFB): "AttributeList",
+    (0x00000402, 0x0000FFFC): "FeatureMap",
+    (0x00000402, 0x0000FFFD): "ClusterRevision",
+    (0x00000403, 0x00000000): "MeasuredValue",
+    (0x00000403, 0x00000001): "MinMeasuredValue",
+    (0x00000403, 0x00000002): "MaxMeasuredValue",
+    (0x00000403, 0x00000003): "Tolerance",
+    (0x00000403, 0x00000010): "ScaledValue",
+    (0x00000403, 0x00000011): "MinScaledValue",
+    (0x00000403, 0x00000012): "MaxScaledValue",
+    (0x00000403, 0x00000013): "ScaledTolerance",
+    (0x00000403, 0x00000014): "Scale",
+    (0x00000403, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000403, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000403, 0x0000FFFB): "AttributeList",
+    (0x00000403, 0x0000FFFC): "FeatureMap",
+    (0x00000403, 0x0000FFFD): "ClusterRevision",
+    (0x00000404, 0x00000000): "MeasuredValue",
+    (0x00000404, 0x00000001): "MinMeasuredValue",
+    (0x00000404, 0x00000002): "MaxMeasuredValue",
+    (0x00000404, 0x00000003): "Tolerance",
+    (0x00000404, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000404, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000404, 0x0000FFFB): "AttributeList",
+    (0x00000404, 0x0000FFFC): "FeatureMap",
+    (0x00000404, 0x0000FFFD): "ClusterRevision",
+    (0x00000405, 0x00000000): "MeasuredValue",
+    (0x00000405, 0x00000001): "MinMeasuredValue",
+    (0x00000405, 0x00000002): "MaxMeasuredValue",
+    (0x00000405, 0x00000003): "Tolerance",
+    (0x00000405, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000405, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000405, 0x0000FFFB): "AttributeList",
+    (0x00000405, 0x0000FFFC): "FeatureMap",
+    (0x00000405, 0x0000FFFD): "ClusterRevision",
+    (0x00000406, 0x00000000): "Occupancy",
+    (0x00000406, 0x00000001): "OccupancySensorType",
+    (0x00000406, 0x00000002): "OccupancySensorTypeBitmap",
+    (0x00000406, 0x00000003): "HoldTime",
+    (0x00000406, 0x00000004): "HoldTimeLimits",
+    (0x00000406, 0x00000010): "PIROccupiedToUnoccupiedDelay",
+    (0x00000406, 0x00000011): "PIRUnoccupiedToOccupiedDelay",
+    (0x00000406, 0x00000012): "PIRUnoccupiedToOccupiedThreshold",
+    (0x00000406, 0x00000020): "UltrasonicOccupiedToUnoccupiedDelay",
+    (0x00000406, 0x00000021): "UltrasonicUnoccupiedToOccupiedDelay",
+    (0x00000406, 0x00000022): "UltrasonicUnoccupiedToOccupiedThreshold",
+    (0x00000406, 0x00000030): "PhysicalContactOccupiedToUnoccupiedDelay",
+    (0x00000406, 0x00000031): "PhysicalContactUnoccupiedToOccupiedDelay",
+    (0x00000406, 0x00000032): "PhysicalContactUnoccupiedToOccupiedThreshold",
+    (0x00000406, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000406, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000406, 0x0000FFFB): "AttributeList",
+    (0x00000406, 0x0000FFFC): "FeatureMap",
+    (0x00000406, 0x0000FFFD): "ClusterRevision",
+    (0x0000040C, 0x00000000): "MeasuredValue",
+    (0x0000040C, 0x00000001): "MinMeasuredValue",
+    (0x0000040C, 0x00000002): "MaxMeasuredValue",
+    (0x0000040C, 0x00000003): "PeakMeasuredValue",
+    (0x0000040C, 0x00000004): "PeakMeasuredValueWindow",
+    (0x0000040C, 0x00000005): "AverageMeasuredValue",
+    (0x0000040C, 0x00000006): "AverageMeasuredValueWindow",
+    (0x0000040C, 0x00000007): "Uncertainty",
+    (0x0000040C, 0x00000008): "MeasurementUnit",
+    (0x0000040C, 0x00000009): "MeasurementMedium",
+    (0x0000040C, 0x0000000A): "LevelValue",
+    (0x0000040C, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000040C, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000040C, 0x0000FFFB): "AttributeList",
+    (0x0000040C, 0x0000FFFC): "FeatureMap",
+    (0x0000040C, 0x0000FFFD): "ClusterRevision",
+    (0x0000040D, 0x00000000): "MeasuredValue",
+    (0x0000040D, 0x00000001): "MinMeasuredValue",
+    (0x0000040D, 0x00000002): "MaxMeasuredValue",
+    (0x0000040D, 0x00000003): "PeakMeasuredValue",
+    (0x0000040D, 0x00000004): "PeakMeasuredValueWindow",
+    (0x0000040D, 0x00000005): "AverageMeasuredValue",
+    (0x0000040D, 0x00000006): "AverageMeasuredValueWindow",
+    (0x0000040D, 0x00000007): "Uncertainty",
+    (0x0000040D, 0x00000008): "MeasurementUnit",
+    (0x0000040D, 0x00000009): "MeasurementMedium",
+    (0x0000040D, 0x0000000A): "LevelValue",
+    (0x0000040D, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000040D, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000040D, 0x0000FFFB): "AttributeList",
+    (0x0000040D, 0x0000FFFC): "FeatureMap",
+    (0x0000040D, 0x0000FFFD): "ClusterRevision",
+    (0x00000413, 0x00000000): "MeasuredValue",
+    (0x00000413, 0x00000001): "MinMeasuredValue",
+    (0x00000413, 0x00000002): "MaxMeasuredValue",
+    (0x00000413, 0x00000003): "PeakMeasuredValue",
+    (0x00000413, 0x00000004): "PeakMeasuredValueWindow",
+    (0x00000413, 0x00000005): "AverageMeasuredValue",
+    (0x00000413, 0x00000006): "AverageMeasuredValueWindow",
+    (0x00000413, 0x00000007): "Uncertainty",
+    (0x00000413, 0x00000008): "MeasurementUnit",
+    (0x00000413, 0x00000009): "MeasurementMedium",
+    (0x00000413, 0x0000000A): "LevelValue",
+    (0x00000413, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000413, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000413, 0x0000FFFB): "AttributeList",
+    (0x00000413, 0x0000FFFC): "FeatureMap",
+    (0x00000413, 0x0000FFFD): "ClusterRevision",
+    (0x00000415, 0x00000000): "MeasuredValue",
+    (0x00000415, 0x00000001): "MinMeasuredValue",
+    (0x00000415, 0x00000002): "MaxMeasuredValue",
+    (0x00000415, 0x00000003): "PeakMeasuredValue",
+    (0x00000415, 0x00000004): "PeakMeasuredValueWindow",
+    (0x00000415, 0x00000005): "AverageMeasuredValue",
+    (0x00000415, 0x00000006): "AverageMeasuredValueWindow",
+    (0x00000415, 0x00000007): "Uncertainty",
+    (0x00000415, 0x00000008): "MeasurementUnit",
+    (0x00000415, 0x00000009): "MeasurementMedium",
+    (0x00000415, 0x0000000A): "LevelValue",
+    (0x00000415, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000415, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000415, 0x0000FFFB): "AttributeList",
+    (0x00000415, 0x0000FFFC): "FeatureMap",
+    (0x00000415, 0x0000FFFD): "ClusterRevision",
+    (0x0000042A, 0x00000000): "MeasuredValue",
+    (0x0000042A, 0x00000001): "MinMeasuredValue",
+    (0x0000042A, 0x00000002): "MaxMeasuredValue",
+    (0x0000042A, 0x00000003): "PeakMeasuredValue",
+    (0x0000042A, 0x00000004): "PeakMeasuredValueWindow",
+    (0x0000042A, 0x00000005): "AverageMeasuredValue",
+    (0x0000042A, 0x00000006): "AverageMeasuredValueWindow",
+    (0x0000042A, 0x00000007): "Uncertainty",
+    (0x0000042A, 0x00000008): "MeasurementUnit",
+    (0x0000042A, 0x00000009): "MeasurementMedium",
+    (0x0000042A, 0x0000000A): "LevelValue",
+    (0x0000042A, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000042A, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000042A, 0x0000FFFB): "AttributeList",
+    (0x0000042A, 0x0000FFFC): "FeatureMap",
+    (0x0000042A, 0x0000FFFD): "ClusterRevision",
+    (0x0000042B, 0x00000000): "MeasuredValue",
+    (0x0000042B, 0x00000001): "MinMeasuredValue",
+    (0x0000042B, 0x00000002): "MaxMeasuredValue",
+    (0x0000042B, 0x00000003): "PeakMeasuredValue",
+    (0x0000042B, 0x00000004): "PeakMeasuredValueWindow",
+    (0x0000042B, 0x00000005): "AverageMeasuredValue",
+    (0x0000042B, 0x00000006): "AverageMeasuredValueWindow",
+    (0x0000042B, 0x00000007): "Uncertainty",
+    (0x0000042B, 0x00000008): "MeasurementUnit",
+    (0x0000042B, 0x00000009): "MeasurementMedium",
+    (0x0000042B, 0x0000000A): "LevelValue",
+    (0x0000042B, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000042B, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000042B, 0x0000FFFB): "AttributeList",
+    (0x0000042B, 0x0000FFFC): "FeatureMap",
+    (0x0000042B, 0x0000FFFD): "ClusterRevision",
+    (0x0000042C, 0x00000000): "MeasuredValue",
+    (0x0000042C, 0x00000001): "MinMeasuredValue",
+    (0x0000042C, 0x00000002): "MaxMeasuredValue",
+    (0x0000042C, 0x00000003): "PeakMeasuredValue",
+    (0x0000042C, 0x00000004): "PeakMeasuredValueWindow",
+    (0x0000042C, 0x00000005): "AverageMeasuredValue",
+    (0x0000042C, 0x00000006): "AverageMeasuredValueWindow",
+    (0x0000042C, 0x00000007): "Uncertainty",
+    (0x0000042C, 0x00000008): "MeasurementUnit",
+    (0x0000042C, 0x00000009): "MeasurementMedium",
+    (0x0000042C, 0x0000000A): "LevelValue",
+    (0x0000042C, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000042C, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000042C, 0x0000FFFB): "AttributeList",
+    (0x0000042C, 0x0000FFFC): "FeatureMap",
+    (0x0000042C, 0x0000FFFD): "ClusterRevision",
+    (0x0000042D, 0x00000000): "MeasuredValue",
+    (0x0000042D, 0x00000001): "MinMeasuredValue",
+    (0x0000042D, 0x00000002): "MaxMeasuredValue",
+    (0x0000042D, 0x00000003): "PeakMeasuredValue",
+    (0x0000042D, 0x00000004): "PeakMeasuredValueWindow",
+    (0x0000042D, 0x00000005): "AverageMeasuredValue",
+    (0x0000042D, 0x00000006): "AverageMeasuredValueWindow",
+    (0x0000042D, 0x00000007): "Uncertainty",
+    (0x0000042D, 0x00000008): "MeasurementUnit",
+    (0x0000042D, 0x00000009): "MeasurementMedium",
+    (0x0000042D, 0x0000000A): "LevelValue",
+    (0x0000042D, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000042D, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000042D, 0x0000FFFB): "AttributeList",
+    (0x0000042D, 0x0000FFFC): "FeatureMap",
+    (0x0000042D, 0x0000FFFD): "ClusterRevision",
+    (0x0000042E, 0x00000000): "MeasuredValue",
+    (0x0000042E, 0x00000001): "MinMeasuredValue",
+    (0x0000042E, 0x00000002): "MaxMeasuredValue",
+    (0x0000042E, 0x00000003): "PeakMeasuredValue",
+    (0x0000042E, 0x00000004): "PeakMeasuredValueWindow",
+    (0x0000042E, 0x00000005): "AverageMeasuredValue",
+    (0x0000042E, 0x00000006): "AverageMeasuredValueWindow",
+    (0x0000042E, 0x00000007): "Uncertainty",
+    (0x0000042E, 0x00000008): "MeasurementUnit",
+    (0x0000042E, 0x00000009): "MeasurementMedium",
+    (0x0000042E, 0x0000000A): "LevelValue",
+    (0x0000042E, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000042E, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000042E, 0x0000FFFB): "AttributeList",
+    (0x0000042E, 0x0000FFFC): "FeatureMap",
+    (0x0000042E, 0x0000FFFD): "ClusterRevision",
+    (0x0000042F, 0x00000000): "MeasuredValue",
+    (0x0000042F, 0x00000001): "MinMeasuredValue",
+    (0x0000042F, 0x00000002): "MaxMeasuredValue",
+    (0x0000042F, 0x00000003): "PeakMeasuredValue",
+    (0x0000042F, 0x00000004): "PeakMeasuredValueWindow",
+    (0x0000042F, 0x00000005): "AverageMeasuredValue",
+    (0x0000042F, 0x00000006): "AverageMeasuredValueWindow",
+    (0x0000042F, 0x00000007): "Uncertainty",
+    (0x0000042F, 0x00000008): "MeasurementUnit",
+    (0x0000042F, 0x00000009): "MeasurementMedium",
+    (0x0000042F, 0x0000000A): "LevelValue",
+    (0x0000042F, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000042F, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000042F, 0x0000FFFB): "AttributeList",
+    (0x0000042F, 0x0000FFFC): "FeatureMap",
+    (0x0000042F, 0x0000FFFD): "ClusterRevision",
+    (0x00000430, 0x00000000): "SoilMoistureMeasurementLimits",
+    (0x00000430, 0x00000001): "SoilMoistureMeasuredValue",
+    (0x00000430, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000430, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000430, 0x0000FFFB): "AttributeList",
+    (0x00000430, 0x0000FFFC): "FeatureMap",
+    (0x00000430, 0x0000FFFD): "ClusterRevision",
+    (0x00000451, 0x00000000): "Ssid",
+    (0x00000451, 0x00000001): "PassphraseSurrogate",
+    (0x00000451, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000451, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000451, 0x0000FFFB): "AttributeList",
+    (0x00000451, 0x0000FFFC): "FeatureMap",
+    (0x00000451, 0x0000FFFD): "ClusterRevision",
+    (0x00000452, 0x00000000): "BorderRouterName",
+    (0x00000452, 0x00000001): "BorderAgentID",
+    (0x00000452, 0x00000002): "ThreadVersion",
+    (0x00000452, 0x00000003): "InterfaceEnabled",
+    (0x00000452, 0x00000004): "ActiveDatasetTimestamp",
+    (0x00000452, 0x00000005): "PendingDatasetTimestamp",
+    (0x00000452, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000452, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000452, 0x0000FFFB): "AttributeList",
+    (0x00000452, 0x0000FFFC): "FeatureMap",
+    (0x00000452, 0x0000FFFD): "ClusterRevision",
+    (0x00000453, 0x00000000): "PreferredExtendedPanID",
+    (0x00000453, 0x00000001): "ThreadNetworks",
+    (0x00000453, 0x00000002): "ThreadNetworkTableSize",
+    (0x00000453, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000453, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000453, 0x0000FFFB): "AttributeList",
+    (0x00000453, 0x0000FFFC): "FeatureMap",
+    (0x00000453, 0x0000FFFD): "ClusterRevision",
+    (0x00000503, 0x00000000): "MACAddress",
+    (0x00000503, 0x00000001): "LinkLocalAddress",
+    (0x00000503, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000503, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000503, 0x0000FFFB): "AttributeList",
+    (0x00000503, 0x0000FFFC): "FeatureMap",
+    (0x00000503, 0x0000FFFD): "ClusterRevision",
+    (0x00000504, 0x00000000): "ChannelList",
+    (0x00000504, 0x00000001): "Lineup",
+    (0x00000504, 0x00000002): "CurrentChannel",
+    (0x00000504, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000504, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000504, 0x0000FFFB): "AttributeList",
+    (0x00000504, 0x0000FFFC): "FeatureMap",
+    (0x00000504, 0x0000FFFD): "ClusterRevision",
+    (0x00000505, 0x00000000): "TargetList",
+    (0x00000505, 0x00000001): "CurrentTarget",
+    (0x00000505, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000505, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000505, 0x0000FFFB): "AttributeList",
+    (0x00000505, 0x0000FFFC): "FeatureMap",
+    (0x00000505, 0x0000FFFD): "ClusterRevision",
+    (0x00000506, 0x00000000): "CurrentState",
+    (0x00000506, 0x00000001): "StartTime",
+    (0x00000506, 0x00000002): "Duration",
+    (0x00000506, 0x00000003): "SampledPosition",
+    (0x00000506, 0x00000004): "PlaybackSpeed",
+    (0x00000506, 0x00000005): "SeekRangeEnd",
+    (0x00000506, 0x00000006): "SeekRangeStart",
+    (0x00000506, 0x00000007): "ActiveAudioTrack",
+    (0x00000506, 0x00000008): "AvailableAudioTracks",
+    (0x00000506, 0x00000009): "ActiveTextTrack",
+    (0x00000506, 0x0000000A): "AvailableTextTracks",
+    (0x00000506, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000506, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000506, 0x0000FFFB): "AttributeList",
+    (0x00000506, 0x0000FFFC): "FeatureMap",
+    (0x00000506, 0x0000FFFD): "ClusterRevision",
+    (0x00000507, 0x00000000): "InputList",
+    (0x00000507, 0x00000001): "CurrentInput",
+    (0x00000507, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000507, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000507, 0x0000FFFB): "AttributeList",
+    (0x00000507, 0x0000FFFC): "FeatureMap",
+    (0x00000507, 0x0000FFFD): "ClusterRevision",
+    (0x00000508, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000508, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000508, 0x0000FFFB): "AttributeList",
+    (0x00000508, 0x0000FFFC): "FeatureMap",
+    (0x00000508, 0x0000FFFD): "ClusterRevision",
+    (0x00000509, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000509, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000509, 0x0000FFFB): "AttributeList",
+    (0x00000509, 0x0000FFFC): "FeatureMap",
+    (0x00000509, 0x0000FFFD): "ClusterRevision",
+    (0x0000050A, 0x00000000): "AcceptHeader",
+    (0x0000050A, 0x00000001): "SupportedStreamingProtocols",
+    (0x0000050A, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000050A, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000050A, 0x0000FFFB): "AttributeList",
+    (0x0000050A, 0x0000FFFC): "FeatureMap",
+    (0x0000050A, 0x0000FFFD): "ClusterRevision",
+    (0x0000050B, 0x00000000): "OutputList",
+    (0x0000050B, 0x00000001): "CurrentOutput",
+    (0x0000050B, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000050B, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000050B, 0x0000FFFB): "AttributeList",
+    (0x0000050B, 0x0000FFFC): "FeatureMap",
+    (0x0000050B, 0x0000FFFD): "ClusterRevision",
+    (0x0000050C, 0x00000000): "CatalogList",
+    (0x0000050C, 0x00000001): "CurrentApp",
+    (0x0000050C, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000050C, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000050C, 0x0000FFFB): "AttributeList",
+    (0x0000050C, 0x0000FFFC): "FeatureMap",
+    (0x0000050C, 0x0000FFFD): "ClusterRevision",
+    (0x0000050D, 0x00000000): "VendorName",
+    (0x0000050D, 0x00000001): "VendorID",
+    (0x0000050D, 0x00000002): "ApplicationName",
+    (0x0000050D, 0x00000003): "ProductID",
+    (0x0000050D, 0x00000004): "Application",
+    (0x0000050D, 0x00000005): "Status",
+    (0x0000050D, 0x00000006): "ApplicationVersion",
+    (0x0000050D, 0x00000007): "AllowedVendorList",
+    (0x0000050D, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000050D, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000050D, 0x0000FFFB): "AttributeList",
+    (0x0000050D, 0x0000FFFC): "FeatureMap",
+    (0x0000050D, 0x0000FFFD): "ClusterRevision",
+    (0x0000050E, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000050E, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000050E, 0x0000FFFB): "AttributeList",
+    (0x0000050E, 0x0000FFFC): "FeatureMap",
+    (0x0000050E, 0x0000FFFD): "ClusterRevision",
+    (0x0000050F, 0x00000000): "Enabled",
+    (0x0000050F, 0x00000001): "OnDemandRatings",
+    (0x0000050F, 0x00000002): "OnDemandRatingThreshold",
+    (0x0000050F, 0x00000003): "ScheduledContentRatings",
+    (0x0000050F, 0x00000004): "ScheduledContentRatingThreshold",
+    (0x0000050F, 0x00000005): "ScreenDailyTime",
+    (0x0000050F, 0x00000006): "RemainingScreenTime",
+    (0x0000050F, 0x00000007): "BlockUnrated",
+    (0x0000050F, 0x0000FFF8): "GeneratedCommandList",
+    (0x0000050F, 0x0000FFF9): "AcceptedCommandList",
+    (0x0000050F, 0x0000FFFB): "AttributeList",
+    (0x0000050F, 0x0000FFFC): "FeatureMap",
+    (0x0000050F, 0x0000FFFD): "ClusterRevision",
+    (0x00000510, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000510, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000510, 0x0000FFFB): "AttributeList",
+    (0x00000510, 0x0000FFFC): "FeatureMap",
+    (0x00000510, 0x0000FFFD): "ClusterRevision",
+    (0x00000550, 0x00000000): "SupportedZoneSources",
+    (0x00000550, 0x00000001): "Zones",
+    (0x00000550, 0x00000002): "Triggers",
+    (0x00000550, 0x00000003): "Sensitivity",
+    (0x00000550, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000550, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000550, 0x0000FFFB): "AttributeList",
+    (0x00000550, 0x0000FFFC): "FeatureMap",
+    (0x00000550, 0x0000FFFD): "ClusterRevision",
+    (0x00000551, 0x00000000): "MaxConcurrentEncoders",
+    (0x00000551, 0x00000001): "MaxEncodedPixelRate",
+    (0x00000551, 0x00000002): "VideoSensorParams",
+    (0x00000551, 0x00000003): "NightVisionCapable",
+    (0x00000551, 0x00000004): "MinViewport",
+    (0x00000551, 0x00000005): "RateDistortionTradeOffPoints",
+    (0x00000551, 0x00000006): "MaxContentBufferSize",
+    (0x00000551, 0x00000007): "MicrophoneCapabilities",
+    (0x00000551, 0x00000008): "SpeakerCapabilities",
+    (0x00000551, 0x00000009): "TwoWayTalkSupport",
+    (0x00000551, 0x0000000A): "SnapshotCapabilities",
+    (0x00000551, 0x0000000B): "MaxNetworkBandwidth",
+    (0x00000551, 0x0000000C): "CurrentFrameRate",
+    (0x00000551, 0x0000000D): "HDRModeEnabled",
+    (0x00000551, 0x0000000E): "SupportedStreamUsages",
+    (0x00000551, 0x0000000F): "AllocatedVideoStreams",
+    (0x00000551, 0x00000010): "AllocatedAudioStreams",
+    (0x00000551, 0x00000011): "AllocatedSnapshotStreams",
+    (0x00000551, 0x00000012): "RankedVideoStreamPrioritiesList",
+    (0x00000551, 0x00000013): "SoftRecordingPrivacyModeEnabled",
+    (0x00000551, 0x00000014): "SoftLivestreamPrivacyModeEnabled",
+    (0x00000551, 0x00000015): "HardPrivacyModeOn",
+    (0x00000551, 0x00000016): "NightVision",
+    (0x00000551, 0x00000017): "NightVisionIllum",
+    (0x00000551, 0x00000018): "Viewport",
+    (0x00000551, 0x00000019): "SpeakerMuted",
+    (0x00000551, 0x0000001A): "SpeakerVolumeLevel",
+    (0x00000551, 0x0000001B): "SpeakerMaxLevel",
+    (0x00000551, 0x0000001C): "SpeakerMinLevel",
+    (0x00000551, 0x0000001D): "MicrophoneMuted",
+    (0x00000551, 0x0000001E): "MicrophoneVolumeLevel",
+    (0x00000551, 0x0000001F): "MicrophoneMaxLevel",
+    (0x00000551, 0x00000020): "MicrophoneMinLevel",
+    (0x00000551, 0x00000021): "MicrophoneAGCEnabled",
+    (0x00000551, 0x00000022): "ImageRotation",
+    (0x00000551, 0x00000023): "ImageFlipHorizontal",
+    (0x00000551, 0x00000024): "ImageFlipVertical",
+    (0x00000551, 0x00000025): "LocalVideoRecordingEnabled",
+    (0x00000551, 0x00000026): "LocalSnapshotRecordingEnabled",
+    (0x00000551, 0x00000027): "StatusLightEnabled",
+    (0x00000551, 0x00000028): "StatusLightBrightness",
+    (0x00000551, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000551, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000551, 0x0000FFFB): "AttributeList",
+    (0x00000551, 0x0000FFFC): "FeatureMap",
+    (0x00000551, 0x0000FFFD): "ClusterRevision",
+    (0x00000552, 0x00000000): "MPTZPosition",
+    (0x00000552, 0x00000001): "MaxPresets",
+    (0x00000552, 0x00000002): "MPTZPresets",
+    (0x00000552, 0x00000003): "DPTZRelativeMove",
+    (0x00000552, 0x00000004): "ZoomMax",
+    (0x00000552, 0x00000005): "TiltMin",
+    (0x00000552, 0x00000006): "TiltMax",
+    (0x00000552, 0x00000007): "PanMin",
+    (0x00000552, 0x00000008): "PanMax",
+    (0x00000552, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000552, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000552, 0x0000FFFB): "AttributeList",
+    (0x00000552, 0x0000FFFC): "FeatureMap",
+    (0x00000552, 0x0000FFFD): "ClusterRevision",
+    (0x00000553, 0x00000000): "CurrentSessions",
+    (0x00000553, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000553, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000553, 0x0000FFFB): "AttributeList",
+    (0x00000553, 0x0000FFFC): "FeatureMap",
+    (0x00000553, 0x0000FFFD): "ClusterRevision",
+    (0x00000554, 0x00000000): "CurrentSessions",
+    (0x00000554, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000554, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000554, 0x0000FFFB): "AttributeList",
+    (0x00000554, 0x0000FFFC): "FeatureMap",
+    (0x00000554, 0x0000FFFD): "ClusterRevision",
+    (0x00000555, 0x00000000): "SupportedContainerFormats",
+    (0x00000555, 0x00000001): "SupportedIngestMethods",
+    (0x00000555, 0x00000002): "CurrentConnections",
+    (0x00000555, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000555, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000555, 0x0000FFFB): "AttributeList",
+    (0x00000555, 0x0000FFFC): "FeatureMap",
+    (0x00000555, 0x0000FFFD): "ClusterRevision",
+    (0x00000556, 0x00000000): "InstalledChimeSounds",
+    (0x00000556, 0x00000001): "SelectedChime",
+    (0x00000556, 0x00000002): "Enabled",
+    (0x00000556, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000556, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000556, 0x0000FFFB): "AttributeList",
+    (0x00000556, 0x0000FFFC): "FeatureMap",
+    (0x00000556, 0x0000FFFD): "ClusterRevision",
+    (0x00000700, 0x00000000): "TariffInfo",
+    (0x00000700, 0x00000001): "TariffUnit",
+    (0x00000700, 0x00000002): "StartDate",
+    (0x00000700, 0x00000003): "DayEntries",
+    (0x00000700, 0x00000004): "DayPatterns",
+    (0x00000700, 0x00000005): "CalendarPeriods",
+    (0x00000700, 0x00000006): "IndividualDays",
+    (0x00000700, 0x00000007): "CurrentDay",
+    (0x00000700, 0x00000008): "NextDay",
+    (0x00000700, 0x00000009): "CurrentDayEntry",
+    (0x00000700, 0x0000000A): "CurrentDayEntryDate",
+    (0x00000700, 0x0000000B): "NextDayEntry",
+    (0x00000700, 0x0000000C): "NextDayEntryDate",
+    (0x00000700, 0x0000000D): "TariffComponents",
+    (0x00000700, 0x0000000E): "TariffPeriods",
+    (0x00000700, 0x0000000F): "CurrentTariffComponents",
+    (0x00000700, 0x00000010): "NextTariffComponents",
+    (0x00000700, 0x00000011): "DefaultRandomizationOffset",
+    (0x00000700, 0x00000012): "DefaultRandomizationType",
+    (0x00000700, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000700, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000700, 0x0000FFFB): "AttributeList",
+    (0x00000700, 0x0000FFFC): "FeatureMap",
+    (0x00000700, 0x0000FFFD): "ClusterRevision",
+    (0x00000750, 0x00000000): "DeviceDirectory",
+    (0x00000750, 0x00000001): "LocationDirectory",
+    (0x00000750, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000750, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000750, 0x0000FFFB): "AttributeList",
+    (0x00000750, 0x0000FFFC): "FeatureMap",
+    (0x00000750, 0x0000FFFD): "ClusterRevision",
+    (0x00000751, 0x00000000): "SupportedDeviceCategories",
+    (0x00000751, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000751, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000751, 0x0000FFFB): "AttributeList",
+    (0x00000751, 0x0000FFFC): "FeatureMap",
+    (0x00000751, 0x0000FFFD): "ClusterRevision",
+    (0x00000801, 0x00000000): "MaxRootCertificates",
+    (0x00000801, 0x00000001): "ProvisionedRootCertificates",
+    (0x00000801, 0x00000002): "MaxClientCertificates",
+    (0x00000801, 0x00000003): "ProvisionedClientCertificates",
+    (0x00000801, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000801, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000801, 0x0000FFFB): "AttributeList",
+    (0x00000801, 0x0000FFFC): "FeatureMap",
+    (0x00000801, 0x0000FFFD): "ClusterRevision",
+    (0x00000802, 0x00000000): "MaxProvisioned",
+    (0x00000802, 0x00000001): "ProvisionedEndpoints",
+    (0x00000802, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000802, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000802, 0x0000FFFB): "AttributeList",
+    (0x00000802, 0x0000FFFC): "FeatureMap",
+    (0x00000802, 0x0000FFFD): "ClusterRevision",
+    (0x00000B06, 0x00000000): "MeterType",
+    (0x00000B06, 0x00000001): "PointOfDelivery",
+    (0x00000B06, 0x00000002): "MeterSerialNumber",
+    (0x00000B06, 0x00000003): "ProtocolVersion",
+    (0x00000B06, 0x00000004): "PowerThreshold",
+    (0x00000B06, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000B06, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000B06, 0x0000FFFB): "AttributeList",
+    (0x00000B06, 0x0000FFFC): "FeatureMap",
+    (0x00000B06, 0x0000FFFD): "ClusterRevision",
+    (0x00000B07, 0x00000000): "MeteredQuantity",
+    (0x00000B07, 0x00000001): "MeteredQuantityTimestamp",
+    (0x00000B07, 0x00000002): "MeasurementType",
+    (0x00000B07, 0x0000FFF8): "GeneratedCommandList",
+    (0x00000B07, 0x0000FFF9): "AcceptedCommandList",
+    (0x00000B07, 0x0000FFFB): "AttributeList",
+    (0x00000B07, 0x0000FFFC): "FeatureMap",
+    (0x00000B07, 0x0000FFFD): "ClusterRevision",
+    (0xFFF1FC05, 0x00000000): "Boolean",
+    (0xFFF1FC05, 0x00000001): "Bitmap8",
+    (0xFFF1FC05, 0x00000002): "Bitmap16",
+    (0xFFF1FC05, 0x00000003): "Bitmap32",
+    (0xFFF1FC05, 0x00000004): "Bitmap64",
+    (0xFFF1FC05, 0x00000005): "Int8u",
+    (0xFFF1FC05, 0x00000006): "Int16u",
+    (0xFFF1FC05, 0x00000007): "Int24u",
+    (0xFFF1FC05, 0x00000008): "Int32u",
+    (0xFFF1FC05, 0x00000009): "Int40u",
+    (0xFFF1FC05, 0x0000000A): "Int48u",
+    (0xFFF1FC05, 0x0000000B): "Int56u",
+    (0xFFF1FC05, 0x0000000C): "Int64u",
+    (0xFFF1FC05, 0x0000000D): "Int8s",
+    (0xFFF1FC05, 0x0000000E): "Int16s",
+    (0xFFF1FC05, 0x0000000F): "Int24s",
+    (0xFFF1FC05, 0x00000010): "Int32s",
+    (0xFFF1FC05, 0x00000011): "Int40s",
+    (0xFFF1FC05, 0x00000012): "Int48s",
+    (0xFFF1FC05, 0x00000013): "Int56s",
+    (0xFFF1FC05, 0x00000014): "Int64s",
+    (0xFFF1FC05, 0x00000015): "Enum8",
+    (0xFFF1FC05, 0x00000016): "Enum16",
+    (0xFFF1FC05, 0x00000017): "FloatSingle",
+    (0xFFF1FC05, 0x00000018): "FloatDouble",
+    (0xFFF1FC05, 0x00000019): "OctetString",
+    (0xFFF1FC05, 0x0000001A): "ListInt8u",
+    (0xFFF1FC05, 0x0000001B): "ListOctetString",
+    (0xFFF1FC05, 0x0000001C): "ListStructOctetString",
+    (0xFFF1FC05, 0x0000001D): "LongOctetString",
+    (0xFFF1FC05, 0x0000001E): "CharString",
+    (0xFFF1FC05, 0x0000001F): "LongCharString",
+    (0xFFF1FC05, 0x00000020): "EpochUs",
+    (0xFFF1FC05, 0x00000021): "EpochS",
+    (0xFFF1FC05, 0x00000022): "VendorId",
+    (0xFFF1FC05, 0x00000023): "ListNullablesAndOptionalsStruct",
+    (0xFFF1FC05, 0x00000024): "EnumAttr",
+    (0xFFF1FC05, 0x00000025): "StructAttr",
+    (0xFFF1FC05, 0x00000026): "RangeRestrictedInt8u",
+    (0xFFF1FC05, 0x00000027): "RangeRestrictedInt8s",
+    (0xFFF1FC05, 0x00000028): "RangeRestrictedInt16u",
+    (0xFFF1FC05, 0x00000029): "RangeRestrictedInt16s",
+    (0xFFF1FC05, 0x0000002A): "ListLongOctetString",
+    (0xFFF1FC05, 0x0000002B): "ListFabricScoped",
+    (0xFFF1FC05, 0x00000030): "TimedWriteBoolean",
+    (0xFFF1FC05, 0x00000031): "GeneralErrorBoolean",
+    (0xFFF1FC05, 0x00000032): "ClusterErrorBoolean",
+    (0xFFF1FC05, 0x00000033): "GlobalEnum",
+    (0xFFF1FC05, 0x00000034): "GlobalStruct",
+    (0xFFF1FC05, 0x000000FF): "Unsupported",
+    (0xFFF1FC05, 0x00003000): "ReadFailureCode",
+    (0xFFF1FC05, 0x00003001): "FailureInt32U",
+    (0xFFF1FC05, 0x00004000): "NullableBoolean",
+    (0xFFF1FC05, 0x00004001): "NullableBitmap8",
+    (0xFFF1FC05, 0x00004002): "NullableBitmap16",
+    (0xFFF1FC05, 0x00004003): "NullableBitmap32",
+    (0xFFF1FC05, 0x00004004): "NullableBitmap64",
+    (0xFFF1FC05, 0x00004005): "NullableInt8u",
+    (0xFFF1FC05, 0x00004006): "NullableInt16u",
+    (0xFFF1FC05, 0x00004007): "NullableInt24u",
+    (0xFFF1FC05, 0x00004008): "NullableInt32u",
+    (0xFFF1FC05, 0x00004009): "NullableInt40u",
+    (0xFFF1FC05, 0x0000400A): "NullableInt48u",
+    (0xFFF1FC05, 0x0000400B): "NullableInt56u",
+    (0xFFF1FC05, 0x0000400C): "NullableInt64u",
+    (0xFFF1FC05, 0x0000400D): "NullableInt8s",
+    (0xFFF1FC05, 0x0000400E): "NullableInt16s",
+    (0xFFF1FC05, 0x0000400F): "NullableInt24s",
+    (0xFFF1FC05, 0x00004010): "NullableInt32s",
+    (0xFFF1FC05, 0x00004011): "NullableInt40s",
+    (0xFFF1FC05, 0x00004012): "NullableInt48s",
+    (0xFFF1FC05, 0x00004013): "NullableInt56s",
+    (0xFFF1FC05, 0x00004014): "NullableInt64s",
+    (0xFFF1FC05, 0x00004015): "NullableEnum8",
+    (0xFFF1FC05, 0x00004016): "NullableEnum16",
+    (0xFFF1FC05, 0x00004017): "NullableFloatSingle",
+    (0xFFF1FC05, 0x00004018): "NullableFloatDouble",
+    (0xFFF1FC05, 0x00004019): "NullableOctetString",
+    (0xFFF1FC05, 0x0000401E): "NullableCharString",
+    (0xFFF1FC05, 0x00004024): "NullableEnumAttr",
+    (0xFFF1FC05, 0x00004025): "NullableStruct",
+    (0xFFF1FC05, 0x00004026): "NullableRangeRestrictedInt8u",
+    (0xFFF1FC05, 0x00004027): "NullableRangeRestrictedInt8s",
+    (0xFFF1FC05, 0x00004028): "NullableRangeRestrictedInt16u",
+    (0xFFF1FC05, 0x00004029): "NullableRangeRestrictedInt16s",
+    (0xFFF1FC05, 0x0000402A): "WriteOnlyInt8u",
+    (0xFFF1FC05, 0x00004033): "NullableGlobalEnum",
+    (0xFFF1FC05, 0x00004034): "NullableGlobalStruct",
+    (0xFFF1FC05, 0x0000FFF8): "GeneratedCommandList",
+    (0xFFF1FC05, 0x0000FFF9): "AcceptedCommandList",
+    (0xFFF1FC05, 0x0000FFFB): "AttributeList",
+    (0xFFF1FC05, 0x0000FFFC): "FeatureMap",
+    (0xFFF1FC05, 0x0000FFFD): "ClusterRevision",
+    (0xFFF1FC05, 0xFFF24F01): "MeiInt8u",
+    (0xFFF1FC06, 0x0000FFF8): "GeneratedCommandList",
+    (0xFFF1FC06, 0x0000FFF9): "AcceptedCommandList",
+    (0xFFF1FC06, 0x0000FFFB): "AttributeList",
+    (0xFFF1FC06, 0x0000FFFC): "FeatureMap",
+    (0xFFF1FC06, 0x0000FFFD): "ClusterRevision",
+    (0xFFF1FC20, 0x00000000): "FlipFlop",
+    (0xFFF1FC20, 0x0000FFF8): "GeneratedCommandList",
+    (0xFFF1FC20, 0x0000FFF9): "AcceptedCommandList",
+    (0xFFF1FC20, 0x0000FFFB): "AttributeList",
+    (0xFFF1FC20, 0x0000FFFC): "FeatureMap",
+    (0xFFF1FC20, 0x0000FFFD): "ClusterRevision",
+}
+
+# (cluster id, event id) -> name of the event in the Events class of the cluster object.
+EVENTS: typing.Dict[typing.Tuple[int, int], str] = {
+    (0x0000001F, 0x00000000): "AccessControlEntryChanged",
+    (0x0000001F, 0x00000001): "AccessControlExtensionChanged",
+    (0x0000001F, 0x00000002): "FabricRestrictionReviewUpdate",
+    (0x00000025, 0x00000000): "StateChanged",
+    (0x00000025, 0x00000001): "ActionFailed",
+    (0x00000028, 0x00000000): "StartUp",
+    (0x00000028, 0x00000001): "ShutDown",
+    (0x00000028, 0x00000002): "Leave",
+    (0x00000028, 0x00000003): "ReachableChanged",
+    (0x0000002A, 0x00000000): "StateTransition",
+    (0x0000002A, 0x00000001): "VersionApplied",
+    (0x0000002A, 0x00000002): "DownloadError",
+    (0x0000002F, 0x00000000): "WiredFaultChange",
+    (0x0000002F, 0x00000001): "BatFaultChange",
+    (0x0000002F, 0x00000002): "BatChargeFaultChange",
+    (0x00000033, 0x00000000): "HardwareFaultChange",
+    (0x00000033, 0x00000001): "RadioFaultChange",
+    (0x00000033, 0x00000002): "NetworkFaultChange",
+    (0x00000033, 0x00000003): "BootReason",
+    (0x00000034, 0x00000000): "SoftwareFault",
+    (0x00000035, 0x00000000): "ConnectionStatus",
+    (0x00000035, 0x00000001): "NetworkFaultChange",
+    (0x00000036, 0x00000000): "Disconnection",
+    (0x00000036, 0x00000001): "AssociationFailure",
+    (0x00000036, 0x00000002): "ConnectionStatus",
+    (0x00000038, 0x00000000): "DSTTableEmpty",
+    (0x00000038, 0x00000001): "DSTStatus",
+    (0x00000038, 0x00000002): "TimeZoneStatus",
+    (0x00000038, 0x00000003): "TimeFailure",
+    (0x00000038, 0x00000004): "MissingTrustedTimeSource",
+    (0x00000039, 0x00000000): "StartUp",
+    (0x00000039, 0x00000001): "ShutDown",
+    (0x00000039, 0x00000002): "Leave",
+    (0x00000039, 0x00000003): "ReachableChanged",
+    (0x00000039, 0x00000080): "ActiveChanged",
+    (0x0000003B, 0x00000000): "SwitchLatched",
+    (0x0000003B, 0x00000001): "InitialPress",
+    (0x0000003B, 0x00000002): "LongPress",
+    (0x0000003B, 0x00000003): "ShortRelease",
+    (0x0000003B, 0x00000004): "LongRelease",
+    (0x0000003B, 0x00000005): "MultiPressOngoing",
+    (0x0000003B, 0x00000006): "MultiPressComplete",
+    (0x00000045, 0x00000000): "StateChange",
+    (0x00000048, 0x00000000): "OperationalError",
+    (0x00000048, 0x00000001): "OperationCompletion",
+    (0x00000057, 0x00000000): "Notify",
+    (0x0000005C, 0x00000000): "SmokeAlarm",
+    (0x0000005C, 0x00000001): "COAlarm",
+    (0x0000005C, 0x00000002): "LowBattery",
+    (0x0000005C, 0x00000003): "HardwareFault",
+    (0x0000005C, 0x00000004): "EndOfService",
+    (0x0000005C, 0x00000005): "SelfTestComplete",
+    (0x0000005C, 0x00000006): "AlarmMuted",
+    (0x0000005C, 0x00000007): "MuteEnded",
+    (0x0000005C, 0x00000008): "InterconnectSmokeAlarm",
+    (0x0000005C, 0x00000009): "InterconnectCOAlarm",
+    (0x0000005C, 0x0000000A): "AllClear",
+    (0x0000005D, 0x00000000): "Notify",
+    (0x00000060, 0x00000000): "OperationalError",
+    (0x00000060, 0x00000001): "OperationCompletion",
+    (0x00000061, 0x00000000): "OperationalError",
+    (0x00000061, 0x00000001): "OperationCompletion",
+    (0x00000080, 0x00000000): "AlarmsStateChanged",
+    (0x00000080, 0x00000001): "SensorFault",
+    (0x00000081, 0x00000000): "ValveStateChanged",
+    (0x00000081, 0x00000001): "ValveFault",
+    (0x00000090, 0x00000000): "MeasurementPeriodRanges",
+    (0x00000091, 0x00000000): "CumulativeEnergyMeasured",
+    (0x00000091, 0x00000001): "PeriodicEnergyMeasured",
+    (0x00000094, 0x00000000): "BoostStarted",
+    (0x00000094, 0x00000001): "BoostEnded",
+    (0x00000095, 0x00000000): "PriceChange",
+    (0x00000097, 0x00000000): "MessageQueued",
+    (0x00000097, 0x00000001): "MessagePresented",
+    (0x00000097, 0x00000002): "MessageComplete",
+    (0x00000098, 0x00000000): "PowerAdjustStart",
+    (0x00000098, 0x00000001): "PowerAdjustEnd",
+    (0x00000098, 0x00000002): "Paused",
+    (0x00000098, 0x00000003): "Resumed",
+    (0x00000099, 0x00000000): "EVConnected",
+    (0x00000099, 0x00000001): "EVNotDetected",
+    (0x00000099, 0x00000002): "EnergyTransferStarted",
+    (0x00000099, 0x00000003): "EnergyTransferStopped",
+    (0x00000099, 0x00000004): "Fault",
+    (0x00000099, 0x00000005): "Rfid",
+    (0x000000A0, 0x00000000): "CurrentConditionsChanged",
+    (0x00000101, 0x00000000): "DoorLockAlarm",
+    (0x00000101, 0x00000001): "DoorStateChange",
+    (0x00000101, 0x00000002): "LockOperation",
+    (0x00000101, 0x00000003): "LockOperationError",
+    (0x00000101, 0x00000004): "LockUserChange",
+    (0x00000104, 0x00000000): "OperationalError",
+    (0x00000104, 0x00000001): "MovementCompleted",
+    (0x00000104, 0x00000002): "EngageStateChanged",
+    (0x00000104, 0x00000003): "SecureStateChanged",
+    (0x00000200, 0x00000000): "SupplyVoltageLow",
+    (0x00000200, 0x00000001): "SupplyVoltageHigh",
+    (0x00000200, 0x00000002): "PowerMissingPhase",
+    (0x00000200, 0x00000003): "SystemPressureLow",
+    (0x00000200, 0x00000004): "SystemPressureHigh",
+    (0x00000200, 0x00000005): "DryRunning",
+    (0x00000200, 0x00000006): "MotorTemperatureHigh",
+    (0x00000200, 0x00000007): "PumpMotorFatalFailure",
+    (0x00000200, 0x00000008): "ElectronicTemperatureHigh",
+    (0x00000200, 0x00000009): "PumpBlocked",
+    (0x00000200, 0x0000000A): "SensorFailure",
+    (0x00000200, 0x0000000B): "ElectronicNonFatalFailure",
+    (0x00000200, 0x0000000C): "ElectronicFatalFailure",
+    (0x00000200, 0x0000000D): "GeneralFault",
+    (0x00000200, 0x0000000E): "Leakage",
+    (0x00000200, 0x0000000F): "AirDetection",
+    (0x00000200, 0x00000010): "TurbineOperation",
+    (0x00000406, 0x00000000): "OccupancyChanged",
+    (0x00000505, 0x00000000): "TargetUpdated",
+    (0x00000506, 0x00000000): "StateChanged",
+    (0x0000050E, 0x00000000): "LoggedOut",
+    (0x0000050F, 0x00000000): "RemainingScreenTimeExpired",
+    (0x00000550, 0x00000000): "ZoneTriggered",
+    (0x00000550, 0x00000001): "ZoneStopped",
+    (0x00000555, 0x00000000): "PushTransportBegin",
+    (0x00000555, 0x00000001): "PushTransportEnd",
+    (0x00000751, 0x00000000): "CommissioningRequestResult",
+    (0xFFF1FC05, 0x00000001): "TestEvent",
+    (0xFFF1FC05, 0x00000002): "TestFabricScopedEvent",
+    (0xFFF1FC05, 0xFFF200EE): "TestDifferentVendorMeiEvent",
+    (0xFFF1FC20, 0x00000000): "PingCountEvent",
+}
@@ -0,0 +1,298 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+An opt-in on-disk cache of the attribute data read from nodes.
+
+The cache stores, for each (fabric, node, endpoint, cluster), the cluster data version and the raw TLV data of
+the attributes that were reported. When it is set on a controller (see
+ChipDeviceControllerBase.SetPersistentAttributeCache()), reads and subscriptions request DataVersionFilters for the
+cached clusters, so that nodes only report the clusters that changed since, and the cached data for the other
+clusters is merged into the results. This keeps working across controller restarts.
+
+A cluster is only filtered when the cache holds everything the read asks for: the attributes of concrete attribute
+paths, or the complete cluster for wildcard attribute paths. Clusters for which an error status was reported are
+removed from the cache so that they are read again the next time.
+
+The data of a report is handed to a writer thread at the end of the report, so that the Matter thread does not
+wait for the disk. The writer stores everything handed to it since its last write in a single transaction.
+'''
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..tlv import TLVReader
+from .Attribute import AttributeCache, AttributePath, DataVersionFilter
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS clusters (
+    node TEXT NOT NULL,
+    endpoint INTEGER NOT NULL,
+    cluster INTEGER NOT NULL,
+    data_version INTEGER NOT NULL,
+    complete INTEGER NOT NULL,
+    PRIMARY KEY (node, endpoint, cluster)
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    node TEXT NOT NULL,
+    endpoint INTEGER NOT NULL,
+    cluster INTEGER NOT NULL,
+    attribute INTEGER NOT NULL,
+    tlv BLOB NOT NULL,
+    PRIMARY KEY (node, endpoint, cluster, attribute)
+);
+'''
+
+
+def _NodeKey(fabricId: int, nodeId: int) -> str:
+    # Fabric and node ids are 64-bit unsigned values, which do not fit in SQLite integers.
+    return f'{fabricId:016X}-{nodeId:016X}'
+
+
+def _Matches(path: AttributePath, endpointId: int, clusterId: int) -> bool:
+    return (path.EndpointId is None or path.EndpointId == endpointId) and (path.ClusterId is None or path.ClusterId == clusterId)
+
+
+class _CachedCluster:
+    def __init__(self, dataVersion: int, complete: bool):
+        self.DataVersion = dataVersion
+        self.Complete = complete
+        self.Attributes: Dict[int, bytes] = {}
+
+
+class _PendingCluster:
+    def __init__(self, dataVersion: int):
+        self.DataVersion = dataVersion
+        self.Failed = False
+        self.Attributes: Dict[int, bytes] = {}
+
+
+class PersistentRead:
+    ''' The persistent cache state for a single read or subscribe interaction with a node.
+
+        This is created by PersistentAttributeCache.BeginRead() before the interaction is started. Reported attribute
+        data is recorded from the Matter thread and handed to the writer thread of the cache at the end of every
+        report.
+    '''
+
+    def __init__(self, cache: PersistentAttributeCache, node: str, attributes: List[AttributePath]):
+        self._cache = cache
+        self._node = node
+        self._attributes = attributes
+        self._pending: Dict[Tuple[int, int], _PendingCluster] = {}
+        self._filtered: Dict[Tuple[int, int], _CachedCluster] = {}
+
+        for (endpointId, clusterId), cluster in cache._LoadNode(node).items():
+            paths = [path for path in attributes if _Matches(path, endpointId, clusterId)]
+            if not paths:
+                continue
+            if any(path.AttributeId is None for path in paths):
+                if not cluster.Complete:
+                    continue
+            elif any(path.AttributeId not in cluster.Attributes for path in paths):
+                continue
+            self._filtered[(endpointId, clusterId)] = cluster
+
+    def DataVersionFilters(self) -> List[DataVersionFilter]:
+        ''' Returns the data version filters for the cached clusters that cover the read.
+        '''
+        return [DataVersionFilter(EndpointId=endpointId, ClusterId=clusterId, DataVersion=cluster.DataVersion)
+                for (endpointId, clusterId), cluster in self._filtered.items()]
+
+    def Prime(self, attributeCache: AttributeCache):
+        ''' Fills an AttributeCache with the cached data of the filtered clusters. Data reported by the node for
+            clusters that changed since replaces it as usual.
+        '''
+        for (endpointId, clusterId), cluster in self._filtered.items():
+            for attributeId, data in cluster.Attributes.items():
+                path = AttributePath(EndpointId=endpointId, ClusterId=clusterId, AttributeId=attributeId)
+                if not self._Covers(path):
+                    continue
+                try:
+                    value = TLVReader(data).get().get("Any", {})
+                except Exception as ex:
+                    LOGGER.warning(f"Ignoring cached data that cannot be decoded for {path}: {ex}")
+                    continue
+                attributeCache.UpdateTLV(path, cluster.DataVersion, value)
+
+    def Record(self, path: AttributePath, dataVersion: Optional[int], success: bool, data: bytes):
+        ''' Records attribute data (or an error status) reported by the node.
+        '''
+        key = (path.EndpointId, path.ClusterId)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingCluster(dataVersion)
+        if not success or dataVersion is None:
+            # Without a data version, what is stored could not be told apart from newer data: drop the cluster.
+            pending.Failed = True
+            return
+        pending.DataVersion = dataVersion
+        pending.Attributes[path.AttributeId] = data
+
+    def Commit(self):
+        ''' Hands the data recorded since the last commit to the writer thread of the cache, without waiting for it
+            to be written.
+        '''
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self._cache._Write(self._node, pending, self._Covers, self._CoversCluster)
+
+    def _Covers(self, path: AttributePath) -> bool:
+        return any(_Matches(p, path.EndpointId, path.ClusterId) and p.AttributeId in (None, path.AttributeId)
+                   for p in self._attributes)
+
+    def _CoversCluster(self, endpointId: int, clusterId: int) -> bool:
+        return any(_Matches(p, endpointId, clusterId) and p.AttributeId is None for p in self._attributes)
+
+
+class PersistentAttributeCache:
+    ''' Stores attribute data and cluster data versions in an SQLite database.
+
+        An instance can be shared by several controllers, and used from both the Matter thread and the asyncio event
+        loop; data for different fabrics is kept apart.
+    '''
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.executescript(_SCHEMA)
+
+        # Reports waiting for the writer thread, which is started with the first one.
+        self._writes: List[tuple] = []
+        self._writing = False
+        self._closed = False
+        self._writesCondition = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+
+    def BeginRead(self, fabricId: int, nodeId: int, attributes: List[AttributePath]) -> PersistentRead:
+        ''' Returns the state for a read or subscribe interaction with a node, see PersistentRead.
+
+            fabricId should identify the fabric globally, e.g. be the compressed fabric id.
+        '''
+        self.Flush()
+        return PersistentRead(self, _NodeKey(fabricId, nodeId), attributes)
+
+    def Flush(self):
+        ''' Waits for the reports handed to the writer thread to be written.
+        '''
+        with self._writesCondition:
+            self._writesCondition.wait_for(lambda: not self._writes and not self._writing)
+
+    def Clear(self, fabricId: Optional[int] = None, nodeId: Optional[int] = None):
+        ''' Removes the cached data of a node, or of all nodes if no node is given.
+        '''
+        self.Flush()
+        with self._lock, self._db:
+            if fabricId is None or nodeId is None:
+                self._db.execute('DELETE FROM clusters')
+                self._db.execute('DELETE FROM attributes')
+            else:
+                node = _NodeKey(fabricId, nodeId)
+                self._db.execute('DELETE FROM clusters WHERE node = ?', (node,))
+                self._db.execute('DELETE FROM attributes WHERE node = ?', (node,))
+
+    def Close(self):
+        with self._writesCondition:
+            self._closed = True
+            self._writesCondition.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+        with self._lock:
+            self._db.close()
+
+    def _Write(self, node: str, pending: Dict[Tuple[int, int], _PendingCluster], covers, coversCluster):
+        with self._writesCondition:
+            if self._closed:
+                LOGGER.warning("Dropping attribute data reported after the persistent attribute cache was closed")
+                return
+            self._writes.append((node, pending, covers, coversCluster))
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._WriterThread, name='PersistentAttributeCache', daemon=True)
+                self._writer.start()
+            self._writesCondition.notify_all()
+
+    def _WriterThread(self):
+        while True:
+            with self._writesCondition:
+                self._writesCondition.wait_for(lambda: self._writes or self._closed)
+                if not self._writes:
+                    return
+                writes, self._writes = self._writes, []
+                self._writing = True
+            try:
+                self._Store(writes)
+            except Exception as ex:
+                LOGGER.exception(f"Failed to update the persistent attribute cache: {ex}")
+            finally:
+                with self._writesCondition:
+                    self._writing = False
+                    self._writesCondition.notify_all()
+
+    def _LoadNode(self, node: str) -> Dict[Tuple[int, int], _CachedCluster]:
+        with self._lock:
+            clusters = {(endpointId, clusterId): _CachedCluster(dataVersion, bool(complete))
+                        for endpointId, clusterId, dataVersion, complete in self._db.execute(
+                            'SELECT endpoint, cluster, data_version, complete FROM clusters WHERE node = ?', (node,))}
+            for endpointId, clusterId, attributeId, data in self._db.execute(
+                    'SELECT endpoint, cluster, attribute, tlv FROM attributes WHERE node = ?', (node,)):
+                cluster = clusters.get((endpointId, clusterId))
+                if cluster is not None:
+                    cluster.Attributes[attributeId] = data
+        return clusters
+
+    def _Store(self, writes: List[tuple]):
+        # All the reports written at once are a single transaction, in the order they were received.
+        with self._lock, self._db:
+            for node, pending, covers, coversCluster in writes:
+                self._StoreReport(node, pending, covers, coversCluster)
+
+    def _StoreReport(self, node: str, pending: Dict[Tuple[int, int], _PendingCluster], covers, coversCluster):
+        for (endpointId, clusterId), cluster in pending.items():
+            key = (node, endpointId, clusterId)
+            if cluster.Failed:
+                self._db.execute('DELETE FROM clusters WHERE node = ? AND endpoint = ? AND cluster = ?', key)
+                self._db.execute('DELETE FROM attributes WHERE node = ? AND endpoint = ? AND cluster = ?', key)
+                continue
+
+            complete = coversCluster(endpointId, clusterId)
+            row = self._db.execute('SELECT data_version, complete FROM clusters WHERE node = ? AND endpoint = ? AND cluster = ?',
+                                   key).fetchone()
+            if row is not None and row[0] == cluster.DataVersion:
+                complete = complete or bool(row[1])
+            elif row is not None:
+                # Attributes outside of this interaction's paths may have changed along with the data version.
+                stale: Set[int] = set()
+                for (attributeId,) in self._db.execute(
+                        'SELECT attribute FROM attributes WHERE node = ? AND endpoint = ? AND cluster = ?', key):
+                    if not covers(AttributePath(EndpointId=endpointId, ClusterId=clusterId, AttributeId=attributeId)):
+                        stale.add(attributeId)
+                self._db.executemany('DELETE FROM attributes WHERE node = ? AND endpoint = ? AND cluster = ? AND attribute = ?',
+                                     [key + (attributeId,) for attributeId in stale])
+
+            self._db.execute('INSERT OR REPLACE INTO clusters VALUES (?, ?, ?, ?, ?)',
+                             key + (cluster.DataVersion, int(complete)))
+            self._db.executemany('INSERT OR REPLACE INTO attributes VALUES (?, ?, ?, ?, ?)',
+                                 [key + (attributeId, data) for attributeId, data in cluster.Attributes.items()])
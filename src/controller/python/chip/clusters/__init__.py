@@ -15,5 +15,19 @@
 #    limitations under the License.
 #
 
-from . import Attribute, CHIPClusters, Command, Objects  # noqa: F401
-from .Objects import *  # noqa: F401, F403
+from . import LazyObjects
+
+if LazyObjects.IsEnabled() and LazyObjects.Install():
+    from . import Attribute, CHIPClusters, Command, Objects  # noqa: F401
+
+    # Cluster objects are only defined when they are first accessed, see LazyObjects.
+    def __getattr__(name: str):
+        if name in Objects.__all__:
+            return getattr(Objects, name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(globals()) | set(Objects.__all__))
+else:
+    from . import Attribute, CHIPClusters, Command, Objects  # noqa: F401
+    from .Objects import *  # noqa: F401, F403
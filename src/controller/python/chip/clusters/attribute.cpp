@@ -17,8 +17,10 @@
 
 #include "system/SystemClock.h"
 #include <cstdarg>
+#include <cstring>
 #include <memory>
 #include <type_traits>
+#include <vector>
 
 #include <app/BufferedReadCallback.h>
 #include <app/ChunkedWriteCallback.h>
@@ -68,8 +70,42 @@ struct __attribute__((packed)) DataVersionFilter
     chip::DataVersion dataVersion;
 };
 
-using OnReadAttributeDataCallback       = void (*)(PyObject * appContext, chip::DataVersion version, chip::EndpointId endpointId,
-                                             chip::ClusterId clusterId, chip::AttributeId attributeId,
+// Records of the batched report buffer passed to OnReadReportDataCallback. Each record is one of the headers below,
+// identified by its first byte, immediately followed by dataLen bytes of TLV data.
+enum class ReportRecordType : uint8_t
+{
+    kAttributeData = 0,
+    kEventData     = 1,
+};
+
+struct __attribute__((packed)) AttributeReportRecord
+{
+    uint8_t recordType;
+    chip::EndpointId endpointId;
+    chip::ClusterId clusterId;
+    chip::AttributeId attributeId;
+    chip::DataVersion dataVersion;
+    uint8_t hasDataVersion;
+    uint8_t imStatus;
+    uint32_t dataLen;
+};
+
+struct __attribute__((packed)) EventReportRecord
+{
+    uint8_t recordType;
+    chip::EndpointId endpointId;
+    chip::ClusterId clusterId;
+    chip::EventId eventId;
+    chip::EventNumber eventNumber;
+    uint8_t priority;
+    uint64_t timestamp;
+    uint8_t timestampType;
+    uint8_t imStatus;
+    uint32_t dataLen;
+};
+
+using OnReadAttributeDataCallback       = void (*)(PyObject * appContext, chip::DataVersion version, bool hasDataVersion,
+                                             chip::EndpointId endpointId, chip::ClusterId clusterId, chip::AttributeId attributeId,
                                              std::underlying_type_t<Protocols::InteractionModel::Status> imstatus, uint8_t * data,
                                              size_t dataLen);
 using OnReadEventDataCallback           = void (*)(PyObject * appContext, chip::EndpointId endpointId, chip::ClusterId clusterId,
@@ -83,6 +119,7 @@ using OnReadErrorCallback               = void (*)(PyObject * appContext, PyChip
 using OnReadDoneCallback                = void (*)(PyObject * appContext);
 using OnReportBeginCallback             = void (*)(PyObject * appContext);
 using OnReportEndCallback               = void (*)(PyObject * appContext);
+using OnReadReportDataCallback          = void (*)(PyObject * appContext, const uint8_t * data, size_t dataLen);
 
 OnReadAttributeDataCallback gOnReadAttributeDataCallback             = nullptr;
 OnReadEventDataCallback gOnReadEventDataCallback                     = nullptr;
@@ -92,6 +129,7 @@ OnReadErrorCallback gOnReadErrorCallback                             = nullptr;
 OnReadDoneCallback gOnReadDoneCallback                               = nullptr;
 OnReportBeginCallback gOnReportBeginCallback                         = nullptr;
 OnReportBeginCallback gOnReportEndCallback                           = nullptr;
+OnReadReportDataCallback gOnReadReportDataCallback                   = nullptr;
 
 void PythonResubscribePolicy(uint32_t aNumCumulativeRetries, uint32_t & aNextSubscriptionIntervalMsec, bool & aShouldResubscribe)
 {
@@ -133,14 +171,31 @@ public:
             size = writer.GetLengthWritten();
         }
 
+        // Reports without a DataVersion are passed with hasDataVersion unset, version 0 is a valid DataVersion.
         DataVersion version = 0;
         if (aPath.mDataVersion.HasValue())
         {
             version = aPath.mDataVersion.Value();
         }
 
-        gOnReadAttributeDataCallback(mAppContext, version, aPath.mEndpointId, aPath.mClusterId, aPath.mAttributeId,
-                                     to_underlying(aStatus.mStatus), buffer.get(), size);
+        if (mBatchReports)
+        {
+            AttributeReportRecord record = {
+                to_underlying(ReportRecordType::kAttributeData),
+                aPath.mEndpointId,
+                aPath.mClusterId,
+                aPath.mAttributeId,
+                version,
+                static_cast<uint8_t>(aPath.mDataVersion.HasValue()),
+                to_underlying(aStatus.mStatus),
+                static_cast<uint32_t>(size),
+            };
+            AppendReportRecord(record, buffer.get(), size);
+            return;
+        }
+
+        gOnReadAttributeDataCallback(mAppContext, version, aPath.mDataVersion.HasValue(), aPath.mEndpointId, aPath.mClusterId,
+                                     aPath.mAttributeId, to_underlying(aStatus.mStatus), buffer.get(), size);
     }
 
     void OnSubscriptionEstablished(SubscriptionId aSubscriptionId) override
@@ -197,6 +252,24 @@ public:
             this->OnError(err);
         }
 
+        if (mBatchReports)
+        {
+            EventReportRecord record = {
+                to_underlying(ReportRecordType::kEventData),
+                aEventHeader.mPath.mEndpointId,
+                aEventHeader.mPath.mClusterId,
+                aEventHeader.mPath.mEventId,
+                aEventHeader.mEventNumber,
+                to_underlying(aEventHeader.mPriorityLevel),
+                aEventHeader.mTimestamp.mValue,
+                to_underlying(aEventHeader.mTimestamp.mType),
+                to_underlying(apStatus == nullptr ? Protocols::InteractionModel::Status::Success : apStatus->mStatus),
+                static_cast<uint32_t>(size),
+            };
+            AppendReportRecord(record, buffer, size);
+            return;
+        }
+
         gOnReadEventDataCallback(
             mAppContext, aEventHeader.mPath.mEndpointId, aEventHeader.mPath.mClusterId, aEventHeader.mPath.mEventId,
             aEventHeader.mEventNumber, to_underlying(aEventHeader.mPriorityLevel), aEventHeader.mTimestamp.mValue,
@@ -204,7 +277,11 @@ public:
             to_underlying(apStatus == nullptr ? Protocols::InteractionModel::Status::Success : apStatus->mStatus));
     }
 
-    void OnError(CHIP_ERROR aError) override { gOnReadErrorCallback(mAppContext, ToPyChipError(aError)); }
+    void OnError(CHIP_ERROR aError) override
+    {
+        FlushReportRecords();
+        gOnReadErrorCallback(mAppContext, ToPyChipError(aError));
+    }
 
     void OnReportBegin() override { gOnReportBeginCallback(mAppContext); }
     void OnDeallocatePaths(chip::app::ReadPrepareParams && aReadPrepareParams) override
@@ -225,10 +302,15 @@ public:
         }
     }
 
-    void OnReportEnd() override { gOnReportEndCallback(mAppContext); }
+    void OnReportEnd() override
+    {
+        FlushReportRecords();
+        gOnReportEndCallback(mAppContext);
+    }
 
     void OnDone(ReadClient *) override
     {
+        FlushReportRecords();
         gOnReadDoneCallback(mAppContext);
 
         delete this;
@@ -238,7 +320,31 @@ public:
 
     void SetAutoResubscribe(bool autoResubscribe) { mAutoResubscribe = autoResubscribe; }
 
+    void SetBatchReports(bool batchReports) { mBatchReports = batchReports; }
+
 private:
+    template <typename RecordType>
+    void AppendReportRecord(const RecordType & record, const uint8_t * data, size_t dataLen)
+    {
+        const uint8_t * header = reinterpret_cast<const uint8_t *>(&record);
+        mReportRecords.insert(mReportRecords.end(), header, header + sizeof(record));
+        if (dataLen != 0)
+        {
+            mReportRecords.insert(mReportRecords.end(), data, data + dataLen);
+        }
+    }
+
+    // Delivers the attribute and event data accumulated for the current report to Python in a single callback.
+    void FlushReportRecords()
+    {
+        if (mReportRecords.empty())
+        {
+            return;
+        }
+        gOnReadReportDataCallback(mAppContext, mReportRecords.data(), mReportRecords.size());
+        mReportRecords.clear();
+    }
+
     BufferedReadCallback mBufferedReadCallback;
 
     PyObject * mAppContext;
@@ -246,6 +352,8 @@ private:
     std::unique_ptr<ReadClient> mReadClient;
     bool mAutoResubscribe       = true;
     bool mAutoResubscribeNeeded = false;
+    bool mBatchReports          = false;
+    std::vector<uint8_t> mReportRecords;
 };
 
 extern "C" {
@@ -258,6 +366,7 @@ struct __attribute__((packed)) PyReadAttributeParams
     bool isFabricFiltered;
     bool keepSubscriptions;
     bool autoResubscribe;
+    bool batchReports;
 };
 
 PyChipError pychip_WriteClient_WriteAttributes(void * appContext, DeviceProxy * device, size_t timedWriteTimeoutMsSizeT,
@@ -329,7 +438,8 @@ void pychip_ReadClient_InitCallbacks(OnReadAttributeDataCallback onReadAttribute
                                      OnSubscriptionEstablishedCallback onSubscriptionEstablishedCallback,
                                      OnResubscriptionAttemptedCallback onResubscriptionAttemptedCallback,
                                      OnReadErrorCallback onReadErrorCallback, OnReadDoneCallback onReadDoneCallback,
-                                     OnReportBeginCallback onReportBeginCallback, OnReportEndCallback onReportEndCallback)
+                                     OnReportBeginCallback onReportBeginCallback, OnReportEndCallback onReportEndCallback,
+                                     OnReadReportDataCallback onReadReportDataCallback)
 {
     gOnReadAttributeDataCallback       = onReadAttributeDataCallback;
     gOnReadEventDataCallback           = onReadEventDataCallback;
@@ -339,6 +449,7 @@ void pychip_ReadClient_InitCallbacks(OnReadAttributeDataCallback onReadAttribute
     gOnReadDoneCallback                = onReadDoneCallback;
     gOnReportBeginCallback             = onReportBeginCallback;
     gOnReportEndCallback               = onReportEndCallback;
+    gOnReadReportDataCallback          = onReadReportDataCallback;
 }
 
 PyChipError pychip_WriteClient_WriteAttributes(void * appContext, DeviceProxy * device, size_t timedWriteTimeoutMsSizeT,
@@ -516,6 +627,7 @@ PyChipError pychip_ReadClient_Read(void * appContext, ReadClient ** pReadClient,
     memcpy(&pyParams, readParamsBuf, sizeof(pyParams));
 
     std::unique_ptr<ReadClientCallback> callback = std::make_unique<ReadClientCallback>(appContext);
+    callback->SetBatchReports(pyParams.batchReports);
 
     std::unique_ptr<AttributePathParams[]> attributePaths(new AttributePathParams[numAttributePaths]);
     std::unique_ptr<chip::app::DataVersionFilter[]> dataVersionFilters(new chip::app::DataVersionFilter[numDataversionFilters]);
@@ -29,7 +29,8 @@ using namespace chip::Dnssd;
 namespace {
 
 // callback types shared with python code (see ptyhon code in chip.discovery.types)
-using DiscoverSuccessCallback = void (*)(uint64_t fabricId, uint64_t nodeId, uint32_t interfaceId, const char * ip, uint16_t port);
+using DiscoverSuccessCallback = void (*)(uint64_t fabricId, uint64_t nodeId, uint32_t interfaceId, const char * ip, uint16_t port,
+                                         bool hasZeroTTL);
 using DiscoverFailureCallback = void (*)(uint64_t fabricId, uint64_t nodeId, PyChipError error_code);
 
 class PythonResolverDelegate : public OperationalResolveDelegate
@@ -49,7 +50,8 @@ public:
                 nodeData.operationalData.peerId.GetNodeId(),                                             //
                 nodeData.resolutionData.interfaceId.GetPlatformInterface(),                              //
                 nodeData.resolutionData.ipAddress[0].ToString(ipAddressBuffer, sizeof(ipAddressBuffer)), //
-                nodeData.resolutionData.port                                                             //
+                nodeData.resolutionData.port,                                                            //
+                nodeData.operationalData.hasZeroTTL                                                      //
             );
         }
         else
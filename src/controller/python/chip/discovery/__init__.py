@@ -14,12 +14,16 @@
 #    limitations under the License.
 #
 
+import asyncio
 import enum
+import functools
+import heapq
+import itertools
 import logging
 import threading
-import time
-from dataclasses import dataclass
-from typing import Callable, List, Optional, Set
+import weakref
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from ..native import PyChipError
 from .library_handle import _GetDiscoveryLibraryHandle
@@ -72,8 +76,16 @@ class PendingDiscovery:
     """Accumulator for ongoing discovery."""
     result: AggregatedDiscoveryResults
     callback: Callable[[AggregatedDiscoveryResults], None]
-    expireTime: int
-    firstResultTime: int
+    expireTime: float
+    firstResultTime: float = 0
+    # Callbacks of the later requests for the same peer, which share this discovery.
+    otherCallbacks: List[Callable[[AggregatedDiscoveryResults], None]] = field(default_factory=list)
+    # Time at which the callbacks are due, as scheduled in the expiry heap.
+    deadline: float = 0
+
+    @property
+    def callbacks(self) -> List[Callable[[AggregatedDiscoveryResults], None]]:
+        return [self.callback] + self.otherCallbacks
 
 
 @dataclass
@@ -99,115 +111,222 @@ class CommissionableNode():
     rotatingId: Optional[str] = None
 
 
-# Milliseconds to wait for additional results onece a single result has
+# Seconds to wait for additional results once a single result has
 # been received
 _RESULT_WAIT_TIME_SEC = 0.05
 
+# Seconds resolved addresses are cached for, when resolving with useCache. The resolver
+# only reports whether the records were withdrawn (zero TTL), so this uses the TTL
+# RFC 6762 recommends for the SRV and address records an operational node advertises.
+DEFAULT_CACHE_TTL_SEC = 120
 
-class _PendingDiscoveries:
-    """Manages a list of pending discoveries and associated callbacks."""
 
-    activeDiscoveries: List[PendingDiscovery] = []
+class DiscoveryManager:
+    """Resolves operational nodes on an asyncio event loop.
 
-    def __init__(self):
-        self.operationCondition = threading.Condition()
-        self.resolution = threading.Thread(
-            target=self.ResolutionThread, daemon=True)
-        self.resolution.start()
-
-    def Start(self, peerId: PeerId, callback: Callable[[AggregatedDiscoveryResults], None], timeoutMs: int):
-        """Add a new pending result item to the internal list."""
-        with self.operationCondition:
-            self.activeDiscoveries.append(
-                PendingDiscovery(
-                    AggregatedDiscoveryResults(peerId, addresses=set()),
-                    callback=callback,
-                    expireTime=time.time() + timeoutMs/1000.0,
-                    firstResultTime=0,
-                ))
-            self.operationCondition.notify()
-
-    def OnSuccess(self, peerId: PeerId, address: NodeAddress):
-        """Notify of a succesful address resolution."""
-        with self.operationCondition:
-            for item in self.activeDiscoveries:
-                if item.result.peerId != peerId:
-                    continue
-
-                item.result.addresses.add(address)
-                if item.firstResultTime == 0:
-                    item.firstResultTime = time.time()
-            self.operationCondition.notify()
-
-    def ResolutionThread(self):
-        while True:
-            with self.operationCondition:
-                self.operationCondition.wait(
-                    self.ComputeNextEventTimeoutSeconds())
-
-                updatedDiscoveries = []
-
-                for item in self.activeDiscoveries:
-                    if self.NeedsCallback(item):
-                        try:
-                            item.callback(item.result)
-                        except Exception:
-                            logging.exception("Node discovery callback failed")
-                    else:
-                        updatedDiscoveries.append(item)
-
-                self.activeDiscoveries = updatedDiscoveries
-
-    def NeedsCallback(self, item: PendingDiscovery):
-        """Find out if the callback needs to be called for the given item."""
-        now = time.time()
-        if item.expireTime <= now:
-            return True
-
-        if (item.firstResultTime > 0) and (item.firstResultTime + _RESULT_WAIT_TIME_SEC <= now):
-            return True
-
-        return False
-
-    def ComputeNextEventTimeoutSeconds(self):
-        """Compute how much a thread needs to sleep based on the active discoveries list."""
-        sleepTimeSec = 10.0  # just in case
-
-        now = time.time()
-        for item in self.activeDiscoveries:
-            # figure out expiry time for an item
-            expireSleep = item.expireTime - now
-            if expireSleep < sleepTimeSec:
-                sleepTimeSec = expireSleep
-
-            # Allow only a short time window for 'additional results' once we
-            # have one
-            resultSleep = (item.firstResultTime + _RESULT_WAIT_TIME_SEC) - now
-            if resultSleep < sleepTimeSec:
-                sleepTimeSec = resultSleep
-
-        # in case our processing missed some expire times, set a very short
-        # sleep
-        if sleepTimeSec <= 0:
-            sleepTimeSec = 0.001
-
-        return sleepTimeSec
-
-
-# define firstResultTime
-
-
-# All pending discovery operations awayting callback results
-_gPendingDiscoveries = _PendingDiscoveries()
+    Pending resolutions are kept by PeerId, so any number of requests for the same
+    peer share one resolution, and their deadlines are kept in a heap, so only the
+    resolutions that are due get looked at. Callbacks run on the event loop of the
+    manager.
 
+    Resolved addresses are cached for cacheTtlSec, or until the node withdraws its
+    records. The cache is only used by requests made with useCache: a node that
+    changed address without withdrawing its records (e.g. after a network flap)
+    keeps its cached address until the TTL expires or ClearCache() is called.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, cacheTtlSec: float = DEFAULT_CACHE_TTL_SEC):
+        self._loop = loop
+        self._cacheTtlSec = cacheTtlSec
+        self._pending: Dict[PeerId, PendingDiscovery] = {}
+        self._expiry: List[Tuple[float, int, PendingDiscovery]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timerDeadline: Optional[float] = None
+        self._cache: Dict[PeerId, Tuple[float, Set[NodeAddress]]] = {}
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def _StartResolve(self, peerId: PeerId):
+        _GetDiscoveryLibraryHandle().pychip_discovery_resolve(peerId.fabricId, peerId.nodeId).raise_on_error()
+
+    def _Schedule(self, item: PendingDiscovery, deadline: float):
+        item.deadline = deadline
+        heapq.heappush(self._expiry, (deadline, next(self._sequence), item))
+        if self._timerDeadline is None or deadline < self._timerDeadline:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = self._loop.call_at(deadline, self._OnTimer)
+            self._timerDeadline = deadline
+
+    def _OnTimer(self):
+        self._timer = None
+        self._timerDeadline = None
+        now = self._loop.time()
+        while self._expiry and self._expiry[0][0] <= now:
+            deadline, _, item = heapq.heappop(self._expiry)
+            # Entries are not removed from the heap when a resolution completes or its
+            # deadline moves, skip the ones that are no longer current.
+            if self._pending.get(item.result.peerId) is item and item.deadline == deadline:
+                self._Complete(item)
+
+        while self._expiry:
+            deadline, _, item = self._expiry[0]
+            if self._pending.get(item.result.peerId) is item and item.deadline == deadline:
+                self._timer = self._loop.call_at(deadline, self._OnTimer)
+                self._timerDeadline = deadline
+                break
+            heapq.heappop(self._expiry)
+
+    def _Complete(self, item: PendingDiscovery):
+        del self._pending[item.result.peerId]
+        if item.result.addresses:
+            self._cache[item.result.peerId] = (self._loop.time() + self._cacheTtlSec, set(item.result.addresses))
+        for callback in item.callbacks:
+            try:
+                callback(item.result)
+            except Exception:
+                logging.exception("Node discovery callback failed")
+
+    def Start(self, peerId: PeerId, callback: Callable[[AggregatedDiscoveryResults], None], timeoutMs: int,
+              useCache: bool = False):
+        """Resolves a peer and calls callback with the result on the event loop of the manager.
+
+        With useCache, addresses resolved less than cacheTtlSec ago are returned without resolving the peer again.
+        Must be called on the event loop of the manager.
+        """
+        if useCache:
+            cached = self.GetCached(peerId)
+            if cached is not None:
+                self._loop.call_soon(callback, cached)
+                return
+
+        expireTime = self._loop.time() + timeoutMs / 1000.0
+        item = self._pending.get(peerId)
+        if item is not None:
+            item.otherCallbacks.append(callback)
+            if item.firstResultTime == 0 and expireTime > item.expireTime:
+                item.expireTime = expireTime
+                self._Schedule(item, expireTime)
+            return
+
+        item = PendingDiscovery(AggregatedDiscoveryResults(peerId, addresses=set()), callback=callback,
+                                expireTime=expireTime)
+        self._pending[peerId] = item
+        try:
+            self._StartResolve(peerId)
+        except Exception:
+            del self._pending[peerId]
+            raise
+        self._Schedule(item, expireTime)
+
+    def OnSuccess(self, peerId: PeerId, address: NodeAddress, hasZeroTTL: bool = False):
+        """Notify of a succesful address resolution. Must be called on the event loop of the manager."""
+        if hasZeroTTL:
+            # The node withdrew its records.
+            self._cache.pop(peerId, None)
+            return
+
+        item = self._pending.get(peerId)
+        if item is None:
+            return
+
+        item.result.addresses.add(address)
+        if item.firstResultTime == 0:
+            item.firstResultTime = self._loop.time()
+            # Allow only a short time window for 'additional results' once we have one.
+            self._Schedule(item, min(item.expireTime, item.firstResultTime + _RESULT_WAIT_TIME_SEC))
+
+    def GetCached(self, peerId: PeerId) -> Optional[AggregatedDiscoveryResults]:
+        """Returns the cached addresses of a peer, if they have not expired."""
+        entry = self._cache.get(peerId)
+        if entry is None:
+            return None
+        if entry[0] <= self._loop.time():
+            del self._cache[peerId]
+            return None
+        return AggregatedDiscoveryResults(peerId, addresses=set(entry[1]))
+
+    def ClearCache(self, peerId: Optional[PeerId] = None):
+        if peerId is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(peerId, None)
+
+    async def FindAddresses(self, peers: Iterable[PeerId], timeoutMs: int = 1000,
+                            useCache: bool = False) -> Dict[PeerId, AggregatedDiscoveryResults]:
+        """Resolves the addresses of several peers concurrently.
+
+        Returns the results by PeerId. Peers that could not be resolved within
+        timeoutMs have no addresses in their result. With useCache, peers resolved
+        less than cacheTtlSec ago are not resolved again.
+        """
+        futures = {}
+        for peerId in dict.fromkeys(peers):
+            future = self._loop.create_future()
+            futures[peerId] = future
+            self.Start(peerId, functools.partial(_SetFutureResult, future), timeoutMs, useCache=useCache)
+        return {peerId: await future for peerId, future in futures.items()}
+
+
+def _SetFutureResult(future: asyncio.Future, result):
+    if not future.done():
+        future.set_result(result)
+
+
+# Discovery managers by event loop, results of the native resolver are dispatched to all of them.
+_gDiscoveryManagers: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, DiscoveryManager]' = weakref.WeakKeyDictionary()
+_gDiscoveryManagersLock = threading.Lock()
+
+# Event loop running in the background for callers of FindAddressAsync without an event loop.
+_gBackgroundLoop: Optional[asyncio.AbstractEventLoop] = None
+
+
+# Whether the native resolver has been given the callbacks dispatching its results to the managers.
+_gCallbacksSet = False
+
+
+def GetDiscoveryManager(loop: Optional[asyncio.AbstractEventLoop] = None) -> DiscoveryManager:
+    """Returns the discovery manager of an event loop (by default the running one)."""
+    global _gCallbacksSet
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    with _gDiscoveryManagersLock:
+        if not _gCallbacksSet:
+            _GetDiscoveryLibraryHandle().pychip_discovery_set_callbacks(_DiscoverSuccess, _DiscoverFailure)
+            _gCallbacksSet = True
+        manager = _gDiscoveryManagers.get(loop)
+        if manager is None:
+            manager = DiscoveryManager(loop)
+            _gDiscoveryManagers[loop] = manager
+        return manager
+
+
+def _GetBackgroundLoop() -> asyncio.AbstractEventLoop:
+    global _gBackgroundLoop
+    with _gDiscoveryManagersLock:
+        if _gBackgroundLoop is None:
+            _gBackgroundLoop = asyncio.new_event_loop()
+            threading.Thread(target=_gBackgroundLoop.run_forever, name='chip.discovery', daemon=True).start()
+        return _gBackgroundLoop
+
+
+def _Dispatch(method: str, *args):
+    with _gDiscoveryManagersLock:
+        managers = list(_gDiscoveryManagers.values())
+    for manager in managers:
+        try:
+            manager.loop.call_soon_threadsafe(getattr(manager, method), *args)
+        except RuntimeError:
+            # The event loop of the manager has been closed.
+            pass
 
-@DiscoverSuccessCallback_t
-def _DiscoverSuccess(fabric: int, node: int, interface: int, ip: str,  port: int):
-    peerId = PeerId(fabric, node)
-    address = NodeAddress(interface, ip, port)
 
-    global _gPendingDiscoveries
-    _gPendingDiscoveries.OnSuccess(peerId, address)
+@DiscoverSuccessCallback_t
+def _DiscoverSuccess(fabric: int, node: int, interface: int, ip: str,  port: int, hasZeroTTL: bool):
+    _Dispatch('OnSuccess', PeerId(fabric, node), NodeAddress(interface, ip, port), hasZeroTTL)
 
 
 @DiscoverFailureCallback_t
@@ -223,21 +342,34 @@ def FindAddressAsync(fabricid: int, nodeid: int, callback, timeout_ms=1000):
     Args:
       fabricid: the fabric to which the node is attached
       nodeid:   the node id to find
-      callback: Will be called once node resolution completes.
+      callback: Will be called once node resolution completes. When called on an
+                event loop, the callback runs on that loop, otherwise on a
+                background event loop.
     """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop is not None:
+        GetDiscoveryManager(loop).Start(PeerId(fabricid, nodeid), callback, timeout_ms)
+    else:
+        _StartInBackground(PeerId(fabricid, nodeid), callback, timeout_ms)
+
+
+async def _Start(manager: DiscoveryManager, peerId: PeerId, callback, timeoutMs: int):
+    manager.Start(peerId, callback, timeoutMs)
+
 
-    _GetDiscoveryLibraryHandle().pychip_discovery_set_callbacks(
-        _DiscoverSuccess, _DiscoverFailure)
+def _StartInBackground(peerId: PeerId, callback, timeoutMs: int):
+    manager = GetDiscoveryManager(_GetBackgroundLoop())
+    asyncio.run_coroutine_threadsafe(_Start(manager, peerId, callback, timeoutMs), manager.loop).result()
 
-    global _gPendingDiscoveries
-    _gPendingDiscoveries.Start(
-        PeerId(fabricid, nodeid),
-        callback,
-        timeout_ms
-    )
 
-    res = _GetDiscoveryLibraryHandle().pychip_discovery_resolve(fabricid, nodeid)
-    res.raise_on_error()
+async def FindAddresses(peers: Iterable[PeerId], timeout_ms: int = 1000,
+                        useCache: bool = False) -> Dict[PeerId, AggregatedDiscoveryResults]:
+    """Discovers the IP addresses of several nodes concurrently, see DiscoveryManager.FindAddresses."""
+    return await GetDiscoveryManager().FindAddresses(peers, timeout_ms, useCache)
 
 
 class _SyncAddressFinder:
@@ -259,5 +391,7 @@ class _SyncAddressFinder:
 def FindAddress(fabricid, nodeid, timeout_ms=1000):
     """Performs an address discovery for a node and returns the result."""
     finder = _SyncAddressFinder()
-    FindAddressAsync(fabricid, nodeid, finder.Callback, timeout_ms)
+    # Resolve on the background event loop, the calling thread may be running an event loop that
+    # would otherwise have to deliver the result while it is blocked waiting for it.
+    _StartInBackground(PeerId(fabricid, nodeid), finder.Callback, timeout_ms)
     return finder.WaitForResult()
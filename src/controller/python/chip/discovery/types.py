@@ -14,7 +14,7 @@
 #    limitations under the License.
 #
 
-from ctypes import CFUNCTYPE, c_char_p, c_uint16, c_uint32, c_uint64
+from ctypes import CFUNCTYPE, c_bool, c_char_p, c_uint16, c_uint32, c_uint64
 
 from ..native import PyChipError
 
@@ -24,7 +24,8 @@ DiscoverSuccessCallback_t = CFUNCTYPE(
     c_uint64,  # node id
     c_uint32,  # interface id
     c_char_p,  # IP address
-    c_uint16  # port
+    c_uint16,  # port
+    c_bool,  # records have a zero TTL (withdrawn)
 )
 
 DiscoverFailureCallback_t = CFUNCTYPE(
@@ -21,12 +21,17 @@ from __future__ import annotations
 import base64
 import copy
 import ctypes
-import json
 import logging
+import os
+import threading
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_char, c_char_p, c_uint16, c_void_p, py_object
-from typing import IO, Dict, Optional
+from typing import Dict, Optional
 
 from ..native import GetLibraryHandle
+from .backends import JsonStorageBackend, SqliteStorageBackend, StorageBackend
+
+# Storage paths with one of these extensions use the SQLite backend.
+SQLITE_EXTENSIONS = ('.sqlite', '.sqlite3', '.db')
 
 LOGGER = logging.getLogger(__name__)
 
@@ -93,45 +98,50 @@ class PersistentStorage:
         Object must be resident before the Matter stack starts up and last past its shutdown.
     '''
 
-    def __init__(self, path: Optional[str] = None, jsonData: Optional[Dict] = None):
-        ''' Initializes the object with either a path to a JSON file that contains the configuration OR
-            a JSON dictionary that contains an in-memory representation of the configuration.
+    def __init__(self, path: Optional[str] = None, jsonData: Optional[Dict] = None,
+                 backend: Optional[StorageBackend] = None, commitDelaySec: float = 0):
+        ''' Initializes the object with either a path to a file that contains the configuration, a JSON dictionary
+            that contains an in-memory representation of the configuration OR a storage backend.
+
+            Paths ending with one of SQLITE_EXTENSIONS are stored in an SQLite database (see SqliteStorageBackend),
+            other paths in a JSON file. When an SQLite database is created next to a JSON file with the same name
+            (e.g. repl-storage.sqlite and repl-storage.json), the configuration of the JSON file is migrated to it.
+
+            Changes are committed right away by default. With a commitDelaySec above zero, REPL key changes are
+            instead committed together once no more changes happened for that long (or on Commit() or Shutdown()).
+            SDK key changes (fabric data, message counters...) are always committed right away, along with the
+            REPL key changes that wait for a delayed commit: losing them in a crash could make the stack reuse
+            message counters after a restart.
 
-            In either case, if there are no valid configurations that already exist, empty Python
+            In all cases, if there are no valid configurations that already exist, empty Python
             and SDK configuration records will be created upon construction.
         '''
-        if (path is None and jsonData is None):
-            raise ValueError("Need to provide at least one of path or jsonData")
-
-        if (path is not None and jsonData is not None):
-            raise ValueError("Can't provide both a valid path and jsonData")
+        if [path, jsonData, backend].count(None) != 2:
+            raise ValueError("Need to provide exactly one of path, jsonData or backend")
 
         if (path is not None):
             LOGGER.info(f"Initializing persistent storage from file: {path}")
+            if path.endswith(SQLITE_EXTENSIONS):
+                backend = SqliteStorageBackend(path, migrateFrom=os.path.splitext(path)[0] + '.json')
+            else:
+                backend = JsonStorageBackend(path)
+        elif (backend is not None):
+            LOGGER.info(f"Initializing persistent storage from {type(backend).__name__}")
         else:
             LOGGER.info("Initializing persistent storage from dict")
 
         self._handle = GetLibraryHandle()
         self._isActive = True
         self._path = path
-
-        if (self._path):
-            try:
-                self._file: Optional[IO[str]] = open(path, 'r')
-                self._file.seek(0, 2)
-                size = self._file.tell()
-                self._file.seek(0)
-
-                if (size != 0):
-                    LOGGER.info(f"Loading configuration from {path}...")
-                    self._jsonData = json.load(self._file)
-                else:
-                    self._jsonData = {}
-
-            except Exception as ex:
-                LOGGER.error(ex)
-                LOGGER.critical(f"Could not load configuration from {path} - resetting configuration...")
-                self._jsonData = {}
+        self._backend = backend
+        self._commitDelaySec = commitDelaySec
+        self._commitTimer: Optional[threading.Timer] = None
+        self._closed = False
+        # SDK keys are written from the Matter thread, delayed commits happen on a timer thread.
+        self._lock = threading.RLock()
+
+        if (self._backend is not None):
+            self._jsonData = self._backend.Load()
         else:
             self._jsonData = jsonData
 
@@ -143,9 +153,6 @@ class PersistentStorage:
             LOGGER.warn("No valid REPL configuration present - clearing out configuration")
             self._jsonData['repl-config'] = {}
 
-        # Clear out the file so that calling 'Commit' will re-open the file at that time in write mode.
-        self._file = None
-
         self._handle.pychip_Storage_InitializeStorageAdapter.restype = c_void_p
         self._handle.pychip_Storage_InitializeStorageAdapter.argtypes = [ctypes.py_object,
                                                                          _SyncSetKeyValueCbFunct,
@@ -161,25 +168,48 @@ class PersistentStorage:
         return self._closure
 
     def Commit(self):
-        ''' Commits the cached JSON configuration to file (if one was provided in the constructor).
-            Otherwise, this is a no-op.
+        ''' Commits the pending changes to the storage backend (if a path or backend was provided in the
+            constructor). Otherwise, this is a no-op.
         '''
+        with self._lock:
+            if (self._commitTimer is not None):
+                self._commitTimer.cancel()
+                self._commitTimer = None
 
-        if (self._path is None):
-            return
+            # A delayed commit may have been waiting for the lock while Shutdown() closed the backend.
+            if (self._backend is None or self._closed):
+                return
 
-        if (self._file is None):
             try:
-                self._file = open(self._path, 'w')
+                self._backend.Commit()
             except Exception as ex:
-                LOGGER.error(
-                    f"Could not open {self._path} for writing configuration. Error: {ex}")
-                return
+                LOGGER.error(f"Could not commit configuration. Error: {ex}")
+
+    def _Set(self, section: str, key: str, value):
+        with self._lock:
+            self._jsonData[section][key] = value
+            if (self._backend is not None):
+                self._backend.Set(section, key, value)
+            self._ScheduleCommit(section)
+
+    def _Delete(self, section: str, key: str):
+        with self._lock:
+            del (self._jsonData[section][key])
+            if (self._backend is not None):
+                self._backend.Delete(section, key)
+            self._ScheduleCommit(section)
+
+    def _ScheduleCommit(self, section: str):
+        if (self._commitDelaySec <= 0 or section == 'sdk-config'):
+            self.Commit()
+            return
 
-        self._file.seek(0)
-        json.dump(self._jsonData, self._file, ensure_ascii=True, indent=4)
-        self._file.truncate()
-        self._file.flush()
+        # Restart the delay, so that a burst of changes results in a single commit.
+        if (self._commitTimer is not None):
+            self._commitTimer.cancel()
+        self._commitTimer = threading.Timer(self._commitDelaySec, self.Commit)
+        self._commitTimer.daemon = True
+        self._commitTimer.start()
 
     def SetReplKey(self, key: str, value):
         ''' Set a REPL key to a specific value. Creates the key if one doesn't exist already.
@@ -190,11 +220,9 @@ class PersistentStorage:
             raise ValueError("Invalid Key")
 
         if (value is None):
-            del (self._jsonData['repl-config'][key])
+            self._Delete('repl-config', key)
         else:
-            self._jsonData['repl-config'][key] = value
-
-        self.Commit()
+            self._Set('repl-config', key, value)
 
     def GetReplKey(self, key: str):
         ''' Retrieves the value of a REPL key. Returns 'None' if the key
@@ -216,10 +244,8 @@ class PersistentStorage:
         if (value is None):
             raise ValueError('value is not expected to be None')
         else:
-            self._jsonData['sdk-config'][key] = base64.b64encode(
-                value).decode("utf-8")
-
-        self.Commit()
+            self._Set('sdk-config', key, base64.b64encode(
+                value).decode("utf-8"))
 
     def GetSdkKey(self, key: str):
         ''' Returns the SDK key if one exist. Otherwise, returns 'None'.
@@ -234,8 +260,7 @@ class PersistentStorage:
         '''
         LOGGER.debug(f"DeleteSdkKey: {key}")
 
-        del (self._jsonData['sdk-config'][key])
-        self.Commit()
+        self._Delete('sdk-config', key)
 
     def Shutdown(self):
         ''' Shuts down the object by free'ing up the associated adapter instance.
@@ -255,6 +280,14 @@ class PersistentStorage:
             self._handle.pychip_Storage_ShutdownAdapter(self._closure)
             self._isActive = False
 
+            # Flush the changes that are still waiting for a delayed commit, holding the lock so that a delayed
+            # commit cannot run on the timer thread while (or after) the backend is closed.
+            with self._lock:
+                self.Commit()
+                if (self._backend is not None):
+                    self._backend.Close()
+                self._closed = True
+
     @property
     def jsonData(self) -> Dict:
         ''' Returns a copy of the internal cached JSON data.
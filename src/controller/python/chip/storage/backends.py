@@ -0,0 +1,173 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Storage backends for chip.storage.PersistentStorage.
+
+The configuration is organized in sections ('sdk-config' and 'repl-config') of key/value pairs, where values are
+JSON serializable. A backend loads the whole configuration once, then receives every change through Set() and
+Delete(). Changes only have to be durable once Commit() returns: a crash leaves the storage in the state of the
+last successful commit.
+'''
+
+import copy
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+from typing import Any, Dict, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+
+class StorageBackend:
+    ''' Interface of the storage backends used by PersistentStorage.
+    '''
+
+    def Load(self) -> Dict[str, Dict[str, Any]]:
+        ''' Returns the stored configuration, keyed by section then key.
+        '''
+        raise NotImplementedError()
+
+    def Set(self, section: str, key: str, value: Any):
+        raise NotImplementedError()
+
+    def Delete(self, section: str, key: str):
+        raise NotImplementedError()
+
+    def Commit(self):
+        ''' Makes the changes since the last commit durable.
+        '''
+        raise NotImplementedError()
+
+    def Close(self):
+        pass
+
+
+def _LoadJsonFile(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path, 'r') as f:
+        f.seek(0, 2)
+        size = f.tell()
+        f.seek(0)
+        if size == 0:
+            return {}
+        return json.load(f)
+
+
+class JsonStorageBackend(StorageBackend):
+    ''' Stores the configuration in a JSON file, which is rewritten as a whole on every commit.
+
+        The new content is written to a temporary file that then replaces the previous one, so the file always
+        holds a complete configuration.
+    '''
+
+    def __init__(self, path: str):
+        self._path = path
+        self._data: Dict[str, Dict[str, Any]] = {}
+
+    def Load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            if os.path.exists(self._path):
+                LOGGER.info(f"Loading configuration from {self._path}...")
+                self._data = _LoadJsonFile(self._path)
+        except Exception as ex:
+            LOGGER.error(ex)
+            LOGGER.critical(f"Could not load configuration from {self._path} - resetting configuration...")
+            self._data = {}
+        # The caller keeps its own copy of the configuration, changes only reach this one through Set() and Delete().
+        return copy.deepcopy(self._data)
+
+    def Set(self, section: str, key: str, value: Any):
+        self._data.setdefault(section, {})[key] = value
+
+    def Delete(self, section: str, key: str):
+        self._data.get(section, {}).pop(key, None)
+
+    def Commit(self):
+        directory = os.path.dirname(os.path.abspath(self._path))
+        try:
+            fd, tmpPath = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self._path) + '.', suffix='.tmp')
+        except Exception as ex:
+            LOGGER.error(f"Could not open {self._path} for writing configuration. Error: {ex}")
+            return
+
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._data, f, ensure_ascii=True, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmpPath, self._path)
+        except Exception:
+            os.unlink(tmpPath)
+            raise
+
+
+class SqliteStorageBackend(StorageBackend):
+    ''' Stores the configuration in an SQLite database, with one row per key.
+
+        Each change only writes its own row, and a commit is an SQLite transaction commit, so the cost of a change
+        does not depend on the total size of the configuration.
+
+        If the database is empty and migrateFrom is the path to an existing JSON configuration file, as written by
+        JsonStorageBackend, its content is imported once when the database is opened.
+    '''
+
+    def __init__(self, path: str, migrateFrom: Optional[str] = None):
+        self._path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        with self._db:
+            self._db.execute('CREATE TABLE IF NOT EXISTS config ('
+                             'section TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (section, key))')
+
+        if migrateFrom is not None and os.path.exists(migrateFrom) and self._IsEmpty():
+            self._Migrate(migrateFrom)
+
+    def _IsEmpty(self) -> bool:
+        return self._db.execute('SELECT COUNT(*) FROM config').fetchone()[0] == 0
+
+    def _Migrate(self, jsonPath: str):
+        try:
+            data = _LoadJsonFile(jsonPath)
+        except Exception as ex:
+            LOGGER.error(f"Could not migrate configuration from {jsonPath}: {ex}")
+            return
+
+        LOGGER.info(f"Migrating configuration from {jsonPath} to {self._path}")
+        with self._db:
+            self._db.executemany('INSERT OR REPLACE INTO config VALUES (?, ?, ?)',
+                                 [(section, key, json.dumps(value)) for section, values in data.items()
+                                  if isinstance(values, dict) for key, value in values.items()])
+
+    def Load(self) -> Dict[str, Dict[str, Any]]:
+        data: Dict[str, Dict[str, Any]] = {}
+        for section, key, value in self._db.execute('SELECT section, key, value FROM config'):
+            data.setdefault(section, {})[key] = json.loads(value)
+        return data
+
+    def Set(self, section: str, key: str, value: Any):
+        self._db.execute('INSERT OR REPLACE INTO config VALUES (?, ?, ?)', (section, key, json.dumps(value)))
+
+    def Delete(self, section: str, key: str):
+        self._db.execute('DELETE FROM config WHERE section = ? AND key = ?', (section, key))
+
+    def Commit(self):
+        self._db.commit()
+
+    def Close(self):
+        self._db.close()
@@ -699,6 +699,276 @@ class TLVReader(object):
                     raise ValueError("Attempt to decode unsupported TLV tag")
 
 
+_TAG_FIELD_LENGTHS = {
+    TLV_TAG_CONTROL_ANONYMOUS: 0,
+    TLV_TAG_CONTROL_CONTEXT_SPECIFIC: 1,
+    TLV_TAG_CONTROL_COMMON_PROFILE_2Bytes: 2,
+    TLV_TAG_CONTROL_COMMON_PROFILE_4Bytes: 4,
+    TLV_TAG_CONTROL_IMPLICIT_PROFILE_2Bytes: 2,
+    TLV_TAG_CONTROL_IMPLICIT_PROFILE_4Bytes: 4,
+    TLV_TAG_CONTROL_FULLY_QUALIFIED_6Bytes: 6,
+    TLV_TAG_CONTROL_FULLY_QUALIFIED_8Bytes: 8,
+}
+
+_UNSIGNED_FORMATS = ("<B", "<H", "<L", "<Q")
+_SIGNED_FORMATS = ("<b", "<h", "<l", "<q")
+
+
+def _decodeElementHeader(buf, offset):
+    """Decodes the control byte and tag of the element starting at offset.
+
+    Returns a tuple of (elementType, tag, valueOffset). The tag follows the conventions of
+    TLVReader: None for anonymous tags, an int for context-specific tags and a
+    (profile, tagNum) tuple for profile-specific tags.
+    """
+    controlByte = buf[offset]
+    tagControl = controlByte & 0xE0
+    elementType = controlByte & 0x1F
+    offset += 1
+    if tagControl == TLV_TAG_CONTROL_ANONYMOUS:
+        return elementType, None, offset
+    if tagControl == TLV_TAG_CONTROL_CONTEXT_SPECIFIC:
+        return elementType, buf[offset], offset + 1
+    if tagControl == TLV_TAG_CONTROL_COMMON_PROFILE_2Bytes:
+        return elementType, (0, struct.unpack_from("<H", buf, offset)[0]), offset + 2
+    if tagControl == TLV_TAG_CONTROL_COMMON_PROFILE_4Bytes:
+        return elementType, (0, struct.unpack_from("<L", buf, offset)[0]), offset + 4
+    if tagControl == TLV_TAG_CONTROL_IMPLICIT_PROFILE_2Bytes:
+        return elementType, (None, struct.unpack_from("<H", buf, offset)[0]), offset + 2
+    if tagControl == TLV_TAG_CONTROL_IMPLICIT_PROFILE_4Bytes:
+        return elementType, (None, struct.unpack_from("<L", buf, offset)[0]), offset + 4
+    (vendorId, profileNum) = struct.unpack_from("<HH", buf, offset)
+    profile = (vendorId << 16) | profileNum
+    if tagControl == TLV_TAG_CONTROL_FULLY_QUALIFIED_6Bytes:
+        return elementType, (profile, struct.unpack_from("<H", buf, offset + 4)[0]), offset + 6
+    return elementType, (profile, struct.unpack_from("<L", buf, offset + 4)[0]), offset + 8
+
+
+def _skipElementValue(buf, elementType, offset):
+    """Returns the offset just past the value of an element whose value starts at offset.
+
+    Containers are skipped by walking the headers of their members, no value is decoded.
+    """
+    if elementType <= 0x07:
+        return offset + (1 << (elementType & 0x03))
+    if elementType in (TLVBoolean_False, TLVBoolean_True, TLV_TYPE_NULL):
+        return offset
+    if elementType == 0x0A:
+        return offset + 4
+    if elementType == 0x0B:
+        return offset + 8
+    if TLV_TYPE_UTF8_STRING <= elementType < TLV_TYPE_NULL:
+        lenOfLen = 1 << (elementType & 0x03)
+        (strLen,) = struct.unpack_from(_UNSIGNED_FORMATS[elementType & 0x03], buf, offset)
+        return offset + lenOfLen + strLen
+    if elementType in (TLV_TYPE_STRUCTURE, TLV_TYPE_ARRAY, TLV_TYPE_PATH):
+        depth = 1
+        while depth > 0:
+            controlByte = buf[offset]
+            memberType = controlByte & 0x1F
+            offset += 1 + _TAG_FIELD_LENGTHS[controlByte & 0xE0]
+            if memberType == TLVEndOfContainer:
+                depth -= 1
+            elif memberType in (TLV_TYPE_STRUCTURE, TLV_TYPE_ARRAY, TLV_TYPE_PATH):
+                depth += 1
+            else:
+                offset = _skipElementValue(buf, memberType, offset)
+        return offset
+    raise ValueError("Attempt to decode unsupported TLV type")
+
+
+def _decodeElementValue(buf, elementType, offset):
+    """Decodes the value of an element whose value starts at offset.
+
+    Primitive values are decoded to the same Python types as TLVReader. Structures and arrays
+    are returned as lazy views over buf, paths are decoded into a TLVList whose members are lazy.
+    """
+    if elementType <= 0x03:
+        return struct.unpack_from(_SIGNED_FORMATS[elementType], buf, offset)[0]
+    if elementType <= 0x07:
+        return uint(struct.unpack_from(_UNSIGNED_FORMATS[elementType & 0x03], buf, offset)[0])
+    if elementType == TLVBoolean_False:
+        return False
+    if elementType == TLVBoolean_True:
+        return True
+    if elementType == 0x0A:
+        return float32(struct.unpack_from("<f", buf, offset)[0])
+    if elementType == 0x0B:
+        return struct.unpack_from("<d", buf, offset)[0]
+    if TLV_TYPE_UTF8_STRING <= elementType < TLV_TYPE_BYTE_STRING:
+        (strLen,) = struct.unpack_from(_UNSIGNED_FORMATS[elementType & 0x03], buf, offset)
+        offset += 1 << (elementType & 0x03)
+        val = bytes(buf[offset: offset + strLen])
+        try:
+            return str(val, "utf-8")
+        except Exception:
+            return val
+    if TLV_TYPE_BYTE_STRING <= elementType < TLV_TYPE_NULL:
+        (strLen,) = struct.unpack_from(_UNSIGNED_FORMATS[elementType & 0x03], buf, offset)
+        offset += 1 << (elementType & 0x03)
+        return bytes(buf[offset: offset + strLen])
+    if elementType == TLV_TYPE_NULL:
+        return None
+    if elementType == TLV_TYPE_STRUCTURE:
+        return TLVStructureView(buf, offset)
+    if elementType == TLV_TYPE_ARRAY:
+        return TLVArrayView(buf, offset)
+    if elementType == TLV_TYPE_PATH:
+        out = TLVList()
+        for tag, memberType, valueOffset in _TLVContainerView(buf, offset)._members():
+            out.append(tag, _decodeElementValue(buf, memberType, valueOffset))
+        return out
+    raise ValueError("Attempt to decode unsupported TLV type")
+
+
+def _materialize(val):
+    if isinstance(val, (TLVStructureView, TLVArrayView)):
+        return val.materialize()
+    if isinstance(val, TLVList):
+        out = TLVList()
+        for tag, member in val:
+            out.append(tag, _materialize(member))
+        return out
+    return val
+
+
+class _TLVContainerView(object):
+    """Base class for lazy views over the members of an encoded TLV container.
+
+    The members are located by walking their headers the first time the view is accessed,
+    member values are decoded on first access and cached afterwards.
+    """
+
+    __slots__ = ("_buf", "_start", "_memberList", "_values")
+
+    def __init__(self, buf, start):
+        self._buf = buf
+        self._start = start
+        self._memberList = None
+        self._values = {}
+
+    def _members(self):
+        if self._memberList is None:
+            buf = self._buf
+            offset = self._start
+            members = []
+            while True:
+                elementType, tag, valueOffset = _decodeElementHeader(buf, offset)
+                if elementType == TLVEndOfContainer:
+                    break
+                members.append((tag, elementType, valueOffset))
+                offset = _skipElementValue(buf, elementType, valueOffset)
+            self._memberList = members
+        return self._memberList
+
+    def _valueAt(self, index):
+        try:
+            return self._values[index]
+        except KeyError:
+            _, elementType, valueOffset = self._members()[index]
+            val = _decodeElementValue(self._buf, elementType, valueOffset)
+            self._values[index] = val
+            return val
+
+
+class TLVStructureView(_TLVContainerView, Mapping):
+    """A read-only mapping over an encoded TLV structure.
+
+    Keys follow the conventions of TLVReader.get(): context-specific tags are ints, profile
+    tags are (profile, tagNum) tuples and anonymous members use the key "Any".
+    """
+
+    __slots__ = ("_indexByTag",)
+
+    def __init__(self, buf, start):
+        super().__init__(buf, start)
+        self._indexByTag = None
+
+    def _tagIndex(self):
+        if self._indexByTag is None:
+            self._indexByTag = {("Any" if tag is None else tag): index
+                                for index, (tag, _, _) in enumerate(self._members())}
+        return self._indexByTag
+
+    def __getitem__(self, tag):
+        return self._valueAt(self._tagIndex()[tag])
+
+    def __iter__(self):
+        return iter(self._tagIndex())
+
+    def __len__(self):
+        return len(self._tagIndex())
+
+    def __contains__(self, tag):
+        return tag in self._tagIndex()
+
+    def materialize(self):
+        """Decodes the whole structure into a dict, as returned by TLVReader."""
+        return {tag: _materialize(self[tag]) for tag in self._tagIndex()}
+
+    def __repr__(self):
+        return "TLVStructureView(" + repr(self.materialize()) + ")"
+
+
+class TLVArrayView(_TLVContainerView, Sequence):
+    """A read-only sequence over an encoded TLV array."""
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._valueAt(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("TLV array index out of range")
+        return self._valueAt(index)
+
+    def __len__(self):
+        return len(self._members())
+
+    def __eq__(self, other):
+        if isinstance(other, (TLVArrayView, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def materialize(self):
+        """Decodes the whole array into a list, as returned by TLVReader."""
+        return [_materialize(val) for val in self]
+
+    def __repr__(self):
+        return "TLVArrayView(" + repr(self.materialize()) + ")"
+
+
+class LazyTLVReader(object):
+    """Decodes TLV data in place, without copying the underlying buffer.
+
+    The encoding is accessed through a memoryview and top-level structures and arrays are
+    returned as TLVStructureView / TLVArrayView objects, which only decode the members that
+    are actually accessed. This makes picking a few fields out of large payloads (e.g.
+    wildcard reads) much cheaper than decoding the whole tree with TLVReader.
+
+    The buffer must not be modified while views obtained from this reader are in use.
+    """
+
+    def __init__(self, tlv):
+        buf = memoryview(tlv)
+        self._buf = buf if buf.format == "B" else buf.cast("B")
+
+    def get(self):
+        """Get the top-level elements of the tlv data, keyed in the same way as TLVReader.get()"""
+        out = {}
+        buf = self._buf
+        offset = 0
+        while offset < len(buf):
+            elementType, tag, valueOffset = _decodeElementHeader(buf, offset)
+            if elementType == TLVEndOfContainer:
+                break
+            out["Any" if tag is None else tag] = _decodeElementValue(buf, elementType, valueOffset)
+            offset = _skipElementValue(buf, elementType, valueOffset)
+        return out
+
+
 def tlvTagToSortKey(tag):
     if tag is None:
         return -1
@@ -26,12 +26,114 @@
 #include <tracing/perfetto/simple_initialize.h>
 #include <tracing/registry.h>
 
+#include <lib/support/CodeUtils.h>
+#include <system/SystemClock.h>
+#include <tracing/backend.h>
+#include <tracing/metric_event.h>
+#include <tracing/metric_keys.h>
+#include <transport/TracingStructs.h>
+
+#include <cstring>
+#include <deque>
+#include <map>
+#include <string>
+#include <utility>
+#include <vector>
+
 namespace {
+
+// Called for every counter and duration sample collected, see pychip_tracing_collect_metrics.
+using MetricsSampleFunct = void (*)(const char * name, uint32_t label, uint64_t value);
+
+/// Counts messages and retransmissions and measures the duration of metric events that have a
+/// begin and an end (CASE and PASE establishment, subscription setup...), for the Python side to
+/// collect periodically.
+class MetricsBackend : public chip::Tracing::Backend
+{
+public:
+    void LogMessageSend(chip::Tracing::MessageSendInfo & info) override
+    {
+        mMessagesSent[info.payloadHeader->GetProtocolID().ToFullyQualifiedSpecForm()]++;
+    }
+
+    void LogMessageReceived(chip::Tracing::MessageReceivedInfo & info) override
+    {
+        mMessagesReceived[info.payloadHeader->GetProtocolID().ToFullyQualifiedSpecForm()]++;
+    }
+
+    void LogMetricEvent(const chip::Tracing::MetricEvent & event) override
+    {
+        using Type = chip::Tracing::MetricEvent::Type;
+
+        const uint64_t now = chip::System::SystemClock().GetMonotonicMicroseconds64().count();
+        switch (event.type())
+        {
+        case Type::kBeginEvent:
+            mPendingBegins[event.key()].push_back(now);
+            break;
+        case Type::kEndEvent: {
+            // Events of the same key are not identified, concurrent ones are matched in order.
+            auto pending = mPendingBegins.find(event.key());
+            if (pending == mPendingBegins.end() || pending->second.empty())
+            {
+                break;
+            }
+            mDurationSamples.emplace_back(event.key(), now - pending->second.front());
+            pending->second.pop_front();
+            break;
+        }
+        case Type::kInstantEvent:
+            if (strcmp(event.key(), chip::Tracing::kMetricDeviceRMPRetryCount) == 0)
+            {
+                mRetransmissions++;
+            }
+            break;
+        }
+    }
+
+    void Collect(MetricsSampleFunct callback)
+    {
+        for (const auto & [protocolId, count] : mMessagesSent)
+        {
+            callback("messages_sent", protocolId, count);
+        }
+        for (const auto & [protocolId, count] : mMessagesReceived)
+        {
+            callback("messages_received", protocolId, count);
+        }
+        callback("retransmissions", 0, mRetransmissions);
+        for (const auto & [key, durationUs] : mDurationSamples)
+        {
+            callback(key.c_str(), 0, durationUs);
+        }
+        mDurationSamples.clear();
+    }
+
+    void Reset()
+    {
+        mMessagesSent.clear();
+        mMessagesReceived.clear();
+        mRetransmissions = 0;
+        mPendingBegins.clear();
+        mDurationSamples.clear();
+    }
+
+private:
+    std::map<uint32_t, uint64_t> mMessagesSent;
+    std::map<uint32_t, uint64_t> mMessagesReceived;
+    uint64_t mRetransmissions = 0;
+    std::map<std::string, std::deque<uint64_t>> mPendingBegins;
+    // Durations in microseconds not collected yet.
+    std::vector<std::pair<std::string, uint64_t>> mDurationSamples;
+};
+
 chip::Tracing::Json::JsonBackend gJsonBackend;
 
 chip::Tracing::Perfetto::FileTraceOutput gPerfettoFileOutput;
 chip::Tracing::Perfetto::PerfettoBackend gPerfettoBackend;
 
+MetricsBackend gMetricsBackend;
+
 } // namespace
 
 extern "C" void pychip_tracing_start_json_log()
@@ -94,3 +196,21 @@ extern "C" void pychip_tracing_stop()
         chip::Tracing::Unregister(gJsonBackend);
     });
 }
+
+extern "C" void pychip_tracing_start_metrics()
+{
+    chip::MainLoopWork::ExecuteInMainLoop([] {
+        gMetricsBackend.Reset();
+        chip::Tracing::Register(gMetricsBackend);
+    });
+}
+
+extern "C" void pychip_tracing_collect_metrics(MetricsSampleFunct callback)
+{
+    chip::MainLoopWork::ExecuteInMainLoop([callback] { gMetricsBackend.Collect(callback); });
+}
+
+extern "C" void pychip_tracing_stop_metrics()
+{
+    chip::MainLoopWork::ExecuteInMainLoop([] { chip::Tracing::Unregister(gMetricsBackend); });
+}
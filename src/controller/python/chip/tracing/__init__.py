@@ -45,6 +45,10 @@ def _GetTracingLibraryHandle() -> ctypes.CDLL:
 
         setter.Set('pychip_tracing_stop', None, [])
 
+        setter.Set('pychip_tracing_start_metrics', None, [])
+        setter.Set('pychip_tracing_collect_metrics', None, [ctypes.c_void_p])
+        setter.Set('pychip_tracing_stop_metrics', None, [])
+
     return handle
 
 
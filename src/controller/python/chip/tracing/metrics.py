@@ -0,0 +1,296 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+"""
+Live interaction metrics of the controllers in this process.
+
+While started, the controllers record the latency of every read, subscribe, invoke, write and connection
+in histograms per node, cluster and interaction type, and a tracing backend registered with the Matter
+stack counts the messages sent and received per protocol, the retransmissions, and measures the duration
+of CASE and PASE session establishment and subscription setup. The metrics can be read from Python or
+dumped in the Prometheus text exposition format:
+
+    metrics = StartMetrics()
+    # ...
+    print(GetMetrics().PrometheusText())
+    StopMetrics()
+
+When metrics are not started, the controllers only pay for a check of a module global per interaction.
+"""
+
+import bisect
+import ctypes
+import enum
+import math
+import time
+import typing
+from dataclasses import dataclass
+
+from . import _GetTracingLibraryHandle
+
+# Upper bounds, in seconds, of the latency histogram buckets; an implicit +Inf bucket follows.
+DEFAULT_LATENCY_BUCKETS_SEC = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_MetricsSampleFunct = ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint64)
+
+
+class InteractionType(enum.Enum):
+    READ = 'read'
+    SUBSCRIBE = 'subscribe'
+    INVOKE = 'invoke'
+    WRITE = 'write'
+    # Getting a session to the node, established or reused.
+    CONNECT = 'connect'
+
+
+class Histogram:
+    """ Counts observations in buckets of fixed upper bounds, like a Prometheus histogram.
+    """
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS_SEC):
+        self.buckets = tuple(sorted(buckets))
+        # One count per bucket, the last one for the values above all bounds.
+        self.bucketCounts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def Observe(self, value: float):
+        self.bucketCounts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def CumulativeCounts(self) -> typing.List[typing.Tuple[float, int]]:
+        """ Returns (upper bound, observations less or equal to it) for each bucket, ending with +Inf.
+        """
+        counts = []
+        total = 0
+        for bound, count in zip(self.buckets + (math.inf,), self.bucketCounts):
+            total += count
+            counts.append((bound, total))
+        return counts
+
+    def Quantile(self, q: float) -> float:
+        """ Estimates the q-quantile by interpolating linearly within its bucket, like Prometheus histogram_quantile.
+        """
+        if self.count == 0:
+            return math.nan
+        rank = q * self.count
+        lower = 0.0
+        previous = 0
+        for bound, total in self.CumulativeCounts():
+            if total >= rank and total > previous:
+                if bound == math.inf:
+                    return lower
+                return lower + (bound - lower) * (rank - previous) / (total - previous)
+            if bound != math.inf:
+                lower = bound
+            previous = total
+        return lower
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else math.nan
+
+
+@dataclass
+class InteractionStats:
+    latency: Histogram
+    # Interactions that raised, their latency is recorded too.
+    errors: int = 0
+
+
+class Metrics:
+    """ The metrics recorded since StartMetrics.
+
+        interactions: InteractionStats by (InteractionType, node ID, cluster ID or None for wildcard paths).
+        messagesSent, messagesReceived: Message counts by protocol ID, fully qualified (vendor ID << 16 | protocol).
+        retransmissions: Messages retransmitted by the reliable messaging protocol.
+        stackDurations: Histograms in seconds of the Matter stack metric events with a begin and an end, by
+            metric key (core_dev_case_session, core_dcm_pase_session, core_dev_subscription_setup...).
+    """
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS_SEC):
+        self._buckets = tuple(buckets)
+        self.interactions: typing.Dict[typing.Tuple[InteractionType, int, typing.Optional[int]], InteractionStats] = {}
+        self.messagesSent: typing.Dict[int, int] = {}
+        self.messagesReceived: typing.Dict[int, int] = {}
+        self.retransmissions = 0
+        self.stackDurations: typing.Dict[str, Histogram] = {}
+
+    def ObserveInteraction(self, interaction: InteractionType, nodeId: int, clusterIds: typing.Iterable[typing.Optional[int]],
+                           durationSec: float, failed: bool = False):
+        ''' Records an interaction in the histogram of each distinct cluster it addressed.
+        '''
+        for clusterId in set(clusterIds) or {None}:
+            stats = self.interactions.get((interaction, nodeId, clusterId))
+            if stats is None:
+                stats = self.interactions[(interaction, nodeId, clusterId)] = InteractionStats(Histogram(self._buckets))
+            stats.latency.Observe(durationSec)
+            if failed:
+                stats.errors += 1
+
+    def _OnStackSample(self, name: str, label: int, value: int):
+        if name == 'messages_sent':
+            self.messagesSent[label] = value
+        elif name == 'messages_received':
+            self.messagesReceived[label] = value
+        elif name == 'retransmissions':
+            self.retransmissions = value
+        else:
+            histogram = self.stackDurations.get(name)
+            if histogram is None:
+                histogram = self.stackDurations[name] = Histogram(self._buckets)
+            histogram.Observe(value / 1e6)
+
+    def PrometheusText(self) -> str:
+        ''' Returns the metrics in the Prometheus text exposition format.
+        '''
+        lines = []
+
+        def histogram(name: str, labels: str, value: Histogram):
+            for bound, count in value.CumulativeCounts():
+                le = '+Inf' if bound == math.inf else repr(bound)
+                lines.append(f'{name}_bucket{{{labels}{"," if labels else ""}le="{le}"}} {count}')
+            lines.append(f'{name}_sum{{{labels}}} {value.sum!r}')
+            lines.append(f'{name}_count{{{labels}}} {value.count}')
+
+        def interactionLabels(key) -> str:
+            interaction, nodeId, clusterId = key
+            cluster = '*' if clusterId is None else f'0x{clusterId:04X}'
+            return f'interaction="{interaction.value}",node="0x{nodeId:016X}",cluster="{cluster}"'
+
+        def interactionOrder(item):
+            (interaction, nodeId, clusterId), _ = item
+            return (interaction.value, nodeId, -1 if clusterId is None else clusterId)
+
+        interactions = sorted(self.interactions.items(), key=interactionOrder)
+        lines.append('# HELP matter_interaction_duration_seconds Duration of the interactions with a node.')
+        lines.append('# TYPE matter_interaction_duration_seconds histogram')
+        for key, stats in interactions:
+            histogram('matter_interaction_duration_seconds', interactionLabels(key), stats.latency)
+        lines.append('# HELP matter_interaction_errors_total Interactions with a node that failed.')
+        lines.append('# TYPE matter_interaction_errors_total counter')
+        for key, stats in interactions:
+            lines.append(f'matter_interaction_errors_total{{{interactionLabels(key)}}} {stats.errors}')
+
+        for name, counts, description in (('matter_messages_sent_total', self.messagesSent, 'Messages sent'),
+                                          ('matter_messages_received_total', self.messagesReceived, 'Messages received')):
+            lines.append(f'# HELP {name} {description}, by protocol.')
+            lines.append(f'# TYPE {name} counter')
+            for protocolId, count in sorted(counts.items()):
+                lines.append(f'{name}{{protocol="0x{protocolId:08X}"}} {count}')
+
+        lines.append('# HELP matter_retransmissions_total Messages retransmitted by the reliable messaging protocol.')
+        lines.append('# TYPE matter_retransmissions_total counter')
+        lines.append(f'matter_retransmissions_total {self.retransmissions}')
+
+        lines.append('# HELP matter_stack_duration_seconds Duration of Matter stack operations such as session establishment.')
+        lines.append('# TYPE matter_stack_duration_seconds histogram')
+        for key, value in sorted(self.stackDurations.items()):
+            histogram('matter_stack_duration_seconds', f'metric="{key}"', value)
+
+        return '\n'.join(lines) + '\n'
+
+
+class _NoMeasurement:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NO_MEASUREMENT = _NoMeasurement()
+
+
+class _InteractionMeasurement:
+    __slots__ = ('_metrics', '_interaction', '_nodeId', '_clusterIds', '_start')
+
+    def __init__(self, metrics: Metrics, interaction: InteractionType, nodeId: int, clusterIds):
+        self._metrics = metrics
+        self._interaction = interaction
+        self._nodeId = nodeId
+        self._clusterIds = clusterIds
+
+    def __enter__(self):
+        self._start = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._metrics.ObserveInteraction(self._interaction, self._nodeId, self._clusterIds,
+                                         time.monotonic() - self._start, failed=exc_type is not None)
+        return False
+
+
+_activeMetrics: typing.Optional[Metrics] = None
+_lastMetrics: typing.Optional[Metrics] = None
+_collectFromStack = False
+
+
+def MeasureInteraction(interaction: InteractionType, nodeId: int,
+                       clusterIds: typing.Iterable[typing.Optional[int]] = (None,)):
+    """ Returns a context manager recording the duration of the interaction it wraps, if metrics are started.
+
+        clusterIds is only iterated when metrics are started, so a generator can be passed.
+    """
+    metrics = _activeMetrics
+    if metrics is None:
+        return _NO_MEASUREMENT
+    return _InteractionMeasurement(metrics, interaction, nodeId, clusterIds)
+
+
+def StartMetrics(buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS_SEC, includeStack: bool = True) -> Metrics:
+    """ Starts recording metrics, discarding the metrics recorded before.
+
+        buckets: Upper bounds in seconds of the histogram buckets.
+        includeStack: Also register the tracing backend counting messages and measuring session establishment.
+    """
+    global _activeMetrics, _collectFromStack
+    if includeStack:
+        _GetTracingLibraryHandle().pychip_tracing_start_metrics()
+    _activeMetrics = Metrics(buckets)
+    _collectFromStack = includeStack
+    return _activeMetrics
+
+
+def StopMetrics():
+    """ Stops recording metrics, GetMetrics still returns the last metrics recorded.
+    """
+    global _activeMetrics, _lastMetrics, _collectFromStack
+    if _activeMetrics is None:
+        return
+    if _collectFromStack:
+        _CollectFromStack(_activeMetrics)
+        _GetTracingLibraryHandle().pychip_tracing_stop_metrics()
+    _lastMetrics = _activeMetrics
+    _activeMetrics = None
+    _collectFromStack = False
+
+
+def _CollectFromStack(metrics: Metrics):
+    callback = _MetricsSampleFunct(lambda name, label, value: metrics._OnStackSample(name.decode(), label, value))
+    _GetTracingLibraryHandle().pychip_tracing_collect_metrics(callback)
+
+
+def GetMetrics() -> typing.Optional[Metrics]:
+    """ Returns the metrics recorded since StartMetrics, updated with the latest Matter stack counters.
+    """
+    if _activeMetrics is None:
+        return _lastMetrics
+    if _collectFromStack:
+        _CollectFromStack(_activeMetrics)
+    return _activeMetrics
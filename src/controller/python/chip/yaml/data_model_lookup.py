@@ -15,15 +15,47 @@
 #    limitations under the License.
 #
 
+import dataclasses
+import types
 from abc import ABC, abstractmethod
+from typing import Any, Dict
 
 from .. import clusters as Clusters
 
+# Lowercase member name to member name, built on first use for each module, class or dataclass type looked up.
+# Cluster objects are generated once, so the index is shared by every lookup and never invalidated.
+_lowercase_member_names: Dict[Any, Dict[str, str]] = {}
 
-def _case_insensitive_getattr(object, attr_name, default):
-    for attr in dir(object):
-        if attr.lower() == attr_name.lower():
-            return getattr(object, attr)
+
+def _get_lowercase_member_names(owner) -> Dict[str, str]:
+    names = _lowercase_member_names.get(owner)
+    if names is None:
+        members = dir(owner)
+        if dataclasses.is_dataclass(owner):
+            # Fields without a class level default are only set on instances.
+            members += [field.name for field in dataclasses.fields(owner)]
+        names = {}
+        for member in members:
+            names.setdefault(member.lower(), member)
+        _lowercase_member_names[owner] = names
+    return names
+
+
+def case_insensitive_getattr(object, attr_name, default):
+    '''Returns the attribute 'attr_name' of 'object', ignoring case, or 'default' if there is none.
+
+    Modules and classes are indexed themselves, other objects through their type.
+    '''
+    is_instance = not isinstance(object, (type, types.ModuleType))
+    names = _get_lowercase_member_names(type(object) if is_instance else object)
+    name = names.get(attr_name.lower())
+    if name is not None:
+        return getattr(object, name, default)
+    if is_instance:
+        # Attributes set on the instance only.
+        for attr in vars(object) if hasattr(object, '__dict__') else ():
+            if attr.lower() == attr_name.lower():
+                return getattr(object, attr)
     return default
 
 
@@ -48,27 +80,27 @@ class DataModelLookup(ABC):
 class PreDefinedDataModelLookup(DataModelLookup):
     def get_cluster(self, cluster: str):
         try:
-            return _case_insensitive_getattr(Clusters, cluster, None)
+            return case_insensitive_getattr(Clusters, cluster, None)
         except AttributeError:
             return None
 
     def get_command(self, cluster: str, command: str):
         try:
-            commands = _case_insensitive_getattr(Clusters, cluster, None).Commands
-            return _case_insensitive_getattr(commands, command, None)
+            commands = case_insensitive_getattr(Clusters, cluster, None).Commands
+            return case_insensitive_getattr(commands, command, None)
         except AttributeError:
             return None
 
     def get_attribute(self, cluster: str, attribute: str):
         try:
-            attributes = _case_insensitive_getattr(Clusters, cluster, None).Attributes
-            return _case_insensitive_getattr(attributes, attribute, None)
+            attributes = case_insensitive_getattr(Clusters, cluster, None).Attributes
+            return case_insensitive_getattr(attributes, attribute, None)
         except AttributeError:
             return None
 
     def get_event(self, cluster: str, event: str):
         try:
-            events = _case_insensitive_getattr(Clusters, cluster, None).Events
-            return _case_insensitive_getattr(events, event, None)
+            events = case_insensitive_getattr(Clusters, cluster, None).Events
+            return case_insensitive_getattr(events, event, None)
         except AttributeError:
             return None
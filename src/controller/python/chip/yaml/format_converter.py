@@ -23,6 +23,7 @@ from matter.idl import matter_idl_types
 from ..clusters.enum import MatterIntEnum
 from ..clusters.Types import Nullable, NullValue
 from ..tlv import float32, uint
+from .data_model_lookup import case_insensitive_getattr
 from .errors import ValidationError
 
 
@@ -32,13 +33,6 @@ class _TargetTypeInfo:
     is_fabric_scoped: bool
 
 
-def _case_insensitive_getattr(object, attr_name, default):
-    for attr in dir(object):
-        if attr.lower() == attr_name.lower():
-            return getattr(object, attr)
-    return default
-
-
 def _get_target_type_info(test_spec_definition, cluster_name, target_name) -> _TargetTypeInfo:
     element = test_spec_definition.get_type_by_name(cluster_name, target_name)
     if hasattr(element, 'fields'):
@@ -69,9 +63,9 @@ def from_data_model_to_test_definition(test_spec_definition, cluster_name, respo
         # is_fabric_scoped will only be relevant for struct types, hence why it is only checked
         # here.
         if is_fabric_scoped:
-            rv['FabricIndex'] = _case_insensitive_getattr(response_value, 'fabricIndex', None)
+            rv['FabricIndex'] = case_insensitive_getattr(response_value, 'fabricIndex', None)
         for item in response_definition:
-            value = _case_insensitive_getattr(response_value, item.name, None)
+            value = case_insensitive_getattr(response_value, item.name, None)
             if item.is_optional and value is None:
                 continue
             rv[item.name] = from_data_model_to_test_definition(test_spec_definition, cluster_name,
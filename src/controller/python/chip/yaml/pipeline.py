@@ -0,0 +1,180 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''Pipelined execution of parsed YAML test steps with the ReplTestRunner.
+
+Steps run one after the other by default. With max_inflight above 1, attribute reads and invokes sent to a
+node are started without waiting for the steps before them to complete, as long as they do not depend on
+those steps:
+  - A step that uses a variable saved by a step still in flight (saveAs, saveDataVersionAs, saveResponseAs)
+    waits for that step, since the variable is only known once its response has been post processed.
+  - An invoke waits for the steps in flight on the same node, and a read waits for the invokes in flight on
+    its node, so a read never races the command it checks.
+  - Every other step (writes, events, subscriptions, waits, group messages, pseudo clusters...) waits for
+    all steps in flight and runs alone. Invokes also run alone while subscriptions are active, since the
+    reports they trigger are checked by later wait steps.
+
+Responses are always decoded and handed back in the original step order.
+'''
+
+import asyncio
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Set, Tuple
+
+from .errors import UnexpectedActionCreationError
+from .runner import BaseAction, InvokeAction, ReadAttributeAction, ReplTestRunner
+
+# Same separators the YAML parser uses to find variables in expressions such as 'myVar + 1'.
+_VARIABLE_SEPARATORS = re.compile('[- ()|+*/%]')
+
+_SAVE_KEYS = ('saveAs', 'saveDataVersionAs')
+
+
+def _collect_tokens(value, tokens: Set[str]):
+    if isinstance(value, dict):
+        for entry in value.values():
+            _collect_tokens(entry, tokens)
+    elif isinstance(value, list):
+        for entry in value:
+            _collect_tokens(entry, tokens)
+    elif isinstance(value, str):
+        tokens.update(_VARIABLE_SEPARATORS.split(value))
+
+
+def _collect_saved(value, saved: Set[str]):
+    if isinstance(value, dict):
+        for key, entry in value.items():
+            if key in _SAVE_KEYS and isinstance(entry, str):
+                saved.add(entry)
+            else:
+                _collect_saved(entry, saved)
+    elif isinstance(value, list):
+        for entry in value:
+            _collect_saved(entry, saved)
+
+
+def referenced_variables(raw_step) -> Set[str]:
+    '''Returns the words in the fields of 'raw_step' that variables are substituted into.
+
+    This is a superset of the variables the step uses, which is all that is needed to order it
+    after the steps saving them.
+    '''
+    tokens = set()
+    for value in (raw_step.node_id, raw_step.group_id, raw_step.endpoint, raw_step.cluster, raw_step.command,
+                  raw_step.attribute, raw_step.event, raw_step.run_if, raw_step.data_version, raw_step.event_number,
+                  raw_step.arguments_with_placeholders, raw_step.responses_with_placeholders):
+        _collect_tokens(value, tokens)
+    return tokens
+
+
+def saved_variables(raw_step) -> Set[str]:
+    '''Returns the variables that post processing the response of 'raw_step' saves.'''
+    saved = set()
+    _collect_saved(raw_step.responses_with_placeholders, saved)
+    if raw_step.save_response_as:
+        saved.add(raw_step.save_response_as)
+    return saved
+
+
+@dataclass
+class _InflightStep:
+    test_step: Any
+    action: BaseAction
+    saves: Set[str]
+    task: asyncio.Task
+
+
+def _can_pipeline(test_step, action: BaseAction, runner: ReplTestRunner) -> bool:
+    if type(action) is ReadAttributeAction:
+        return True
+    if type(action) is InvokeAction:
+        return (test_step.group_id is None and test_step.busy_wait_ms is None and
+                not runner.has_subscriptions)
+    return False
+
+
+def _conflicts(test_step, action: BaseAction, inflight: _InflightStep) -> bool:
+    if type(action) is ReadAttributeAction and type(inflight.action) is ReadAttributeAction:
+        return False
+    return test_step.node_id == inflight.test_step.node_id
+
+
+async def execute_steps(tests, runner: ReplTestRunner, max_inflight: int = 1) -> AsyncIterator[Tuple[Any, Any]]:
+    '''Runs the steps of 'tests' and yields each enabled step with its decoded response, in step order.
+
+    Args:
+      'tests': YamlTests providing the steps to run.
+      'runner': ReplTestRunner encoding, executing and decoding the steps.
+      'max_inflight': Maximum number of steps executing at once, 1 runs the steps one after the other.
+    Yields:
+      (test_step, decoded_response) tuples. The caller is expected to post process each response before
+      iterating further, as later steps may use the variables it saves.
+    Raises:
+      UnexpectedActionCreationError: Raised if a step could not be encoded.
+    '''
+    if max_inflight < 1:
+        raise ValueError('max_inflight must be at least 1')
+
+    inflight: Deque[_InflightStep] = deque()
+
+    async def complete_oldest():
+        step = inflight.popleft()
+        return step.test_step, runner.decode(await step.task)
+
+    try:
+        while True:
+            if len(inflight) >= max_inflight:
+                yield await complete_oldest()
+                continue
+
+            raw_step = tests.peek()
+            if raw_step is None:
+                break
+
+            saves = saved_variables(raw_step)
+            if inflight:
+                pending_saves = set().union(*(step.saves for step in inflight))
+                if pending_saves & referenced_variables(raw_step):
+                    # Variables are substituted when the TestStep is created, so wait for them first.
+                    while inflight:
+                        yield await complete_oldest()
+
+            test_step = next(tests)
+            if not test_step.is_pics_enabled:
+                continue
+            action = runner.encode(test_step)
+            if action is None:
+                raise UnexpectedActionCreationError(f'Failed to encode test step {test_step.label}')
+
+            if max_inflight > 1 and _can_pipeline(test_step, action, runner):
+                while any(_conflicts(test_step, action, step) for step in inflight):
+                    yield await complete_oldest()
+                task = asyncio.create_task(runner.execute(action))
+                inflight.append(_InflightStep(test_step, action, saves, task))
+                continue
+
+            while inflight:
+                yield await complete_oldest()
+            yield test_step, runner.decode(await runner.execute(action))
+
+        while inflight:
+            yield await complete_oldest()
+    finally:
+        for step in inflight:
+            step.task.cancel()
@@ -1024,6 +1024,11 @@ class ReplTestRunner:
         dev_ctrl = self._get_dev_ctrl(action)
         return await action.run_action(dev_ctrl)
 
+    @property
+    def has_subscriptions(self) -> bool:
+        '''Whether subscriptions established by earlier steps may still deliver reports.'''
+        return len(self._context.subscriptions) > 0
+
     def shutdown(self):
         for subscription in self._context.subscriptions:
             subscription.Shutdown()
@@ -0,0 +1,107 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Compares the reflective ClusterObjectDescriptor encode/decode path with the
+compiled ClusterObjectCodec on some of the larger generated structs.
+
+Usage: python3 cluster_object_codec.py [iterations]
+'''
+
+import sys
+import timeit
+from dataclasses import asdict
+
+import chip.clusters as Clusters
+from chip.clusters.ClusterObjects import GetClusterObjectCodec
+from chip.tlv import TLVReader, uint
+
+
+def _simple_struct():
+    return Clusters.UnitTesting.Structs.SimpleStruct(
+        23, True, Clusters.UnitTesting.Enums.SimpleEnum.kValueA, b'1234', 'hello', 1, 0, 0)
+
+
+def _acl_entry():
+    return Clusters.AccessControl.Structs.AccessControlEntryStruct(
+        privilege=Clusters.AccessControl.Enums.AccessControlEntryPrivilegeEnum.kAdminister,
+        authMode=Clusters.AccessControl.Enums.AccessControlEntryAuthModeEnum.kCase,
+        subjects=list(range(4)),
+        targets=[Clusters.AccessControl.Structs.AccessControlTargetStruct(cluster=6, endpoint=1)] * 4,
+        fabricIndex=1)
+
+
+def _samples():
+    nested = Clusters.UnitTesting.Structs.NestedStructList(
+        a=23, b=True, c=_simple_struct(), d=[_simple_struct()] * 8, e=list(range(32)),
+        f=[b'1', b'2', b'3'], g=list(range(32)))
+    yield 'UnitTesting.Structs.NestedStructList', nested
+
+    yield 'UnitTesting.Structs.NullablesAndOptionalsStruct', Clusters.UnitTesting.Structs.NullablesAndOptionalsStruct(
+        nullableInt=2, optionalInt=3, nullableOptionalInt=4, nullableString='hello1', optionalString='hello2',
+        nullableOptionalString='hello3', nullableStruct=_simple_struct(), optionalStruct=_simple_struct(),
+        nullableOptionalStruct=_simple_struct(), nullableList=[Clusters.UnitTesting.Enums.SimpleEnum.kValueA] * 16,
+        optionalList=[Clusters.UnitTesting.Enums.SimpleEnum.kValueB] * 16,
+        nullableOptionalList=[Clusters.UnitTesting.Enums.SimpleEnum.kValueC] * 16)
+
+    yield 'AccessControl.Structs.AccessControlEntryStruct', _acl_entry()
+
+
+def _cluster_samples():
+    # Cluster objects are only ever decoded, from the attribute values of a report.
+    attributes = Clusters.AccessControl.Attributes
+    acl = [asdict(_acl_entry())] * 16
+    yield 'AccessControl cluster (16 ACL entries)', Clusters.AccessControl, {
+        attributes.Acl.attribute_id: TLVReader(attributes.Acl.ToTLV(None, acl)).get()['Any'],
+        attributes.SubjectsPerAccessControlEntry.attribute_id: uint(4),
+        attributes.TargetsPerAccessControlEntry.attribute_id: uint(3),
+        attributes.AccessControlEntriesPerFabric.attribute_id: uint(4),
+    }
+
+
+def _time(fn, iterations):
+    return min(timeit.repeat(fn, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def main(iterations: int = 1000):
+    print(f"{'Type':<50} {'Path':<8} {'Reflective (us)':>16} {'Compiled (us)':>14} {'Speedup':>8}")
+
+    def report(name, path, reflective, compiled):
+        before = _time(reflective, iterations)
+        after = _time(compiled, iterations)
+        print(f"{name:<50} {path:<8} {before:>16.1f} {after:>14.1f} {before / after:>7.1f}x")
+
+    def report_decode(name, cls, tlvData):
+        codec = GetClusterObjectCodec(cls)
+        if codec.TagDictToLabelDict('', tlvData) != cls.descriptor.TagDictToLabelDict('', tlvData):
+            raise AssertionError(f"Decoded values differ for {name}")
+        report(name, 'decode', lambda: cls.descriptor.TagDictToLabelDict('', tlvData),
+               lambda: codec.TagDictToLabelDict('', tlvData))
+
+    for name, value in _samples():
+        cls = type(value)
+        data = asdict(value)
+        codec = GetClusterObjectCodec(cls)
+        report(name, 'encode', lambda: cls.descriptor.DictToTLV(data), lambda: codec.DictToTLV(data))
+        report_decode(name, cls, TLVReader(codec.DictToTLV(data)).get()['Any'])
+
+    for name, cls, tlvData in _cluster_samples():
+        report_decode(name, cls, tlvData)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,75 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+'''
+Measures the time chip.clusters.Command.FindCommandClusterObject takes to find the type of a command
+response, compared with the previous reflection (inspect + eval) based implementation.
+
+Usage: python3 command_lookup.py [iterations]
+'''
+
+import inspect
+import sys
+import time
+
+from chip.clusters import ClusterObjects
+from chip.clusters import Objects as GeneratedObjects  # noqa: F401
+from chip.clusters.Command import CommandPath, FindCommandClusterObject
+
+
+def _reflective_find(isClientSideCommand: bool, path: CommandPath):
+    # FindCommandClusterObject from before the lookup used the command registries, kept here as the baseline.
+    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
+        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
+            for objName, subclass in inspect.getmembers(obj):
+                if inspect.isclass(subclass) and (('Commands') in str(subclass)):
+                    for commandName, command in inspect.getmembers(subclass):
+                        if inspect.isclass(command):
+                            for name, field in inspect.getmembers(command):
+                                if ('__dataclass_fields__' in name):
+                                    if (field['cluster_id'].default == path.ClusterId) and (field['command_id'].default ==
+                                                                                            path.CommandId) and (field['is_client'].default == isClientSideCommand):
+                                        return eval('GeneratedObjects.' + clusterName + '.Commands.' + commandName)
+    return None
+
+
+def _time(fn, paths, iterations):
+    best = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        for path in paths:
+            fn(False, path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(paths) * 1e6
+
+
+def main(iterations: int = 3):
+    responses = [command for commands in ClusterObjects.ALL_GENERATED_COMMANDS.values() for command in commands.values()]
+    paths = [CommandPath(EndpointId=1, ClusterId=c.cluster_id, CommandId=c.command_id) for c in responses]
+
+    for path in paths:
+        if _reflective_find(False, path) is not FindCommandClusterObject(False, path):
+            raise AssertionError(f"Lookups differ for {path}")
+
+    reflective = _time(_reflective_find, paths, iterations)
+    registry = _time(FindCommandClusterObject, paths, iterations * 1000)
+    print(f"{'FindCommandClusterObject':<40} {'reflective (us)':>18} {'registry (us)':>18} {'Speedup':>10}")
+    print(f"{f'{len(paths)} responses':<40} {reflective:>18.1f} {registry:>18.3f} {reflective / registry:>9.0f}x")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
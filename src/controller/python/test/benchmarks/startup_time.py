@@ -0,0 +1,116 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+'''
+Measures the time spent importing chip.clusters, with and without lazy loading
+of the cluster objects, and the time spent building the attribute, cluster and
+event indexes of chip.clusters.Attribute from the generated ObjectsIndex
+compared with the previous reflection (inspect + eval) based implementation.
+
+Usage: python3 startup_time.py [iterations]
+'''
+
+import inspect
+import os
+import subprocess
+import sys
+import time
+
+_IMPORT_SCRIPT = '''
+import time
+start = time.perf_counter()
+import chip.clusters
+print(time.perf_counter() - start)
+'''
+
+
+def _import_time(lazy: bool, iterations: int) -> float:
+    env = dict(os.environ, CHIP_LAZY_CLUSTER_OBJECTS='1' if lazy else '0')
+    return min(float(subprocess.run([sys.executable, '-c', _IMPORT_SCRIPT], env=env, check=True,
+                                    capture_output=True, text=True).stdout) for _ in range(iterations))
+
+
+def _reflective_index():
+    # The index build from before ObjectsIndex was generated, kept here as the baseline.
+    from chip.clusters import Objects as GeneratedObjects  # noqa: F401
+    from chip.clusters.Attribute import EventPath
+
+    attributeIndex = {}
+    clusterIndex = {}
+    eventIndex = {}
+    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
+        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
+            for objName, subclass in inspect.getmembers(obj):
+                if inspect.isclass(subclass) and (('Attributes') in str(subclass)):
+                    for attributeName, attribute in inspect.getmembers(subclass):
+                        if inspect.isclass(attribute):
+                            if [value for value in inspect.getmro(attribute) if 'ClusterAttributeDescriptor' in str(value)]:
+                                attributeIndex[(attribute.cluster_id, attribute.attribute_id)] = (eval(
+                                    'GeneratedObjects.' + clusterName + '.Attributes.' + attributeName), obj)
+    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
+        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj) and issubclass(obj, GeneratedObjects.Cluster):
+            clusterIndex[obj.id] = obj
+    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
+        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
+            for objName, subclass in inspect.getmembers(obj):
+                if inspect.isclass(subclass) and (('Events' == objName)):
+                    for eventName, event in inspect.getmembers(subclass):
+                        if inspect.isclass(event):
+                            if [value for value in inspect.getmro(event) if 'ClusterEvent' in str(value)]:
+                                eventIndex[str(EventPath(ClusterId=event.cluster_id, EventId=event.event_id))] = eval(
+                                    'GeneratedObjects.' + clusterName + '.Events.' + eventName)
+    return attributeIndex, clusterIndex, eventIndex
+
+
+def _generated_index():
+    from chip.clusters import Attribute
+
+    Attribute._AttributeIndex.clear()
+    Attribute._ClusterIndex.clear()
+    Attribute._EventIndex.clear()
+    Attribute._BuildClusterIndex()
+    Attribute._BuildAttributeIndex()
+    Attribute._BuildEventIndex()
+    return Attribute._AttributeIndex, Attribute._ClusterIndex, Attribute._EventIndex
+
+
+def _time(fn, iterations):
+    best = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e3
+
+
+def main(iterations: int = 5):
+    regular = _import_time(False, iterations) * 1e3
+    lazy = _import_time(True, iterations) * 1e3
+    print(f"{'import chip.clusters':<40} {'regular (ms)':>18} {'lazy (ms)':>18}")
+    print(f"{'':<40} {regular:>18.1f} {lazy:>18.1f}")
+
+    if _reflective_index() != _generated_index():
+        raise AssertionError("Indexes built from ObjectsIndex differ from the reflective ones")
+
+    reflective = _time(_reflective_index, iterations)
+    generated = _time(_generated_index, iterations)
+    print(f"{'Attribute.Init() indexes':<40} {'reflective (ms)':>18} {'ObjectsIndex (ms)':>18} {'Speedup':>8}")
+    print(f"{'':<40} {reflective:>18.1f} {generated:>18.1f} {reflective / generated:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,171 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+'''
+Runs the YAML tests of src/app/tests/suites through the chip-repl runner without a device: every step is
+encoded, and a default response object is decoded for each command and attribute the steps use. The name
+lookups and response conversions are timed with the indexed case_insensitive_getattr and with the previous
+implementation scanning dir() for every lookup.
+
+Usage: python3 yaml_data_model_lookup.py [iterations]
+'''
+
+import glob
+import logging
+import os
+import sys
+import time
+import typing
+from types import SimpleNamespace
+from unittest import mock
+
+# ensure matter IDL and yamltests are available for import, otherwise set relative paths
+try:
+    import matter_yamltests  # noqa: F401
+except ImportError:
+    SCRIPTS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../scripts'))
+    sys.path.append(os.path.join(SCRIPTS_PATH, 'py_matter_idl'))
+    sys.path.append(os.path.join(SCRIPTS_PATH, 'py_matter_yamltests'))
+
+from chip.clusters import ClusterObjects  # noqa: E402
+from chip.yaml import data_model_lookup, format_converter  # noqa: E402
+from chip.yaml.data_model_lookup import PreDefinedDataModelLookup  # noqa: E402
+from chip.yaml.runner import ReplTestRunner  # noqa: E402
+from matter_yamltests.definitions import SpecDefinitionsFromPaths  # noqa: E402
+from matter_yamltests.parser import TestParser, TestParserConfig  # noqa: E402
+
+_CHIP_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../..'))
+_SUITES_PATH = os.path.join(_CHIP_ROOT, 'src/app/tests/suites')
+_CLUSTER_XML_PATH = os.path.join(_CHIP_ROOT, 'src/app/zap-templates/zcl/data-model/chip/*.xml')
+
+
+def _dir_scan_getattr(object, attr_name, default):
+    # case_insensitive_getattr from before the lookups were indexed, kept here as the baseline.
+    for attr in dir(object):
+        if attr.lower() == attr_name.lower():
+            return getattr(object, attr)
+    return default
+
+
+class _RecordingDataModelLookup(PreDefinedDataModelLookup):
+    def __init__(self):
+        self.calls = []
+
+    def get_cluster(self, cluster):
+        self.calls.append(('get_cluster', (cluster,)))
+        return super().get_cluster(cluster)
+
+    def get_command(self, cluster, command):
+        self.calls.append(('get_command', (cluster, command)))
+        return super().get_command(cluster, command)
+
+    def get_attribute(self, cluster, attribute):
+        self.calls.append(('get_attribute', (cluster, attribute)))
+        return super().get_attribute(cluster, attribute)
+
+    def get_event(self, cluster, event):
+        self.calls.append(('get_event', (cluster, event)))
+        return super().get_event(cluster, event)
+
+
+def _default_value(field_type):
+    if typing.get_origin(field_type) is list:
+        element = typing.get_args(field_type)[0]
+        return [element()] if isinstance(element, type) and issubclass(element, ClusterObjects.ClusterObject) else None
+    if isinstance(field_type, type) and issubclass(field_type, ClusterObjects.ClusterObject):
+        return field_type()
+    return None
+
+
+def _responses(lookup, calls):
+    # Default response objects for the commands and struct attributes looked up, as the runner decodes them.
+    responses = []
+    for name, args in calls:
+        if name == 'get_command':
+            command = lookup.get_command(*args)
+            if command is not None and command.response_type:
+                response = lookup.get_command(args[0], command.response_type)
+                if response is not None:
+                    responses.append(response())
+        elif name == 'get_attribute':
+            attribute = lookup.get_attribute(*args)
+            if attribute is not None and attribute.attribute_type is not None:
+                value = _default_value(attribute.attribute_type.Type)
+                if value is not None:
+                    responses.append(SimpleNamespace(cluster_id=attribute.cluster_id, attribute_id=attribute.attribute_id,
+                                                     value=value))
+    return responses
+
+
+def _load_corpus(definitions):
+    runner = ReplTestRunner(definitions, None, None)
+    lookup = _RecordingDataModelLookup()
+    runner._context.data_model_lookup = lookup
+    files = steps = 0
+    for path in sorted(glob.glob(os.path.join(_SUITES_PATH, '**', '*.yaml'), recursive=True)):
+        try:
+            for test_step in TestParser(path, TestParserConfig(None, definitions)).tests:
+                steps += 1
+                try:
+                    runner.encode(test_step)
+                except Exception as ex:
+                    # Steps using values saved from responses cannot always be encoded without a device.
+                    logging.debug(f'Failed to encode {test_step.label} of {path}: {ex}')
+        except Exception as ex:
+            logging.debug(f'Skipping the rest of {path}: {ex}')
+        files += 1
+    return runner, lookup.calls, files, steps
+
+
+def _run(runner, lookup, calls, responses):
+    for name, args in calls:
+        getattr(lookup, name)(*args)
+    return [runner.decode(SimpleNamespace(response=response)) for response in responses]
+
+
+def _time(runner, lookup, calls, responses, iterations):
+    best = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        _run(runner, lookup, calls, responses)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e3
+
+
+def main(iterations: int = 3):
+    logging.disable(logging.WARNING)
+    definitions = SpecDefinitionsFromPaths([_CLUSTER_XML_PATH])
+    runner, calls, files, steps = _load_corpus(definitions)
+    lookup = PreDefinedDataModelLookup()
+    responses = _responses(lookup, calls)
+
+    with mock.patch.object(data_model_lookup, 'case_insensitive_getattr', _dir_scan_getattr), \
+            mock.patch.object(format_converter, 'case_insensitive_getattr', _dir_scan_getattr):
+        expected = _run(runner, lookup, calls, responses)
+        scan = _time(runner, lookup, calls, responses, iterations)
+
+    if _run(runner, lookup, calls, responses) != expected:
+        raise AssertionError("Decoded responses differ")
+    indexed = _time(runner, lookup, calls, responses, iterations)
+
+    print(f"{files} files, {steps} steps, {len(calls)} lookups, {len(responses)} responses decoded")
+    print(f"{'':<24} {'dir() scan (ms)':>18} {'indexed (ms)':>18} {'Speedup':>10}")
+    print(f"{'suites corpus':<24} {scan:>18.1f} {indexed:>18.1f} {scan / indexed:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
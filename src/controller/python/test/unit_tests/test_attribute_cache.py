@@ -0,0 +1,136 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import unittest
+
+import chip.clusters as Clusters
+from chip.clusters import Attribute
+from chip.clusters.Attribute import AsyncReadTransaction, AttributeCache, AttributePath, DataVersion, ValueDecodeFailure
+from chip.interaction_model import Status
+from chip.tlv import TLVWriter, uint
+
+'''
+This file tests the incremental updates of the AttributeCache, which is filled from read/subscribe reports.
+'''
+
+_ENDPOINT = 1
+_ON_OFF = Clusters.OnOff.Attributes.OnOff
+_ON_TIME = Clusters.OnOff.Attributes.OnTime
+_OFF_WAIT_TIME = Clusters.OnOff.Attributes.OffWaitTime
+
+
+def _path(attribute) -> AttributePath:
+    return AttributePath(EndpointId=_ENDPOINT, ClusterId=attribute.cluster_id, AttributeId=attribute.attribute_id)
+
+
+class TestAttributeCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Attribute.Init() needs the native library, only build the indexes it would build.
+        Attribute._BuildClusterIndex()
+        Attribute._BuildAttributeIndex()
+
+    def _full_decode(self, cache: AttributeCache):
+        fresh = AttributeCache(returnClusterObject=True)
+        for clusterId, attributes in cache.attributeTLVCache[_ENDPOINT].items():
+            for attributeId, value in attributes.items():
+                fresh.UpdateTLV(AttributePath(EndpointId=_ENDPOINT, ClusterId=clusterId, AttributeId=attributeId),
+                                cache.versionList[_ENDPOINT][clusterId], value)
+        return fresh.GetUpdatedAttributeCache()[_ENDPOINT][Clusters.OnOff]
+
+    def test_cluster_view_patched_in_place(self):
+        cache = AttributeCache(returnClusterObject=True)
+        cache.UpdateTLV(_path(_ON_OFF), 1, True)
+        cache.UpdateTLV(_path(_ON_TIME), 1, uint(5))
+        onOff = cache.GetUpdatedAttributeCache()[_ENDPOINT][Clusters.OnOff]
+        self.assertEqual(onOff.onOff, True)
+        self.assertEqual(onOff.onTime, 5)
+        self.assertEqual(onOff.data_version, 1)
+
+        cache.UpdateTLV(_path(_ON_TIME), 2, uint(7))
+        cache.UpdateTLV(_path(_OFF_WAIT_TIME), 2, uint(3))
+        patched = cache.GetUpdatedAttributeCache()[_ENDPOINT][Clusters.OnOff]
+        self.assertIs(patched, onOff)
+        self.assertEqual(patched.onOff, True)
+        self.assertEqual(patched.onTime, 7)
+        self.assertEqual(patched.offWaitTime, 3)
+        self.assertEqual(patched.data_version, 2)
+        self.assertEqual(patched, self._full_decode(cache))
+
+    def test_cluster_view_decode_failure(self):
+        cache = AttributeCache(returnClusterObject=True)
+        cache.UpdateTLV(_path(_ON_OFF), 1, True)
+        onOff = cache.GetUpdatedAttributeCache()[_ENDPOINT][Clusters.OnOff]
+
+        cache.UpdateTLV(_path(_ON_TIME), 2, 'not a number')
+        self.assertIsInstance(cache.GetUpdatedAttributeCache()[_ENDPOINT][Clusters.OnOff], ValueDecodeFailure)
+
+        cache.UpdateTLV(_path(_ON_TIME), 3, uint(7))
+        recovered = cache.GetUpdatedAttributeCache()[_ENDPOINT][Clusters.OnOff]
+        self.assertIsNot(recovered, onOff)
+        self.assertEqual(recovered.onOff, True)
+        self.assertEqual(recovered.onTime, 7)
+
+    def test_attribute_view(self):
+        cache = AttributeCache()
+        cache.UpdateTLV(_path(_ON_OFF), 1, True)
+        cache.UpdateTLV(_path(_ON_TIME), 1, uint(5))
+        self.assertEqual(cache.GetUpdatedAttributeCache()[_ENDPOINT][Clusters.OnOff],
+                         {DataVersion: 1, _ON_OFF: True, _ON_TIME: 5})
+
+        cache.UpdateTLV(_path(_ON_TIME), 2, uint(7))
+        self.assertEqual(cache.GetUpdatedAttributeCache()[_ENDPOINT][Clusters.OnOff],
+                         {DataVersion: 2, _ON_OFF: True, _ON_TIME: 7})
+
+    def test_unchanged_data_version(self):
+        cache = AttributeCache()
+        self.assertFalse(cache.IsUnchanged(_path(_ON_OFF), 1))
+        cache.UpdateTLV(_path(_ON_OFF), 1, True)
+        self.assertTrue(cache.IsUnchanged(_path(_ON_OFF), 1))
+        self.assertFalse(cache.IsUnchanged(_path(_ON_OFF), 2))
+        self.assertFalse(cache.IsUnchanged(_path(_ON_TIME), 1))
+
+        cache.UpdateTLV(_path(_ON_OFF), 2, ValueDecodeFailure(None, None))
+        self.assertFalse(cache.IsUnchanged(_path(_ON_OFF), 2))
+
+        # Data reported without a data version always replaces the cached data.
+        cache.UpdateTLV(_path(_ON_TIME), None, uint(5))
+        self.assertFalse(cache.IsUnchanged(_path(_ON_TIME), None))
+        cache.UpdateTLV(_path(_ON_TIME), 0, uint(5))
+        cache.UpdateTLV(_path(_ON_TIME), None, uint(6))
+        self.assertFalse(cache.IsUnchanged(_path(_ON_TIME), 0))
+
+    def test_report_with_unchanged_data_version_is_not_decoded(self):
+        transaction = AsyncReadTransaction(None, None, None, returnClusterObject=False)
+        writer = TLVWriter()
+        writer.put(None, True)
+        transaction.handleAttributeData(_path(_ON_OFF), 1, Status.Success, bytes(writer.encoding))
+        self.assertEqual(transaction._cache.attributeTLVCache[_ENDPOINT][Clusters.OnOff.id][_ON_OFF.attribute_id], True)
+
+        # Same data version, the data (which would not even decode) is ignored.
+        transaction.handleAttributeData(_path(_ON_OFF), 1, Status.Success, b'\xff')
+        self.assertEqual(transaction._cache.attributeTLVCache[_ENDPOINT][Clusters.OnOff.id][_ON_OFF.attribute_id], True)
+        self.assertEqual(transaction._changedPathSet, {_path(_ON_OFF)})
+
+        writer = TLVWriter()
+        writer.put(None, False)
+        transaction.handleAttributeData(_path(_ON_OFF), 2, Status.Success, bytes(writer.encoding))
+        self.assertEqual(transaction._cache.attributeTLVCache[_ENDPOINT][Clusters.OnOff.id][_ON_OFF.attribute_id], False)
+
+
+if __name__ == '__main__':
+    unittest.main()
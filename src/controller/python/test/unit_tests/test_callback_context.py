@@ -0,0 +1,106 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import threading
+import unittest
+
+from chip.ChipDeviceCtrl import CallbackContext, ShardedCallbackContext
+
+'''
+This file tests the callback contexts serializing operations that complete through a callback, with the
+callbacks called from another thread like the Matter thread does.
+'''
+
+
+def _complete_later(getFuture, result, delay=0.02):
+    timer = threading.Timer(delay, lambda: getFuture().set_result(result))
+    timer.start()
+    return timer
+
+
+class TestCallbackContext(unittest.IsolatedAsyncioTestCase):
+    async def test_contention(self):
+        context = CallbackContext(asyncio.Lock())
+        order = []
+
+        async def operation(name):
+            async with context as ctx:
+                order.append(name)
+                _complete_later(lambda: context.future, name)
+                return await asyncio.wrap_future(ctx.future)
+
+        self.assertEqual(await asyncio.gather(*(operation(n) for n in range(3))), [0, 1, 2])
+        self.assertEqual(order, [0, 1, 2])
+        self.assertEqual((context.stats.acquisitions, context.stats.contended, context.stats.maxWaiting), (3, 2, 2))
+        self.assertEqual(context.stats.waiting, 0)
+        self.assertGreater(context.stats.maxWaitSec, 0.01)
+        self.assertIsNone(context.future)
+
+
+class TestShardedCallbackContext(unittest.IsolatedAsyncioTestCase):
+    async def test_shards(self):
+        context = ShardedCallbackContext()
+        inFlight = []
+
+        async def operation(nodeId, result):
+            async with context.Shard(nodeId) as ctx:
+                inFlight.append(context.inFlight)
+                _complete_later(lambda: context.GetFuture(nodeId), result)
+                return await asyncio.wrap_future(ctx.future)
+
+        results = await asyncio.gather(operation(1, 'a'), operation(2, 'b'), operation(1, 'c'), operation(3, 'd'))
+        self.assertEqual(results, ['a', 'b', 'c', 'd'])
+
+        # Nodes 1, 2 and 3 were in flight at once, the second operation on node 1 waited for the first.
+        self.assertEqual(max(inFlight), 3)
+        self.assertEqual((context.stats.acquisitions, context.stats.contended), (4, 1))
+        self.assertEqual(context.inFlight, 0)
+        self.assertIsNone(context.GetFuture(1))
+
+    async def test_failed_operation(self):
+        context = ShardedCallbackContext()
+        with self.assertRaises(RuntimeError):
+            async with context.Shard(1) as ctx:
+                future = ctx.future
+                raise RuntimeError("The operation could not be started")
+        self.assertTrue(future.cancelled())
+        self.assertEqual(context.inFlight, 0)
+
+    async def test_cancelled_waiter(self):
+        context = ShardedCallbackContext()
+        shard = context.Shard(1)
+        await shard.__aenter__()
+
+        async def waiter():
+            async with context.Shard(1):
+                pass
+
+        task = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(context.inFlight, 1)
+
+        await shard.__aexit__(None, None, None)
+        self.assertEqual(context.inFlight, 0)
+        self.assertEqual(context.stats.waiting, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
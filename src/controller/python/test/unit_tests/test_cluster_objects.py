@@ -1,6 +1,6 @@
 import typing
 import unittest
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 import chip.ChipUtility
 from chip.clusters import ClusterObjects
@@ -258,5 +258,48 @@ class TestAttributeDescriptor(unittest.TestCase):
         self.assertEqual(res, [1, 2, 3, 4, 5])
 
 
+class TestClusterObjectCodec(unittest.TestCase):
+    def test_codec_is_cached(self):
+        self.assertIs(ClusterObjects.GetClusterObjectCodec(TestClusterObjects.C),
+                      ClusterObjects.GetClusterObjectCodec(TestClusterObjects.C))
+
+    def test_matches_descriptor(self):
+        C = TestClusterObjects.C
+        SWA = TestClusterObjects.StructWithArray
+        SWAOSWA = TestClusterObjects.StructWithArrayOfStructWithArray
+        data = asdict(SWAOSWA(
+            X=['test-str1', 'test-str2'],
+            Y=[C(X=12, Y=34), C(X=56, Y=78)],
+            Z=[SWA(X=[12, 34], Y=5678)],
+            W=[SWAOSWA(X=['test-str4'], Y=[C(X=55, Y=66)], Z=[SWA(X=[123], Y=456)], W=[])]))
+
+        codec = ClusterObjects.GetClusterObjectCodec(SWAOSWA)
+        encoded = codec.DictToTLV(data)
+        self.assertEqual(encoded, SWAOSWA.descriptor.DictToTLV(data))
+
+        tagDict = TLVReader(encoded).get()['Any']
+        tagDict[99] = 'unknown'
+        self.assertEqual(codec.TagDictToLabelDict('', tagDict),
+                         SWAOSWA.descriptor.TagDictToLabelDict('', tagDict))
+
+    def test_errors_match_descriptor(self):
+        codec = ClusterObjects.GetClusterObjectCodec(TestClusterObjects.StructWithEmbeddedStructAndString)
+        descriptor = TestClusterObjects.StructWithEmbeddedStructAndString.descriptor
+
+        for data in [{'X': 'a', 'Y': 5, 'Z': b''}, {'X': 'a', 'Y': {'X': 1, 'Y': 2}, 'Z': None}]:
+            with self.assertRaises(ValueError) as expected:
+                descriptor.DictToTLV(data)
+            with self.assertRaises(ValueError) as actual:
+                codec.DictToTLV(data)
+            self.assertEqual(str(actual.exception), str(expected.exception))
+
+        for tagDict in [{0: 'a', 1: 5}, {0: 5}]:
+            with self.assertRaises(ValueError) as expected:
+                descriptor.TagDictToLabelDict('', tagDict)
+            with self.assertRaises(ValueError) as actual:
+                codec.TagDictToLabelDict('', tagDict)
+            self.assertEqual(str(actual.exception), str(expected.exception))
+
+
 if __name__ == '__main__':
     unittest.main()
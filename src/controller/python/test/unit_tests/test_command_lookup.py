@@ -0,0 +1,71 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+import chip.clusters as Clusters
+from chip.clusters import ClusterObjects
+from chip.clusters.Command import CommandPath, FindCommandClusterObject
+
+'''
+This file checks that FindCommandClusterObject finds every generated command, including for clusters
+that have not been loaded yet when lazy loading is enabled.
+'''
+
+
+def _path(command) -> CommandPath:
+    return CommandPath(EndpointId=1, ClusterId=command.cluster_id, CommandId=command.command_id)
+
+
+class TestFindCommandClusterObject(unittest.TestCase):
+    def test_all_generated_commands(self):
+        count = 0
+        for cluster in ClusterObjects.ALL_CLUSTERS.values():
+            for command in vars(getattr(cluster, 'Commands', object)).values():
+                if isinstance(command, type) and issubclass(command, ClusterObjects.ClusterCommand):
+                    self.assertIs(FindCommandClusterObject(command.is_client, _path(command)), command)
+                    count += 1
+        self.assertGreater(count, 0)
+
+    def test_direction(self):
+        response = Clusters.GeneralCommissioning.Commands.ArmFailSafeResponse
+        self.assertIs(FindCommandClusterObject(False, _path(response)), response)
+        self.assertIsNone(FindCommandClusterObject(True, _path(response)))
+
+    def test_unknown(self):
+        self.assertIsNone(FindCommandClusterObject(False, CommandPath(EndpointId=1, ClusterId=0xFFF1FC99, CommandId=0)))
+        self.assertIsNone(FindCommandClusterObject(False, CommandPath(EndpointId=1, ClusterId=Clusters.OnOff.id,
+                                                                      CommandId=0xFE)))
+
+    def test_lazy_objects(self):
+        env = dict(os.environ, CHIP_LAZY_CLUSTER_OBJECTS='1')
+        out = subprocess.run([sys.executable, '-c', textwrap.dedent('''
+            from chip.clusters import ClusterObjects
+            from chip.clusters.Command import CommandPath, FindCommandClusterObject
+
+            print(len(ClusterObjects.ALL_CLUSTERS))
+            print(FindCommandClusterObject(False, CommandPath(EndpointId=0, ClusterId=0x30, CommandId=1)).__qualname__)
+        ''')], env=env, check=True, capture_output=True, text=True).stdout.splitlines()
+        self.assertEqual(out, ['0', 'GeneralCommissioning.Commands.ArmFailSafeResponse'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import unittest
+
+from chip.discovery import AggregatedDiscoveryResults, DiscoveryManager, NodeAddress, PeerId, PendingDiscovery
+
+'''
+This file tests the asyncio discovery manager, with the native resolver replaced by one that answers
+for a configurable set of peers after a delay.
+'''
+
+_FABRIC = 0x1234
+
+
+class _FakeResolverManager(DiscoveryManager):
+    def __init__(self, loop, answers, delay=0.01, **kwargs):
+        super().__init__(loop, **kwargs)
+        self.answers = answers
+        self.delay = delay
+        self.resolves = []
+
+    def _StartResolve(self, peerId):
+        self.resolves.append(peerId)
+        for address in self.answers.get(peerId, []):
+            self.loop.call_later(self.delay, self.OnSuccess, peerId, address)
+
+
+def _address(n: int) -> NodeAddress:
+    return NodeAddress(interface=1, ip=f'fd00::{n:x}'.encode(), port=5540)
+
+
+class TestDiscoveryManager(unittest.IsolatedAsyncioTestCase):
+    async def test_find_addresses(self):
+        peers = [PeerId(_FABRIC, n) for n in range(1, 1001)]
+        answers = {peer: [_address(peer.nodeId)] for peer in peers[:-1]}
+        manager = _FakeResolverManager(asyncio.get_running_loop(), answers)
+
+        # Starting 1000 resolutions takes a while on the debug event loop of the test, the timeout leaves them time
+        # to be answered. The last peer does not answer and times out without addresses.
+        results, unanswered = await asyncio.gather(manager.FindAddresses(peers[:-1], timeoutMs=2000),
+                                                   manager.FindAddresses(peers[-1:], timeoutMs=50))
+        self.assertEqual(list(results), peers[:-1])
+        for peer in peers[:-1]:
+            self.assertEqual(results[peer].addresses, {_address(peer.nodeId)})
+        self.assertEqual(unanswered[peers[-1]].addresses, set())
+
+    async def test_shared_resolution(self):
+        peer = PeerId(_FABRIC, 1)
+        manager = _FakeResolverManager(asyncio.get_running_loop(), {peer: [_address(1), _address(2)]})
+
+        first, second = await asyncio.gather(manager.FindAddresses([peer], useCache=False),
+                                             manager.FindAddresses([peer], useCache=False))
+        self.assertEqual(manager.resolves, [peer])
+        self.assertEqual(first[peer].addresses, {_address(1), _address(2)})
+        self.assertEqual(second[peer].addresses, first[peer].addresses)
+
+    def test_pending_discovery(self):
+        callbacks = [lambda result: None, lambda result: None]
+        item = PendingDiscovery(AggregatedDiscoveryResults(PeerId(_FABRIC, 1), set()), callbacks[0], expireTime=1.0,
+                                firstResultTime=0)
+        item.otherCallbacks.append(callbacks[1])
+        self.assertIs(item.callback, callbacks[0])
+        self.assertEqual(item.callbacks, callbacks)
+
+    async def test_callbacks_run_on_loop(self):
+        peer = PeerId(_FABRIC, 1)
+        loop = asyncio.get_running_loop()
+        manager = _FakeResolverManager(loop, {peer: [_address(1)]})
+        done = loop.create_future()
+
+        def callback(result):
+            done.set_result((asyncio.get_running_loop(), result))
+
+        manager.Start(peer, callback, timeoutMs=200)
+        callbackLoop, result = await done
+        self.assertIs(callbackLoop, loop)
+        self.assertEqual(result.addresses, {_address(1)})
+
+    async def test_cache(self):
+        peer = PeerId(_FABRIC, 1)
+        manager = _FakeResolverManager(asyncio.get_running_loop(), {peer: [_address(1)]}, cacheTtlSec=0.1)
+
+        await manager.FindAddresses([peer], useCache=True)
+        results = await manager.FindAddresses([peer], useCache=True)
+        self.assertEqual(results[peer].addresses, {_address(1)})
+        self.assertEqual(len(manager.resolves), 1)
+
+        # The cache is opt-in.
+        await manager.FindAddresses([peer])
+        self.assertEqual(len(manager.resolves), 2)
+
+        # Records withdrawn by the node evict the cached addresses.
+        manager.OnSuccess(peer, _address(1), hasZeroTTL=True)
+        self.assertIsNone(manager.GetCached(peer))
+        await manager.FindAddresses([peer], useCache=True)
+        self.assertEqual(len(manager.resolves), 3)
+
+        await asyncio.sleep(0.15)
+        self.assertIsNone(manager.GetCached(peer))
+        await manager.FindAddresses([peer], useCache=True)
+        self.assertEqual(len(manager.resolves), 4)
+
+        # Failed resolutions are not cached.
+        unknown = PeerId(_FABRIC, 2)
+        await manager.FindAddresses([unknown], timeoutMs=10, useCache=True)
+        self.assertIsNone(manager.GetCached(unknown))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import copy
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import chip.clusters as Clusters
+from chip.ChipDeviceCtrl import ChipDeviceControllerBase
+from chip.clusters import Attribute
+from chip.clusters.Attribute import AsyncReadTransaction, EventPath, EventPriority, EventTimestampType
+from chip.clusters.EventNumberCursor import EventNumberCursor
+from chip.interaction_model import Status
+
+'''
+This file tests the event number cursor and the dropping of duplicate events, with the interaction of the device
+controller replaced by a fake that reports the events it is given.
+'''
+
+_FABRIC = 0x1234
+_BASIC_INFORMATION = [EventPath(EndpointId=0, ClusterId=Clusters.BasicInformation.id)]
+_ALL_EVENTS = [EventPath()]
+
+
+class _FakeStorage:
+    def __init__(self):
+        self.replConfig = {}
+
+    def SetReplKey(self, key, value):
+        # Stored as JSON, which copies the value.
+        self.replConfig[key] = copy.deepcopy(value)
+
+    def GetReplKey(self, key):
+        return copy.deepcopy(self.replConfig.get(key))
+
+
+def _StartUp(number: int, priority: EventPriority = EventPriority.CRITICAL) -> bytes:
+    data = Clusters.BasicInformation.Events.StartUp(softwareVersion=3).ToTLV()
+    return Attribute._EventReportRecord.pack(Attribute._REPORT_RECORD_EVENT_DATA, 0, Clusters.BasicInformation.id,
+                                             Clusters.BasicInformation.Events.StartUp.event_id, number, priority.value, 1234,
+                                             EventTimestampType.EPOCH.value, Status.Success, len(data)) + data
+
+
+class _FakeController(ChipDeviceControllerBase):
+    def __init__(self):
+        self._isActive = False
+        self._persistentAttributeCache = None
+        self._eventNumberCursor = None
+        self.reads = []
+        # The report data each interaction receives.
+        self.reports = []
+
+    def GetCompressedFabricId(self):
+        return _FABRIC
+
+    def _Read(self, transaction, eventNumberFilter=None, subscriptionParameters=None, **kwargs):
+        self.reads.append(eventNumberFilter)
+        for report in self.reports.pop(0):
+            transaction.handleReportData(report)
+            transaction._handleReportEnd()
+        transaction._future.set_result(transaction)
+        return SimpleNamespace(raise_on_error=lambda: None)
+
+    async def Subscribe(self, events, **kwargs):
+        with mock.patch.object(Attribute, 'Read', self._Read):
+            return await self._ReadWithDevice(SimpleNamespace(deviceProxy=None), 1, events=events, reportInterval=(0, 10),
+                                              **kwargs)
+
+
+class TestEventNumberCursor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Attribute.Init() needs the native library, only build the indexes it would build.
+        Attribute._BuildClusterIndex()
+        Attribute._BuildAttributeIndex()
+        Attribute._BuildEventIndex()
+
+    def test_duplicate_events(self):
+        transaction = AsyncReadTransaction(None, None, None, False)
+        transaction.handleReportData(_StartUp(5) + _StartUp(6) + _StartUp(5))
+        transaction.handleReportData(_StartUp(6) + _StartUp(7))
+        self.assertEqual([event.Header.EventNumber for event in transaction.GetAllEventValues()], [5, 6, 7])
+        self.assertEqual(transaction.duplicateEvents, 2)
+
+    def test_cursor(self):
+        storage = _FakeStorage()
+        cursor = EventNumberCursor(storage)
+        stream = cursor.BeginSubscription(_FABRIC, 1, _BASIC_INFORMATION)
+        self.assertIsNone(stream.EventNumberFilter())
+
+        stream.Record(EventPriority.INFO, 9)
+        stream.Record(EventPriority.CRITICAL, 4)
+        stream.Record(EventPriority.INFO, 8)
+        self.assertIsNone(stream.EventNumberFilter())
+        stream.Commit()
+        self.assertEqual(stream.EventNumberFilter(), 10)
+        self.assertEqual(cursor.GetHighestEventNumbers(_FABRIC, 1, _BASIC_INFORMATION),
+                         {EventPriority.INFO: 9, EventPriority.CRITICAL: 4})
+
+        # Other event paths, nodes and fabrics have their own cursors.
+        self.assertIsNone(cursor.BeginSubscription(_FABRIC, 1, _ALL_EVENTS).EventNumberFilter())
+        self.assertIsNone(cursor.BeginSubscription(_FABRIC, 2, _BASIC_INFORMATION).EventNumberFilter())
+        self.assertIsNone(cursor.BeginSubscription(_FABRIC + 1, 1, _BASIC_INFORMATION).EventNumberFilter())
+        # Urgency does not change the events subscribed to.
+        urgent = [EventPath(EndpointId=0, ClusterId=Clusters.BasicInformation.id, Urgent=1)]
+        self.assertEqual(cursor.BeginSubscription(_FABRIC, 1, urgent).EventNumberFilter(), 10)
+
+        # The cursor is kept in the storage, once the delayed write happened.
+        self.assertEqual(storage.replConfig, {})
+        cursor.Flush()
+        restored = EventNumberCursor(storage)
+        self.assertEqual(restored.BeginSubscription(_FABRIC, 1, _BASIC_INFORMATION).EventNumberFilter(), 10)
+        restored.Clear(_FABRIC, 1)
+        self.assertIsNone(EventNumberCursor(storage).BeginSubscription(_FABRIC, 1, _BASIC_INFORMATION).EventNumberFilter())
+
+    def test_delayed_store(self):
+        storage = _FakeStorage()
+        cursor = EventNumberCursor(storage, storeDelaySec=0.05)
+        stream = cursor.BeginSubscription(_FABRIC, 1, _BASIC_INFORMATION)
+
+        # A burst of reports results in a single write.
+        with mock.patch.object(storage, 'SetReplKey', wraps=storage.SetReplKey) as setReplKey:
+            for number in range(100):
+                stream.Record(EventPriority.INFO, number)
+                stream.Commit()
+            self.assertEqual(setReplKey.call_count, 0)
+            time.sleep(0.2)
+            self.assertEqual(setReplKey.call_count, 1)
+        self.assertEqual(EventNumberCursor(storage).BeginSubscription(_FABRIC, 1, _BASIC_INFORMATION).EventNumberFilter(), 100)
+
+
+class TestSubscriptionResume(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        Attribute._BuildClusterIndex()
+        Attribute._BuildAttributeIndex()
+        Attribute._BuildEventIndex()
+
+    async def test_resume(self):
+        devCtrl = _FakeController()
+        storage = _FakeStorage()
+        cursor = EventNumberCursor(storage)
+        devCtrl.SetEventNumberCursor(cursor)
+
+        devCtrl.reports = [[_StartUp(3, EventPriority.INFO), _StartUp(4)]]
+        response = await devCtrl.Subscribe([(0, Clusters.BasicInformation, 0)])
+        self.assertEqual(len(response.events), 2)
+
+        # After a restart, which flushes the cursor, the subscription asks for the events after the last one received.
+        cursor.Flush()
+        devCtrl.SetEventNumberCursor(EventNumberCursor(storage))
+        devCtrl.reports = [[_StartUp(5)]]
+        await devCtrl.Subscribe([(0, Clusters.BasicInformation, 0)])
+        devCtrl.reports = [[]]
+        await devCtrl.Subscribe([(0, Clusters.BasicInformation, 0)], eventNumberFilter=1)
+        self.assertEqual(devCtrl.reads, [None, 5, 1])
+
+        # Without a cursor, nothing is filtered.
+        devCtrl.SetEventNumberCursor(None)
+        devCtrl.reports = [[]]
+        await devCtrl.Subscribe([(0, Clusters.BasicInformation, 0)])
+        self.assertEqual(devCtrl.reads[-1], None)
+
+
+if __name__ == '__main__':
+    unittest.main()
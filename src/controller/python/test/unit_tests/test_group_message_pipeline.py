@@ -0,0 +1,145 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import time
+import unittest
+
+import chip.clusters as Clusters
+from chip.ChipDeviceCtrl import ChipDeviceControllerBase
+from chip.clusters.Attribute import EncodedGroupWrite
+from chip.clusters.Command import EncodedGroupCommand
+from chip.GroupMessagePipeline import GroupMessagePipeline
+from chip.native import PyChipError
+
+'''
+This file tests the group message pipeline, with sending replaced by recording the encoded messages.
+'''
+
+
+class _RecordingPipeline(GroupMessagePipeline):
+    def __init__(self, *args, failingGroups=(), **kwargs):
+        super().__init__(ChipDeviceControllerBase, *args, **kwargs)
+        self.failingGroups = failingGroups
+        self.sent = []
+
+    async def _Send(self, groupId, message):
+        self.sent.append((time.monotonic(), groupId, message))
+        return PyChipError(0x2F if groupId in self.failingGroups else 0)
+
+
+class TestGroupMessagePipeline(unittest.IsolatedAsyncioTestCase):
+    async def test_send(self):
+        pipeline = _RecordingPipeline()
+        pipeline.Start()
+        results = await asyncio.gather(*(pipeline.SendCommand(group, Clusters.OnOff.Commands.On()) for group in range(1, 11)),
+                                       pipeline.WriteAttribute(11, [(Clusters.OnOff.Attributes.OnTime(5),)]))
+        pipeline.Stop()
+
+        self.assertEqual(results, [True] * 11)
+        self.assertEqual([groupId for _, groupId, _ in pipeline.sent], list(range(1, 12)))
+
+        # The command is encoded once for all the groups it is sent to.
+        commands = [message for _, _, message in pipeline.sent[:10]]
+        self.assertIsInstance(commands[0], EncodedGroupCommand)
+        self.assertEqual((commands[0].ClusterId, commands[0].CommandId), (Clusters.OnOff.id, Clusters.OnOff.Commands.On.command_id))
+        self.assertTrue(all(command is commands[0] for command in commands))
+        self.assertIsInstance(pipeline.sent[10][2], EncodedGroupWrite)
+
+        self.assertEqual(pipeline.stats.sent, 11)
+        self.assertEqual(pipeline.groupStats[3].sent, 1)
+        self.assertEqual(len(pipeline.groupStats[3].latencies), 1)
+
+    async def test_distinct_payloads(self):
+        pipeline = _RecordingPipeline()
+        pipeline.Start()
+        await asyncio.gather(pipeline.SendCommand(1, Clusters.LevelControl.Commands.MoveToLevel(level=10)),
+                             pipeline.SendCommand(1, Clusters.LevelControl.Commands.MoveToLevel(level=20)),
+                             pipeline.SendCommand(2, Clusters.LevelControl.Commands.MoveToLevel(level=10)))
+        pipeline.Stop()
+
+        first, second, third = (message for _, _, message in pipeline.sent)
+        self.assertNotEqual(first.PayloadTLV, second.PayloadTLV)
+        self.assertIs(first, third)
+
+    async def test_rate_limit(self):
+        pipeline = _RecordingPipeline(messagesPerSec=200, burst=5)
+        pipeline.Start()
+        await asyncio.gather(*(pipeline.SendCommand(1, Clusters.OnOff.Commands.Toggle()) for _ in range(25)))
+        pipeline.Stop()
+
+        times = [sentAt for sentAt, _, _ in pipeline.sent]
+        # The burst goes out at once, the other 20 messages are paced at 200 per second.
+        self.assertLess(times[4] - times[0], 0.02)
+        self.assertGreaterEqual(times[-1] - times[0], 0.09)
+
+    async def test_drops_and_failures(self):
+        pipeline = _RecordingPipeline(maxQueueSize=2, failingGroups=(2,))
+        futures = [pipeline.SendCommand(group, Clusters.OnOff.Commands.Off()) for group in (1, 2, 3)]
+        # The queue is full before the pipeline starts sending.
+        self.assertTrue(futures[2].done())
+        pipeline.Start()
+        self.assertEqual(await asyncio.gather(*futures), [True, False, False])
+        pipeline.Stop()
+
+        self.assertEqual(pipeline.groupStats[2].failed, 1)
+        self.assertEqual(pipeline.groupStats[3].dropped, 1)
+        self.assertEqual((pipeline.stats.sent, pipeline.stats.failed, pipeline.stats.dropped), (1, 1, 1))
+
+    async def test_stale_messages(self):
+        pipeline = _RecordingPipeline(maxQueueDelaySec=0.01)
+        future = pipeline.SendCommand(1, Clusters.OnOff.Commands.Off())
+        await asyncio.sleep(0.02)
+        pipeline.Start()
+        self.assertFalse(await future)
+        self.assertEqual(pipeline.groupStats[1].dropped, 1)
+
+        queued = pipeline.SendCommand(1, Clusters.OnOff.Commands.Off())
+        pipeline.Stop()
+        self.assertFalse(await queued)
+
+    async def test_skipped_messages_use_no_rate(self):
+        pipeline = _RecordingPipeline(messagesPerSec=2, burst=1, maxQueueDelaySec=0.01)
+        stale = [pipeline.SendCommand(1, Clusters.OnOff.Commands.Off()) for _ in range(3)]
+        cancelled = pipeline.SendCommand(1, Clusters.OnOff.Commands.Off())
+        cancelled.cancel()
+        await asyncio.sleep(0.02)
+        fresh = pipeline.SendCommand(2, Clusters.OnOff.Commands.On())
+
+        # The only token goes to the message actually sent, not to the ones skipped before it.
+        start = time.monotonic()
+        pipeline.Start()
+        self.assertTrue(await asyncio.wait_for(fresh, 0.4))
+        self.assertLess(time.monotonic() - start, 0.4)
+        pipeline.Stop()
+        self.assertEqual([await future for future in stale], [False] * 3)
+        self.assertEqual([groupId for _, groupId, _ in pipeline.sent], [2])
+
+    async def test_flush_not_started(self):
+        pipeline = _RecordingPipeline()
+        future = pipeline.SendCommand(1, Clusters.OnOff.Commands.Off())
+        await asyncio.wait_for(pipeline.Flush(), 1)
+        self.assertFalse(future.done())
+
+        pipeline.Start()
+        await pipeline.Flush()
+        self.assertTrue(future.result())
+        pipeline.Stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
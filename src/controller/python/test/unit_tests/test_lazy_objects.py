@@ -0,0 +1,112 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+import chip.clusters as Clusters
+from chip.clusters import Attribute, ClusterObjects, ObjectsIndex
+
+'''
+This file checks that the generated ObjectsIndex matches the cluster objects, and that cluster objects
+loaded on demand (CHIP_LAZY_CLUSTER_OBJECTS=1) behave like the ones from a regular import.
+
+Lazy loading has to be enabled before chip.clusters is imported, so those checks run in a subprocess.
+'''
+
+
+def _run_lazy(script: str) -> str:
+    env = dict(os.environ, CHIP_LAZY_CLUSTER_OBJECTS='1')
+    return subprocess.run([sys.executable, '-c', textwrap.dedent(script)], env=env, check=True,
+                          capture_output=True, text=True).stdout
+
+
+class TestObjectsIndex(unittest.TestCase):
+    def test_clusters(self):
+        self.assertEqual(set(ObjectsIndex.CLUSTERS), set(ClusterObjects.ALL_CLUSTERS))
+        for clusterId, (module, name) in ObjectsIndex.CLUSTERS.items():
+            self.assertEqual(sys.modules[module].__dict__[name], ClusterObjects.ALL_CLUSTERS[clusterId])
+
+    def test_attributes(self):
+        # Other tests register attributes for made-up clusters, only compare the generated ones.
+        expected = {(clusterId, attributeId) for clusterId, attributes in ClusterObjects.ALL_ATTRIBUTES.items()
+                    if clusterId in ObjectsIndex.CLUSTERS for attributeId in attributes}
+        self.assertEqual(set(ObjectsIndex.ATTRIBUTES), expected)
+        for (clusterId, attributeId), name in ObjectsIndex.ATTRIBUTES.items():
+            self.assertEqual(getattr(ClusterObjects.ALL_CLUSTERS[clusterId].Attributes, name),
+                             ClusterObjects.ALL_ATTRIBUTES[clusterId][attributeId])
+
+    def test_events(self):
+        expected = {(clusterId, eventId) for clusterId, events in ClusterObjects.ALL_EVENTS.items()
+                    if clusterId in ObjectsIndex.CLUSTERS for eventId in events}
+        self.assertEqual(set(ObjectsIndex.EVENTS), expected)
+        for (clusterId, eventId), name in ObjectsIndex.EVENTS.items():
+            self.assertEqual(getattr(ClusterObjects.ALL_CLUSTERS[clusterId].Events, name),
+                             ClusterObjects.ALL_EVENTS[clusterId][eventId])
+
+    def test_attribute_index(self):
+        Attribute._BuildClusterIndex()
+        Attribute._BuildAttributeIndex()
+        Attribute._BuildEventIndex()
+
+        self.assertEqual(Attribute._ClusterIndex[Clusters.OnOff.id], Clusters.OnOff)
+        self.assertEqual(Attribute._AttributeIndex[(Clusters.OnOff.id, Clusters.OnOff.Attributes.OnTime.attribute_id)],
+                         (Clusters.OnOff.Attributes.OnTime, Clusters.OnOff))
+        path = Attribute.EventPath(ClusterId=Clusters.BasicInformation.id,
+                                   EventId=Clusters.BasicInformation.Events.StartUp.event_id)
+        self.assertEqual(Attribute._EventIndex[str(path)], Clusters.BasicInformation.Events.StartUp)
+
+
+class TestLazyObjects(unittest.TestCase):
+    def test_load_on_access(self):
+        out = _run_lazy('''
+            import chip.clusters as Clusters
+            from chip.clusters import Attribute, ClusterObjects
+
+            print(len(ClusterObjects.ALL_CLUSTERS))
+            print(Clusters.OnOff.Attributes.OnOff.__qualname__, Clusters.OnOff.__module__)
+            print(Attribute._GetClusterType(Clusters.Descriptor.id).__name__)
+            print(sorted(ClusterObjects.ALL_CLUSTERS))
+        ''').splitlines()
+        self.assertEqual(out[0], '0')
+        self.assertEqual(out[1], 'OnOff.Attributes.OnOff chip.clusters.Objects')
+        self.assertEqual(out[2], 'Descriptor')
+        self.assertEqual(out[3], str(sorted([Clusters.OnOff.id, Clusters.Descriptor.id])))
+
+    def test_load_all(self):
+        out = _run_lazy('''
+            import chip.clusters as Clusters
+            from chip.clusters import ClusterObjects, LazyObjects
+
+            LazyObjects.LoadAll()
+            print(sorted(ClusterObjects.ALL_CLUSTERS))
+            print(sorted((c, sorted(a)) for c, a in ClusterObjects.ALL_ATTRIBUTES.items()))
+            print(sorted(name for name in dir(Clusters) if not name.startswith('_')))
+        ''').splitlines()
+        self.assertEqual(out[0], str(sorted(ClusterObjects.ALL_CLUSTERS)))
+        # Other tests register attributes for made-up clusters, only compare the generated ones.
+        self.assertEqual(out[1], str(sorted((c, sorted(a)) for c, a in ClusterObjects.ALL_ATTRIBUTES.items()
+                                            if c in ObjectsIndex.CLUSTERS)))
+        for name in Clusters.Objects.__all__:
+            self.assertIn(repr(name), out[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
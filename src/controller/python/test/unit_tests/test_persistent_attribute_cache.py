@@ -0,0 +1,178 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import chip.clusters as Clusters
+from chip.clusters import Attribute
+from chip.clusters.Attribute import AsyncReadTransaction, AttributePath, DataVersionFilter
+from chip.clusters.PersistentAttributeCache import PersistentAttributeCache
+from chip.interaction_model import Status
+from chip.tlv import TLVWriter, uint
+
+'''
+This file tests the PersistentAttributeCache, which provides DataVersionFilters and cached data for reads.
+'''
+
+_FABRIC = 0xFEDCBA9876543210
+_NODE = 0xFFFFFFEF00000001
+_ENDPOINT = 1
+_ON_OFF = Clusters.OnOff.Attributes.OnOff
+_ON_TIME = Clusters.OnOff.Attributes.OnTime
+
+
+def _path(attribute=None, cluster=Clusters.OnOff) -> AttributePath:
+    if attribute is None:
+        return AttributePath(EndpointId=_ENDPOINT, ClusterId=cluster.id)
+    return AttributePath(EndpointId=_ENDPOINT, ClusterId=attribute.cluster_id, AttributeId=attribute.attribute_id)
+
+
+def _tlv(value) -> bytes:
+    writer = TLVWriter()
+    writer.put(None, value)
+    return bytes(writer.encoding)
+
+
+class TestPersistentAttributeCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Attribute.Init() needs the native library, only build the indexes it would build.
+        Attribute._BuildClusterIndex()
+        Attribute._BuildAttributeIndex()
+
+    def setUp(self):
+        fd, self._path = tempfile.mkstemp(suffix='.sqlite')
+        os.close(fd)
+        self._cache = PersistentAttributeCache(self._path)
+
+    def tearDown(self):
+        self._cache.Close()
+        os.unlink(self._path)
+
+    def _read(self, paths, report):
+        ''' Runs a read interaction against the cache, returning the filters requested and the read response. '''
+        return self._report(self._cache.BeginRead(_FABRIC, _NODE, paths), report)
+
+    def _report(self, persistentRead, report):
+        filters = persistentRead.DataVersionFilters()
+        transaction = AsyncReadTransaction(None, None, None, False, persistentRead)
+        for path, dataVersion, status, data in report:
+            transaction.handleAttributeData(path, dataVersion, status, data)
+        transaction.handleReportEnd()
+        return filters, transaction.GetReadResponse().attributes
+
+    def _restart(self):
+        self._cache.Close()
+        self._cache = PersistentAttributeCache(self._path)
+
+    def test_wildcard_read_replay(self):
+        filters, _ = self._read([_path()], [
+            (_path(_ON_OFF), 5, Status.Success, _tlv(True)),
+            (_path(_ON_TIME), 5, Status.Success, _tlv(uint(10))),
+        ])
+        self.assertEqual(filters, [])
+
+        self._restart()
+        # Nothing changed on the node, which reports nothing for the filtered cluster.
+        filters, attributes = self._read([_path()], [])
+        self.assertEqual(filters, [DataVersionFilter(EndpointId=_ENDPOINT, ClusterId=Clusters.OnOff.id, DataVersion=5)])
+        self.assertEqual(attributes[_ENDPOINT][Clusters.OnOff][_ON_OFF], True)
+        self.assertEqual(attributes[_ENDPOINT][Clusters.OnOff][_ON_TIME], 10)
+        self.assertEqual(attributes[_ENDPOINT][Clusters.OnOff][Attribute.DataVersion], 5)
+
+        # The cluster changed, the node reports it again.
+        _, attributes = self._read([_path()], [
+            (_path(_ON_OFF), 6, Status.Success, _tlv(False)),
+            (_path(_ON_TIME), 6, Status.Success, _tlv(uint(10))),
+        ])
+        self.assertEqual(attributes[_ENDPOINT][Clusters.OnOff][_ON_OFF], False)
+        filters, _ = self._read([_path()], [])
+        self.assertEqual(filters, [DataVersionFilter(EndpointId=_ENDPOINT, ClusterId=Clusters.OnOff.id, DataVersion=6)])
+
+    def test_concrete_paths(self):
+        self._read([_path(_ON_OFF)], [(_path(_ON_OFF), 5, Status.Success, _tlv(True))])
+
+        # Only OnOff is cached, so the cluster is not complete.
+        filters, _ = self._read([_path()], [])
+        self.assertEqual(filters, [])
+        filters, _ = self._read([_path(_ON_TIME)], [])
+        self.assertEqual(filters, [])
+
+        filters, attributes = self._read([_path(_ON_OFF)], [])
+        self.assertEqual(len(filters), 1)
+        self.assertEqual(attributes[_ENDPOINT][Clusters.OnOff], {Attribute.DataVersion: 5, _ON_OFF: True})
+
+    def test_data_version_change_drops_uncovered_attributes(self):
+        self._read([_path()], [
+            (_path(_ON_OFF), 5, Status.Success, _tlv(True)),
+            (_path(_ON_TIME), 5, Status.Success, _tlv(uint(10))),
+        ])
+        # OnTime may have changed along with the data version, it is not known anymore.
+        self._read([_path(_ON_OFF)], [(_path(_ON_OFF), 6, Status.Success, _tlv(False))])
+
+        filters, _ = self._read([_path()], [])
+        self.assertEqual(filters, [])
+        filters, _ = self._read([_path(_ON_TIME)], [])
+        self.assertEqual(filters, [])
+        filters, attributes = self._read([_path(_ON_OFF)], [])
+        self.assertEqual(filters, [DataVersionFilter(EndpointId=_ENDPOINT, ClusterId=Clusters.OnOff.id, DataVersion=6)])
+        self.assertEqual(attributes[_ENDPOINT][Clusters.OnOff][_ON_OFF], False)
+
+    def test_error_status_removes_cluster(self):
+        self._read([_path()], [(_path(_ON_OFF), 5, Status.Success, _tlv(True))])
+        self._read([_path()], [(_path(_ON_TIME), 0, Status.UnsupportedRead, b'')])
+
+        filters, _ = self._read([_path(_ON_OFF)], [])
+        self.assertEqual(filters, [])
+
+    def test_clear(self):
+        self._read([_path()], [(_path(_ON_OFF), 5, Status.Success, _tlv(True))])
+        self._cache.Clear(_FABRIC, _NODE + 1)
+        self.assertEqual(len(self._read([_path()], [])[0]), 1)
+        self._cache.Clear(_FABRIC, _NODE)
+        self.assertEqual(self._read([_path()], [])[0], [])
+
+    def test_reports_written_off_the_matter_thread(self):
+        with mock.patch.object(self._cache, '_Store', wraps=self._cache._Store) as store:
+            # While the database is busy, the end of a report does not wait for it.
+            onOff = self._cache.BeginRead(_FABRIC, _NODE, [_path(_ON_OFF)])
+            onTime = self._cache.BeginRead(_FABRIC, _NODE, [_path(_ON_TIME)])
+            with self._cache._lock:
+                self._report(onOff, [(_path(_ON_OFF), 5, Status.Success, _tlv(True))])
+                self._report(onTime, [(_path(_ON_TIME), 5, Status.Success, _tlv(uint(10)))])
+            self._cache.Flush()
+
+        # The reports that queued up are written together, in order.
+        self.assertLessEqual(store.call_count, 2)
+        self.assertEqual(sum(len(call.args[0]) for call in store.call_args_list), 2)
+        filters, attributes = self._read([_path(_ON_OFF), _path(_ON_TIME)], [])
+        self.assertEqual(len(filters), 1)
+        self.assertEqual(attributes[_ENDPOINT][Clusters.OnOff][_ON_TIME], 10)
+
+        # Reports still waiting are written when the cache is closed.
+        onOff = self._cache.BeginRead(_FABRIC, _NODE, [_path(_ON_OFF)])
+        with self._cache._lock:
+            self._report(onOff, [(_path(_ON_OFF), 6, Status.Success, _tlv(False))])
+        self._restart()
+        self.assertEqual(self._read([_path(_ON_OFF)], [])[0][0].DataVersion, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
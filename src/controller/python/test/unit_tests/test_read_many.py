@@ -0,0 +1,179 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import contextlib
+import unittest
+from unittest import mock
+
+from chip.ChipDeviceCtrl import ChipDeviceControllerBase, NodeReadResult, ShardedCallbackContext
+from chip.clusters.Attribute import AsyncReadTransaction, SubscriptionTransaction
+
+'''
+This file tests the fan-out of reads and subscriptions over several nodes, with the session establishment and
+interaction of the device controller replaced by coroutines that take a configurable amount of time.
+'''
+
+
+class _FakeSubscription(SubscriptionTransaction):
+    def __init__(self, nodeid):
+        self._subscriptionId = nodeid
+        self.isShutdown = False
+
+    def Shutdown(self):
+        self.isShutdown = True
+
+
+class _FakeController(ChipDeviceControllerBase):
+    def __init__(self, sessionDelays=None, readDelays=None, failingNodes=()):
+        self._isActive = False
+        self._read_many_context = ShardedCallbackContext()
+        self.sessionDelays = sessionDelays or {}
+        self.readDelays = readDelays or {}
+        self.failingNodes = failingNodes
+        self.inflight = 0
+        self.maxInflight = 0
+        self.readArgs = {}
+        self.subscriptions = {}
+        self.cancelled = []
+
+    def CheckIsActive(self):
+        pass
+
+    async def GetConnectedDevice(self, nodeid, allowPASE=True, timeoutMs=None, payloadCapability=0):
+        self.inflight += 1
+        self.maxInflight = max(self.maxInflight, self.inflight)
+        try:
+            await asyncio.sleep(self.sessionDelays.get(nodeid, 0))
+            if nodeid in self.failingNodes:
+                raise TimeoutError(f"no session with {nodeid}")
+            return f"device-{nodeid}"
+        finally:
+            self.inflight -= 1
+
+    async def _ReadWithDevice(self, device, nodeid, **kwargs):
+        self.readArgs[nodeid] = kwargs
+        try:
+            await asyncio.sleep(self.readDelays.get(nodeid, 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(nodeid)
+            raise
+        if kwargs['reportInterval'] is not None:
+            subscription = self.subscriptions[nodeid] = _FakeSubscription(nodeid)
+            return subscription
+        return (device, nodeid)
+
+
+class TestReadMany(unittest.IsolatedAsyncioTestCase):
+    async def test_results_in_completion_order(self):
+        devCtrl = _FakeController(readDelays={1: 0.05, 2: 0.0, 3: 0.02})
+        results = [r async for r in devCtrl.ReadMany([1, 2, 3], attributes=[0])]
+        self.assertEqual([r.nodeId for r in results], [2, 3, 1])
+        for result in results:
+            self.assertIsInstance(result, NodeReadResult)
+            self.assertTrue(result.success)
+            self.assertEqual(result.response, (f"device-{result.nodeId}", result.nodeId))
+        self.assertGreaterEqual(results[-1].interactionTime, 0.05)
+        self.assertEqual(devCtrl.readArgs[1]['attributes'], [0])
+        self.assertIsNone(devCtrl.readArgs[1]['reportInterval'])
+
+    async def test_errors_are_per_node(self):
+        devCtrl = _FakeController(failingNodes=(2,))
+        results = {r.nodeId: r async for r in devCtrl.ReadMany([1, 2, 3])}
+        self.assertEqual(set(results), {1, 2, 3})
+        self.assertIsInstance(results[2].error, TimeoutError)
+        self.assertIsNone(results[2].response)
+        self.assertNotIn(2, devCtrl.readArgs)
+        self.assertTrue(results[1].success and results[3].success)
+
+    async def test_bounded_concurrency(self):
+        nodes = list(range(1, 21))
+        devCtrl = _FakeController(sessionDelays={n: 0.01 for n in nodes})
+        results = [r async for r in devCtrl.ReadMany(nodes, maxConcurrency=4)]
+        self.assertEqual(sorted(r.nodeId for r in results), nodes)
+        self.assertEqual(devCtrl.maxInflight, 4)
+        for result in results:
+            self.assertGreaterEqual(result.sessionEstablishmentTime, 0.01)
+
+        with self.assertRaises(ValueError):
+            [r async for r in devCtrl.ReadMany(nodes, maxConcurrency=0)]
+
+    async def test_duplicate_nodes_read_once(self):
+        devCtrl = _FakeController()
+        results = [r async for r in devCtrl.ReadMany([5, 5, 6, 5])]
+        self.assertEqual(sorted(r.nodeId for r in results), [5, 6])
+
+    async def test_subscribe_many(self):
+        devCtrl = _FakeController()
+        results = [r async for r in devCtrl.SubscribeMany([1, 2], (0, 10), events=[('*', 1)])]
+        self.assertEqual(sorted(r.nodeId for r in results), [1, 2])
+        self.assertEqual(devCtrl.readArgs[1]['reportInterval'], (0, 10))
+        self.assertEqual(devCtrl.readArgs[2]['events'], [('*', 1)])
+
+    async def test_cancel_mid_iteration(self):
+        devCtrl = _FakeController(readDelays={1: 0.0, 2: 0.01, 3: 10})
+        received = []
+
+        async def consume():
+            async with contextlib.aclosing(devCtrl.SubscribeMany([1, 2, 3], (0, 10))) as results:
+                async for result in results:
+                    received.append(result.response)
+                    # Node 2 completes while the consumer is busy with node 1.
+                    await asyncio.sleep(0.1)
+
+        task = asyncio.create_task(consume())
+        while not received:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        # The subscription the caller received is theirs to shut down, the one it never received is shut down and
+        # the one still being established is cancelled.
+        self.assertEqual(received, [devCtrl.subscriptions[1]])
+        self.assertFalse(devCtrl.subscriptions[1].isShutdown)
+        self.assertTrue(devCtrl.subscriptions[2].isShutdown)
+        self.assertEqual(devCtrl.cancelled, [3])
+        self.assertEqual(devCtrl._read_many_context.inFlight, 0)
+
+    async def test_shared_nodes_serialized(self):
+        devCtrl = _FakeController(readDelays={1: 0.02, 2: 0.02})
+
+        async def readMany(nodes):
+            return [r async for r in devCtrl.ReadMany(nodes)]
+
+        first, second = await asyncio.gather(readMany([1, 2]), readMany([2]))
+        self.assertEqual(len(first) + len(second), 3)
+        # Only the reads of node 2 waited for each other.
+        self.assertEqual(devCtrl._read_many_context.stats.contended, 1)
+
+    def test_established_after_cancel(self):
+        future = asyncio.get_event_loop_policy().new_event_loop().create_future()
+        future.cancel()
+        transaction = AsyncReadTransaction(future, None, None, False)
+        with mock.patch.object(SubscriptionTransaction, '__init__', return_value=None), \
+                mock.patch.object(SubscriptionTransaction, 'Shutdown') as shutdown:
+            transaction._handleSubscriptionEstablished(1)
+            # A resubscription of the same read client does not shut it down again.
+            transaction._handleSubscriptionEstablished(1)
+        shutdown.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import unittest
+from typing import Optional
+
+import chip.clusters as Clusters
+from chip.clusters import Attribute
+from chip.clusters.Attribute import AsyncReadTransaction, AttributePath, EventPriority, EventTimestampType
+from chip.interaction_model import Status
+from chip.tlv import TLVWriter
+
+'''
+This file tests the handling of batched report data, as delivered by attribute.cpp when report batching is enabled.
+'''
+
+_ENDPOINT = 1
+
+
+def _tlv(value) -> bytes:
+    writer = TLVWriter()
+    writer.put(None, value)
+    return bytes(writer.encoding)
+
+
+def _attributeRecord(attribute, dataVersion: Optional[int], status: Status, data: bytes) -> bytes:
+    return Attribute._AttributeReportRecord.pack(Attribute._REPORT_RECORD_ATTRIBUTE_DATA, _ENDPOINT, attribute.cluster_id,
+                                                 attribute.attribute_id, dataVersion or 0, dataVersion is not None, status,
+                                                 len(data)) + data
+
+
+def _eventRecord(event, number: int, status: Status, data: bytes) -> bytes:
+    return Attribute._EventReportRecord.pack(Attribute._REPORT_RECORD_EVENT_DATA, _ENDPOINT, event.cluster_id, event.event_id,
+                                             number, EventPriority.CRITICAL.value, 1234, EventTimestampType.EPOCH.value, status,
+                                             len(data)) + data
+
+
+class TestReportData(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Attribute.Init() needs the native library, only build the indexes it would build.
+        Attribute._BuildClusterIndex()
+        Attribute._BuildAttributeIndex()
+        Attribute._BuildEventIndex()
+
+    def test_attribute_and_event_records(self):
+        startUp = Clusters.BasicInformation.Events.StartUp(softwareVersion=3)
+        transaction = AsyncReadTransaction(None, None, None, False)
+        transaction.handleReportData(
+            _attributeRecord(Clusters.OnOff.Attributes.OnOff, 5, Status.Success, _tlv(True)) +
+            _eventRecord(Clusters.BasicInformation.Events.StartUp, 7, Status.Success, startUp.ToTLV()) +
+            _attributeRecord(Clusters.OnOff.Attributes.OnTime, 0, Status.UnsupportedRead, b''))
+
+        attributes = transaction.GetReadResponse().attributes[_ENDPOINT][Clusters.OnOff]
+        self.assertEqual(attributes[Attribute.DataVersion], 0)
+        self.assertEqual(attributes[Clusters.OnOff.Attributes.OnOff], True)
+        self.assertIsInstance(attributes[Clusters.OnOff.Attributes.OnTime], Attribute.ValueDecodeFailure)
+        self.assertEqual(transaction._changedPathSet, {
+            AttributePath.from_attribute(_ENDPOINT, Clusters.OnOff.Attributes.OnOff),
+            AttributePath.from_attribute(_ENDPOINT, Clusters.OnOff.Attributes.OnTime),
+        })
+
+        events = transaction.GetAllEventValues()
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].Header.EventNumber, 7)
+        self.assertEqual(events[0].Header.Priority, EventPriority.CRITICAL)
+        self.assertEqual(events[0].Data, startUp)
+
+    def test_attribute_without_data_version(self):
+        transaction = AsyncReadTransaction(None, None, None, False)
+        transaction.handleReportData(_attributeRecord(Clusters.OnOff.Attributes.OnOff, None, Status.Success, _tlv(True)))
+        transaction.handleReportData(_attributeRecord(Clusters.OnOff.Attributes.OnOff, None, Status.Success, _tlv(False)))
+
+        # Not mistaken for data reported with DataVersion 0 and left unchanged.
+        attributes = transaction.GetReadResponse().attributes[_ENDPOINT][Clusters.OnOff]
+        self.assertEqual(attributes[Clusters.OnOff.Attributes.OnOff], False)
+        self.assertIsNone(attributes[Attribute.DataVersion])
+
+    def test_unknown_record(self):
+        transaction = AsyncReadTransaction(None, None, None, False)
+        transaction.handleReportData(
+            _attributeRecord(Clusters.OnOff.Attributes.OnOff, 5, Status.Success, _tlv(True)) + b'\x7f' + b'\x00' * 32)
+        self.assertEqual(transaction._changedPathSet, {AttributePath.from_attribute(_ENDPOINT, Clusters.OnOff.Attributes.OnOff)})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import threading
+import unittest
+
+from chip.ChipDeviceCtrl import ChipDeviceControllerBase
+from chip.interaction_model import SessionParameters
+from chip.SessionPool import SessionPool
+
+'''
+This file tests the session pool, with the session handling of the device controller replaced by a fake that
+keeps track of the established sessions.
+'''
+
+
+class _FakeController(ChipDeviceControllerBase):
+    def __init__(self, unreachable=()):
+        self._isActive = False
+        self._sessionPool = None
+        self.unreachable = set(unreachable)
+        self.sessions = set()
+        self.establishments = []
+        self.refreshReads = []
+        self.expired = []
+
+    def CheckIsActive(self):
+        pass
+
+    async def _GetConnectedDevice(self, nodeid, allowPASE=True, timeoutMs=None, payloadCapability=0):
+        if nodeid not in self.sessions:
+            await asyncio.sleep(0.01)
+            if nodeid in self.unreachable:
+                raise TimeoutError(f"node {nodeid} is unreachable")
+            self.sessions.add(nodeid)
+            self.establishments.append(nodeid)
+        return nodeid
+
+    def _ComputeRoundTripTimeoutForDevice(self, device, upperLayerProcessingTimeoutMs=0):
+        return 1000 + device
+
+    def _GetRemoteSessionParametersForDevice(self, device):
+        return SessionParameters(sessionIdleInterval=500, sessionActiveInterval=300, sessionActiveThreshold=4000,
+                                 dataModelRevision=17, interactionModelRevision=11, specficiationVersion=None,
+                                 maxPathsPerInvoke=1)
+
+    async def _ReadWithDevice(self, device, nodeid, **kwargs):
+        self.refreshReads.append(nodeid)
+        if nodeid in self.unreachable:
+            raise TimeoutError(f"node {nodeid} is unreachable")
+
+    def ExpireSessions(self, nodeid):
+        self.expired.append(nodeid)
+        self.sessions.discard(nodeid)
+
+
+class TestSessionPool(unittest.IsolatedAsyncioTestCase):
+    async def test_warm(self):
+        devCtrl = _FakeController(unreachable=(3,))
+        pool = await devCtrl.StartSessionPool([1, 2, 3], checkIntervalSec=60)
+        self.assertIs(devCtrl.sessionPool, pool)
+
+        self.assertEqual(sorted(devCtrl.establishments), [1, 2])
+        self.assertEqual(pool.stats.establishments, 2)
+        self.assertEqual(pool.stats.establishmentFailures, 1)
+        self.assertEqual(len(pool.stats.establishmentLatencies), 2)
+        self.assertGreater(pool.stats.averageEstablishmentLatency, 0)
+
+        self.assertEqual(pool.GetNode(1).roundTripTimeoutMs, 1001)
+        self.assertEqual(pool.GetNode(2).sessionParameters.sessionIdleInterval, 500)
+        self.assertTrue(pool.IsWarm(1))
+        self.assertFalse(pool.IsWarm(3))
+        self.assertIsInstance(pool.GetNode(3).lastError, TimeoutError)
+
+        devCtrl.StopSessionPool()
+        self.assertIsNone(devCtrl.sessionPool)
+
+    async def test_hits_and_misses(self):
+        devCtrl = _FakeController()
+        pool = await devCtrl.StartSessionPool([1], checkIntervalSec=60)
+
+        await devCtrl.GetConnectedDevice(1)
+        await devCtrl.GetConnectedDevice(1)
+        # Nodes outside of the working set are not counted.
+        await devCtrl.GetConnectedDevice(7)
+        self.assertEqual((pool.stats.hits, pool.stats.misses), (2, 0))
+
+        pool.AddNodes([8])
+        await devCtrl.GetConnectedDevice(8)
+        self.assertEqual((pool.stats.hits, pool.stats.misses), (2, 1))
+        self.assertEqual(len(pool.stats.missLatencies), 1)
+        self.assertTrue(pool.IsWarm(8))
+        self.assertAlmostEqual(pool.stats.hitRatio, 2 / 3)
+
+        pool.RemoveNodes([8])
+        self.assertNotIn(8, pool)
+        devCtrl.StopSessionPool()
+
+    async def test_refresh_before_idle_timeout(self):
+        devCtrl = _FakeController()
+        pool = await devCtrl.StartSessionPool([1, 2], idleTimeoutSec=0.2, refreshMarginSec=0.15, checkIntervalSec=0.02)
+
+        await asyncio.sleep(0.1)
+        self.assertGreater(pool.stats.refreshes, 0)
+        self.assertIn(1, devCtrl.refreshReads)
+        self.assertTrue(pool.IsWarm(1) and pool.IsWarm(2))
+
+        # The node went away, the refresh fails and the session gets re-established once the node is back.
+        devCtrl.unreachable.add(2)
+        await asyncio.sleep(0.1)
+        self.assertGreater(pool.stats.refreshFailures, 0)
+        self.assertIn(2, devCtrl.expired)
+        self.assertFalse(pool.IsWarm(2))
+
+        devCtrl.unreachable.discard(2)
+        await asyncio.sleep(0.1)
+        self.assertTrue(pool.IsWarm(2))
+        self.assertEqual(devCtrl.establishments.count(2), 2)
+        devCtrl.StopSessionPool()
+
+    def test_stop_outside_loop(self):
+        loop = asyncio.new_event_loop()
+        devCtrl = _FakeController()
+
+        # Stopped from another thread, the check task is cancelled on its loop.
+        pool = loop.run_until_complete(devCtrl.StartSessionPool([1], checkIntervalSec=60))
+        task = pool._task
+        thread = threading.Thread(target=devCtrl.StopSessionPool)
+        thread.start()
+        thread.join()
+        loop.run_until_complete(asyncio.wait([task]))
+        self.assertTrue(task.cancelled())
+
+        # Stopped at exit, after the loop is closed.
+        loop.run_until_complete(devCtrl.StartSessionPool([1], checkIntervalSec=60))
+        loop.close()
+        devCtrl.StopSessionPool()
+        self.assertIsNone(devCtrl.sessionPool)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            SessionPool(None, idleTimeoutSec=10, refreshMarginSec=10)
+        with self.assertRaises(ValueError):
+            SessionPool(None, maxConcurrency=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import chip.storage
+from chip.storage import PersistentStorage
+from chip.storage.backends import JsonStorageBackend, SqliteStorageBackend
+
+'''
+This file tests the storage backends of chip.storage.PersistentStorage, and the commits of PersistentStorage with
+the native storage adapter replaced by a mock.
+'''
+
+
+class _BackendTests:
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._dir.name, 'storage' + self.EXTENSION)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_commit_and_reload(self):
+        backend = self.Open()
+        self.assertEqual(backend.Load(), {})
+        backend.Set('repl-config', 'a', {'b': [1, 2]})
+        backend.Set('sdk-config', 'k', 'dmFsdWU=')
+        backend.Set('sdk-config', 'deleted', 'eA==')
+        backend.Delete('sdk-config', 'deleted')
+        backend.Commit()
+        backend.Close()
+
+        backend = self.Open()
+        self.assertEqual(backend.Load(), {'repl-config': {'a': {'b': [1, 2]}}, 'sdk-config': {'k': 'dmFsdWU='}})
+        backend.Close()
+
+    def test_uncommitted_changes_are_not_stored(self):
+        backend = self.Open()
+        backend.Load()
+        backend.Set('repl-config', 'a', 1)
+        backend.Commit()
+        backend.Set('repl-config', 'a', 2)
+
+        # A new instance only sees the committed state, as after a crash.
+        other = self.Open()
+        self.assertEqual(other.Load(), {'repl-config': {'a': 1}})
+        other.Close()
+        backend.Close()
+
+
+class TestJsonStorageBackend(_BackendTests, unittest.TestCase):
+    EXTENSION = '.json'
+
+    def Open(self):
+        return JsonStorageBackend(self._path)
+
+    def test_existing_file(self):
+        with open(self._path, 'w') as f:
+            json.dump({'repl-config': {'a': 1}, 'sdk-config': {}}, f)
+        self.assertEqual(self.Open().Load(), {'repl-config': {'a': 1}, 'sdk-config': {}})
+
+    def test_corrupted_file(self):
+        with open(self._path, 'w') as f:
+            f.write('{')
+        self.assertEqual(self.Open().Load(), {})
+
+    def test_load_returns_copy(self):
+        backend = self.Open()
+        backend.Load()['repl-config'] = {'a': 1}
+        backend.Commit()
+        self.assertEqual(self.Open().Load(), {})
+
+
+class TestSqliteStorageBackend(_BackendTests, unittest.TestCase):
+    EXTENSION = '.sqlite'
+
+    def Open(self, migrateFrom=None):
+        return SqliteStorageBackend(self._path, migrateFrom=migrateFrom)
+
+    def test_migration(self):
+        jsonPath = os.path.join(self._dir.name, 'storage.json')
+        with open(jsonPath, 'w') as f:
+            json.dump({'repl-config': {'a': 1}, 'sdk-config': {'k': 'dmFsdWU='}}, f)
+
+        backend = self.Open(migrateFrom=jsonPath)
+        self.assertEqual(backend.Load(), {'repl-config': {'a': 1}, 'sdk-config': {'k': 'dmFsdWU='}})
+        backend.Set('repl-config', 'a', 2)
+        backend.Commit()
+        backend.Close()
+
+        # The migration only happens once, into an empty database.
+        backend = self.Open(migrateFrom=jsonPath)
+        self.assertEqual(backend.Load()['repl-config'], {'a': 2})
+        backend.Close()
+
+
+class TestPersistentStorage(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self._path = os.path.join(self._dir.name, 'storage.json')
+        patcher = mock.patch.object(chip.storage, 'GetLibraryHandle')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def Stored(self):
+        # What a restart after a crash would see.
+        return JsonStorageBackend(self._path).Load()
+
+    def test_delayed_commit(self):
+        storage = PersistentStorage(self._path, commitDelaySec=0.05)
+        with mock.patch.object(storage._backend, 'Commit', wraps=storage._backend.Commit) as commit:
+            for value in range(10):
+                storage.SetReplKey('a', value)
+            self.assertEqual(self.Stored(), {})
+            time.sleep(0.3)
+            self.assertEqual(commit.call_count, 1)
+        self.assertEqual(self.Stored(), {'repl-config': {'a': 9}})
+        storage.Shutdown()
+
+    def test_sdk_keys_committed_right_away(self):
+        storage = PersistentStorage(self._path, commitDelaySec=10)
+        storage.SetReplKey('a', 1)
+        storage.SetSdkKey('counter', b'\x01')
+        # The REPL change made before is committed along.
+        self.assertEqual(self.Stored(), {'repl-config': {'a': 1}, 'sdk-config': {'counter': 'AQ=='}})
+
+        storage.DeleteSdkKey('counter')
+        storage.SetReplKey('a', 2)
+        self.assertEqual(self.Stored(), {'repl-config': {'a': 1}, 'sdk-config': {}})
+        storage.Shutdown()
+
+    def test_shutdown_flushes(self):
+        storage = PersistentStorage(self._path, commitDelaySec=10)
+        storage.SetReplKey('a', 1)
+        timer = storage._commitTimer
+        storage.Shutdown()
+        self.assertEqual(self.Stored(), {'repl-config': {'a': 1}})
+        self.assertIsNone(storage._commitTimer)
+        self.assertTrue(timer.finished.is_set())
+
+        # A delayed commit that was already waiting for the lock does nothing.
+        with mock.patch.object(storage._backend, 'Commit') as commit:
+            storage.Commit()
+        commit.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,266 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import unittest
+
+import chip.clusters as Clusters
+from chip.ChipDeviceCtrl import ChipDeviceControllerBase
+from chip.clusters import Attribute
+from chip.clusters.Attribute import AttributePath, EventHeader, EventPath, EventReadResult, TypedAttributePath
+from chip.interaction_model import Status
+from chip.SubscriptionMultiplexer import MinimalCoveringPaths, PlanSubscriptions
+
+'''
+This file tests the subscription multiplexer, with the subscriptions of the device controller replaced by fakes
+that report the attribute changes and events passed to them.
+'''
+
+
+class _FakeSubscription:
+    def __init__(self, nodeid, attributes, events):
+        self.nodeid = nodeid
+        self.attributes = attributes or []
+        self.events = events or []
+        self.isShutdown = False
+
+    def SetAttributeUpdateCallback(self, callback):
+        self.onAttributeChange = callback
+
+    def SetEventUpdateCallback(self, callback):
+        self.onEventChange = callback
+
+    def SetErrorCallback(self, callback):
+        self.onError = callback
+
+    def Report(self, path: AttributePath):
+        self.onAttributeChange(TypedAttributePath(Path=path), self)
+
+    def ReportEvent(self, path: EventPath):
+        header = EventHeader(EndpointId=path.EndpointId, ClusterId=path.ClusterId, EventId=path.EventId)
+        self.onEventChange(EventReadResult(Status=Status.Success, Header=header), self)
+
+    def GetAttribute(self, path: TypedAttributePath):
+        return (self, path.Path)
+
+    def Shutdown(self):
+        self.isShutdown = True
+
+
+class _FakeController(ChipDeviceControllerBase):
+    def __init__(self):
+        self._isActive = False
+        self._sessionPool = None
+        self._subscriptionMultiplexer = None
+        self.subscriptions = []
+        self.failingNodes = set()
+        # When set, subscriptions wait for it before being established.
+        self.gate = None
+        # Number of subscriptions to fail next, whatever the node.
+        self.failNext = 0
+
+    async def Read(self, nodeid, attributes=None, events=None, reportInterval=None, keepSubscriptions=False, **kwargs):
+        assert reportInterval is not None and keepSubscriptions
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.failNext:
+            self.failNext -= 1
+            raise TimeoutError(f"node {nodeid} did not respond")
+        if nodeid in self.failingNodes:
+            raise TimeoutError(f"node {nodeid} is unreachable")
+        subscription = _FakeSubscription(nodeid, attributes, events)
+        self.subscriptions.append(subscription)
+        return subscription
+
+
+ON_OFF = AttributePath.from_attribute(1, Clusters.OnOff.Attributes.OnOff)
+LEVEL = AttributePath.from_attribute(1, Clusters.LevelControl.Attributes.CurrentLevel)
+
+
+class TestPlanning(unittest.TestCase):
+    def test_minimal_covering_paths(self):
+        self.assertEqual(MinimalCoveringPaths([ON_OFF, AttributePath(EndpointId=1, ClusterId=6), ON_OFF, LEVEL]),
+                         [AttributePath(EndpointId=1, ClusterId=6), LEVEL])
+        self.assertEqual(MinimalCoveringPaths([ON_OFF, AttributePath()]), [AttributePath()])
+
+        # A non-urgent event path does not cover an urgent one.
+        urgent = EventPath(EndpointId=1, ClusterId=0x28, EventId=0, Urgent=1)
+        self.assertEqual(MinimalCoveringPaths([EventPath(ClusterId=0x28), urgent]), [EventPath(ClusterId=0x28), urgent])
+        self.assertEqual(MinimalCoveringPaths([EventPath(ClusterId=0x28, Urgent=1), urgent]),
+                         [EventPath(ClusterId=0x28, Urgent=1)])
+
+    def test_plan_subscriptions(self):
+        attributes = [AttributePath(EndpointId=endpoint, ClusterId=6) for endpoint in range(5)]
+        events = [EventPath(EndpointId=0, ClusterId=0x28)]
+        self.assertEqual(PlanSubscriptions(attributes, events), [(tuple(attributes), tuple(events))])
+        self.assertEqual(PlanSubscriptions(attributes, events, maxPathsPerSubscription=3),
+                         [(tuple(attributes[:3]), tuple(events)), (tuple(attributes[3:]), ())])
+        self.assertEqual(PlanSubscriptions([], []), [])
+
+
+class TestSubscriptionMultiplexer(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Attribute.Init() needs the native library, only build the indexes it would build.
+        Attribute._BuildClusterIndex()
+        Attribute._BuildAttributeIndex()
+
+    async def test_fan_out(self):
+        devCtrl = _FakeController()
+        multiplexer = devCtrl.subscriptionMultiplexer
+        onOffReports, clusterReports, events = [], [], []
+
+        onOff = await multiplexer.Subscribe(1, (0, 10), attributes=[(1, Clusters.OnOff.Attributes.OnOff)])
+        onOff.SetAttributeUpdateCallback(lambda path, transaction: onOffReports.append(path.Path))
+        # Covered by the first subscription's paths: no new device subscription.
+        again = await multiplexer.Subscribe(1, (0, 10), attributes=[ON_OFF])
+        self.assertEqual(len(devCtrl.subscriptions), 1)
+
+        # A broader consumer replaces the device subscription with one covering both.
+        cluster = await multiplexer.Subscribe(1, (0, 10), attributes=[(1, Clusters.OnOff), (1, Clusters.LevelControl)],
+                                              events=[(0, Clusters.BasicInformation, 0)])
+        cluster.SetAttributeUpdateCallback(lambda path, transaction: clusterReports.append(path.Path))
+        cluster.SetEventUpdateCallback(lambda event, transaction: events.append(event.Header.ClusterId))
+        self.assertEqual(len(devCtrl.subscriptions), 2)
+        first, second = devCtrl.subscriptions
+        self.assertTrue(first.isShutdown)
+        self.assertEqual(second.attributes, [AttributePath(EndpointId=1, ClusterId=6), AttributePath(EndpointId=1, ClusterId=8)])
+
+        second.Report(ON_OFF)
+        second.Report(LEVEL)
+        second.ReportEvent(EventPath(EndpointId=0, ClusterId=0x28, EventId=0))
+        self.assertEqual(onOffReports, [ON_OFF])
+        self.assertEqual(clusterReports, [ON_OFF, LEVEL])
+        self.assertEqual(events, [0x28])
+        self.assertEqual(again.GetAttribute(TypedAttributePath(Path=ON_OFF)), (second, ON_OFF))
+        with self.assertRaises(KeyError):
+            onOff.GetAttribute(TypedAttributePath(Path=LEVEL))
+
+        # Another report interval or node gets its own device subscription.
+        await multiplexer.Subscribe(2, (0, 10), attributes=[ON_OFF])
+        await multiplexer.Subscribe(1, (5, 60), attributes=[ON_OFF])
+        self.assertEqual(len(devCtrl.subscriptions), 4)
+        self.assertEqual(multiplexer.stats.consumers, 5)
+        self.assertEqual(multiplexer.stats.subscriptions, 3)
+
+        multiplexer.Shutdown()
+        self.assertTrue(all(subscription.isShutdown for subscription in devCtrl.subscriptions))
+        self.assertEqual(multiplexer.stats.subscriptions, 0)
+
+    async def test_replan_on_shutdown(self):
+        devCtrl = _FakeController()
+        multiplexer = devCtrl.subscriptionMultiplexer
+        onOff = await multiplexer.Subscribe(1, (0, 10), attributes=[ON_OFF])
+        level = await multiplexer.Subscribe(1, (0, 10), attributes=[LEVEL])
+        both = devCtrl.subscriptions[-1]
+        self.assertEqual(both.attributes, [ON_OFF, LEVEL])
+
+        # The device subscription is narrowed to the remaining consumer.
+        await level.Shutdown()
+        self.assertTrue(both.isShutdown)
+        self.assertEqual(devCtrl.subscriptions[-1].attributes, [ON_OFF])
+        self.assertEqual(multiplexer.GetSubscriptions(1), [devCtrl.subscriptions[-1]])
+
+        await onOff.Shutdown()
+        self.assertTrue(devCtrl.subscriptions[-1].isShutdown)
+        self.assertEqual(multiplexer.GetSubscriptions(1), [])
+        self.assertEqual((multiplexer.stats.consumers, multiplexer.stats.subscriptions), (0, 0))
+
+    async def test_no_duplicates_while_replanning(self):
+        devCtrl = _FakeController()
+        multiplexer = devCtrl.subscriptionMultiplexer
+        multiplexer._maxPathsPerSubscription = 1
+        reports = []
+        onOff = await multiplexer.Subscribe(1, (0, 10), attributes=[ON_OFF])
+        onOff.SetAttributeUpdateCallback(lambda path, transaction: reports.append((transaction, path.Path)))
+
+        # Replaced by a subscription to the OnOff cluster and one to LEVEL, the latter not established yet.
+        devCtrl.gate = asyncio.Event()
+        subscribing = asyncio.create_task(multiplexer.Subscribe(
+            1, (0, 10), attributes=[(1, Clusters.OnOff), (1, Clusters.LevelControl.Attributes.CurrentLevel)]))
+        await asyncio.sleep(0)
+        devCtrl.gate.set()
+        devCtrl.gate = asyncio.Event()
+        while len(devCtrl.subscriptions) < 2:
+            await asyncio.sleep(0)
+        outgoing, cluster = devCtrl.subscriptions
+
+        # The outgoing subscription no longer delivers the paths covered by the replacement.
+        outgoing.Report(ON_OFF)
+        cluster.Report(ON_OFF)
+        self.assertFalse(outgoing.isShutdown)
+        self.assertEqual(reports, [(cluster, ON_OFF)])
+
+        devCtrl.gate.set()
+        await subscribing
+        self.assertTrue(outgoing.isShutdown)
+        self.assertEqual(multiplexer._channels[(1, (0, 10))].outgoing, ())
+
+    async def test_failed_subscription(self):
+        devCtrl = _FakeController()
+        multiplexer = devCtrl.subscriptionMultiplexer
+        onOff = await multiplexer.Subscribe(1, (0, 10), attributes=[ON_OFF])
+        devCtrl.failingNodes.update((1, 2))
+
+        # The consumer is not added and the current subscription keeps serving the others.
+        with self.assertRaises(TimeoutError):
+            await multiplexer.Subscribe(1, (0, 10), attributes=[LEVEL])
+        self.assertEqual(multiplexer.GetSubscriptions(1), [devCtrl.subscriptions[0]])
+        self.assertFalse(devCtrl.subscriptions[0].isShutdown)
+        self.assertEqual(multiplexer.stats.consumers, 1)
+
+        with self.assertRaises(TimeoutError):
+            await multiplexer.Subscribe(2, (0, 10), attributes=[LEVEL])
+        self.assertEqual(multiplexer.GetSubscriptions(2), [])
+
+        reports = []
+        onOff.SetAttributeUpdateCallback(lambda path, transaction: reports.append(path.Path))
+        devCtrl.subscriptions[0].Report(ON_OFF)
+        self.assertEqual(reports, [ON_OFF])
+
+    async def test_channel_removed_while_waiting(self):
+        devCtrl = _FakeController()
+        multiplexer = devCtrl.subscriptionMultiplexer
+        onOff = await multiplexer.Subscribe(1, (0, 10), attributes=[ON_OFF])
+
+        # While a subscription is being established, the last consumer leaves (removing the channel) and another
+        # consumer subscribes: it must not subscribe through the removed channel.
+        devCtrl.gate = asyncio.Event()
+        devCtrl.failNext = 1
+        failing = asyncio.create_task(multiplexer.Subscribe(1, (0, 10), attributes=[LEVEL]))
+        await asyncio.sleep(0)
+        shutdown = asyncio.create_task(onOff.Shutdown())
+        level = asyncio.create_task(multiplexer.Subscribe(1, (0, 10), attributes=[LEVEL]))
+        await asyncio.sleep(0)
+
+        devCtrl.gate.set()
+        with self.assertRaises(TimeoutError):
+            await failing
+        await shutdown
+        level = await level
+
+        self.assertTrue(devCtrl.subscriptions[0].isShutdown)
+        self.assertEqual(multiplexer.GetSubscriptions(1), [devCtrl.subscriptions[-1]])
+        self.assertEqual(devCtrl.subscriptions[-1].attributes, [LEVEL])
+        self.assertEqual(level.GetAttribute(TypedAttributePath(Path=LEVEL)), (devCtrl.subscriptions[-1], LEVEL))
+
+        multiplexer.Shutdown()
+        self.assertTrue(devCtrl.subscriptions[-1].isShutdown)
+
+
+if __name__ == '__main__':
+    unittest.main()
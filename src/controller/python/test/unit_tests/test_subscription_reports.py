@@ -0,0 +1,198 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import builtins
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import chip.clusters as Clusters
+from chip.clusters import Attribute
+from chip.clusters.Attribute import (AsyncReadTransaction, AttributePath, AttributeReport, EventHeader, EventReadResult,
+                                     ReportQueuePolicy, SubscriptionTransaction)
+from chip.interaction_model import Status
+from chip.tlv import TLVWriter, uint
+
+'''
+This file tests the asynchronous iteration over subscription reports, with the reports delivered from another
+thread like the Matter thread does.
+'''
+
+_ON_OFF = AttributePath.from_attribute(1, Clusters.OnOff.Attributes.OnOff)
+_ON_TIME = AttributePath.from_attribute(1, Clusters.OnOff.Attributes.OnTime)
+
+
+def _tlv(value) -> bytes:
+    writer = TLVWriter()
+    writer.put(None, value)
+    return bytes(writer.encoding)
+
+
+class TestSubscriptionReports(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Attribute.Init() needs the native library, only build the indexes it would build.
+        Attribute._BuildClusterIndex()
+        Attribute._BuildAttributeIndex()
+        Attribute._BuildEventIndex()
+
+    async def asyncSetUp(self):
+        chipStack = SimpleNamespace(RegisterSubscription=lambda subscription: None,
+                                    UnregisterSubscription=lambda subscription: None, Call=lambda callable: None)
+        patcher = mock.patch('builtins.chipStack', chipStack, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.transaction = AsyncReadTransaction(asyncio.get_running_loop().create_future(), asyncio.get_running_loop(),
+                                                None, False)
+        self.subscription = SubscriptionTransaction(self.transaction, 1, None)
+        self.subscription.SetAttributeUpdateCallback(lambda path, transaction: None)
+        self.subscription.SetEventUpdateCallback(lambda event, transaction: None)
+        self.transaction._subscription_handler = self.subscription
+        # The subscription is established.
+        self.transaction._future.set_result(self.transaction)
+        self.dataVersion = 0
+
+    def _Report(self, *values):
+        # A report with the (path, value) attribute data, handled on another thread.
+        def report():
+            for path, value in values:
+                self.dataVersion += 1
+                self.transaction.handleAttributeData(path, self.dataVersion, Status.Success, _tlv(value))
+            self.transaction._handleReportEnd()
+
+        thread = threading.Thread(target=report)
+        thread.start()
+        thread.join()
+
+    def _Event(self, number: int):
+        header = EventHeader(EndpointId=0, ClusterId=0x28, EventId=0, EventNumber=number)
+        self.subscription._PublishEvent(EventReadResult(Header=header, Status=Status.Success))
+
+    async def _Collect(self, reports, count):
+        return [report async for report in _Take(reports, count)]
+
+    async def test_coalesce(self):
+        reports = self.subscription.reports(maxsize=2)
+        self._Report((_ON_OFF, True))
+        self._Report((_ON_TIME, uint(5)))
+        self._Report((_ON_OFF, False))
+        self._Event(7)
+
+        received = await self._Collect(reports, 2)
+        # The second OnOff report replaced the first, the event dropped the oldest report.
+        self.assertIsInstance(received[0], AttributeReport)
+        self.assertEqual((received[0].Path.Path, received[0].Value), (_ON_OFF, False))
+        self.assertEqual(received[1].Header.EventNumber, 7)
+        self.assertEqual((reports.stats.enqueued, reports.stats.coalesced, reports.stats.dropped), (4, 1, 1))
+        self.assertEqual((reports.stats.depth, reports.stats.maxDepth, reports.stats.delivered), (0, 2, 2))
+
+    async def test_drop_oldest(self):
+        reports = self.subscription.reports(maxsize=2, policy=ReportQueuePolicy.DROP_OLDEST)
+        self._Report((_ON_OFF, True))
+        self._Report((_ON_TIME, uint(5)))
+        self._Report((_ON_OFF, False))
+
+        received = await self._Collect(reports, 2)
+        self.assertEqual([(report.Path.Path, report.Value) for report in received], [(_ON_TIME, uint(5)), (_ON_OFF, False)])
+        self.assertEqual((reports.stats.coalesced, reports.stats.dropped), (0, 1))
+
+    async def test_block(self):
+        reports = self.subscription.reports(maxsize=1, policy=ReportQueuePolicy.BLOCK, blockTimeoutSec=5)
+        self._Report((_ON_OFF, True))
+
+        # The second report waits on the reporting thread until the consumer takes the first one.
+        thread = threading.Thread(target=self._Report, args=((_ON_OFF, False),))
+        thread.start()
+        received = await self._Collect(reports, 2)
+        await asyncio.to_thread(thread.join)
+        self.assertEqual([report.Value for report in received], [True, False])
+        self.assertEqual(reports.stats.dropped, 0)
+        self.assertGreater(reports.stats.blockedSec, 0)
+
+    async def test_abandoned_block(self):
+        # A consumer leaving the iteration early closes the iterator, later reports must not wait for it.
+        async with self.subscription.reports(maxsize=1, policy=ReportQueuePolicy.BLOCK, blockTimeoutSec=5) as reports:
+            self._Report((_ON_OFF, True))
+            async for report in reports:
+                break
+            self._Report((_ON_OFF, False))
+        self.assertEqual(self.subscription._reports, ())
+
+        start = time.monotonic()
+        self._Report((_ON_TIME, uint(1)))
+        self._Report((_ON_TIME, uint(2)))
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(reports.stats.blockedSec, 0)
+        self.assertEqual(await self._Collect(reports, 1), [])
+
+    async def test_shutdown_while_blocked(self):
+        reports = self.subscription.reports(maxsize=1, policy=ReportQueuePolicy.BLOCK, blockTimeoutSec=5)
+        self._Report((_ON_OFF, True))
+        thread = threading.Thread(target=self._Report, args=((_ON_OFF, False),))
+        thread.start()
+
+        # The shutdown runs on the Matter thread, which waits for the consumer to take the first report.
+        start = time.monotonic()
+        with mock.patch.object(builtins.chipStack, 'Call', lambda callable: thread.join()), \
+                mock.patch.object(Attribute, 'GetLibraryHandle'):
+            self.subscription.Shutdown()
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual([report.Value for report in await self._Collect(reports, 2)], [True])
+
+    async def test_end_of_subscription(self):
+        reports = self.subscription.reports()
+        waiting = asyncio.ensure_future(self._Collect(reports, 10))
+        await asyncio.sleep(0)
+        self._Report((_ON_OFF, True))
+        self.subscription._CloseReports()
+        received = await waiting
+        self.assertEqual([report.Value for report in received], [True])
+
+        # A subscription that terminated with an error raises it once the reports are consumed.
+        reports = self.subscription.reports()
+        self.transaction._resultError = SimpleNamespace(to_exception=lambda: TimeoutError("Subscription lost"))
+        self.subscription._reports = (reports,)
+        self._Report((_ON_TIME, uint(3)))
+        with mock.patch('ctypes.pythonapi.Py_DecRef'):
+            self.transaction._handleDone()
+        iterator = aiter(reports)
+        self.assertEqual((await anext(iterator)).Value, 3)
+        with self.assertRaises(TimeoutError):
+            await anext(iterator)
+
+    async def test_events(self):
+        # Events are never coalesced.
+        reports = self.subscription.reports(maxsize=10)
+        self._Event(1)
+        self._Event(2)
+        self.assertEqual([event.Header.EventNumber for event in await self._Collect(reports, 2)], [1, 2])
+
+
+async def _Take(iterator, count):
+    async for item in iterator:
+        yield item
+        count -= 1
+        if count == 0:
+            return
+
+
+if __name__ == '__main__':
+    unittest.main()
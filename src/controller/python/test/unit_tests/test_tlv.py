@@ -17,7 +17,7 @@
 
 import unittest
 
-from chip.tlv import TLVList, TLVReader, TLVWriter
+from chip.tlv import LazyTLVReader, TLVArrayView, TLVList, TLVReader, TLVStructureView, TLVWriter
 from chip.tlv import uint as tlvUint
 
 
@@ -196,6 +196,59 @@ class TestTLVReader(unittest.TestCase):
                          ], TLVList([(None, 1), (None, TLVList([(None, 2), (3, 4)]))]))
 
 
+class TestLazyTLVReader(unittest.TestCase):
+    STRUCTURE_CASES = [
+        b'\x15\x36\x01\x15\x35\x01\x26\x00\xBF\xA2\x55\x16\x37\x01\x24'
+        b'\x02\x00\x24\x03\x28\x24\x04\x00\x18\x24\x02\x01\x18\x18\x18\x18',
+        b'\x156\x01\x155\x01&\x00\xBF\xA2U\x167\x01$\x02\x00$\x03($\x04\x01'
+        b'\x18,\x02\x18Nordic Semiconductor ASA\x18\x18\x18\x18',
+    ]
+
+    def _read_case(self, input, answer):
+        decoded = LazyTLVReader(bytearray(input)).get()["Any"]
+        self.assertEqual(decoded, answer)
+        if isinstance(decoded, (TLVStructureView, TLVArrayView)):
+            decoded = decoded.materialize()
+        self.assertEqual(type(decoded), type(answer))
+        self.assertEqual(decoded, answer)
+
+    def test_primitives(self):
+        self._read_case([0b00000011,
+                         0xfe, 0x00, 0xca, 0xef, 0xbe, 0xad, 0xde, 0x00], 0x00deadbeefca00fe)
+        self._read_case([0b00000001, 0xab, 0xaa], -(0x5555))
+        self._read_case([0b00000110, 0xef, 0xbe, 0xad, 0x7c], tlvUint(0x7cadbeef))
+        self._read_case([0b00001001], True)
+        self._read_case([0b00010100], None)
+        self._read_case([0b00001100, 0x02, 0x68, 0x69], "hi")
+        self._read_case([0b00010000, 0x02, 0xde, 0xad], b"\xde\xad")
+
+    def test_matches_tlv_reader(self):
+        for tlv_bytes in self.STRUCTURE_CASES:
+            self._read_case(tlv_bytes, TLVReader(tlv_bytes).get()["Any"])
+
+        val = {1: 0, 2: 65536, 3: True, 4: None, 5: "Hello!", 6: bytearray([0xDE, 0xAD, 0xBE, 0xEF]),
+               7: ["Goodbye!", 71024724507, False, {0: -1}], (0x235A0000, 42): "FOO", (None, 42): "BAR"}
+        writer = TLVWriter()
+        writer.put(None, val)
+        self._read_case(writer.encoding, TLVReader(writer.encoding).get()["Any"])
+
+    def test_lazy_access(self):
+        writer = TLVWriter()
+        writer.put(None, {0: [{1: "a" * 100}] * 50, 1: "last"})
+        decoded = LazyTLVReader(bytes(writer.encoding)).get()["Any"]
+        self.assertIsInstance(decoded, TLVStructureView)
+        self.assertEqual(decoded[1], "last")
+        # Only the accessed member has been decoded.
+        self.assertEqual(list(decoded._values.values()), ["last"])
+
+        array = decoded[0]
+        self.assertIsInstance(array, TLVArrayView)
+        self.assertEqual(len(array), 50)
+        self.assertEqual(array[-1][1], "a" * 100)
+        self.assertEqual(list(array._values.keys()), [49])
+        self.assertIs(array[-1], array[49])
+
+
 class TestTLVTypes(unittest.TestCase):
     def test_list(self):
         var = TLVList([(None, 1), (None, 2), (1, 3)])
@@ -0,0 +1,103 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import math
+import unittest
+
+from chip.tracing import metrics as TracingMetrics
+from chip.tracing.metrics import Histogram, InteractionType
+
+'''
+This file tests the interaction metrics histograms and their Prometheus text exposition, without the
+Matter stack tracing backend.
+'''
+
+
+class TestHistogram(unittest.TestCase):
+    def test_buckets(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.Observe(value)
+        self.assertEqual(histogram.CumulativeCounts(), [(0.1, 2), (1.0, 3), (float('inf'), 4)])
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.sum, 2.65)
+
+    def test_quantile(self):
+        histogram = Histogram(buckets=(1.0, 2.0, 3.0))
+        for value in (0.5, 1.5, 1.5, 2.5):
+            histogram.Observe(value)
+        self.assertAlmostEqual(histogram.Quantile(0.5), 1.5)
+        self.assertAlmostEqual(histogram.Quantile(1.0), 3.0)
+        self.assertTrue(math.isnan(Histogram().Quantile(0.5)))
+
+
+class TestMetrics(unittest.TestCase):
+    def tearDown(self):
+        TracingMetrics.StopMetrics()
+
+    def test_measure_interaction(self):
+        self.assertIsNone(TracingMetrics.GetMetrics())
+        # Without started metrics, nothing is recorded and the cluster IDs are not iterated.
+        with TracingMetrics.MeasureInteraction(InteractionType.READ, 1, iter(lambda: self.fail('iterated'), None)):
+            pass
+
+        metrics = TracingMetrics.StartMetrics(includeStack=False)
+        with TracingMetrics.MeasureInteraction(InteractionType.READ, 1, (6, 8, 6)):
+            pass
+        with self.assertRaises(TimeoutError):
+            with TracingMetrics.MeasureInteraction(InteractionType.INVOKE, 2, (6,)):
+                raise TimeoutError()
+        with TracingMetrics.MeasureInteraction(InteractionType.CONNECT, 2):
+            pass
+
+        self.assertEqual(set(metrics.interactions), {(InteractionType.READ, 1, 6), (InteractionType.READ, 1, 8),
+                                                     (InteractionType.INVOKE, 2, 6), (InteractionType.CONNECT, 2, None)})
+        self.assertEqual(metrics.interactions[(InteractionType.READ, 1, 6)].latency.count, 1)
+        self.assertEqual(metrics.interactions[(InteractionType.INVOKE, 2, 6)].errors, 1)
+
+        TracingMetrics.StopMetrics()
+        self.assertIs(TracingMetrics.GetMetrics(), metrics)
+        with TracingMetrics.MeasureInteraction(InteractionType.READ, 1, (6,)):
+            pass
+        self.assertEqual(metrics.interactions[(InteractionType.READ, 1, 6)].latency.count, 1)
+
+    def test_prometheus_text(self):
+        metrics = TracingMetrics.Metrics(buckets=(0.1, 1.0))
+        metrics.ObserveInteraction(InteractionType.WRITE, 0x12344321, (0x0006,), 0.05)
+        metrics.ObserveInteraction(InteractionType.SUBSCRIBE, 0x12344321, (None,), 2.0, failed=True)
+        metrics._OnStackSample('messages_sent', 0x0001, 12)
+        metrics._OnStackSample('messages_received', 0x0001, 10)
+        metrics._OnStackSample('retransmissions', 0, 3)
+        metrics._OnStackSample('core_dev_case_session', 0, 250000)
+
+        lines = metrics.PrometheusText().splitlines()
+        labels = 'interaction="write",node="0x0000000012344321",cluster="0x0006"'
+        self.assertIn('# TYPE matter_interaction_duration_seconds histogram', lines)
+        self.assertIn(f'matter_interaction_duration_seconds_bucket{{{labels},le="0.1"}} 1', lines)
+        self.assertIn(f'matter_interaction_duration_seconds_bucket{{{labels},le="+Inf"}} 1', lines)
+        self.assertIn(f'matter_interaction_duration_seconds_count{{{labels}}} 1', lines)
+        self.assertIn('matter_interaction_errors_total{interaction="subscribe",node="0x0000000012344321",cluster="*"} 1',
+                      lines)
+        self.assertIn('matter_messages_sent_total{protocol="0x00000001"} 12', lines)
+        self.assertIn('matter_messages_received_total{protocol="0x00000001"} 10', lines)
+        self.assertIn('matter_retransmissions_total 3', lines)
+        self.assertIn('matter_stack_duration_seconds_bucket{metric="core_dev_case_session",le="1.0"} 1', lines)
+        self.assertIn('matter_stack_duration_seconds_sum{metric="core_dev_case_session"} 0.25', lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
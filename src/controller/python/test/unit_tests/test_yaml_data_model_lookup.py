@@ -0,0 +1,63 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+# ensure matter IDL and yamltests are available for import, otherwise set relative paths
+try:
+    import matter_yamltests  # noqa: F401
+except ImportError:
+    SCRIPTS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../scripts'))
+    sys.path.append(os.path.join(SCRIPTS_PATH, 'py_matter_idl'))
+    sys.path.append(os.path.join(SCRIPTS_PATH, 'py_matter_yamltests'))
+
+import chip.clusters as Clusters  # noqa: E402
+from chip.yaml.data_model_lookup import PreDefinedDataModelLookup, case_insensitive_getattr  # noqa: E402
+
+'''
+This file tests the case insensitive name lookups of the YAML runner.
+'''
+
+
+class TestDataModelLookup(unittest.TestCase):
+    def test_lookup(self):
+        lookup = PreDefinedDataModelLookup()
+        self.assertIs(lookup.get_cluster('onoff'), Clusters.OnOff)
+        self.assertIs(lookup.get_command('OnOff', 'TOGGLE'), Clusters.OnOff.Commands.Toggle)
+        self.assertIs(lookup.get_attribute('levelcontrol', 'currentLevel'), Clusters.LevelControl.Attributes.CurrentLevel)
+        self.assertIs(lookup.get_event('BasicInformation', 'startUp'), Clusters.BasicInformation.Events.StartUp)
+
+        self.assertIsNone(lookup.get_cluster('NotACluster'))
+        self.assertIsNone(lookup.get_command('NotACluster', 'Toggle'))
+        self.assertIsNone(lookup.get_attribute('OnOff', 'NotAnAttribute'))
+
+    def test_instances(self):
+        target = Clusters.AccessControl.Structs.AccessControlTargetStruct(cluster=6, endpoint=1)
+        self.assertEqual(case_insensitive_getattr(target, 'Cluster', None), 6)
+        self.assertEqual(case_insensitive_getattr(target, 'ENDPOINT', None), 1)
+        self.assertIsNone(case_insensitive_getattr(target, 'missing', None))
+
+        # Attributes only set on the instance are found too.
+        value = SimpleNamespace(fabricIndex=2)
+        self.assertEqual(case_insensitive_getattr(value, 'FabricIndex', None), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+# ensure matter IDL and yamltests are available for import, otherwise set relative paths
+try:
+    import matter_yamltests  # noqa: F401
+except ImportError:
+    SCRIPTS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../scripts'))
+    sys.path.append(os.path.join(SCRIPTS_PATH, 'py_matter_idl'))
+    sys.path.append(os.path.join(SCRIPTS_PATH, 'py_matter_yamltests'))
+
+from chip.yaml.pipeline import execute_steps, referenced_variables, saved_variables  # noqa: E402
+from chip.yaml.runner import InvokeAction, ReadAttributeAction, WriteAttributeAction  # noqa: E402
+
+'''
+This file tests the pipelined YAML step execution, with the parsed steps and the runner replaced by
+fakes that record when each step starts and completes.
+'''
+
+
+def _raw(node_id=1, arguments=None, responses=None, save_response_as=None):
+    return SimpleNamespace(node_id=node_id, group_id=None, endpoint=1, cluster='OnOff', command=None, attribute=None,
+                           event=None, run_if=None, data_version=None, event_number=None,
+                           arguments_with_placeholders=arguments, responses_with_placeholders=responses or [{}],
+                           save_response_as=save_response_as)
+
+
+class _FakeTests:
+    def __init__(self, steps):
+        # Each step is (label, action type, raw step).
+        self._steps = steps
+        self._index = 0
+
+    def peek(self):
+        return self._steps[self._index][2] if self._index < len(self._steps) else None
+
+    def __next__(self):
+        label, action_type, raw = self._steps[self._index]
+        self._index += 1
+        return SimpleNamespace(label=label, action_type=action_type, node_id=raw.node_id, group_id=raw.group_id,
+                               busy_wait_ms=None, is_pics_enabled=True)
+
+
+class _FakeRunner:
+    def __init__(self, delays):
+        self.delays = delays
+        self.events = []
+        self.has_subscriptions = False
+
+    def encode(self, test_step):
+        action = object.__new__(test_step.action_type)
+        action._label = test_step.label
+        return action
+
+    async def execute(self, action):
+        self.events.append(('start', action.label))
+        await asyncio.sleep(self.delays.get(action.label, 0.01))
+        self.events.append(('end', action.label))
+        return action.label
+
+    def decode(self, response):
+        return f'decoded {response}'
+
+
+async def _run(steps, runner, max_inflight):
+    return [(test_step.label, response) async for test_step, response in execute_steps(_FakeTests(steps), runner, max_inflight)]
+
+
+class TestYamlPipeline(unittest.IsolatedAsyncioTestCase):
+    def test_variables(self):
+        raw = _raw(arguments={'values': [{'name': 'level', 'value': 'savedLevel + 1'}]},
+                   responses=[{'values': [{'name': 'OnTime', 'saveAs': 'onTime'}]}], save_response_as='response')
+        self.assertIn('savedLevel', referenced_variables(raw))
+        self.assertEqual(saved_variables(raw), {'onTime', 'response'})
+
+    async def test_results_in_order(self):
+        steps = [(f'read{i}', ReadAttributeAction, _raw()) for i in range(4)]
+        runner = _FakeRunner({'read0': 0.05, 'read1': 0.03})
+        results = await _run(steps, runner, max_inflight=4)
+
+        self.assertEqual(results, [(f'read{i}', f'decoded read{i}') for i in range(4)])
+        # All reads were started before the first one completed.
+        self.assertEqual(runner.events[:4], [('start', f'read{i}') for i in range(4)])
+
+    async def test_sequential_by_default(self):
+        steps = [(f'read{i}', ReadAttributeAction, _raw()) for i in range(3)]
+        runner = _FakeRunner({})
+        await _run(steps, runner, max_inflight=1)
+        self.assertEqual(runner.events, [(event, f'read{i}') for i in range(3) for event in ('start', 'end')])
+
+    async def test_max_inflight(self):
+        steps = [(f'read{i}', ReadAttributeAction, _raw()) for i in range(6)]
+        runner = _FakeRunner({})
+        await _run(steps, runner, max_inflight=2)
+        inflight = peak = 0
+        for event, _ in runner.events:
+            inflight += 1 if event == 'start' else -1
+            peak = max(peak, inflight)
+        self.assertEqual(peak, 2)
+
+    async def test_dependencies(self):
+        steps = [
+            ('save', ReadAttributeAction, _raw(responses=[{'values': [{'saveAs': 'value'}]}])),
+            ('other node', InvokeAction, _raw(node_id=2)),
+            ('use', ReadAttributeAction, _raw(node_id=3, arguments={'values': [{'value': 'value'}]})),
+            ('invoke', InvokeAction, _raw(node_id=3)),
+            ('read after invoke', ReadAttributeAction, _raw(node_id=3)),
+            ('write', WriteAttributeAction, _raw(node_id=4)),
+            ('read after write', ReadAttributeAction, _raw(node_id=5)),
+        ]
+        runner = _FakeRunner({})
+        results = await _run(steps, runner, max_inflight=8)
+        self.assertEqual([label for label, _ in results], [label for label, _, _ in steps])
+
+        order = runner.events
+        # Reads and invokes on other nodes run concurrently.
+        self.assertLess(order.index(('start', 'other node')), order.index(('end', 'save')))
+        # A step using a saved variable waits for the step saving it.
+        self.assertGreater(order.index(('start', 'use')), order.index(('end', 'save')))
+        # An invoke waits for the steps in flight on its node, a read waits for the invoke in flight on its node.
+        self.assertGreater(order.index(('start', 'invoke')), order.index(('end', 'use')))
+        self.assertGreater(order.index(('start', 'read after invoke')), order.index(('end', 'invoke')))
+        # Writes run alone.
+        self.assertGreater(order.index(('start', 'write')), order.index(('end', 'read after invoke')))
+        self.assertGreater(order.index(('start', 'read after write')), order.index(('end', 'write')))
+
+    async def test_invokes_with_subscriptions(self):
+        steps = [(f'invoke{i}', InvokeAction, _raw(node_id=i)) for i in range(3)]
+        runner = _FakeRunner({})
+        runner.has_subscriptions = True
+        await _run(steps, runner, max_inflight=4)
+        self.assertEqual(runner.events, [(event, f'invoke{i}') for i in range(3) for event in ('start', 'end')])
+
+
+if __name__ == '__main__':
+    unittest.main()